@@ -0,0 +1,168 @@
+"""
+Module implementing the binary export of the experiment data of one data
+storage object.
+
+The samples are exported either as structured .npy array, which can be loaded
+without copying by memory-mapping it, or as compressed .npz archive containing
+one array per column. In both cases a JSON sidecar with the same file name
+contains the experiment type, the experiment parameters and the column labels.
+The decimation pyramid of the data storage object is saved as well, so it
+doesn't have to be rebuilt when the export is loaded again:
+
+Experiment_Data_SP0_CV.npy
+Experiment_Data_SP0_CV.json
+Experiment_Data_SP0_CV_Pyramid.npz
+
+If a compression is chosen, the .npy export is compressed block wise (e.g.
+Experiment_Data_SP0_CV.npy.gz) and decompressed by `load_DataStorage_binary`.
+The .npz archive is always compressed with deflate.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Include dependencies
+import io
+import json
+import os
+import zipfile
+
+import numpy as np
+
+# Include internal dependencies
+from .compression import (get_CompressedPath, open_File, read_File,
+                          remove_CompressionExtension)
+from .constants import *
+from .data_storage import DataStorage
+from .dictionaries import *
+
+def export_DataStorage_binary(strPath : str, dataStorage : DataStorage,
+                              iBinaryExport : int = BINARY_EXPORT_NPY,
+                              strCompression : str = COMPRESSION_NONE) -> str:
+    """
+    Description
+    -----------
+    Export the samples of a data storage object and its metadata sidecar.
+
+    Parameters
+    ----------
+    `strPath` : str
+        Path of the export without file extension
+
+    `dataStorage` : DataStorage
+        Data storage object which should be exported
+
+    `iBinaryExport` : int
+        Format of the export (BINARY_EXPORT_NPY or BINARY_EXPORT_NPZ)
+
+    `strCompression` : str
+        Compression of the .npy export (COMPRESSION_X)
+
+    Return
+    ------
+    `strFile` : str
+        Path of the exported data file
+
+    """
+    # Initialize variables
+    iOffset : int = 0
+    iLength : int = dataStorage.get_DataLength()
+
+    if (iBinaryExport == BINARY_EXPORT_NPZ):
+        # Store every column as own compressed array, written block by block
+        strFile : str = strPath + ".npz"
+        with zipfile.ZipFile(strFile, "w", zipfile.ZIP_DEFLATED,
+                             allowZip64= True) as npzFile:
+            for strLabel in dataStorage.get_ColumnLabels():
+                with npzFile.open(strLabel + ".npy", "w",
+                                  force_zip64= True) as npyFile:
+                    np.lib.format.write_array_header_1_0(npyFile, {
+                        "descr" : np.lib.format.dtype_to_descr(
+                            dataStorage.get_DataArray(0, 1).dtype[strLabel]),
+                        "fortran_order" : False,
+                        "shape" : (iLength,)})
+                    for np_arrColumn in dataStorage.get_ColumnBlocks(strLabel):
+                        npyFile.write(np_arrColumn.tobytes())
+    elif (strCompression != COMPRESSION_NONE):
+        # Write header and samples block by block into the compressed file
+        strFile : str = get_CompressedPath(strPath + ".npy", strCompression)
+        with open_File(strFile, "wb") as npyFile:
+            np.lib.format.write_array_header_1_0(npyFile, {
+                "descr" : np.lib.format.dtype_to_descr(
+                    dataStorage.get_DataArray(0, 1).dtype),
+                "fortran_order" : False,
+                "shape" : (iLength,)})
+            for np_arrBlock in dataStorage.get_DataBlocks():
+                npyFile.write(np_arrBlock.tobytes())
+    elif (iLength == 0):
+        # Empty files can't be memory-mapped
+        strFile : str = strPath + ".npy"
+        np.save(strFile, dataStorage.get_DataArray())
+    else:
+        # Copy block by block into the file to avoid a copy of all samples
+        strFile : str = strPath + ".npy"
+        np_arrData = np.lib.format.open_memmap(strFile, mode= "w+",
+            dtype= dataStorage.get_DataArray(0, 1).dtype, shape= (iLength,))
+        for np_arrBlock in dataStorage.get_DataBlocks():
+            np_arrData[iOffset:iOffset + len(np_arrBlock)] = np_arrBlock
+            iOffset += len(np_arrBlock)
+        np_arrData.flush()
+        del np_arrData
+
+    # Save decimation pyramid
+    dataStorage.save_DecimationPyramid(strPath + FREISTAT_PYRAMID_EXTENSION)
+
+    # Write metadata sidecar
+    with open(strPath + FREISTAT_METADATA_EXTENSION, "w",
+              encoding="utf-8") as jsonFile:
+        json.dump({
+            "Electrochemical method" : dataStorage.get_ExperimentType(),
+            "Experiment parameters" : {
+                dic_configParameters[listParameter[0]][1] : listParameter[1]
+                for listParameter in dataStorage.get_ExperimentParameters()},
+            "Columns" : dataStorage.get_ColumnLabels(),
+            "Samples" : iLength,
+            "Decimation pyramid" : os.path.basename(
+                strPath + FREISTAT_PYRAMID_EXTENSION)}, jsonFile, indent= 4)
+
+    return strFile
+
+def load_DataStorage_binary(strFile : str) -> tuple:
+    """
+    Description
+    -----------
+    Load a binary export. Structured .npy exports are memory-mapped read only,
+    so no samples are copied until they are accessed.
+
+    Parameters
+    ----------
+    `strFile` : str
+        Path of the exported .npy or .npz file, compressed .npy files are
+        decompressed into the memory
+
+    Return
+    ------
+    `np_arrData` : np.ndarray | NpzFile
+        Structured array (.npy) or archive containing one array per column
+        (.npz). In both cases the columns are accessed by their labels.
+
+    `dictMetadata` : dict
+        Content of the metadata sidecar
+
+    """
+    # Read metadata sidecar
+    with open(os.path.splitext(remove_CompressionExtension(strFile))[0] + 
+              FREISTAT_METADATA_EXTENSION, encoding="utf-8") as jsonFile:
+        dictMetadata : dict = json.load(jsonFile)
+
+    if (remove_CompressionExtension(strFile) != strFile):
+        return np.load(io.BytesIO(read_File(strFile))), dictMetadata
+    elif (strFile.endswith(".npz")):
+        return np.load(strFile), dictMetadata
+    return np.load(strFile, mmap_mode= "r"), dictMetadata
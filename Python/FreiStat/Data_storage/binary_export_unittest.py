@@ -0,0 +1,65 @@
+"""
+Module implementing different unittests for the binary_export module.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import os
+import tempfile
+import unittest
+
+# Import internal dependencies
+from .binary_export import export_DataStorage_binary, load_DataStorage_binary
+from .constants import *
+from .data_storage import DataStorage
+
+class BinaryExport_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the binary export.
+
+    """
+    def test_export_DataStorage_binary(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that both binary formats return the exported columns
+        and the metadata.
+
+        """
+        # Test data storage object
+        _DataStorage = DataStorage()
+        _DataStorage.save_ExperimentType(CV)
+        _DataStorage.save_ExperimentParameters([[CYCLE, 2]])
+        _DataStorage.append_DataBatch([[1, iIndex, -200.5 + iIndex, 3.25,
+                                        120.0 + iIndex] for iIndex in range(7)])
+
+        with tempfile.TemporaryDirectory() as strDirectory:
+            for iBinaryExport in [BINARY_EXPORT_NPY, BINARY_EXPORT_NPZ]:
+                strFile = export_DataStorage_binary(
+                    os.path.join(strDirectory, "Test"), _DataStorage,
+                    iBinaryExport)
+
+                np_arrData, dictMetadata = load_DataStorage_binary(strFile)
+
+                # Check results
+                self.assertEqual(np_arrData[DE_TAG_VOLTAGE].tolist(),
+                    _DataStorage.get_Column(DE_TAG_VOLTAGE).tolist())
+                self.assertEqual(dictMetadata["Electrochemical method"], CV)
+                self.assertEqual(dictMetadata["Columns"], FREISTAT_CV_LABEL)
+                self.assertEqual(dictMetadata["Samples"], 7)
+                self.assertEqual(list(dictMetadata["Experiment parameters"].
+                                      values()), [2])
+                del np_arrData
+
+if __name__ == '__main__':
+    unittest.main()
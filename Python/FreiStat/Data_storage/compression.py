@@ -0,0 +1,432 @@
+"""
+Module implementing the block compression of the persistent data storage
+objects and the exports.
+
+Compressed files consist of independently compressed blocks (gzip members, xz
+streams, zstd or lz4 frames), which are appended to the file. Therefore
+appending stays cheap and a partially written file can still be decoded up to
+its last complete block. The compression is encoded in the file extension:
+
+COMPRESSION_GZIP    : `Experiment_Data_SP0_CV.csv.gz`    (stdlib)
+COMPRESSION_LZMA    : `Experiment_Data_SP0_CV.csv.xz`    (stdlib)
+COMPRESSION_ZSTD    : `Experiment_Data_SP0_CV.csv.zst`   (requires zstandard)
+COMPRESSION_LZ4     : `Experiment_Data_SP0_CV.csv.lz4`   (requires lz4)
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Include dependencies
+import gzip
+import io
+import lzma
+import zlib
+
+# Optional dependencies
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
+# Include internal dependencies
+from .constants import *
+from .dictionaries import *
+
+def is_CompressionAvailable(strCompression : str) -> bool:
+    """
+    Description
+    -----------
+    Check if a compression is known and its module is installed.
+
+    Parameters
+    ----------
+    `strCompression` : str
+        Compression (COMPRESSION_X)
+
+    Return
+    ------
+    `bAvailable` : bool
+        True if files can be compressed with the compression
+
+    """
+    if (strCompression == COMPRESSION_ZSTD):
+        return zstandard is not None
+    elif (strCompression == COMPRESSION_LZ4):
+        return lz4 is not None
+    return strCompression == COMPRESSION_NONE or \
+           strCompression in dic_compressionExtensions
+
+def get_CompressedPath(strPath : str, strCompression : str) -> str:
+    """
+    Description
+    -----------
+    Add the file extension of a compression to a path.
+
+    Parameters
+    ----------
+    `strPath` : str
+        Path of the uncompressed file
+
+    `strCompression` : str
+        Compression (COMPRESSION_X)
+
+    Return
+    ------
+    `strCompressedPath` : str
+        Path of the compressed file
+
+    """
+    return strPath + dic_compressionExtensions.get(strCompression, "")
+
+def get_Compression(strPath : str) -> str:
+    """
+    Description
+    -----------
+    Get compression of a file by its file extension.
+
+    Parameters
+    ----------
+    `strPath` : str
+        Path of the file
+
+    Return
+    ------
+    `strCompression` : str
+        Compression (COMPRESSION_X) or COMPRESSION_NONE
+
+    """
+    for strCompression, strExtension in dic_compressionExtensions.items():
+        if (strPath.endswith(strExtension)):
+            return strCompression
+    return COMPRESSION_NONE
+
+def remove_CompressionExtension(strPath : str) -> str:
+    """
+    Description
+    -----------
+    Remove the file extension of the compression from a path.
+
+    Parameters
+    ----------
+    `strPath` : str
+        Path of the file
+
+    Return
+    ------
+    `strUncompressedPath` : str
+        Path without the extension of the compression
+
+    """
+    # Initialize variables
+    strCompression : str = get_Compression(strPath)
+
+    if (strCompression == COMPRESSION_NONE):
+        return strPath
+    return strPath[:-len(dic_compressionExtensions[strCompression])]
+
+def compress_Block(strCompression : str, bBlock : bytes) -> bytes:
+    """
+    Description
+    -----------
+    Compress a block into a self-contained gzip member, xz stream, zstd or lz4
+    frame, which can be appended to a compressed file.
+
+    Parameters
+    ----------
+    `strCompression` : str
+        Compression (COMPRESSION_X)
+
+    `bBlock` : bytes
+        Uncompressed block
+
+    Return
+    ------
+    `bCompressed` : bytes
+        Compressed block
+
+    """
+    if (strCompression == COMPRESSION_NONE):
+        return bBlock
+    elif (strCompression == COMPRESSION_GZIP):
+        return gzip.compress(bBlock, compresslevel= FREISTAT_COMPRESSION_LEVEL)
+    elif (strCompression == COMPRESSION_LZMA):
+        return lzma.compress(bBlock)
+    elif (strCompression == COMPRESSION_ZSTD and zstandard is not None):
+        return zstandard.ZstdCompressor().compress(bBlock)
+    elif (strCompression == COMPRESSION_LZ4 and lz4 is not None):
+        return lz4.frame.compress(bBlock)
+    raise ValueError("Compression not supported: " + strCompression)
+
+def _create_Decompressor(strCompression : str):
+    """
+    Description
+    -----------
+    Create a decompressor for one compressed block.
+
+    Parameters
+    ----------
+    `strCompression` : str
+        Compression (COMPRESSION_X)
+
+    Return
+    ------
+    `decompressor` : object
+        Decompressor providing `decompress`, `eof` and `unused_data`
+
+    """
+    if (strCompression == COMPRESSION_GZIP):
+        return zlib.decompressobj(wbits= 16 + zlib.MAX_WBITS)
+    elif (strCompression == COMPRESSION_LZMA):
+        return lzma.LZMADecompressor()
+    elif (strCompression == COMPRESSION_ZSTD and zstandard is not None):
+        return zstandard.ZstdDecompressor().decompressobj()
+    elif (strCompression == COMPRESSION_LZ4 and lz4 is not None):
+        return lz4.frame.LZ4FrameDecompressor()
+    raise ValueError("Compression not supported: " + strCompression)
+
+def decompress_Blocks(strCompression : str, bData : bytes) -> bytes:
+    """
+    Description
+    -----------
+    Decompress all complete blocks of a compressed file. A block which was
+    cut off (e.g. by a crash) and everything behind it is ignored.
+
+    Parameters
+    ----------
+    `strCompression` : str
+        Compression (COMPRESSION_X)
+
+    `bData` : bytes
+        Content of the compressed file
+
+    Return
+    ------
+    `bDecompressed` : bytes
+        Content of all complete blocks
+
+    """
+    # Initialize variables
+    listBlocks : list = []
+
+    if (strCompression == COMPRESSION_NONE):
+        return bData
+
+    while (len(bData) > 0):
+        decompressor = _create_Decompressor(strCompression)
+        try:
+            bBlock : bytes = decompressor.decompress(bData)
+        except (OSError, EOFError, zlib.error, lzma.LZMAError, RuntimeError):
+            break
+
+        # Stop at a block which was cut off
+        if (not decompressor.eof):
+            break
+
+        listBlocks.append(bBlock)
+        bData = decompressor.unused_data
+
+    return b"".join(listBlocks)
+
+def read_File(strPath : str) -> bytes:
+    """
+    Description
+    -----------
+    Read the content of a file, which is decompressed if its file extension
+    encodes a compression.
+
+    Parameters
+    ----------
+    `strPath` : str
+        Path of the file
+
+    Return
+    ------
+    `bContent` : bytes
+        Uncompressed content of all complete blocks
+
+    """
+    with open(strPath, "rb") as input:
+        return decompress_Blocks(get_Compression(strPath), input.read())
+
+def open_File(strPath : str, strMode : str = "w"):
+    """
+    Description
+    -----------
+    Open a file for writing. If the file extension encodes a compression, the
+    written data is compressed block wise (see `BlockWriter`).
+
+    Parameters
+    ----------
+    `strPath` : str
+        Path of the file
+
+    `strMode` : str
+        "w" or "a" for text files (utf-8), "wb" or "ab" for binary files
+
+    Return
+    ------
+    `file` : file object
+        Opened file
+
+    """
+    # Initialize variables
+    strCompression : str = get_Compression(strPath)
+
+    if (strCompression == COMPRESSION_NONE):
+        if ("b" in strMode):
+            return open(strPath, strMode)
+        return open(strPath, strMode, newline="", encoding="utf-8")
+
+    blockWriter = BlockWriter(strPath, strCompression, strMode.startswith("a"))
+    if ("b" in strMode):
+        return blockWriter
+    return io.TextIOWrapper(blockWriter, encoding="utf-8", newline="")
+
+class BlockWriter(io.RawIOBase):
+    """
+    Description
+    -----------
+    Class which collects written data and appends it as compressed block to
+    its file, as soon as FREISTAT_COMPRESSION_BLOCK_SIZE bytes are collected
+    or the file is closed. Flushing doesn't end a block, so periodic flushes
+    don't split the file into many small blocks with a bad compression ratio.
+    Collected data which isn't written yet is lost in case of a crash, the
+    journal of the data storage object keeps the samples recoverable.
+
+    """
+
+    def __init__(self, strPath : str, strCompression : str,
+                 bAppend : bool = False) -> None:
+        """
+        Description
+        -----------
+        Constructor of class BlockWriter
+
+        Parameters
+        ----------
+        `strPath` : str
+            Path of the compressed file
+
+        `strCompression` : str
+            Compression (COMPRESSION_X)
+
+        `bAppend` : bool
+            Flag indicating if the blocks should be appended to an existing
+            file
+
+        """
+        super().__init__()
+
+        # Check compression before the file is created
+        if (not is_CompressionAvailable(strCompression) or
+            strCompression == COMPRESSION_NONE):
+            raise ValueError("Compression not supported: " + strCompression)
+
+        # Initalize class variable
+        self._strCompression : str = strCompression
+        self._listBuffer : list = []
+        self._iBuffered : int = 0
+        self._file = open(strPath, "ab" if bAppend else "wb")
+
+    def writable(self) -> bool:
+        """
+        Description
+        -----------
+        Report that the file can be written, which is required by the
+        buffered and text wrappers of the io module.
+
+        Return
+        ------
+        `bWritable` : bool
+            Always True
+
+        """
+        return True
+
+    def write(self, bData) -> int:
+        """
+        Description
+        -----------
+        Collect data for the next block.
+
+        Parameters
+        ----------
+        `bData` : bytes-like
+            Uncompressed data
+
+        Return
+        ------
+        `iLength` : int
+            Amount of collected bytes
+
+        """
+        self._listBuffer.append(bytes(bData))
+        self._iBuffered += len(bData)
+
+        if (self._iBuffered >= FREISTAT_COMPRESSION_BLOCK_SIZE):
+            self._write_Block()
+        return len(bData)
+
+    def _write_Block(self) -> None:
+        """
+        Description
+        -----------
+        Compress the collected data and append it as one block to the file.
+
+        """
+        if (self._iBuffered == 0):
+            return
+
+        self._file.write(compress_Block(self._strCompression,
+                                        b"".join(self._listBuffer)))
+        self._listBuffer = []
+        self._iBuffered = 0
+
+    def flush(self) -> None:
+        """
+        Description
+        -----------
+        Flush the blocks which are already written to the file. The collected
+        data stays buffered until the block is full or the file is closed.
+
+        """
+        if (not self._file.closed):
+            self._file.flush()
+
+    def fileno(self) -> int:
+        """
+        Description
+        -----------
+        Get the file descriptor of the compressed file, e.g. to synchronize
+        it to the disk with `os.fsync`.
+
+        Return
+        ------
+        `iFileDescriptor` : int
+            File descriptor of the compressed file
+
+        """
+        return self._file.fileno()
+
+    def close(self) -> None:
+        """
+        Description
+        -----------
+        Append the collected data and close the file.
+
+        """
+        if (not self._file.closed):
+            self._write_Block()
+            self._file.close()
+        super().close()
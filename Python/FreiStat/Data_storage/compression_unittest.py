@@ -0,0 +1,100 @@
+"""
+Module implementing different unittests for the compression module.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+# Import internal dependencies
+from .compression import *
+from .constants import *
+from .data_journal import DataJournal, replay_DataJournal
+from .data_storage import DataStorage
+
+class Compression_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the block compression.
+
+    """
+    def test_decompress_Blocks(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that files written block wise can be decoded up to
+        the last complete block, even if the file was cut off.
+
+        """
+        with tempfile.TemporaryDirectory() as strDirectory:
+            for strCompression in [COMPRESSION_GZIP, COMPRESSION_LZMA,
+                                   COMPRESSION_ZSTD, COMPRESSION_LZ4]:
+                if (not is_CompressionAvailable(strCompression)):
+                    continue
+
+                strPath : str = get_CompressedPath(os.path.join(
+                    strDirectory, "Test.csv"), strCompression)
+
+                # Write two blocks of text, flushing doesn't end a block
+                with open_File(strPath, "w") as textFile:
+                    textFile.write("1,2\n")
+                    textFile.flush()
+                    self.assertEqual(read_File(strPath), b"")
+
+                    textFile.write("0" * (FREISTAT_COMPRESSION_BLOCK_SIZE - 4))
+                    textFile.write("3,4\n")
+
+                # Check results
+                bContent : bytes = b"1,2\n" + \
+                    b"0" * (FREISTAT_COMPRESSION_BLOCK_SIZE - 4) + b"3,4\n"
+                self.assertEqual(get_Compression(strPath), strCompression)
+                self.assertEqual(read_File(strPath), bContent)
+
+                # Cut off the second block
+                with open(strPath, "rb") as input:
+                    bData : bytes = input.read()
+                with open(strPath, "wb") as output:
+                    output.write(bData[:-3])
+                self.assertEqual(read_File(strPath), 
+                                 bContent[:FREISTAT_COMPRESSION_BLOCK_SIZE])
+
+    def test_replay_DataJournal(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing the replay of a journal, whose flushes are appended
+        as compressed blocks.
+
+        """
+        # Test data storage object
+        _DataStorage = DataStorage()
+
+        with tempfile.TemporaryDirectory() as strDirectory:
+            strPath : str = os.path.join(strDirectory, "Test" +
+                FREISTAT_JOURNAL_EXTENSION + ".gz")
+            _DataJournal = DataJournal(strPath)
+
+            for iIndex in range(10):
+                _DataStorage.append_Data([1, iIndex, 0.5 * iIndex, 2.0,
+                                          10.0 * iIndex])
+                _DataJournal.flush(_DataStorage)
+
+            # Check results
+            np.testing.assert_array_equal(replay_DataJournal(strPath),
+                                          _DataStorage.get_DataArray())
+
+if __name__ == '__main__':
+    unittest.main()
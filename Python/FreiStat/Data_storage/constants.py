@@ -109,6 +109,8 @@ FIXED_WE_POTENTIAL      = "pFWP"        # Parameter fixed working electrorde pot
 MAINS_FILTER            = "pMF"         # Parameter 50 Hz/ 60 Hz mains filter enabled
 SINC2_OVERSAMPLING      = "pOS2"        # Parameter oversampling rate sinc2 filter
 SINC3_OVERSAMPLING      = "pOS3"        # Parameter oversampling rate sinc3 filter
+DATA_FORMAT             = "pDF"         # Parameter format of the data telegrams send by FreiStat
+BATCH_SIZE              = "pBS"         # Parameter amount of samples packed into one data telegram
 
 """-----------------------------------------------------------------------------
 | Configuration parameters: Default values
@@ -173,9 +175,14 @@ AD5940_SAMPLING_RATE    = 800000        # Clock = 16 MHz -> 800 kHz sampling
 |   Constant              Value                     Meaning
 -----------------------------------------------------------------------------"""
 FREISTAT_SEQUENCE_LENGTH= 35            # Maximum sequence length which is supoorted by FreiStat
+FREISTAT_MAX_BATCH_SIZE = 10            # Maximum amount of samples packed into one data telegram
+FREISTAT_ST_MEASUREMENT = 1.000e-3      # Minimal sampling time in s limited by the measurement itself (without telegram overhead)
 FREISTAT_CA_ST_SERIAL   = 3.000e-3      # Minimal sampling time in s at which the CA still operates
 FREISTAT_CV_ST_SERIAL   = 2.875e-3      # Minimal sampling time in s at which the CV still operates
 FREISTAT_DPV_ST_SERIAL  = 3e-3          # Minimal sampling time in s at which the DPV still operates
+FREISTAT_CA_ST_SERIAL_BIN = 1.250e-3    # Minimal sampling time in s at which the CA still operates (binary data telegrams)
+FREISTAT_CV_ST_SERIAL_BIN = 1.250e-3    # Minimal sampling time in s at which the CV still operates (binary data telegrams)
+FREISTAT_DPV_ST_SERIAL_BIN = 1.250e-3   # Minimal sampling time in s at which the DPV still operates (binary data telegrams)
 FREISTAT_CA_ST_WLAN     = 3.000e-3      
 FREISTAT_CV_ST_WLAN     = 2.875e-3      
 FREISTAT_DPV_ST_WLAN    = 3e-3          
@@ -188,6 +195,10 @@ FREISTAT_DPV_ST_WLAN    = 3e-3
 FREISTAT_SERIAL_PORT    = "COM5"        # Name of the serial port used for communication
 FREISTAT_SERIAL_BAUDRATE= 230400        # Used baudrate in symbols per second
 FREISTAT_SERIAL_TIMEOUT = 400           # Timeout of serial connection in seconds
+FREISTAT_MAX_TELEGRAM_LENGTH = 1024     # Max. length of one telegram in bytes
+FREISTAT_READ_TIMEOUT   = 0.05          # Max. time in s a single blocking read waits for new bytes
+FREISTAT_WAIT_TIMEOUT   = 0.1           # Time in s the execute loops block for data before checking for termination
+FREISTAT_DRAIN_TIMEOUT  = 0.1           # Idle time in s after which the input is considered drained
 
 FREISTAT_UDP_CLIENT_PORT= 20000         # Port of the client (Microcontroller)
 FREISTAT_UDP_CLIENT_IP  = "192.168.178.40" # IP address of the client
@@ -210,6 +221,11 @@ VID_ARDUINO             = 0x2341        # Vendor ID of Ardunio
 COMMAND_TELEGRAM        = "C"           # Command telegram
 ACKNOWLEDGE_TELEGRAM    = "A"           # Acknowledge telegram
 
+TELEGRAM_TYPE_UNKNOWN   = 0             # Telegram couldn't be identified
+TELEGRAM_TYPE_DATA      = 1             # Data telegram (JSON or binary)
+TELEGRAM_TYPE_COMMAND   = 2             # Command telegram
+TELEGRAM_TYPE_ACKNOWLEDGE = 3           # Acknowledge telegram
+
 """-----------------------------------------------------------------------------
 | Telegrams: Command telegram types
 |   
@@ -261,6 +277,23 @@ VOLTAGE_VALUE           = "V"           # Voltage value
 CURRENT_VALUE           = "C"           # Current value   
 TIME_STAMP              = "T"           # Time 
 
+"""-----------------------------------------------------------------------------
+| Telegrams: Binary data telegrams
+|   
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+DATA_FORMAT_JSON        = 0             # Data telegrams are send as JSON strings
+DATA_FORMAT_BINARY      = 1             # Data telegrams are send as binary records
+
+BINARY_TELEGRAM_MAGIC   = b"\xA5\x5A"   # Magic header marking a binary data telegram
+BINARY_TELEGRAM_HEADER  = 4             # Size of magic header and payload length in bytes
+BINARY_RECORD_SIZE      = 20            # Size of one sample record in bytes
+BINARY_RECORD_DTYPE     = [(RUN, "<i4"),                # Layout of one sample record
+                           (DATA_PAIR_NUMBER, "<i4"),   # (see S_DataContainer of 
+                           (VOLTAGE_VALUE, "<f4"),      # the firmware)
+                           (CURRENT_VALUE, "<f4"),
+                           (TIME_STAMP, "<f4")]
+
 """-----------------------------------------------------------------------------
 | Data export
 |   
@@ -276,6 +309,36 @@ FREISTAT_SEQUENCE_POSITION      = "SP"                      # Addition for the f
 
 FREISTAT_CORE_OBJECT_FOLDER     = "Persistent_Data_Objects" # Core folder for storing data objects in a persistent way
 FREISTAT_DATA_STORAGE           = "Data_Storage_Object"     # File name for the data storage object
+FREISTAT_JOURNAL_EXTENSION      = ".journal"                # File extension of the journal of a data storage object
+FREISTAT_MEMMAP_EXTENSION       = ".mmap"                   # Folder extension of a memory-mapped data storage object
+FREISTAT_MEMMAP_CHUNK           = "Chunk_"                  # File name of one memory-mapped chunk (+ index + .npy)
+FREISTAT_MEMMAP_LENGTH          = "Length.npy"              # File name of the memory-mapped amount of stored samples
+FREISTAT_MEMMAP_PYRAMID         = "Pyramid.npz"             # File name of the decimation pyramid in the memory-mapped folder
+
+BINARY_EXPORT_NONE              = 0                         # Experiment data is only exported as csv
+BINARY_EXPORT_NPY               = 1                         # Experiment data is exported as structured .npy array (memory-mappable)
+BINARY_EXPORT_NPZ               = 2                         # Experiment data is exported as compressed .npz with one array per column
+FREISTAT_METADATA_EXTENSION     = ".json"                   # File extension of the metadata sidecar of the binary export
+COMPRESSION_NONE                = ""                        # Files aren't compressed
+COMPRESSION_GZIP                = "gzip"                    # Files are compressed block wise with gzip (.gz)
+COMPRESSION_LZMA                = "lzma"                    # Files are compressed block wise with lzma (.xz)
+COMPRESSION_ZSTD                = "zstd"                    # Files are compressed block wise with zstd (.zst), requires zstandard
+COMPRESSION_LZ4                 = "lz4"                     # Files are compressed block wise with lz4 (.lz4), requires lz4
+FREISTAT_COMPRESSION_BLOCK_SIZE = 1048576                   # Max. amount of uncompressed bytes collected for one compressed block
+FREISTAT_COMPRESSION_LEVEL      = 6                         # Compression level of gzip
+FREISTAT_PYRAMID_EXTENSION      = "_Pyramid.npz"            # Suffix of the decimation pyramid of the binary export
+FREISTAT_NDJSON_EXTENSION       = ".ndjson"                 # File extension of the newline-delimited JSON export
+FREISTAT_RECOVERY_MANIFEST      = "Recovery_Manifest.json"  # File name of the manifest of the bulk recovery (state of every recovered file)
+FREISTAT_CATALOG                = "Experiment_Catalog.sqlite" # File name of the experiment catalog in the core data folder
+FREISTAT_CATALOG_TIMEOUT        = 5.0                       # Max. time in s to wait for a locked experiment catalog
+
+FREISTAT_JOURNAL_FLUSH_TIME     = 1.0                       # Max. time in s new samples stay unwritten in memory
+FREISTAT_JOURNAL_FLUSH_SAMPLES  = 1000                      # Max. amount of samples which stay unwritten in memory
+FREISTAT_JOURNAL_SYNC_TIME      = 5.0                       # Min. time in s between two fsync calls on the journal
+
+JOURNAL_SEGMENT_HEADER          = "<BI"                     # Segment type and payload length in bytes
+JOURNAL_SEGMENT_LAYOUT          = 0                         # Segment containing the column layout (JSON)
+JOURNAL_SEGMENT_SAMPLES         = 1                         # Segment containing raw samples in the column layout
 
 """-----------------------------------------------------------------------------
 | Data export: Tags
@@ -291,6 +354,7 @@ DE_TAG_TOTAL_TIME       = "Total time in ms"
 DE_TAG_SEQ_CYCLE        = "Sequence Cycle"
 DE_TAG_SEQ_TIME         = "Sequence time in ms"
 DE_TAG_VOLTAGE          = "Voltage in mV"
+DE_TAG_EXPERIMENT       = "Experiment type"
 
 """-----------------------------------------------------------------------------
 | Data export: Labels
@@ -315,6 +379,75 @@ FREISTAT_CA_LABEL_SEQ   = [DE_TAG_SEQ_CYCLE, DE_TAG_CYCLE, DE_TAG_DATAPOINT,
                            DE_TAG_VOLTAGE, DE_TAG_CURRENT, DE_TAG_CYCLE_TIME, 
                            DE_TAG_SEQ_TIME, DE_TAG_TOTAL_TIME]
 
+"""-----------------------------------------------------------------------------
+| Data storage: Column layout
+|
+| Disclaimer: The column layout of a data storage object is chosen by the
+|             amount of values of the first stored sample (see dictionaries)
+|
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+FREISTAT_STORAGE_CHUNK_SIZE = 4096      # Amount of samples stored in one preallocated chunk
+FREISTAT_MEMMAP_CHUNK_SIZE  = 262144    # Amount of samples stored in one memory-mapped chunk file
+FREISTAT_STORAGE_INT_TYPE   = "<i4"     # Data type of the counting columns (cycle, datapoint)
+FREISTAT_STORAGE_FLOAT_TYPE = "<f8"     # Data type of the measured columns (voltage, current, time)
+FREISTAT_DECIMATION_FACTORS = [16, 256, 4096]   # Decimation factors of the levels of the decimation pyramid
+FREISTAT_DECIMATION_UPDATE  = 4096      # Amount of new samples after which the decimation pyramid is updated
+
+"""-----------------------------------------------------------------------------
+| Data queue: Shared memory ring buffer
+|
+| Disclaimer: Every record consists of FREISTAT_RING_RECORD_SIZE float64 values
+|             [Amount of values, Method code, Integer mask, Value 0, ...]
+|
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+FREISTAT_RING_CAPACITY      = 65536     # Amount of records stored in the ring buffer
+FREISTAT_RING_RECORD_SIZE   = 12        # Amount of float64 values of one record (max. 9 sample values)
+FREISTAT_RING_HEADER_SIZE   = 32        # Amount of uint64 values of the header (read and write index on own cache lines)
+FREISTAT_RING_TIMEOUT       = 0.1       # Max. time in s the producer waits for free records of an attached consumer, if records are dropped on a full ring
+FREISTAT_RING_POLL_TIME     = 0.001     # Time in s between two checks of the indices while waiting
+RING_WRITE_INDEX            = 0         # Header position of the amount of written records
+RING_READ_INDEX             = 8         # Header position of the amount of read records
+RING_CAPACITY               = 16        # Header position of the capacity
+RING_OVERFLOW               = 17        # Header position of the amount of dropped records
+RING_BACKPRESSURE           = 18        # Header position of the amount of puts which had to wait
+RING_CONSUMER               = 24        # Header position of the flag indicating an attached consumer
+RING_DROP_ON_FULL           = 25        # Header position of the flag indicating that records are dropped after FREISTAT_RING_TIMEOUT
+RING_NOTIFY                 = 26        # Header position of the flag indicating that the producer wakes up the consumer over a pipe
+RING_METHOD_RECORD          = -1        # Amount of values marking a record which sets the method of the following records
+FREISTAT_PRODUCER_SAMPLES   = 256       # Max. amount of samples collected by the producer before they are published
+FREISTAT_PRODUCER_DELAY     = 0.05      # Max. time in s samples are collected by the producer before they are published
+FREISTAT_STREAM_POLL_TIME   = 0.01      # Time in s between two reads of the data queue by `stream`, if it can't wait for a wake up
+FREISTAT_STREAM_WAIT_TIMEOUT = 1.0      # Max. time in s a consumer waits for a wake up before it checks the data collection again
+
+"""-----------------------------------------------------------------------------
+| Status block: Shared memory control block of the data collection
+|
+| Disclaimer: The header consists of FREISTAT_STATUS_HEADER_SIZE int64 values,
+|             followed by FREISTAT_STATUS_PATH_SIZE bytes of the export path
+|
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+FREISTAT_STATUS_HEADER_SIZE = 9         # Amount of int64 values of the header
+FREISTAT_STATUS_PATH_SIZE   = 4096      # Max. length of the export path in bytes
+STATUS_SEQUENCE             = 0         # Header position of the update counter
+STATUS_ERROR_CODE           = 1         # Header position of the error code of the experiment
+STATUS_SYSTEM_STATUS        = 2         # Header position of the system status (FREISTAT_EXP_X)
+STATUS_SAMPLES              = 3         # Header position of the amount of received samples
+STATUS_PARSE_ERRORS         = 4         # Header position of the amount of faulty telegrams
+STATUS_CYCLE                = 5         # Header position of the current cycle
+STATUS_TIMESTAMP            = 6         # Header position of the timestamp of the last sample (float64)
+STATUS_PATH_LENGTH          = 7         # Header position of the length of the export path
+STATUS_TERMINATE            = 8         # Header position of the flag requesting the termination of the experiment
+
+"""-----------------------------------------------------------------------------
+| Acquisition worker
+|
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+FREISTAT_WORKER_TIMEOUT = 5.0           # Max. time in s to wait for the acquisition worker to shut down
+
 """-----------------------------------------------------------------------------
 | Plotter
 |
@@ -363,6 +496,8 @@ EC_UTILITY              = 17000         # Errorcode for misc. functions
 |   
 |   Constant              Value                     Meaning
 -----------------------------------------------------------------------------"""
+EC_FA_WORKER_STOPPED    = 1             # Acquisition worker stopped before the experiment was completed
+EC_FA_WORKER_FAILED     = 2             # Experiment raised an exception in the acquisition worker
 
 """-----------------------------------------------------------------------------
 | Error Codes : Setup (SE)
@@ -397,6 +532,7 @@ EC_JP_CODEID_UNDEF      = 1             # Passed CodeID is undefiend
 |   
 |   Constant              Value                     Meaning
 -----------------------------------------------------------------------------"""
+EC_SC_BINARY_LENGTH     = 1             # Length of binary telegram doesn't match its header
 
 """-----------------------------------------------------------------------------
 | Error Codes : Data storage (DS)
@@ -0,0 +1,138 @@
+"""
+Module implementing a write-behind exporter, which streams the experiment data
+into csv files while the experiment is still running.
+
+Blocks of new samples are handed over as structured numpy arrays and are
+converted and written by a background thread, so the thread reading the
+telegrams only has to copy the samples.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Include dependencies
+import csv
+import queue
+import threading
+
+import numpy as np
+
+# Include internal dependencies
+from .compression import open_File
+
+class CSVExporter:
+    """
+    Description
+    -----------
+    Class which writes blocks of samples into csv files in a background thread.
+
+    """
+
+    def __init__(self) -> None:
+        """
+        Description
+        -----------
+        Constructor of class CSVExporter
+
+        """
+        # Initalize class variable
+        self._queueBlocks : queue.Queue = queue.Queue()
+        self._thread : threading.Thread = None
+        self._setFailed : set = set()
+
+    def write_Rows(self, strPath : str, listHeader : list,
+                   np_arrBlock : np.ndarray) -> None:
+        """
+        Description
+        -----------
+        Hand a block of samples to the background thread. The csv file is
+        created together with its header by the first block.
+
+        Parameters
+        ----------
+        `strPath` : str
+            Path of the csv file
+
+        `listHeader` : list
+            Header of the csv file
+
+        `np_arrBlock` : np.ndarray
+            Structured array containing the samples which should be written
+
+        """
+        # Start background thread with the first block
+        if (self._thread is None):
+            self._thread = threading.Thread(target= self._write_Files,
+                                            daemon= True)
+            self._thread.start()
+
+        self._queueBlocks.put((strPath, listHeader, np_arrBlock))
+
+    def close_File(self, strPath : str) -> bool:
+        """
+        Description
+        -----------
+        Close a csv file after all handed over blocks are written.
+
+        Parameters
+        ----------
+        `strPath` : str
+            Path of the csv file
+
+        Return
+        ------
+        `bSuccess` : bool
+            False if writing the csv file failed
+
+        """
+        if (self._thread is None):
+            return False
+
+        # Block until the file is closed
+        self._queueBlocks.put((strPath, None, None))
+        self._queueBlocks.join()
+
+        return strPath not in self._setFailed
+
+    def _write_Files(self) -> None:
+        """
+        Description
+        -----------
+        Method running in the background thread, which writes every handed
+        over block into its csv file.
+
+        """
+        # Initialize variables
+        dictFiles : dict = {}
+
+        while (True):
+            strPath, listHeader, np_arrBlock = self._queueBlocks.get()
+            try:
+                # Close file
+                if (np_arrBlock is None):
+                    if (strPath in dictFiles):
+                        dictFiles.pop(strPath)[0].close()
+
+                # Skip blocks of files which couldn't be written
+                elif (strPath not in self._setFailed):
+                    # Create file and write header line
+                    if (strPath not in dictFiles):
+                        csvFile = open_File(strPath, "w")
+                        dictFiles[strPath] = (csvFile, csv.writer(csvFile))
+                        dictFiles[strPath][1].writerow(listHeader)
+
+                    dictFiles[strPath][1].writerows(np_arrBlock.tolist())
+
+                    # Hand the rows to the file, compressed files collect
+                    # them until a block is full
+                    dictFiles[strPath][0].flush()
+            except OSError:
+                self._setFailed.add(strPath)
+            finally:
+                self._queueBlocks.task_done()
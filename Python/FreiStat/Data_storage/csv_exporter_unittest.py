@@ -0,0 +1,64 @@
+"""
+Module implementing different unittests for the csv_exporter module.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import os
+import tempfile
+import unittest
+
+# Import internal dependencies
+from .constants import *
+from .csv_exporter import CSVExporter
+from .data_storage import DataStorage
+
+class CSVExporter_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the class CSVExporter.
+
+    """
+    def test_write_Rows(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that blocks written in the background result in the
+        same csv file as writing all samples at the end.
+
+        """
+        # Test samples
+        _DataStorage = DataStorage()
+        _DataStorage.append_DataBatch([[1, iIndex, -200.5 + iIndex, 3.25,
+                                        120.0 + iIndex] for iIndex in range(7)])
+
+        with tempfile.TemporaryDirectory() as strDirectory:
+            strPath : str = os.path.join(strDirectory, "Test.csv")
+
+            # Create a test instance of the CSVExporter
+            _CSVExporter = CSVExporter()
+            _CSVExporter.write_Rows(strPath, FREISTAT_CV_LABEL,
+                                    _DataStorage.get_DataArray()[:4])
+            _CSVExporter.write_Rows(strPath, FREISTAT_CV_LABEL,
+                                    _DataStorage.get_DataArray(4))
+            self.assertTrue(_CSVExporter.close_File(strPath))
+
+            # Check results
+            with open(strPath, encoding="utf-8") as csvFile:
+                listLines = csvFile.read().splitlines()
+
+        self.assertEqual(listLines[0], ",".join(FREISTAT_CV_LABEL))
+        self.assertEqual(listLines[1:], [",".join(str(value) for value in
+            listSample) for listSample in _DataStorage.get_StoredData()])
+
+if __name__ == '__main__':
+    unittest.main()
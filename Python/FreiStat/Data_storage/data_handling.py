@@ -35,6 +35,8 @@ The data inside the pointed to data object can be accessed in different ways:
 
 `append_StoredData`         : Add new list of data to internal data list of the
                               data storage object.
+`append_StoredDataBatch`    : Add several lists of data at once to internal data
+                              list of the data storage object.
 `save_ExperimentParmeters`  : Save the experiment parameters in list format in
                               the data storage object.
 `save_ExperimentType`       : Save experiment type as string in data object.
@@ -48,12 +50,40 @@ The datahandling can also export the stored data in several forms:
 
 `export_ExperimentParameters_csv`   : Export experiment parameters as csv
 `export_Data_csv`                   : Export experiment data as csv
+`export_Data_binary`                : Export experiment data as .npy/.npz with
+                                      a JSON sidecar containing the metadata
+`export_JSON`                       : Export experiment data as newline-
+                                      delimited JSON
 `export_DataStorage`                : Export the data inside the datastorage
                                       object.
 
 `import_DataStorage`                : Import the data inside the datastorage
                                       object. 
 
+If the memory map is enabled in the data software storage, the data storage
+objects store their samples directly in memory-mapped files in the folder of
+the persistent data objects (see `setup_ExportFiles`) and aren't journaled.
+Otherwise every data storage object is persisted in an append-only journal. New
+samples are appended to the journal if they are older than 
+FREISTAT_JOURNAL_FLUSH_TIME or if more than FREISTAT_JOURNAL_FLUSH_SAMPLES are
+waiting. Calling `export_DataStorage` writes all waiting samples and
+synchronizes the journals to the disk.
+
+With the same policy the new samples are handed to a write-behind exporter,
+which streams them into the csv files of `export_Data_csv` while the experiment
+is running. Calling `export_Data_csv` at the end only writes the remaining
+samples and closes the file. If the JSON export is enabled in the data software
+storage, the new samples are also appended to the NDJSON files of
+`export_JSON`.
+
+If a compression is set in the data software storage, the journals, the csv 
+and NDJSON exports and the binary .npy export are compressed block wise (see
+compression module). The experiment parameters stay uncompressed.
+
+Every export records the current data object in the SQLite experiment catalog
+of the core data folder (see `get_ExperimentCatalog`), which can be queried for
+the exported experiments.
+
 """
 
 __author__ = "Mark Jasper"
@@ -66,16 +96,30 @@ __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 
 # Import dependencies
 import csv
-import glob
-import os
-import pickle
+import logging
+import sqlite3
 import time
 
 # Import internal dependencies
+from .binary_export import export_DataStorage_binary
+from .compression import get_CompressedPath, open_File
 from .constants import *
+from .csv_exporter import CSVExporter
+from .data_journal import DataJournal
+from .data_recovery import (
+    find_PersistentDataStorages,
+    get_RecoveryPath,
+    load_PersistentDataStorage,
+)
 from .data_software_storage import DataSoftwareStorage
 from .data_storage import DataStorage
 from .dictionaries import *
+from .experiment_catalog import ExperimentCatalog
+from .export_manager import ExportManager
+from .ndjson_export import generate_NDJSONHeader, generate_NDJSONRecords
+
+# Logger of the module
+_logger = logging.getLogger(__name__)
 
 
 class DataHandling:
@@ -110,8 +154,15 @@ class DataHandling:
         self._listDataObject: list = []
         self._currentDataObject: int = 0
 
-        self._baseDirectory: str = os.getcwd()
-        self._workingDirectory: list = ["", ""]
+        self._exportManager: ExportManager = ExportManager()
+        self._experimentCatalog: ExperimentCatalog = None
+
+        self._listJournals: list = []
+        self._listCSVExported: list = []
+        self._listJSONExported: list = []
+        self._csvExporter: CSVExporter = CSVExporter()
+        self._iJournalPending: int = 0
+        self._fJournalTime: float = time.monotonic()
 
     def create_DataObject(self) -> None:
         """
@@ -125,6 +176,9 @@ class DataHandling:
         """
         # Create data object and append it to the list
         self._listDataObject.append(DataStorage())
+        self._listJournals.append(None)
+        self._listCSVExported.append(0)
+        self._listJSONExported.append(-1)
 
         # Set reference to this new Data object
         self._currentDataObject = len(self._listDataObject) - 1
@@ -197,50 +251,41 @@ class DataHandling:
         Description
         -----------
         Setup for exporting stored data. This method creates all required
-        folders and saves the references to these subdictionaries.
+        folders and saves the references to these subdictionaries. The working
+        directory of the process isn't changed.
 
         """
-        # Initialize variables
-        strFolderName: str = ""
-
-        # Storing csv-files
-        # Create directory for storing all experiment data
-        self._create_WorkDirectory(FREISTAT_CSV_EXPORT, FREISTAT_CORE_DATA_FOLDER)
-
-        # Create sub directory for the current day (YEAR-MONTH-DAY)
-        strFolderName = time.strftime("%y_%m_%d")
-        self._create_WorkDirectory(FREISTAT_CSV_EXPORT, strFolderName)
-
-        # Create sub directory for the current experiment
-        # (HOUR-MINUTE-SECOND)
-        strFolderName = time.strftime("%H_%M_%S")
-        self._create_WorkDirectory(FREISTAT_CSV_EXPORT, strFolderName)
-
-        # Change back to back to base directory
-        os.chdir(self._baseDirectory)
-
-        # Storing object-files
-        # Create directory for storing the data storage object
-        self._create_WorkDirectory(FREISTAT_OBJECT_EXPORT, FREISTAT_CORE_OBJECT_FOLDER)
-
-        # Create sub directory for the current day (YEAR-MONTH-DAY)
-        strFolderName = time.strftime("%y_%m_%d")
-        self._create_WorkDirectory(FREISTAT_OBJECT_EXPORT, strFolderName)
-
-        # Create sub directory for the current experiment
-        # (HOUR-MINUTE-SECOND)
-        strFolderName = time.strftime("%H_%M_%S")
-        self._create_WorkDirectory(FREISTAT_OBJECT_EXPORT, strFolderName)
-
-        # Change back to back to base directory
-        os.chdir(self._baseDirectory)
+        # Create directories for the experiment data and the data objects
+        # (Measurements/YEAR_MONTH_DAY/HOUR_MINUTE_SECOND)
+        self._exportManager.setup_Directories()
+
+        # Check if data storage objects should be memory-mapped
+        if self._dataSoftwareStorage.get_MemoryMap() == True:
+            # Loop over every data object
+            for iIndex in range(len(self._listDataObject)):
+                if (
+                    self._listDataObject[iIndex].get_MemoryMap() == ""
+                    and self._listDataObject[iIndex].get_ExperimentType()
+                    != SEQUENCE
+                ):
+                    self._listDataObject[iIndex].enable_MemoryMap(
+                        str(
+                            self._exportManager.get_FilePath(
+                                FREISTAT_OBJECT_EXPORT,
+                                self._get_DataStorageName(iIndex)
+                                + FREISTAT_MEMMAP_EXTENSION,
+                            )
+                        )
+                    )
 
     def export_Data_csv(self, listStoredData: list) -> str:
         """
         Description
         -----------
         Exporting stored experiment data as a csv file at the previously defined
-        (`setup_ExportFiles()`) folder locations.
+        (`setup_ExportFiles()`) folder locations. If the data was already
+        streamed into the csv file during the experiment, only the remaining
+        samples are written.
 
         Parameters
         ----------
@@ -257,87 +302,93 @@ class DataHandling:
         # Initialize variables
         iErrorcode: int = 0
 
-        strExperimentType: str = ""
-
-        # Get current experiment type
-        strExperimentType = self._listDataObject[
-            self._currentDataObject
-        ].get_ExperimentType()
-
         # Check if setup was called
-        if self._workingDirectory[FREISTAT_CSV_EXPORT] == "":
+        if not self._exportManager.is_Setup(FREISTAT_CSV_EXPORT):
             iErrorcode = EC_DATASTORAGE + EC_DS_EXPORT_SETUP_ERR
             return str(iErrorcode)
 
-        # Change working directory
-        os.chdir(self._workingDirectory[FREISTAT_CSV_EXPORT])
-
         # Save export path
-        strExportPath = os.getcwd()
+        strExportPath = str(self._exportManager.get_Directory(FREISTAT_CSV_EXPORT))
+
+        # Check if the data was already streamed into the csv-file
+        if self._listCSVExported[self._currentDataObject] > 0:
+            # Write remaining samples and close the file
+            self._flush_CSVExports()
+            if self._csvExporter.close_File(
+                self._get_CSVPath(self._currentDataObject)
+            ):
+                self._update_Catalog(
+                    {"csv_file": self._get_CSVPath(self._currentDataObject)}
+                )
+                return strExportPath
 
         # Create csv-file
-        self._outputFile = (
-            FREISTAT_DATA
-            + "_"
-            + FREISTAT_SEQUENCE_POSITION
-            + str(self._currentDataObject)
-            + "_"
-            + strExperimentType
-            + ".csv"
-        )
+        self._outputFile = self._get_CSVPath(self._currentDataObject)
 
         # Open writer who is used to write into csv file
-        with open(self._outputFile, "w", newline="", encoding="utf-8") as csvFile:
+        with open_File(self._outputFile, "w") as csvFile:
             # Write header line
             writer = csv.writer(csvFile)
 
             # Check if there is data to write
-            if len(self.get_StoredData()) > 0:
-                # Check which electrochemical method should be exported
-                if (
-                    strExperimentType == LSV
-                    or strExperimentType == CV
-                    or strExperimentType == NPV
-                    or strExperimentType == SWV
-                    or strExperimentType == DPV
-                ):
-                    # Check if sequence or single method should be exported
-                    if len(self.get_StoredData()[0]) <= 5:
-                        # Write header in csv file
-                        writer.writerow(FREISTAT_CV_LABEL)
-                    else:
-                        # Write header in csv file
-                        writer.writerow(FREISTAT_CV_LABEL_SEQ)
-
-                    # Loop over every entry
-                    for iEntry in range(len(listStoredData)):
-                        # Write new row
-                        writer.writerow(listStoredData[iEntry])
-
-                elif strExperimentType == CA:
-                    # Check if sequence or single method should be exported
-                    if len(self.get_StoredData()[0]) <= 5:
-                        # Write header in csv file
-                        writer.writerow(FREISTAT_CA_LABEL)
-                    else:
-                        # Write header in csv file
-                        writer.writerow(FREISTAT_CA_LABEL_SEQ)
-
-                    # Loop over every entry
-                    for iEntry in range(len(listStoredData)):
-                        # Write new row
-                        writer.writerow(listStoredData[iEntry])
-                else:
-                    # Method not known
+            if len(listStoredData) > 0:
+                listHeader = self._get_CSVHeader(self._currentDataObject)
+
+                # Check if method is known
+                if listHeader is None:
                     iErrorcode = EC_DATASTORAGE + EC_DS_METHOD_UNKOWN
                     return str(iErrorcode)
 
-        # Close file writer
-        csvFile.close
+                # Write header in csv file
+                writer.writerow(listHeader)
+
+                # Write every entry
+                writer.writerows(listStoredData)
+
+        self._update_Catalog({"csv_file": str(self._outputFile)})
 
         # Return file-path location of the exported csv-file
         return strExportPath
 
+    def export_Data_binary(self, iBinaryExport: int = BINARY_EXPORT_NPY) -> str:
+        """
+        Description
+        -----------
+        Exporting stored experiment data of the current data object as typed
+        columns next to the csv file. The experiment type and parameters are
+        stored in a JSON sidecar. The export can be loaded again with
+        `load_DataStorage_binary`.
+
+        Parameters
+        ----------
+        `iBinaryExport` : int
+            Format of the export (BINARY_EXPORT_NPY or BINARY_EXPORT_NPZ)
+
+        Return
+        ------
+        `strExportPath` : string
+            Path of the exported data file
+
+        """
+        # Initialzie variables
+        iErrorcode: int = 0
+
+        # Check if setup was called
+        if not self._exportManager.is_Setup(FREISTAT_CSV_EXPORT):
+            iErrorcode = EC_DATASTORAGE + EC_DS_EXPORT_SETUP_ERR
+            return str(iErrorcode)
+
+        strExportPath = export_DataStorage_binary(
+            self._get_ExportPath(self._currentDataObject),
+            self._listDataObject[self._currentDataObject],
+            iBinaryExport,
+            self._dataSoftwareStorage.get_Compression(),
+        )
+
+        self._update_Catalog({"binary_file": strExportPath})
+
+        return strExportPath
+
     def export_ExperimentParameters_csv(
         self, strExperimentType: str, listStoredParameters: list
     ) -> None:
@@ -361,22 +412,20 @@ class DataHandling:
         iErrorcode: int = 0
 
         # Check if setup was called
-        if self._workingDirectory[FREISTAT_CSV_EXPORT] == "":
+        if not self._exportManager.is_Setup(FREISTAT_CSV_EXPORT):
             iErrorcode = EC_DATASTORAGE + EC_DS_EXPORT_SETUP_ERR
             return str(iErrorcode)
 
-        # Change working directory
-        os.chdir(self._workingDirectory[FREISTAT_CSV_EXPORT])
-
         # Create csv-file
-        self._outputFile = (
+        self._outputFile = self._exportManager.get_FilePath(
+            FREISTAT_CSV_EXPORT,
             FREISTAT_EXPERIMENT_PARAMETERS
             + "_"
             + FREISTAT_SEQUENCE_POSITION
             + str(self._currentDataObject)
             + "_"
             + strExperimentType
-            + ".csv"
+            + ".csv",
         )
 
         # Write header line
@@ -398,88 +447,404 @@ class DataHandling:
         # Close file
         csvFile.close
 
-    def _create_WorkDirectory(self, iDirectorySelect: int, strName: str):
+        self._update_Catalog(
+            {"parameters_file": str(self._outputFile)}, listStoredParameters
+        )
+
+    def export_JSON(self) -> str:
         """
         Description
         -----------
-        Helper method for checking and creating working directory to store csv
-        and object files. This method is called by `setup_ExportFiles()` and
-        doesn't need to be accessed from outside this class.
+        Exporting stored experiment data of the current data object as a
+        newline-delimited JSON file next to the csv file. The method can be
+        called at any time, every call only appends the samples which aren't
+        exported yet.
+
+        Return
+        ------
+        `strExportPath` : string
+            Path of the NDJSON file
+
+        """
+        # Initialzie variables
+        iErrorcode: int = 0
+
+        # Check if setup was called
+        if not self._exportManager.is_Setup(FREISTAT_CSV_EXPORT):
+            iErrorcode = EC_DATASTORAGE + EC_DS_EXPORT_SETUP_ERR
+            return str(iErrorcode)
+
+        strExportPath = self._write_JSONExport(self._currentDataObject)
+
+        self._update_Catalog({"json_file": strExportPath})
+
+        return strExportPath
+
+    def _write_JSONExport(self, iIndex: int) -> str:
+        """
+        Description
+        -----------
+        Append all samples of a data storage object, which aren't exported
+        yet, to its NDJSON file. The header record is written when the file is
+        created.
 
         Parameters
         ----------
-        `iDirectorySelect` : int
-            Integer determinating if path of persisent data objects or
-            measurements should be chosen.
+        `iIndex` : int
+            Position of the data storage object in the sequence
 
-        `strName` : str
-            Name of the folder of the working directory
+        Return
+        ------
+        `strPath` : string
+            Path of the NDJSON file
+
+        """
+        # Initialize variables
+        dataStorage: DataStorage = self._listDataObject[iIndex]
+        strPath: str = get_CompressedPath(
+            self._get_ExportPath(iIndex) + FREISTAT_NDJSON_EXTENSION,
+            self._dataSoftwareStorage.get_Compression(),
+        )
+
+        # Create file with the header record
+        if self._listJSONExported[iIndex] == -1:
+            with open_File(strPath, "w") as jsonFile:
+                jsonFile.write(generate_NDJSONHeader(dataStorage))
+            self._listJSONExported[iIndex] = 0
 
+        # Append new records
+        with open_File(strPath, "a") as jsonFile:
+            jsonFile.writelines(
+                generate_NDJSONRecords(dataStorage, self._listJSONExported[iIndex])
+            )
+        self._listJSONExported[iIndex] = dataStorage.get_DataLength()
+
+        return strPath
+
+    def _update_Catalog(
+        self, dictColumns: dict, listExperimentParameters: list = None
+    ) -> None:
         """
-        # Check if work directory is already created
-        self._workingDirectory[iDirectorySelect] = os.getcwd()
-        if not os.path.exists(strName):
-            # If folder doesn't exist, create it
-            os.mkdir(strName)
+        Description
+        -----------
+        Record the current data object in the experiment catalog of the core
+        data folder. Besides the given columns the method, start and end time,
+        sample count and path of the persistent data object are updated.
 
-        # Change working directory to new folder
-        self._workingDirectory[iDirectorySelect] = os.path.join(
-            self._workingDirectory[iDirectorySelect], strName
+        Parameters
+        ----------
+        `dictColumns` : dict
+            Columns of the catalog entry which should be updated
+
+        `listExperimentParameters` : list
+            Experiment parameters of the data object
+
+        """
+        # Initialize variables
+        dataStorage: DataStorage = self._listDataObject[self._currentDataObject]
+        strName: str = self._get_DataStorageName(self._currentDataObject)
+
+        if dataStorage.get_MemoryMap() != "":
+            strName += FREISTAT_MEMMAP_EXTENSION
+        else:
+            strName = get_CompressedPath(
+                strName + FREISTAT_JOURNAL_EXTENSION,
+                self._dataSoftwareStorage.get_Compression(),
+            )
+
+        dictColumns.update(
+            {
+                "method": dataStorage.get_ExperimentType(),
+                "start_time": self._exportManager.get_StartTime(),
+                "end_time": time.time(),
+                "samples": dataStorage.get_DataLength(),
+                "object_path": str(
+                    self._exportManager.get_FilePath(FREISTAT_OBJECT_EXPORT, strName)
+                ),
+            }
         )
-        os.chdir(self._workingDirectory[iDirectorySelect])
 
-    def export_JSON(self) -> None:
+        # The catalog is optional, a failing update mustn't stop the export
+        try:
+            self.get_ExperimentCatalog().update_Experiment(
+                str(self._exportManager.get_Directory(FREISTAT_CSV_EXPORT)),
+                self._currentDataObject,
+                dictColumns,
+                listExperimentParameters,
+            )
+        except sqlite3.Error as error:
+            _logger.warning("Experiment catalog couldn't be updated: %s", error)
+
+    def get_ExperimentCatalog(self) -> ExperimentCatalog:
         """
         Description
         -----------
-        Exporting stored experiment data as a JSON file
+        Get the experiment catalog of the core data folder.
+
+        Return
+        ------
+        `experimentCatalog` : ExperimentCatalog
+            Experiment catalog, which can be queried with `query_Experiments`
 
         """
-        # TODO planned feature
+        if self._experimentCatalog is None:
+            self._experimentCatalog = ExperimentCatalog(
+                str(
+                    self._exportManager.get_CoreDirectory(FREISTAT_CSV_EXPORT)
+                    / FREISTAT_CATALOG
+                )
+            )
+        return self._experimentCatalog
 
     def export_DataStorage(self) -> None:
         """
         Description
         -----------
         Exporting data storage object to ensure data persistence in case of a
-        software crash.
+        software crash. All samples which aren't written yet are appended to
+        the journals of the data storage objects and the journals are
+        synchronized to the disk.
 
         """
-        # Initialzie variables
-        iErrorcode: int = 0
+        self._flush_Journals(True)
+
+    def _flush_Journals(self, bSync: bool = False) -> None:
+        """
+        Description
+        -----------
+        Append the new samples of every data storage object to its journal.
 
+        Parameters
+        ----------
+        `bSync` : bool
+            Flag indicating if the journals should be synchronized to the disk
+
+        """
         # Check if setup was called
-        if self._workingDirectory[FREISTAT_CSV_EXPORT] == "":
-            iErrorcode = EC_DATASTORAGE + EC_DS_EXPORT_SETUP_ERR
-            # TODO return value
+        if not self._exportManager.is_Setup(FREISTAT_OBJECT_EXPORT):
+            return
+
+        # Loop over every data object
+        for iIndex in range(len(self._listDataObject)):
+            # Memory-mapped data objects are already persistent
+            if self._listDataObject[iIndex].get_MemoryMap() != "":
+                if bSync == True:
+                    self._listDataObject[iIndex].flush_MemoryMap()
+                continue
+
+            # Create journal with the first samples
+            if self._listJournals[iIndex] is None:
+                if self._listDataObject[iIndex].get_DataLength() == 0:
+                    continue
+
+                self._listJournals[iIndex] = DataJournal(
+                    str(
+                        self._exportManager.get_FilePath(
+                            FREISTAT_OBJECT_EXPORT,
+                            get_CompressedPath(
+                                self._get_DataStorageName(iIndex)
+                                + FREISTAT_JOURNAL_EXTENSION,
+                                self._dataSoftwareStorage.get_Compression(),
+                            ),
+                        )
+                    )
+                )
 
-        # Change working directory
-        os.chdir(self._workingDirectory[FREISTAT_OBJECT_EXPORT])
+            self._listJournals[iIndex].flush(self._listDataObject[iIndex], bSync)
 
-        # Get current experiment type
-        strExperimentType = self._listDataObject[
-            self._currentDataObject
-        ].get_ExperimentType()
+        # Restart flush policy
+        self._iJournalPending = 0
+        self._fJournalTime = time.monotonic()
 
-        # Overwrite existing external object with newest iteration
-        with open(
+    def _get_DataStorageName(self, iIndex: int) -> str:
+        """
+        Description
+        -----------
+        Get file name of the persistent data storage object.
+
+        Parameters
+        ----------
+        `iIndex` : int
+            Position of the data storage object in the sequence
+
+        Return
+        ------
+        `strName` : str
+            File name without extension
+
+        """
+        return (
             FREISTAT_DATA_STORAGE
             + "_"
             + FREISTAT_SEQUENCE_POSITION
-            + str(self._currentDataObject)
+            + str(iIndex)
             + "_"
-            + strExperimentType,
-            "wb",
-        ) as output:
-            # Write data object as data file into the chosen directory.
-            pickle.dump(
-                self._listDataObject[self._currentDataObject].get_StoredData(),
-                output,
-                pickle.HIGHEST_PROTOCOL,
-            )
+            + self._listDataObject[iIndex].get_ExperimentType()
+        )
+
+    def _check_FlushPolicy(self, iSamples: int) -> None:
+        """
+        Description
+        -----------
+        Count newly stored samples and hand them to the journals and the csv
+        export if too many samples are waiting or if the last flush is too 
+        long ago.
+
+        Parameters
+        ----------
+        `iSamples` : int
+            Amount of newly stored samples
+
+        """
+        self._iJournalPending += iSamples
+
+        if (
+            self._iJournalPending >= FREISTAT_JOURNAL_FLUSH_SAMPLES
+            or time.monotonic() - self._fJournalTime >= FREISTAT_JOURNAL_FLUSH_TIME
+        ):
+            self._flush_CSVExports()
+            self._flush_Journals()
+
+            # Append new samples to the NDJSON files
+            if (
+                self._dataSoftwareStorage.get_JSONExport() == True
+                and self._exportManager.is_Setup(FREISTAT_CSV_EXPORT)
+            ):
+                for iIndex in range(len(self._listDataObject)):
+                    if self._listDataObject[iIndex].get_DataLength() > 0:
+                        self._write_JSONExport(iIndex)
+
+    def _flush_CSVExports(self) -> None:
+        """
+        Description
+        -----------
+        Hand the new samples of every data storage object, which can be
+        exported as csv, to the write-behind exporter.
+
+        """
+        # Check if setup was called
+        if not self._exportManager.is_Setup(FREISTAT_CSV_EXPORT):
+            return
+
+        # Loop over every data object
+        for iIndex in range(len(self._listDataObject)):
+            # Initialize variables
+            iExported: int = self._listCSVExported[iIndex]
+
+            # Check if there are new samples and if the method is exported
+            listHeader = self._get_CSVHeader(iIndex)
+            if (
+                listHeader is None
+                or self._listDataObject[iIndex].get_DataLength() <= iExported
+            ):
+                continue
+
+            # Hand over views of the stored blocks, stored samples don't change
+            for np_arrBlock in self._listDataObject[iIndex].get_DataBlocks(
+                iExported
+            ):
+                self._csvExporter.write_Rows(
+                    self._get_CSVPath(iIndex), listHeader, np_arrBlock
+                )
+                self._listCSVExported[iIndex] += len(np_arrBlock)
+
+    def _get_CSVHeader(self, iIndex: int) -> list:
+        """
+        Description
+        -----------
+        Get header of the csv export of a data storage object.
+
+        Parameters
+        ----------
+        `iIndex` : int
+            Position of the data storage object in the sequence
+
+        Return
+        ------
+        `listHeader` : list
+            Header line or None if the electrochemical method isn't exported
+
+        """
+        # Initialize variables
+        strExperimentType: str = self._listDataObject[iIndex].get_ExperimentType()
+        bSequence: bool = (
+            len(self._listDataObject[iIndex].get_ColumnLabels()) > 5
+        )
+
+        # Check which electrochemical method should be exported
+        if (
+            strExperimentType == LSV
+            or strExperimentType == CV
+            or strExperimentType == NPV
+            or strExperimentType == SWV
+            or strExperimentType == DPV
+        ):
+            # Check if sequence or single method should be exported
+            if bSequence:
+                return FREISTAT_CV_LABEL_SEQ
+            return FREISTAT_CV_LABEL
+
+        elif strExperimentType == CA:
+            # Check if sequence or single method should be exported
+            if bSequence:
+                return FREISTAT_CA_LABEL_SEQ
+            return FREISTAT_CA_LABEL
+
+        # Method not known
+        return None
+
+    def _get_CSVPath(self, iIndex: int) -> str:
+        """
+        Description
+        -----------
+        Get path of the csv export of a data storage object.
+
+        Parameters
+        ----------
+        `iIndex` : int
+            Position of the data storage object in the sequence
+
+        Return
+        ------
+        `strPath` : str
+            Path of the csv-file, including the file extension of the
+            compression
+
+        """
+        return get_CompressedPath(
+            self._get_ExportPath(iIndex) + ".csv",
+            self._dataSoftwareStorage.get_Compression(),
+        )
 
-        # Close output writer
-        output.close
+    def _get_ExportPath(self, iIndex: int) -> str:
+        """
+        Description
+        -----------
+        Get path of the exports of a data storage object without file
+        extension.
+
+        Parameters
+        ----------
+        `iIndex` : int
+            Position of the data storage object in the sequence
+
+        Return
+        ------
+        `strPath` : str
+            Path of the exports without file extension
+
+        """
+        return str(
+            self._exportManager.get_FilePath(
+                FREISTAT_CSV_EXPORT,
+                FREISTAT_DATA
+                + "_"
+                + FREISTAT_SEQUENCE_POSITION
+                + str(iIndex)
+                + "_"
+                + self._listDataObject[iIndex].get_ExperimentType(),
+            )
+        )
 
     def import_DataStorage(self, strPath: str) -> None:
         """
@@ -493,18 +858,17 @@ class DataHandling:
         `strPath` : string
             String containg path to the data which should be imported.
 
-        TODO 01.09.2021 -> changed export need to change import as well:
-        "note : load loop until EOFERROR"
+        Journals are replayed up to the last complete segment, memory-mapped
+        data storage objects are opened read only. Data storage objects
+        exported by older versions are loaded as pickle.
 
         """
         # Initialzie variables
         listData: list = []
 
-        # Change working directory
-        os.chdir(strPath)
-
-        # Get all files in the folder
-        listData = glob.glob(FREISTAT_DATA_STORAGE + "*")
+        # Get all journals, memory-mapped data storage objects and data storage
+        # objects of older versions
+        listData = find_PersistentDataStorages(strPath)
 
         print(listData)
 
@@ -514,17 +878,15 @@ class DataHandling:
             self.create_DataObject()
 
             # Fill new datastorage with the external data
-            with open(listData[iIndex], "rb") as input:
-                self._listDataObject[self._currentDataObject].set_StoredData(
-                    pickle.load(input)
-                )
-
-            # Close input reader
-            input.close
+            self._listDataObject[self._currentDataObject] = \
+                load_PersistentDataStorage(listData[iIndex])
 
             # Export data as csv
             with open(
-                listData[iIndex] + "_recovery.csv", "w", newline="", encoding="utf-8"
+                get_RecoveryPath(listData[iIndex]),
+                "w",
+                newline="",
+                encoding="utf-8",
             ) as csvFile:
                 # Write header line
                 writer = csv.writer(csvFile)
@@ -532,10 +894,8 @@ class DataHandling:
                 listStoredData = self._listDataObject[
                     self._currentDataObject
                 ].get_StoredData()
-                # Loop over every entry
-                for iEntry in range(len(listStoredData)):
-                    # Write new row
-                    writer.writerow(listStoredData[iEntry])
+                # Write every entry
+                writer.writerows(listStoredData)
 
     def append_StoredData(self, listTemp: list) -> None:
         """
@@ -551,6 +911,25 @@ class DataHandling:
         """
         # Add list of data to the current referenced data object
         self._listDataObject[self._currentDataObject].append_Data(listTemp)
+        self._check_FlushPolicy(1)
+
+    def append_StoredDataBatch(self, listBatch: list) -> None:
+        """
+        Description
+        -----------
+        Append current data object with a batch of arbitrary lists of data.
+
+        Parameters
+        ----------
+        `listBatch` : list
+            List of lists with new data which should be appended to the 
+            existing data
+
+        """
+        # Add all lists of data to the current referenced data object
+        self._listDataObject[self._currentDataObject].append_DataBatch(
+            listBatch)
+        self._check_FlushPolicy(len(listBatch))
 
     def save_ExperimentParmeters(self, listExperimentParameters: list) -> None:
         """
@@ -597,13 +976,76 @@ class DataHandling:
 
         Return
         ------
-        `listStoredData` : list
-            List containing all data currently stored in the currently
+        `listStoredData` : StoredDataView
+            Lazy view containing all data currently stored in the currently
             referenced data storage object
 
         """
         return self._listDataObject[self._currentDataObject].get_StoredData()
 
+    def get_DataArray(self):
+        """
+        Description
+        -----------
+        Read all samples of the currently referenced data object as one
+        structured numpy array.
+
+        Return
+        ------
+        `np_arrData` : np.ndarray
+            Structured array whose fields are the columns of the currently
+            referenced data storage object
+
+        """
+        return self._listDataObject[self._currentDataObject].get_DataArray()
+
+    def get_Column(self, column):
+        """
+        Description
+        -----------
+        Read one column of the currently referenced data object.
+
+        Parameters
+        ----------
+        `column` : int | str
+            Index or label (e.g. DE_TAG_VOLTAGE) of the column
+
+        Return
+        ------
+        `np_arrColumn` : np.ndarray
+            Array containing the values of the column for every sample
+
+        """
+        return self._listDataObject[self._currentDataObject].get_Column(column)
+
+    def get_DataWindow(self, fStartTime: float, fEndTime: float, iPoints: int):
+        """
+        Description
+        -----------
+        Read a time window of the currently referenced data object decimated
+        to at most `iPoints` points, e.g. for plotting a long experiment.
+
+        Parameters
+        ----------
+        `fStartTime` : float
+            Start of the window in ms
+
+        `fEndTime` : float
+            End of the window in ms
+
+        `iPoints` : int
+            Target amount of points
+
+        Return
+        ------
+        `tupleWindow` : tuple
+            Minimum, maximum and mean of every column for every point
+
+        """
+        return self._listDataObject[self._currentDataObject].get_DataWindow(
+            fStartTime, fEndTime, iPoints
+        )
+
     def get_ExperimentParameters(self) -> list:
         """
         Description
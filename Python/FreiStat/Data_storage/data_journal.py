@@ -0,0 +1,207 @@
+"""
+Module implementing an append-only journal, which stores the experiment data of
+one data storage object persistent in case of a software crash.
+
+Instead of rewriting all stored samples, only the samples which were added
+since the last flush are appended as length-prefixed binary segment:
+
+| Segment type (uint8) | Payload length (uint32) | Payload |
+
+The first segment of every journal contains the column layout of the data
+storage object encoded as JSON, all following segments contain raw samples in
+this layout. A segment which is cut off by a crash is ignored when the journal
+is replayed.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Include dependencies
+import json
+import os
+import struct
+import time
+
+import numpy as np
+
+# Include internal dependencies
+from .compression import compress_Block, get_Compression, read_File
+from .constants import *
+from .data_storage import DataStorage
+
+class DataJournal:
+    """
+    Description
+    -----------
+    Class which appends the new samples of one data storage object to its
+    journal file.
+
+    """
+
+    def __init__(self, strPath : str) -> None:
+        """
+        Description
+        -----------
+        Constructor of class DataJournal
+
+        Parameters
+        ----------
+        `strPath` : str
+            Path of the journal file. If its file extension encodes a
+            compression (e.g. .journal.gz), every flush is appended as
+            compressed block.
+
+        """
+        # Initalize class variable
+        self._strPath : str = strPath
+        self._strCompression : str = get_Compression(strPath)
+        self._iFlushedLength : int = 0
+        self._fSyncTime : float = time.monotonic()
+        self._bCreated : bool = False
+
+    def flush(self, dataStorage : DataStorage, bSync : bool = False) -> int:
+        """
+        Description
+        -----------
+        Append all samples of the data storage object which aren't written yet
+        to the journal. The journal is synchronized to the disk if `bSync` is
+        set or if the last synchronization is longer ago than
+        FREISTAT_JOURNAL_SYNC_TIME.
+
+        Parameters
+        ----------
+        `dataStorage` : DataStorage
+            Data storage object whose samples should be written
+
+        `bSync` : bool
+            Flag indicating if the journal should be synchronized to the disk
+
+        Return
+        ------
+        `iWritten` : int
+            Amount of written samples
+
+        """
+        # Initialize variables
+        iWritten : int = dataStorage.get_DataLength() - self._iFlushedLength
+
+        # Check if there are new samples
+        if (iWritten <= 0):
+            return 0
+
+        np_arrSamples = dataStorage.get_DataArray(self._iFlushedLength)
+        bSegments : bytes = b""
+
+        # Write column layout in front of the first samples
+        if (self._bCreated == False):
+            bSegments = self._get_Segment(JOURNAL_SEGMENT_LAYOUT,
+                json.dumps(np_arrSamples.dtype.descr).encode("utf-8"))
+
+        bSegments += self._get_Segment(JOURNAL_SEGMENT_SAMPLES,
+                                       np_arrSamples.tobytes())
+
+        with open(self._strPath, "ab" if self._bCreated else "wb") as output:
+            # Every flush is appended as one compressed block
+            output.write(compress_Block(self._strCompression, bSegments))
+            output.flush()
+            self._bCreated = True
+
+            # Synchronize periodically to the disk
+            if (bSync or
+                time.monotonic() - self._fSyncTime >= FREISTAT_JOURNAL_SYNC_TIME):
+                os.fsync(output.fileno())
+                self._fSyncTime = time.monotonic()
+
+        self._iFlushedLength += iWritten
+        return iWritten
+
+    def _get_Segment(self, iSegmentType : int, bPayload : bytes) -> bytes:
+        """
+        Description
+        -----------
+        Create one length-prefixed segment of the journal.
+
+        Parameters
+        ----------
+        `iSegmentType` : int
+            Type of the segment (JOURNAL_SEGMENT_X)
+
+        `bPayload` : bytes
+            Payload of the segment
+
+        Return
+        ------
+        `bSegment` : bytes
+            Header and payload of the segment
+
+        """
+        return struct.pack(JOURNAL_SEGMENT_HEADER, iSegmentType,
+                           len(bPayload)) + bPayload
+
+    def get_Path(self) -> str:
+        """
+        Description
+        -----------
+        Get path of the journal file.
+
+        Return
+        ------
+        `strPath` : str
+            Path of the journal file
+
+        """
+        return self._strPath
+
+
+def replay_DataJournal(strPath : str) -> np.ndarray:
+    """
+    Description
+    -----------
+    Read all complete segments of a journal and return the stored samples.
+
+    Parameters
+    ----------
+    `strPath` : str
+        Path of the journal file
+
+    Return
+    ------
+    `np_arrData` : np.ndarray
+        Structured array containing all samples of the journal
+
+    """
+    # Initialize variables
+    iHeaderSize : int = struct.calcsize(JOURNAL_SEGMENT_HEADER)
+    dtypeSamples : np.dtype = np.dtype(FREISTAT_STORAGE_FLOAT_TYPE)
+    listSegments : list = []
+
+    # Decompress all complete blocks of compressed journals
+    bJournal : bytes = read_File(strPath)
+
+    iPosition : int = 0
+    while (iPosition + iHeaderSize <= len(bJournal)):
+        iSegmentType, iLength = struct.unpack_from(JOURNAL_SEGMENT_HEADER,
+                                                   bJournal, iPosition)
+        iPosition += iHeaderSize
+
+        # Stop at a segment which was cut off
+        if (iPosition + iLength > len(bJournal)):
+            break
+
+        if (iSegmentType == JOURNAL_SEGMENT_LAYOUT):
+            dtypeSamples = np.dtype([tuple(listField) for listField in
+                json.loads(bJournal[iPosition:iPosition + iLength])])
+        elif (iSegmentType == JOURNAL_SEGMENT_SAMPLES):
+            listSegments.append(np.frombuffer(bJournal, dtype= dtypeSamples,
+                count= iLength // dtypeSamples.itemsize, offset= iPosition))
+        iPosition += iLength
+
+    if (len(listSegments) == 0):
+        return np.empty(0, dtype= dtypeSamples)
+    return np.concatenate(listSegments)
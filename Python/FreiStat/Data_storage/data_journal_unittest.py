@@ -0,0 +1,71 @@
+"""
+Module implementing different unittests for the data_journal module.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import os
+import tempfile
+import unittest
+
+# Import internal dependencies
+from .data_journal import DataJournal, replay_DataJournal
+from .data_storage import DataStorage
+
+class DataJournal_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the class DataJournal.
+
+    """
+    def test_replay_DataJournal(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that only new samples are appended and that a
+        journal cut off by a crash is replayed up to the last complete segment.
+
+        """
+        # Test samples
+        listTest : list = [[1, iIndex, -200.5 + iIndex, 3.25, 120.0 + iIndex]
+                           for iIndex in range(10)]
+
+        with tempfile.TemporaryDirectory() as strDirectory:
+            strPath : str = os.path.join(strDirectory, "Test.journal")
+
+            # Create a test instance of the DataJournal
+            _DataStorage = DataStorage()
+            _DataJournal = DataJournal(strPath)
+
+            # Flush samples in two segments
+            _DataStorage.append_DataBatch(listTest[:6])
+            self.assertEqual(_DataJournal.flush(_DataStorage), 6)
+            self.assertEqual(_DataJournal.flush(_DataStorage), 0)
+            _DataStorage.append_DataBatch(listTest[6:])
+            self.assertEqual(_DataJournal.flush(_DataStorage, True), 4)
+
+            # Check results
+            _DataStorageReplayed = DataStorage()
+            _DataStorageReplayed.set_StoredData(replay_DataJournal(strPath))
+            self.assertEqual(list(_DataStorageReplayed.get_StoredData()),
+                             listTest)
+
+            # Cut off the last segment
+            with open(strPath, "r+b") as journal:
+                journal.truncate(os.path.getsize(strPath) - 3)
+
+            _DataStorageReplayed.set_StoredData(replay_DataJournal(strPath))
+            self.assertEqual(list(_DataStorageReplayed.get_StoredData()),
+                             listTest[:6])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,208 @@
+"""
+Module implementing the functions which load persistent data storage objects
+and export them as recovery csv files.
+
+The following persistent formats are supported:
+
+Journal                 : `Data_Storage_Object_SP0_CV.journal`
+Memory-mapped folder    : `Data_Storage_Object_SP0_CV.mmap`
+Pickle (older versions) : `Data_Storage_Object_SP0_CV`
+
+Journals and pickles can be compressed (e.g. `Data_Storage_Object_SP0_CV.journal.gz`,
+see compression module), they are decompressed transparently.
+
+The recovery csv file is stored next to the persistent data storage object
+(`Data_Storage_Object_SP0_CV_recovery.csv`). All functions are defined on
+module level, so they can be executed in a process pool.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Include dependencies
+import csv
+import os
+import pickle
+from pathlib import Path
+
+# Include internal dependencies
+from .compression import read_File, remove_CompressionExtension
+from .constants import *
+from .data_journal import replay_DataJournal
+from .data_storage import DataStorage
+
+def find_PersistentDataStorages(strPath : str, bRecursive : bool = False
+                                ) -> list:
+    """
+    Description
+    -----------
+    Find all persistent data storage objects in a folder. Recovery csv files
+    and temporary files of an interrupted recovery are skipped.
+
+    Parameters
+    ----------
+    `strPath` : str
+        Path of the folder
+
+    `bRecursive` : bool
+        Flag indicating if all sub folders should be searched as well
+
+    Return
+    ------
+    `listPaths` : list
+        Sorted list containing the paths of the persistent data storage
+        objects
+
+    """
+    # Initialize variables
+    pathFolder : Path = Path(strPath).resolve()
+
+    if (bRecursive):
+        iteratorPaths = pathFolder.rglob(FREISTAT_DATA_STORAGE + "*")
+    else:
+        iteratorPaths = pathFolder.glob(FREISTAT_DATA_STORAGE + "*")
+
+    return [str(pathFile) for pathFile in sorted(iteratorPaths)
+            if Path(remove_CompressionExtension(pathFile.name)).suffix in
+            ["", FREISTAT_JOURNAL_EXTENSION, FREISTAT_MEMMAP_EXTENSION]]
+
+def load_PersistentDataStorage(strPath : str) -> DataStorage:
+    """
+    Description
+    -----------
+    Load a persistent data storage object.
+
+    Parameters
+    ----------
+    `strPath` : str
+        Path of the journal, memory-mapped folder or pickle, which is
+        decompressed if its file extension encodes a compression
+
+    Return
+    ------
+    `dataStorage` : DataStorage
+        Data storage object containing the recovered samples
+
+    """
+    # Initialize variables
+    dataStorage : DataStorage = DataStorage()
+    strUncompressedPath : str = remove_CompressionExtension(strPath)
+
+    if (strUncompressedPath.endswith(FREISTAT_JOURNAL_EXTENSION)):
+        # Replay journal
+        dataStorage.set_StoredData(replay_DataJournal(strPath))
+    elif (strUncompressedPath.endswith(FREISTAT_MEMMAP_EXTENSION)):
+        # Open memory-mapped files read only
+        dataStorage.open_MemoryMap(strPath)
+    else:
+        dataStorage.set_StoredData(pickle.loads(read_File(strPath)))
+
+    return dataStorage
+
+def get_RecoveryPath(strPath : str) -> str:
+    """
+    Description
+    -----------
+    Get path of the recovery csv file of a persistent data storage object.
+
+    Parameters
+    ----------
+    `strPath` : str
+        Path of the persistent data storage object
+
+    Return
+    ------
+    `strRecoveryPath` : str
+        Path of the recovery csv file
+
+    """
+    strPath = remove_CompressionExtension(strPath)
+
+    for strExtension in [FREISTAT_JOURNAL_EXTENSION, FREISTAT_MEMMAP_EXTENSION]:
+        if (strPath.endswith(strExtension)):
+            strPath = strPath[:-len(strExtension)]
+
+    return strPath + "_recovery.csv"
+
+def get_FileState(strPath : str) -> list:
+    """
+    Description
+    -----------
+    Get modification time and size of a persistent data storage object. For
+    memory-mapped folders the newest modification time and the total size of
+    all files are used.
+
+    Parameters
+    ----------
+    `strPath` : str
+        Path of the persistent data storage object
+
+    Return
+    ------
+    `listState` : list
+        [Modification time in ns (int), Size in bytes (int)]
+
+    """
+    # Initialize variables
+    pathFile : Path = Path(strPath)
+
+    if (pathFile.is_dir()):
+        listStats : list = [pathChild.stat() for pathChild in
+                            pathFile.iterdir() if pathChild.is_file()]
+        return [max([stat.st_mtime_ns for stat in listStats], default= 0),
+                sum([stat.st_size for stat in listStats])]
+
+    stat = pathFile.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+def recover_PersistentDataStorage(strPath : str) -> list:
+    """
+    Description
+    -----------
+    Load a persistent data storage object and export it as recovery csv file.
+    The csv file is written under a temporary name and renamed afterwards, so
+    an interrupted recovery never leaves an incomplete csv file behind. The
+    temporary file is removed if the recovery fails.
+
+    Parameters
+    ----------
+    `strPath` : str
+        Path of the persistent data storage object
+
+    Return
+    ------
+    `listResult` : list
+        [Path of the persistent data storage object (str), State of the
+        persistent data storage object (list), Path of the recovery csv file
+        (str), Amount of recovered samples (int)]
+
+    """
+    # Initialize variables
+    listState : list = get_FileState(strPath)
+    strRecoveryPath : str = get_RecoveryPath(strPath)
+    strTemporaryPath : str = strRecoveryPath + ".tmp"
+
+    dataStorage : DataStorage = load_PersistentDataStorage(strPath)
+
+    try:
+        # Export data as csv
+        with open(strTemporaryPath, "w", newline="",
+                  encoding="utf-8") as csvFile:
+            writer = csv.writer(csvFile)
+
+            # Write every entry
+            writer.writerows(dataStorage.get_StoredData())
+
+        os.replace(strTemporaryPath, strRecoveryPath)
+    finally:
+        # Remove incomplete csv file of a failed recovery
+        if (os.path.isfile(strTemporaryPath)):
+            os.remove(strTemporaryPath)
+
+    return [strPath, listState, strRecoveryPath, dataStorage.get_DataLength()]
@@ -0,0 +1,144 @@
+"""
+Module implementing different unittests for the recovery of persistent data
+storage objects.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import csv
+import os
+import pickle
+import tempfile
+import unittest
+
+# Import internal dependencies
+from .constants import *
+from .data_journal import DataJournal
+from .data_recovery import (find_PersistentDataStorages, get_FileState,
+                            get_RecoveryPath, recover_PersistentDataStorage)
+from .data_storage import DataStorage
+from ..Utility.recovery import Recovery_Data
+
+class DataRecovery_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the recovery of persistent
+    data storage objects.
+
+    """
+    # Test samples
+    _listTest : list = [[1, iIndex, -200.5 + iIndex, 3.25, 120.0 + iIndex]
+                        for iIndex in range(10)]
+
+    def _create_DataStorages(self, strDirectory : str) -> list:
+        """
+        Description
+        -----------
+        Create a journal, a memory-mapped folder and a pickle in different
+        experiment folders and a temporary file of an interrupted recovery.
+
+        """
+        # Initialize variables
+        listPaths : list = [
+            os.path.join(strDirectory, "A", FREISTAT_DATA_STORAGE + "_SP0_CV" +
+                         FREISTAT_JOURNAL_EXTENSION),
+            os.path.join(strDirectory, "B", FREISTAT_DATA_STORAGE + "_SP0_LSV" +
+                         FREISTAT_MEMMAP_EXTENSION),
+            os.path.join(strDirectory, "C", FREISTAT_DATA_STORAGE + "_SP0_CA")]
+
+        for strPath in listPaths:
+            os.makedirs(os.path.dirname(strPath))
+
+        # Journal
+        _DataStorage = DataStorage()
+        _DataStorage.append_DataBatch(self._listTest)
+        DataJournal(listPaths[0]).flush(_DataStorage, True)
+
+        # Memory-mapped folder
+        _DataStorage = DataStorage()
+        _DataStorage.enable_MemoryMap(listPaths[1])
+        _DataStorage.append_DataBatch(self._listTest)
+        _DataStorage.flush_MemoryMap()
+        del _DataStorage
+
+        # Pickle
+        with open(listPaths[2], "wb") as pickleFile:
+            pickle.dump(self._listTest, pickleFile)
+
+        # Leftover of an interrupted recovery
+        with open(os.path.join(strDirectory, "A", FREISTAT_DATA_STORAGE +
+                  "_SP1_CV_recovery.csv.tmp"), "w") as tmpFile:
+            tmpFile.write("1,0")
+
+        return listPaths
+
+    def test_start_BulkRecovery(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing the recovery of all formats, that files with an up
+        to date recovery csv are skipped and that they can be recovered again.
+
+        """
+        with tempfile.TemporaryDirectory() as strDirectory:
+            listPaths : list = self._create_DataStorages(strDirectory)
+            _RecoveryData = Recovery_Data()
+
+            # Temporary files aren't recovered
+            self.assertEqual(find_PersistentDataStorages(strDirectory, True),
+                             listPaths)
+            self.assertEqual(len(get_FileState(listPaths[1])), 2)
+
+            # Recover all formats
+            listRecovered : list = _RecoveryData.start_BulkRecovery(
+                strDirectory, 2)
+            self.assertEqual(len(listRecovered), 3)
+
+            for strRecoveryPath in listRecovered:
+                with open(strRecoveryPath, newline="") as csvFile:
+                    listRows : list = list(csv.reader(csvFile))
+                self.assertEqual(len(listRows), len(self._listTest))
+                self.assertEqual(float(listRows[-1][-1]), 129.0)
+
+            # Skip files which are up to date
+            self.assertEqual(_RecoveryData.start_BulkRecovery(strDirectory, 2),
+                             [])
+
+            # Recover changed files
+            with open(listPaths[2], "wb") as pickleFile:
+                pickle.dump(self._listTest[:5], pickleFile)
+            self.assertEqual(len(_RecoveryData.start_BulkRecovery(
+                strDirectory, 2)), 1)
+
+            # Recover all files again
+            self.assertEqual(sorted(_RecoveryData.start_BulkRecovery(
+                strDirectory, 2, True)), sorted(listRecovered))
+
+    def test_recover_PersistentDataStorage(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that a failed recovery doesn't leave a temporary
+        file behind.
+
+        """
+        with tempfile.TemporaryDirectory() as strDirectory:
+            strPath : str = self._create_DataStorages(strDirectory)[2]
+
+            # Block the recovery csv file with a folder
+            os.makedirs(get_RecoveryPath(strPath))
+
+            self.assertRaises(OSError, recover_PersistentDataStorage, strPath)
+            self.assertFalse(os.path.exists(get_RecoveryPath(strPath) + ".tmp"))
+
+if __name__ == '__main__':
+    unittest.main()
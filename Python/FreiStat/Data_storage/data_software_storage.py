@@ -33,6 +33,9 @@ def JSON_Telegram_Generator():
 def DataHandling():
     pass
 
+def SharedStatusBlock():
+    pass
+
 class DataSoftwareStorage():
     """
     Description
@@ -53,9 +56,16 @@ class DataSoftwareStorage():
         self._dataHandling = None
         self._jsonParser = None
         self._jsonTelegramGenerator = None
+        self._statusBlock = None
 
         self._bLowPerformanceMode : bool = False
 
+        self._iDataFormat : int = DATA_FORMAT_JSON
+        self._iBatchSize : int = 1
+        self._bMemoryMap : bool = False
+        self._bJSONExport : bool = False
+        self._strCompression : str = COMPRESSION_NONE
+
         self._systemStatus : int = FREISTAT_BOOTUP
 
     # Setter methods
@@ -82,6 +92,10 @@ class DataSoftwareStorage():
         """
         self._systemStatus = iSystemStatus
 
+        # Publish system status to the parent process
+        if (self._statusBlock is not None):
+            self._statusBlock.set_SystemStatus(iSystemStatus)
+
     def set_LowPerformanceMode(self, bLowPerformanceMode : bool) -> None:
         """
         Description
@@ -96,6 +110,78 @@ class DataSoftwareStorage():
         """
         self._bLowPerformanceMode = bLowPerformanceMode 
 
+    def set_DataFormat(self, iDataFormat : int) -> None:
+        """
+        Description
+        -----------
+        Save format in which FreiStat should send the data telegrams.
+
+        Parameters
+        ----------
+        `iDataFormat` : int
+            Integer encoding the data format: JSON (0) | Binary (1)
+        
+        """
+        self._iDataFormat = iDataFormat
+
+    def set_BatchSize(self, iBatchSize : int) -> None:
+        """
+        Description
+        -----------
+        Save amount of samples FreiStat should pack into one data telegram.
+
+        Parameters
+        ----------
+        `iBatchSize` : int
+            Amount of samples per data telegram
+        
+        """
+        self._iBatchSize = iBatchSize
+
+    def set_MemoryMap(self, bMemoryMap : bool) -> None:
+        """
+        Description
+        -----------
+        Save if the experiment data should be stored in memory-mapped files.
+
+        Parameters
+        ----------
+        `bMemoryMap` : bool
+            Flag indicating if the data storage objects are memory-mapped
+        
+        """
+        self._bMemoryMap = bMemoryMap
+
+    def set_JSONExport(self, bJSONExport : bool) -> None:
+        """
+        Description
+        -----------
+        Save if the experiment data should be streamed into NDJSON files while
+        the experiment is running.
+
+        Parameters
+        ----------
+        `bJSONExport` : bool
+            Flag indicating if the NDJSON export is enabled
+        
+        """
+        self._bJSONExport = bJSONExport
+
+    def set_Compression(self, strCompression : str) -> None:
+        """
+        Description
+        -----------
+        Save with which compression the persistent data storage objects and
+        the exports should be written.
+
+        Parameters
+        ----------
+        `strCompression` : str
+            Compression (COMPRESSION_X)
+        
+        """
+        self._strCompression = strCompression
+
     def setJSON_Parser(self, jsonParser: JSON_Parser) -> None:
         """
         Description
@@ -153,6 +239,21 @@ class DataSoftwareStorage():
         """
         self._jsonTelegramGenerator = jsonTelegramGenerator
 
+    def set_StatusBlock(self, statusBlock: SharedStatusBlock) -> None:
+        """
+        Description
+        -----------
+        Set reference of the status block, which publishes the progress of the
+        experiment to the parent process.
+
+        Parameters
+        ----------
+        `statusBlock` : SharedStatusBlock
+            Reference to the status block object or None
+
+        """
+        self._statusBlock = statusBlock
+
     # Getter methods
     def get_SystemStatus(self) -> int:
         """
@@ -182,6 +283,78 @@ class DataSoftwareStorage():
         """
         return self._bLowPerformanceMode
 
+    def get_DataFormat(self) -> int:
+        """
+        Description
+        -----------
+        Get format in which FreiStat sends the data telegrams.
+
+        Return
+        ------
+        `iDataFormat` : int
+            Integer encoding the data format: JSON (0) | Binary (1)
+        
+        """
+        return self._iDataFormat
+
+    def get_BatchSize(self) -> int:
+        """
+        Description
+        -----------
+        Get amount of samples FreiStat packs into one data telegram.
+
+        Return
+        ------
+        `iBatchSize` : int
+            Amount of samples per data telegram
+        
+        """
+        return self._iBatchSize
+
+    def get_MemoryMap(self) -> bool:
+        """
+        Description
+        -----------
+        Get if the experiment data should be stored in memory-mapped files.
+
+        Return
+        ------
+        `bMemoryMap` : bool
+            Flag indicating if the data storage objects are memory-mapped
+        
+        """
+        return self._bMemoryMap
+
+    def get_JSONExport(self) -> bool:
+        """
+        Description
+        -----------
+        Get if the experiment data should be streamed into NDJSON files while
+        the experiment is running.
+
+        Return
+        ------
+        `bJSONExport` : bool
+            Flag indicating if the NDJSON export is enabled
+        
+        """
+        return self._bJSONExport
+
+    def get_Compression(self) -> str:
+        """
+        Description
+        -----------
+        Get with which compression the persistent data storage objects and the
+        exports should be written.
+
+        Return
+        ------
+        `strCompression` : str
+            Compression (COMPRESSION_X)
+        
+        """
+        return self._strCompression
+
     def getJSON_Parser(self) -> JSON_Parser:
         """
         Description
@@ -236,4 +409,19 @@ class DataSoftwareStorage():
             Reference to the JSON telegram generator object
             
         """
-        return self._jsonTelegramGenerator
\ No newline at end of file
+        return self._jsonTelegramGenerator
+
+    def get_StatusBlock(self) -> SharedStatusBlock:
+        """
+        Description
+        -----------
+        Get reference of the status block.
+
+        Return
+        ------
+        `statusBlock`: SharedStatusBlock
+            Reference to the status block object or None if the progress isn't
+            published
+
+        """
+        return self._statusBlock
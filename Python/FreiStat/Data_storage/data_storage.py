@@ -6,13 +6,33 @@ The class handles the following variables:
 
 Experiment type         : `self._strElectrochemicalMethod`
 Experiment parameters   : `self._listExperimentParameters`
-Experiment data         : `self._listStoredData`
+Experiment data         : `self._listChunks`
 
 These are accessed by :
 Experiment type         : `save_ExperimentType`      | `get_ExperimentType`
 Experiment parameters   : `save_ExperimentParameters`| `get_ExperimentParameters`
 Experiment data         : `append_Data`              | `get_StoredData`
-                          `set_StoredData`
+                          `append_DataBatch`         | `get_DataArray`
+                          `set_StoredData`           | `get_Column`
+                                                     | `get_DataBlocks`
+                                                     | `get_ColumnBlocks`
+
+The experiment data is stored column wise in preallocated chunks of structured
+numpy arrays. The column layout is chosen by the amount of values of the first
+stored sample, which results in 32 bytes per sample for a single 
+electrochemical method instead of a python list per sample.
+
+By calling `enable_MemoryMap` the chunks are backed by memory-mapped .npy files
+instead. Only the chunk which is currently written is kept writable, full
+chunks are reopened read only, so the operating system can drop their pages.
+Since the amount of stored samples is memory-mapped as well, the data survives
+a crash of the software and can be opened again with `open_MemoryMap`.
+
+While samples are appended, a decimation pyramid (minimum, maximum and mean of
+e.g. every 16, 256 and 4096 samples) is updated every 
+FREISTAT_DECIMATION_UPDATE samples. `get_DataWindow` uses it to return a time
+window at a target resolution without touching every sample. The pyramid is
+saved next to the memory-mapped chunks and the binary export.
 
 """
 
@@ -25,8 +45,43 @@ __maintainer__ = "Mark Jasper"
 __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 
 # Include dependencies
+import glob
+import os
+from typing import Iterator
+
+import numpy as np
 
 # Include internal dependencies
+from .constants import *
+from .decimation_pyramid import DecimationPyramid
+from .dictionaries import *
+from .stored_data_view import StoredDataView
+
+def get_SampleType(iColumns : int) -> np.dtype:
+    """
+    Description
+    -----------
+    Get the column layout of samples with the given amount of values. Known
+    layouts are named after the labels of the data export, all other layouts
+    consist of numbered float columns.
+
+    Parameters
+    ----------
+    `iColumns` : int
+        Amount of values of one sample
+
+    Return
+    ------
+    `dtypeSamples` : np.dtype
+        Structured data type of one sample
+
+    """
+    # Initialize variables
+    listLabels : list = dic_storageLabels.get(iColumns,
+        ["Column " + str(iIndex) for iIndex in range(iColumns)])
+
+    return np.dtype([(strLabel, dic_storageTypes.get(
+        strLabel, FREISTAT_STORAGE_FLOAT_TYPE)) for strLabel in listLabels])
 
 class DataStorage:
     """
@@ -45,9 +100,18 @@ class DataStorage:
         """
         # Initalize class variable
         self._strElectrochemicalMethod : str = ""
-        self._listStoredData : list = []
         self._listExperimentParameters : list = []
 
+        self._dtypeSamples : np.dtype = None
+        self._listChunks : list = []
+        self._iLength : int = 0
+        self._iChunkSize : int = FREISTAT_STORAGE_CHUNK_SIZE
+
+        self._strMemoryMap : str = ""
+        self._np_arrLength : np.ndarray = None
+
+        self._decimationPyramid : DecimationPyramid = DecimationPyramid()
+
     def save_ExperimentParameters(self, listExperimentParameters: list) -> None:
         """
         Descirption
@@ -90,10 +154,271 @@ class DataStorage:
             List with new data which should be appended to the existing data
         
         """
-        self._listStoredData.append(listTemp)
+        # Choose column layout with the first sample
+        if (self._dtypeSamples is None):
+            self._set_ColumnLayout(len(listTemp))
+
+        # Allocate new chunk if the last one is full
+        iOffset : int = self._iLength % self._iChunkSize
+        if (iOffset == 0):
+            self._create_Chunk()
+
+        self._listChunks[-1][iOffset] = tuple(listTemp)
+        self._iLength += 1
+
+        # Update amount of samples after the sample is written
+        if (self._np_arrLength is not None):
+            self._np_arrLength[0] = self._iLength
+
+        # Update decimation pyramid
+        if (self._iLength - self._decimationPyramid.get_Processed() >= 
+            FREISTAT_DECIMATION_UPDATE):
+            self._decimationPyramid.update(self)
+
+    def append_DataBatch(self, dataBatch) -> None:
+        """
+        Descirption
+        -----------
+        Extend data in the data storage by appending several lists of arbitrary
+        data at once. The batch is converted once and copied slice wise into
+        the chunks, it's only split at the chunk boundaries. The amount of
+        stored samples and the decimation pyramid are updated once per batch.
+        
+        Parameters
+        ----------
+        `dataBatch` : list | np.ndarray
+            List of lists with new data which should be appended to the 
+            existing data or structured numpy array, whose fields are assigned
+            to the columns by their position
+        
+        """
+        # Initialize variables
+        iIndex : int = 0
+
+        if (len(dataBatch) == 0):
+            return
+
+        # Choose column layout with the first sample
+        if (self._dtypeSamples is None):
+            if (isinstance(dataBatch, np.ndarray) and dataBatch.dtype.names):
+                self._set_ColumnLayout(len(dataBatch.dtype.names))
+            else:
+                self._set_ColumnLayout(len(dataBatch[0]))
+
+        # Convert lists of samples once into records, which numpy copies
+        # together with the slices
+        if (not (isinstance(dataBatch, np.ndarray) and dataBatch.dtype.names)):
+            dataBatch = [tuple(listTemp) for listTemp in dataBatch]
+
+        while (iIndex < len(dataBatch)):
+            # Allocate new chunk if the last one is full
+            iOffset : int = self._iLength % self._iChunkSize
+            if (iOffset == 0):
+                self._create_Chunk()
+
+            # Fill the last chunk as far as possible
+            iCount : int = min(self._iChunkSize - iOffset, 
+                               len(dataBatch) - iIndex)
+            self._listChunks[-1][iOffset:iOffset + iCount] = \
+                dataBatch[iIndex:iIndex + iCount]
+
+            iIndex += iCount
+            self._iLength += iCount
+
+        # Update amount of samples after the samples are written
+        if (self._np_arrLength is not None):
+            self._np_arrLength[0] = self._iLength
+
+        # Update decimation pyramid
+        if (self._iLength - self._decimationPyramid.get_Processed() >= 
+            FREISTAT_DECIMATION_UPDATE):
+            self._decimationPyramid.update(self)
+
+    def _set_ColumnLayout(self, iColumns : int) -> None:
+        """
+        Descirption
+        -----------
+        Choose the column layout of the data storage. Known layouts are named
+        after the labels of the data export, all other layouts consist of
+        numbered float columns.
+
+        Parameters
+        ----------
+        `iColumns` : int
+            Amount of values of one sample
+
+        """
+        self._dtypeSamples = get_SampleType(iColumns)
+
+    def _create_Chunk(self) -> None:
+        """
+        Descirption
+        -----------
+        Allocate a new chunk for the stored samples. If the data storage is
+        memory-mapped, the previous chunk is written to the disk and reopened
+        read only.
+
+        """
+        # Check if data storage isn't memory-mapped
+        if (self._strMemoryMap == ""):
+            self._listChunks.append(np.empty(self._iChunkSize,
+                                             dtype= self._dtypeSamples))
+            return
+
+        # Release writable mapping of the full chunk
+        if (len(self._listChunks) > 0):
+            self._listChunks[-1].flush()
+            self._listChunks[-1] = np.load(self._get_ChunkPath(
+                len(self._listChunks) - 1), mmap_mode= "r")
+
+        self._listChunks.append(np.lib.format.open_memmap(
+            self._get_ChunkPath(len(self._listChunks)), mode= "w+",
+            dtype= self._dtypeSamples, shape= (self._iChunkSize,)))
+
+    def _get_ChunkPath(self, iChunk : int) -> str:
+        """
+        Descirption
+        -----------
+        Get path of a memory-mapped chunk.
+
+        Parameters
+        ----------
+        `iChunk` : int
+            Index of the chunk
+
+        Return
+        ------
+        `strPath` : str
+            Path of the .npy file of the chunk
+
+        """
+        return os.path.join(self._strMemoryMap, 
+                            FREISTAT_MEMMAP_CHUNK + "%05d.npy" % iChunk)
+
+    def enable_MemoryMap(self, strDirectory : str) -> None:
+        """
+        Descirption
+        -----------
+        Back the stored samples with memory-mapped files. Samples which are
+        already stored are moved into the files.
+
+        Parameters
+        ----------
+        `strDirectory` : str
+            Path of the folder in which the chunk files are created
+
+        """
+        # Initialize variables
+        np_arrData : np.ndarray = self.get_DataArray()
+
+        # Create folder and memory-mapped amount of stored samples
+        os.makedirs(strDirectory, exist_ok= True)
+        self._strMemoryMap = strDirectory
+        self._iChunkSize = FREISTAT_MEMMAP_CHUNK_SIZE
+        self._np_arrLength = np.lib.format.open_memmap(os.path.join(
+            strDirectory, FREISTAT_MEMMAP_LENGTH), mode= "w+", dtype= "<i8",
+            shape= (1,))
+
+        # Move stored samples into the files
+        if (len(np_arrData) > 0):
+            self.set_StoredData(np_arrData)
+
+    def open_MemoryMap(self, strDirectory : str) -> None:
+        """
+        Descirption
+        -----------
+        Open the samples of a memory-mapped data storage object read only, 
+        e.g. to recover them after a crash.
+
+        Parameters
+        ----------
+        `strDirectory` : str
+            Path of the folder containing the chunk files
+
+        """
+        # Initialize variables
+        listChunkFiles : list = sorted(glob.glob(os.path.join(
+            strDirectory, FREISTAT_MEMMAP_CHUNK + "*.npy")))
+
+        self._strMemoryMap = strDirectory
+        self._np_arrLength = None
+        self._listChunks = [np.load(strPath, mmap_mode= "r") 
+                            for strPath in listChunkFiles]
+        self._iLength = 0
+        self._dtypeSamples = None
+
+        if (len(self._listChunks) > 0):
+            self._dtypeSamples = self._listChunks[0].dtype
+            self._iChunkSize = len(self._listChunks[0])
+            self._iLength = int(np.load(os.path.join(
+                strDirectory, FREISTAT_MEMMAP_LENGTH))[0])
+
+        # Reuse saved decimation pyramid
+        self._decimationPyramid = DecimationPyramid()
+        if (os.path.isfile(os.path.join(strDirectory, FREISTAT_MEMMAP_PYRAMID))):
+            self.load_DecimationPyramid(os.path.join(strDirectory, 
+                                                     FREISTAT_MEMMAP_PYRAMID))
+
+    def flush_MemoryMap(self) -> None:
+        """
+        Descirption
+        -----------
+        Write the chunk which is currently written and the amount of stored
+        samples to the disk.
+
+        """
+        if (self._np_arrLength is None):
+            return
+
+        if (len(self._listChunks) > 0):
+            self._listChunks[-1].flush()
+        self._np_arrLength.flush()
+
+        self.save_DecimationPyramid(os.path.join(self._strMemoryMap, 
+                                                 FREISTAT_MEMMAP_PYRAMID))
+
+    def save_DecimationPyramid(self, strPath : str) -> None:
+        """
+        Descirption
+        -----------
+        Update the decimation pyramid and save it as .npz file.
+
+        Parameters
+        ----------
+        `strPath` : str
+            Path of the .npz file
+
+        """
+        self._decimationPyramid.update(self)
+        self._decimationPyramid.save(strPath)
+
+    def load_DecimationPyramid(self, strPath : str) -> None:
+        """
+        Descirption
+        -----------
+        Load a decimation pyramid saved with `save_DecimationPyramid` instead
+        of rebuilding it. Samples which aren't contained in the pyramid are
+        added with the next update. A pyramid which doesn't match the stored 
+        samples is discarded.
+
+        Parameters
+        ----------
+        `strPath` : str
+            Path of the .npz file
+
+        """
+        # Initialize variables
+        decimationPyramid : DecimationPyramid = DecimationPyramid()
+        decimationPyramid.load(strPath)
+
+        if (decimationPyramid.get_Processed() <= self._iLength and 
+            decimationPyramid.get_Labels() in [[], self.get_ColumnLabels()]):
+            self._decimationPyramid = decimationPyramid
+        else:
+            self._decimationPyramid = DecimationPyramid()
 
     # Setter methods
-    def set_StoredData(self, listStoredData : list) -> None:
+    def set_StoredData(self, storedData) -> None:
         """
         Descirption
         -----------
@@ -102,26 +427,292 @@ class DataStorage:
 
         Parameters
         ----------
-        `listStoredData` : list
-            List which consists of experiment data entries
+        `storedData` : list | np.ndarray
+            List which consists of experiment data entries or structured numpy
+            array as returned by `get_DataArray`
 
         """
-        self._listStoredData = listStoredData    
+        # Discard stored data (in place, since views reference the chunks)
+        self._dtypeSamples = None
+        self._listChunks.clear()
+        self._iLength = 0
+        self._decimationPyramid = DecimationPyramid()
+
+        # Keep the column layout of samples which are already stored column 
+        # wise
+        if (isinstance(storedData, np.ndarray) and storedData.dtype.names):
+            self._dtypeSamples = storedData.dtype
+
+        self.append_DataBatch(storedData)
+        self._decimationPyramid.update(self)
 
     # Getter methods
-    def get_StoredData(self) -> list:
+    def get_StoredData(self) -> StoredDataView:
+        """
+        Descirption
+        -----------
+        Return the stored data as a lazy view, which can be used like a list
+        of samples.
+
+        Return
+        ------
+        `listStoredData` : StoredDataView
+            Retrun view which consists of all data aquired during an experiment
+
+        """
+        return StoredDataView(self)
+
+    def get_DataArray(self, iStart : int = 0, iStop : int = None
+                      ) -> np.ndarray:
+        """
+        Descirption
+        -----------
+        Return the stored samples as one structured numpy array, whose fields
+        are the columns of the data storage.
+
+        Parameters
+        ----------
+        `iStart` : int
+            Index of the first sample which should be returned
+
+        `iStop` : int
+            Index after the last sample which should be returned or None for
+            all stored samples
+
+        Return
+        ------
+        `np_arrData` : np.ndarray
+            Structured array containing a copy of the stored samples
+
+        """
+        # Initialize variables
+        iFirstChunk : int = iStart // self._iChunkSize
+
+        if (iStop is None or iStop > self._iLength):
+            iStop = self._iLength
+
+        if (self._dtypeSamples is None):
+            return np.empty(0, dtype= FREISTAT_STORAGE_FLOAT_TYPE)
+        if (iStart >= iStop):
+            return np.empty(0, dtype= self._dtypeSamples)
+
+        # Only concatenate the chunks containing the requested samples
+        return np.concatenate(self._listChunks[
+            iFirstChunk:(iStop - 1) // self._iChunkSize + 1])[
+            iStart - iFirstChunk * self._iChunkSize:
+            iStop - iFirstChunk * self._iChunkSize]
+
+    def get_DataWindow(self, fStartTime : float, fEndTime : float, 
+                       iPoints : int) -> tuple:
+        """
+        Descirption
+        -----------
+        Return a time window of the stored samples decimated to at most 
+        `iPoints` points (e.g. the width of a plot in pixels) using the 
+        decimation pyramid.
+
+        Parameters
+        ----------
+        `fStartTime` : float
+            Start of the window in ms
+
+        `fEndTime` : float
+            End of the window in ms
+
+        `iPoints` : int
+            Target amount of points
+
+        Return
+        ------
+        `np_arrMin` : np.ndarray
+            Minimum of every column for every point (point x column)
+
+        `np_arrMax` : np.ndarray
+            Maximum of every column for every point (point x column)
+
+        `np_arrMean` : np.ndarray
+            Mean of every column for every point (point x column)
+
+        """
+        return self._decimationPyramid.get_Window(self, fStartTime, fEndTime,
+                                                  iPoints)
+
+    def get_Column(self, column) -> np.ndarray:
+        """
+        Descirption
+        -----------
+        Return one column of the stored samples as one array. The column is
+        copied out of every chunk, large (memory-mapped) data storage objects
+        should be read block wise with `get_ColumnBlocks` instead.
+
+        Parameters
+        ----------
+        `column` : int | str
+            Index or label (e.g. DE_TAG_VOLTAGE) of the column
+
+        Return
+        ------
+        `np_arrColumn` : np.ndarray
+            Array containing the values of the column for every sample
+
+        """
+        if (self._iLength == 0):
+            return np.empty(0, dtype= FREISTAT_STORAGE_FLOAT_TYPE)
+
+        return np.concatenate(list(self.get_ColumnBlocks(column)))
+
+    def get_ColumnBlocks(self, column, iStart : int = 0
+                         ) -> Iterator[np.ndarray]:
+        """
+        Descirption
+        -----------
+        Iterate over one column of the stored samples in blocks of at most
+        FREISTAT_STORAGE_CHUNK_SIZE samples without copying them.
+
+        Parameters
+        ----------
+        `column` : int | str
+            Index or label (e.g. DE_TAG_VOLTAGE) of the column
+
+        `iStart` : int
+            Index of the first sample which should be returned
+
+        Return
+        ------
+        `np_arrColumn` : np.ndarray
+            Array viewing the values of the column for the next block of
+            samples
+
+        """
+        # Initialize variables
+        strLabel : str = column
+
+        if (isinstance(column, int) and self._dtypeSamples is not None):
+            strLabel = self._dtypeSamples.names[column]
+
+        for np_arrBlock in self.get_DataBlocks(iStart):
+            yield np_arrBlock[strLabel]
+
+    def get_ColumnLabels(self) -> list:
+        """
+        Descirption
+        -----------
+        Get labels of the columns of the data storage.
+
+        Return
+        ------
+        `listLabels` : list
+            List containing the labels of all columns or an empty list if no
+            data is stored yet
+
+        """
+        if (self._dtypeSamples is None):
+            return []
+        return list(self._dtypeSamples.names)
+
+    def get_DataBlocks(self, iStart : int = 0) -> Iterator[np.ndarray]:
+        """
+        Descirption
+        -----------
+        Iterate over the stored samples in blocks of at most 
+        FREISTAT_STORAGE_CHUNK_SIZE samples without copying them.
+
+        Parameters
+        ----------
+        `iStart` : int
+            Index of the first sample which should be returned
+
+        Return
+        ------
+        `np_arrBlock` : np.ndarray
+            Structured array viewing the next block of samples
+
+        """
+        # Initialize variables
+        iIndex : int = iStart
+        iLength : int = self._iLength
+
+        while (iIndex < iLength):
+            # Stay inside of one chunk
+            iOffset : int = iIndex % self._iChunkSize
+            iStop : int = min(iOffset + FREISTAT_STORAGE_CHUNK_SIZE,
+                              self._iChunkSize, iOffset + iLength - iIndex)
+
+            yield self._listChunks[iIndex // self._iChunkSize][iOffset:iStop]
+            iIndex += iStop - iOffset
+
+    def get_DecimationPyramid(self) -> DecimationPyramid:
+        """
+        Descirption
+        -----------
+        Get the decimation pyramid of the stored samples.
+
+        Return
+        ------
+        `decimationPyramid` : DecimationPyramid
+            Decimation pyramid, which is updated every 
+            FREISTAT_DECIMATION_UPDATE samples
+
+        """
+        return self._decimationPyramid
+
+    def get_DataChunks(self) -> list:
+        """
+        Descirption
+        -----------
+        Get the preallocated chunks of the data storage. Only the first 
+        `get_DataLength()` samples of the chunks are valid.
+
+        Return
+        ------
+        `listChunks` : list
+            List containing structured numpy arrays
+
+        """
+        return self._listChunks
+
+    def get_ChunkSize(self) -> int:
+        """
+        Descirption
+        -----------
+        Get amount of samples stored in one chunk.
+
+        Return
+        ------
+        `iChunkSize` : int
+            Amount of samples per chunk
+
+        """
+        return self._iChunkSize
+
+    def get_MemoryMap(self) -> str:
+        """
+        Descirption
+        -----------
+        Get folder of the memory-mapped chunk files.
+
+        Return
+        ------
+        `strMemoryMap` : str
+            Path of the folder or an empty string if the data storage isn't
+            memory-mapped
+
+        """
+        return self._strMemoryMap
+
+    def get_DataLength(self) -> int:
         """
         Descirption
         -----------
-        Return the stored data as a list.
+        Get amount of stored samples.
 
         Return
         ------
-        `listStoredData` : list
-            Retrun list which consists of all data aquired during an experiment
+        `iLength` : int
+            Amount of stored samples
 
         """
-        return self._listStoredData
+        return self._iLength
 
     def get_ExperimentParameters(self) -> list:
         """
@@ -0,0 +1,141 @@
+"""
+Module implementing different unittests for the data_storage module.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+# Import internal dependencies
+from .constants import *
+from .data_storage import DataStorage
+
+class DataStorage_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the class DataStorage.
+
+    """
+    def test_append_Data(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that the columnar storage returns the appended
+        samples through the lazy view and the column getters.
+
+        """
+        # Test samples spanning more than one chunk
+        listTest : list = [[1, iIndex, -200.5 + iIndex, 3.25, 120.0 + iIndex]
+                           for iIndex in range(FREISTAT_STORAGE_CHUNK_SIZE + 3)]
+
+        # Create a test instance of the DataStorage
+        _DataStorage = DataStorage()
+        _DataStorage.append_Data(listTest[0])
+        _DataStorage.append_DataBatch(listTest[1:])
+
+        # Check results
+        listStoredData = _DataStorage.get_StoredData()
+        self.assertEqual(len(listStoredData), len(listTest))
+        self.assertEqual(listStoredData[0], listTest[0])
+        self.assertEqual(listStoredData[-1], listTest[-1])
+        self.assertEqual(list(listStoredData), listTest)
+        self.assertEqual(_DataStorage.get_ColumnLabels(), FREISTAT_CV_LABEL)
+        self.assertEqual(_DataStorage.get_Column(DE_TAG_VOLTAGE).tolist(),
+                         [listSample[2] for listSample in listTest])
+        self.assertEqual(_DataStorage.get_DataArray().itemsize, 32)
+
+        # Restore data from the persistent format
+        _DataStorageRestored = DataStorage()
+        _DataStorageRestored.set_StoredData(pickle.loads(pickle.dumps(
+            _DataStorage.get_DataArray())))
+        self.assertEqual(list(_DataStorageRestored.get_StoredData()), listTest)
+
+    def test_append_DataBatch(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that batches of lists and structured arrays are
+        split at the chunk boundaries and assigned to the columns by position.
+
+        """
+        # Test samples
+        listTest : list = [[1, iIndex, -200.5 + iIndex, 3.25, 120.0 + iIndex]
+                           for iIndex in range(20)]
+        np_arrTest = np.array([tuple(listSample) for listSample in listTest],
+            dtype= [("R", "<i4"), ("D", "<i4"), ("V", "<f4"), ("C", "<f4"),
+                    ("T", "<f4")])
+
+        # Create a test instance of the DataStorage with small chunks
+        _DataStorage = DataStorage()
+        _DataStorage._iChunkSize = 8
+        _DataStorage.append_DataBatch(listTest[:5])
+        _DataStorage.append_DataBatch(np_arrTest[5:])
+
+        # Check results
+        self.assertEqual(len(_DataStorage.get_DataChunks()), 3)
+        self.assertEqual(_DataStorage.get_ColumnLabels(), FREISTAT_CV_LABEL)
+        self.assertEqual(list(_DataStorage.get_StoredData()), listTest)
+
+        # Read a column block wise without copying it
+        listBlocks : list = list(_DataStorage.get_ColumnBlocks(
+            DE_TAG_VOLTAGE, 6))
+        self.assertEqual([len(np_arrBlock) for np_arrBlock in listBlocks],
+                         [2, 8, 4])
+        self.assertTrue(np.shares_memory(listBlocks[1],
+                                         _DataStorage.get_DataChunks()[1]))
+        self.assertEqual(np.concatenate(listBlocks).tolist(),
+                         [listSample[2] for listSample in listTest[6:]])
+
+    def test_enable_MemoryMap(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that memory-mapped samples can be opened again
+        without exporting them.
+
+        """
+        # Test samples
+        listTest : list = [[1, iIndex, -200.5 + iIndex, 120.0 + iIndex]
+                           for iIndex in range(100)]
+
+        with tempfile.TemporaryDirectory() as strDirectory:
+            strPath : str = os.path.join(strDirectory, "Test.mmap")
+
+            # Create a test instance of the DataStorage
+            _DataStorage = DataStorage()
+            _DataStorage.append_DataBatch(listTest[:10])
+            _DataStorage.enable_MemoryMap(strPath)
+            _DataStorage.append_DataBatch(listTest[10:])
+
+            # Check results
+            self.assertEqual(list(_DataStorage.get_StoredData()), listTest)
+            self.assertEqual(_DataStorage.get_ColumnLabels(), 
+                             FREISTAT_OCP_LABEL)
+
+            # Open samples without flushing them
+            _DataStorageOpened = DataStorage()
+            _DataStorageOpened.open_MemoryMap(strPath)
+            self.assertEqual(list(_DataStorageOpened.get_StoredData()), 
+                             listTest)
+            self.assertEqual(_DataStorageOpened.get_Column(1).tolist(),
+                             list(range(100)))
+
+            # Release memory maps before the folder is removed
+            del _DataStorage, _DataStorageOpened
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,468 @@
+"""
+Module implementing a multi-resolution (decimated) representation of the
+samples of one data storage object.
+
+Every level of the pyramid combines a fixed amount of samples (see
+FREISTAT_DECIMATION_FACTORS, e.g. 1:16, 1:256 and 1:4096) into one bucket,
+which contains the minimum, maximum and mean of every column. The levels are
+updated incrementally with complete buckets only, every coarser level is
+computed from the next finer one.
+
+A time window can be requested at a target resolution with `get_Window`. The
+coarsest level which still resolves the window is used, so the amount of
+touched buckets doesn't depend on the length of the experiment. The time
+column is expected to be increasing.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Include dependencies
+import numpy as np
+from numpy.lib import recfunctions
+
+# Include internal dependencies
+from .constants import *
+
+class DecimationPyramid:
+    """
+    Description
+    -----------
+    Class which maintains the decimation levels of one data storage object.
+
+    """
+
+    def __init__(self, listFactors : list = FREISTAT_DECIMATION_FACTORS
+                 ) -> None:
+        """
+        Description
+        -----------
+        Constructor of class DecimationPyramid
+
+        Parameters
+        ----------
+        `listFactors` : list
+            Increasing decimation factors of the levels. Every factor has to
+            be a multiple of the previous one.
+
+        """
+        # Initalize class variable
+        self._listFactors : list = list(listFactors)
+        self._listLabels : list = []
+        self._iTimeColumn : int = 0
+        self._iProcessed : int = 0
+
+        # Buckets of every level as [minimum, maximum, mean] (bucket x column)
+        self._listLevels : list = []
+        self._listLength : list = [0] * len(self._listFactors)
+
+    def update(self, dataStorage) -> None:
+        """
+        Description
+        -----------
+        Add all complete buckets of the samples, which aren't processed yet, to
+        the levels of the pyramid.
+
+        Parameters
+        ----------
+        `dataStorage` : DataStorage
+            Data storage object containing the samples
+
+        """
+        # Initialize variables
+        iFactor : int = self._listFactors[0]
+        iStop : int = self._iProcessed + (
+            dataStorage.get_DataLength() - self._iProcessed) // iFactor * iFactor
+
+        if (iStop == self._iProcessed):
+            return
+
+        # Create levels with the column layout of the first samples
+        if (len(self._listLabels) == 0):
+            self._set_Columns(dataStorage.get_ColumnLabels())
+
+        # Combine samples into the buckets of the first level
+        np_arrSamples : np.ndarray = recfunctions.structured_to_unstructured(
+            dataStorage.get_DataArray(self._iProcessed, iStop),
+            dtype= np.float64).reshape(-1, iFactor, len(self._listLabels))
+        self._append_Buckets(0, np_arrSamples.min(axis= 1),
+                             np_arrSamples.max(axis= 1),
+                             np_arrSamples.mean(axis= 1))
+        self._iProcessed = iStop
+
+        # Combine complete buckets into the buckets of the next level
+        for iLevel in range(1, len(self._listFactors)):
+            iRatio : int = self._listFactors[iLevel] // \
+                           self._listFactors[iLevel - 1]
+            iStart : int = self._listLength[iLevel] * iRatio
+            iEnd : int = self._listLength[iLevel - 1] // iRatio * iRatio
+
+            if (iEnd == iStart):
+                break
+
+            listFiner : list = [np_arrBucket[iStart:iEnd].reshape(
+                -1, iRatio, len(self._listLabels)) for np_arrBucket in
+                self._get_Level(iLevel - 1)]
+            self._append_Buckets(iLevel, listFiner[0].min(axis= 1),
+                                 listFiner[1].max(axis= 1),
+                                 listFiner[2].mean(axis= 1))
+
+    def _set_Columns(self, listLabels : list) -> None:
+        """
+        Description
+        -----------
+        Create empty levels for the given column layout.
+
+        Parameters
+        ----------
+        `listLabels` : list
+            Labels of the columns of the data storage object
+
+        """
+        self._listLabels = list(listLabels)
+        self._listLevels = [[np.empty((0, len(listLabels))) for iIndex in
+                             range(3)] for iLevel in
+                            range(len(self._listFactors))]
+        self._listLength = [0] * len(self._listFactors)
+
+        # Sequences store the total time, single methods the time
+        self._iTimeColumn = len(listLabels) - 1
+        for strLabel in [DE_TAG_TOTAL_TIME, DE_TAG_TIME]:
+            if (strLabel in self._listLabels):
+                self._iTimeColumn = self._listLabels.index(strLabel)
+                break
+
+    def _append_Buckets(self, iLevel : int, np_arrMin : np.ndarray,
+                        np_arrMax : np.ndarray, np_arrMean : np.ndarray) -> None:
+        """
+        Description
+        -----------
+        Append buckets to a level. The arrays of the level are grown by
+        doubling their capacity to keep appending amortized constant.
+
+        Parameters
+        ----------
+        `iLevel` : int
+            Index of the level
+
+        `np_arrMin`, `np_arrMax`, `np_arrMean` : np.ndarray
+            Minimum, maximum and mean of the new buckets (bucket x column)
+
+        """
+        # Initialize variables
+        iLength : int = self._listLength[iLevel]
+        iNew : int = iLength + len(np_arrMin)
+
+        for iIndex, np_arrBucket in enumerate([np_arrMin, np_arrMax,
+                                               np_arrMean]):
+            np_arrLevel : np.ndarray = self._listLevels[iLevel][iIndex]
+
+            # Grow level
+            if (iNew > len(np_arrLevel)):
+                np_arrGrown = np.empty((max(iNew, 2 * len(np_arrLevel)),
+                                        len(self._listLabels)))
+                np_arrGrown[:iLength] = np_arrLevel[:iLength]
+                np_arrLevel = np_arrGrown
+                self._listLevels[iLevel][iIndex] = np_arrLevel
+
+            np_arrLevel[iLength:iNew] = np_arrBucket
+
+        self._listLength[iLevel] = iNew
+
+    def _get_Level(self, iLevel : int) -> list:
+        """
+        Description
+        -----------
+        Get the valid buckets of a level.
+
+        Parameters
+        ----------
+        `iLevel` : int
+            Index of the level
+
+        Return
+        ------
+        `listLevel` : list
+            [Minimum, maximum, mean] as arrays (bucket x column)
+
+        """
+        return [np_arrBucket[:self._listLength[iLevel]] for np_arrBucket in
+                self._listLevels[iLevel]]
+
+    def get_Window(self, dataStorage, fStartTime : float, fEndTime : float,
+                   iPoints : int) -> tuple:
+        """
+        Description
+        -----------
+        Get the samples of a time window decimated to at most `iPoints`
+        points. The pyramid is updated before, samples which don't fill a
+        complete bucket yet are taken from the data storage object.
+
+        Parameters
+        ----------
+        `dataStorage` : DataStorage
+            Data storage object containing the samples
+
+        `fStartTime` : float
+            Start of the window in the unit of the time column
+
+        `fEndTime` : float
+            End of the window in the unit of the time column
+
+        `iPoints` : int
+            Target amount of points (e.g. width of the plot in pixels)
+
+        Return
+        ------
+        `np_arrMin` : np.ndarray
+            Minimum of every column for every point (point x column)
+
+        `np_arrMax` : np.ndarray
+            Maximum of every column for every point (point x column)
+
+        `np_arrMean` : np.ndarray
+            Mean of every column for every point (point x column)
+
+        """
+        self.update(dataStorage)
+
+        # Initialize variables
+        iLength : int = dataStorage.get_DataLength()
+        iStart : int = 0
+        iStop : int = iLength
+
+        if (len(self._listLabels) == 0):
+            self._set_Columns(dataStorage.get_ColumnLabels())
+
+        # Find samples of the window with the buckets of the finest level
+        if (self._listLength[0] > 0):
+            listFinest : list = self._get_Level(0)
+            iStart = int(np.searchsorted(listFinest[1][:, self._iTimeColumn],
+                                         fStartTime)) * self._listFactors[0]
+            iBucket : int = int(np.searchsorted(
+                listFinest[0][:, self._iTimeColumn], fEndTime, side= "right"))
+            if (iBucket < self._listLength[0]):
+                iStop = iBucket * self._listFactors[0]
+
+        # Use coarsest level which still resolves the window
+        iLevel : int = len(self._listFactors) - 1
+        while (iLevel >= 0 and (iStop - iStart) //
+               self._listFactors[iLevel] < iPoints):
+            iLevel -= 1
+
+        # Collect buckets of the window, starting with the chosen level
+        listParts = self._collect_Parts(dataStorage, iLevel, iStart, iStop)
+
+        # Remove raw samples outside of the window
+        if (len(listParts) > 0 and listParts[-1][3] == 1):
+            np_arrSamples : np.ndarray = listParts[-1][0]
+            listParts[-1] = [np_arrSamples[
+                (np_arrSamples[:, self._iTimeColumn] >= fStartTime) &
+                (np_arrSamples[:, self._iTimeColumn] <= fEndTime)]] * 3 + [1]
+
+        return self._combine_Parts(listParts, iPoints)
+
+    def _collect_Parts(self, dataStorage, iLevel : int, iStart : int,
+                       iStop : int) -> list:
+        """
+        Description
+        -----------
+        Collect the buckets covering the samples from `iStart` to `iStop`.
+        Complete buckets of the given level are used, the remaining samples
+        at the borders are covered by the finer levels and the raw samples.
+
+        Parameters
+        ----------
+        `dataStorage` : DataStorage
+            Data storage object containing the samples
+
+        `iLevel` : int
+            Index of the level (-1 for the raw samples)
+
+        `iStart` : int
+            Index of the first sample
+
+        `iStop` : int
+            Index after the last sample
+
+        Return
+        ------
+        `listParts` : list
+            List of [minimum, maximum, mean, samples per bucket]
+
+        """
+        if (iStart >= iStop):
+            return []
+
+        # Use raw samples
+        if (iLevel < 0):
+            np_arrSamples : np.ndarray = \
+                recfunctions.structured_to_unstructured(
+                    dataStorage.get_DataArray(iStart, iStop),
+                    dtype= np.float64)
+            return [[np_arrSamples] * 3 + [1]]
+
+        # Initialize variables
+        iFactor : int = self._listFactors[iLevel]
+        iFirst : int = -(-iStart // iFactor)
+        iLast : int = min(iStop // iFactor, self._listLength[iLevel])
+
+        if (iLast <= iFirst):
+            return self._collect_Parts(dataStorage, iLevel - 1, iStart, iStop)
+
+        return self._collect_Parts(
+                    dataStorage, iLevel - 1, iStart, iFirst * iFactor) + \
+               [[np_arrBucket[iFirst:iLast] for np_arrBucket in
+                 self._get_Level(iLevel)] + [iFactor]] + \
+               self._collect_Parts(
+                    dataStorage, iLevel - 1, iLast * iFactor, iStop)
+
+    def _combine_Parts(self, listParts : list, iPoints : int) -> tuple:
+        """
+        Description
+        -----------
+        Combine buckets of different levels into at most `iPoints` points
+        containing approximately the same amount of samples.
+
+        Parameters
+        ----------
+        `listParts` : list
+            List of [minimum, maximum, mean, samples per bucket]
+
+        `iPoints` : int
+            Target amount of points
+
+        Return
+        ------
+        `np_arrMin`, `np_arrMax`, `np_arrMean` : np.ndarray
+            Minimum, maximum and mean of every column for every point
+
+        """
+        # Initialize variables
+        iColumns : int = len(self._listLabels)
+
+        if (len(listParts) == 0 or iPoints <= 0):
+            return tuple([np.empty((0, iColumns))] * 3)
+
+        np_arrMin = np.concatenate([listPart[0] for listPart in listParts])
+        np_arrMax = np.concatenate([listPart[1] for listPart in listParts])
+        np_arrMean = np.concatenate([listPart[2] for listPart in listParts])
+        np_arrCount = np.concatenate([np.full(len(listPart[0]), listPart[3],
+                                      dtype= np.float64) for listPart in
+                                      listParts])
+
+        if (len(np_arrMin) <= iPoints):
+            return np_arrMin, np_arrMax, np_arrMean
+
+        # Split buckets into groups of the same amount of samples
+        np_arrCumulative = np.cumsum(np_arrCount)
+        np_arrGroups = np.unique(np.searchsorted(np_arrCumulative, np.linspace(
+            0, np_arrCumulative[-1], iPoints, endpoint= False), side= "right"))
+
+        np_arrSum = np.add.reduceat(np_arrMean * np_arrCount[:, None],
+                                    np_arrGroups)
+        return (np.minimum.reduceat(np_arrMin, np_arrGroups),
+                np.maximum.reduceat(np_arrMax, np_arrGroups),
+                np_arrSum / np.add.reduceat(np_arrCount, np_arrGroups)[:, None])
+
+    def get_Processed(self) -> int:
+        """
+        Description
+        -----------
+        Get amount of samples which are combined into the levels.
+
+        Return
+        ------
+        `iProcessed` : int
+            Amount of processed samples
+
+        """
+        return self._iProcessed
+
+    def get_Labels(self) -> list:
+        """
+        Description
+        -----------
+        Get labels of the columns of the levels.
+
+        Return
+        ------
+        `listLabels` : list
+            List containing the labels or an empty list if no bucket was
+            created yet
+
+        """
+        return self._listLabels
+
+    def get_Levels(self) -> list:
+        """
+        Description
+        -----------
+        Get all levels of the pyramid.
+
+        Return
+        ------
+        `listLevels` : list
+            List of [decimation factor, minimum, maximum, mean] for every level
+
+        """
+        return [[self._listFactors[iLevel]] + self._get_Level(iLevel)
+                for iLevel in range(len(self._listLevels))]
+
+    def save(self, strPath : str) -> None:
+        """
+        Description
+        -----------
+        Save the pyramid as compressed .npz file.
+
+        Parameters
+        ----------
+        `strPath` : str
+            Path of the .npz file
+
+        """
+        # Initialize variables
+        dictArrays : dict = {
+            "factors" : np.array(self._listFactors),
+            "labels" : np.array(self._listLabels, dtype= str),
+            "processed" : np.array(self._iProcessed)}
+
+        for iLevel in range(len(self._listLevels)):
+            for strKey, np_arrBucket in zip(["min", "max", "mean"],
+                                            self._get_Level(iLevel)):
+                dictArrays[strKey + str(iLevel)] = np_arrBucket
+
+        with open(strPath, "wb") as outputFile:
+            np.savez_compressed(outputFile, **dictArrays)
+
+    def load(self, strPath : str) -> None:
+        """
+        Description
+        -----------
+        Replace the pyramid with a pyramid saved by `save`.
+
+        Parameters
+        ----------
+        `strPath` : str
+            Path of the .npz file
+
+        """
+        with np.load(strPath) as npzFile:
+            self._listFactors = npzFile["factors"].tolist()
+            self._listLevels = []
+            self._listLength = [0] * len(self._listFactors)
+            self._iProcessed = 0
+
+            if (len(npzFile["labels"]) > 0):
+                self._set_Columns(npzFile["labels"].tolist())
+                for iLevel in range(len(self._listFactors)):
+                    self._append_Buckets(iLevel, npzFile["min" + str(iLevel)],
+                                         npzFile["max" + str(iLevel)],
+                                         npzFile["mean" + str(iLevel)])
+                self._iProcessed = int(npzFile["processed"])
@@ -0,0 +1,82 @@
+"""
+Module implementing different unittests for the decimation_pyramid module.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+# Import internal dependencies
+from .constants import *
+from .data_storage import DataStorage
+
+class DecimationPyramid_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the class
+    DecimationPyramid.
+
+    """
+    def test_get_DataWindow(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that decimated time windows contain the extreme
+        values of the raw samples and that a saved pyramid is reused.
+
+        """
+        # Test data storage object (time in ms equals the index)
+        iLength : int = 3 * FREISTAT_DECIMATION_UPDATE + 21
+        _DataStorage = DataStorage()
+        _DataStorage.append_DataBatch([[1, iIndex, np.sin(iIndex / 100.0),
+                                        float(iIndex % 7), float(iIndex)]
+                                       for iIndex in range(iLength)])
+
+        # Check window of every sample and a window inside the samples
+        for fStartTime, fEndTime, iPoints in [(0, iLength, 100),
+                                              (1000.5, 5000, 37),
+                                              (iLength - 10, iLength, 100)]:
+            np_arrMin, np_arrMax, np_arrMean = _DataStorage.get_DataWindow(
+                fStartTime, fEndTime, iPoints)
+            np_arrTime = _DataStorage.get_Column(DE_TAG_TIME)
+            np_arrVoltage = _DataStorage.get_Column(DE_TAG_VOLTAGE)[
+                (np_arrTime >= fStartTime) & (np_arrTime <= fEndTime)]
+
+            self.assertLessEqual(len(np_arrMin), iPoints)
+            self.assertAlmostEqual(np_arrMin[:, 2].min(), np_arrVoltage.min())
+            self.assertAlmostEqual(np_arrMax[:, 2].max(), np_arrVoltage.max())
+
+        # Save pyramid and load it for the same samples
+        with tempfile.TemporaryDirectory() as strDirectory:
+            strPath : str = os.path.join(strDirectory, FREISTAT_MEMMAP_PYRAMID)
+            _DataStorage.save_DecimationPyramid(strPath)
+
+            _DataStorageLoaded = DataStorage()
+            _DataStorageLoaded.append_DataBatch(_DataStorage.get_StoredData())
+            _DataStorageLoaded.load_DecimationPyramid(strPath)
+
+            # Check results
+            self.assertEqual(
+                _DataStorageLoaded.get_DecimationPyramid().get_Processed(),
+                iLength // FREISTAT_DECIMATION_FACTORS[0] *
+                FREISTAT_DECIMATION_FACTORS[0])
+            for listLevel, listLoaded in zip(
+                _DataStorage.get_DecimationPyramid().get_Levels(),
+                _DataStorageLoaded.get_DecimationPyramid().get_Levels()):
+                np.testing.assert_array_equal(listLevel[3], listLoaded[3])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -55,4 +55,43 @@ dic_configParameters = {
                            "Oversampling rate sinc2 filter encoded as integer"],
     SINC3_OVERSAMPLING  : ["Sinc3 Oversampling rate",
                            "Oversampling rate sinc3 filter encoded as integer"]               
-}
\ No newline at end of file
+}
+
+# Column labels of the data storage objects selected by the amount of values of
+# one sample
+dic_storageLabels = {
+    len(FREISTAT_OCP_LABEL)     : FREISTAT_OCP_LABEL,
+    len(FREISTAT_CV_LABEL)      : FREISTAT_CV_LABEL,
+    len(FREISTAT_OCP_LABEL_SEQ) : FREISTAT_OCP_LABEL_SEQ,
+    len(FREISTAT_CV_LABEL_SEQ)  : FREISTAT_CV_LABEL_SEQ
+}
+
+# Codes of the electrochemical methods in the records of the ring buffer
+dic_methodCodes = {
+    UNDEFIEND   : 0,
+    SEQUENCE    : 1,
+    OCP         : 2,
+    CA          : 3,
+    LSV         : 4,
+    CV          : 5,
+    NPV         : 6,
+    DPV         : 7,
+    SWV         : 8
+}
+
+# File extensions of the compressions of persistent data storage objects and
+# exports
+dic_compressionExtensions = {
+    COMPRESSION_GZIP    : ".gz",
+    COMPRESSION_LZMA    : ".xz",
+    COMPRESSION_ZSTD    : ".zst",
+    COMPRESSION_LZ4     : ".lz4"
+}
+
+# Data types of the columns of the data storage objects (every column which
+# isn't listed uses FREISTAT_STORAGE_FLOAT_TYPE)
+dic_storageTypes = {
+    DE_TAG_SEQ_CYCLE    : FREISTAT_STORAGE_INT_TYPE,
+    DE_TAG_CYCLE        : FREISTAT_STORAGE_INT_TYPE,
+    DE_TAG_DATAPOINT    : FREISTAT_STORAGE_INT_TYPE
+}
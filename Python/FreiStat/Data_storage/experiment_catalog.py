@@ -0,0 +1,245 @@
+"""
+Module implementing a local SQLite catalog of all exported experiments.
+
+The catalog is stored in the core data folder (`Measurements`) and contains one
+entry per exported data object (electrochemical method of an experiment or of
+a sequence) and its experiment parameters:
+
+experiments : method, sequence position, start and end time, sample count and
+              the locations of all exported files
+parameters  : experiment parameters (e.g. pSR) of every entry
+
+Example, all CV runs with a scan rate above 100 mV/s of the last week:
+
+catalog.query_Experiments(CV, {SCAN_RATE : (">", 100)},
+                          fStartTime= time.time() - 7 * 24 * 3600)
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Include dependencies
+import sqlite3
+from pathlib import Path
+
+# Include internal dependencies
+from .constants import *
+
+# Columns of an experiment entry which can be updated
+_listColumns : list = ["method", "start_time", "end_time", "samples",
+                       "csv_file", "parameters_file", "binary_file",
+                       "json_file", "object_path"]
+
+# Supported comparison operators of parameter queries
+_listOperators : list = ["<", "<=", "=", "!=", ">=", ">"]
+
+class ExperimentCatalog:
+    """
+    Description
+    -----------
+    Class which records the exported experiments in a SQLite database and
+    answers queries over them.
+
+    """
+
+    def __init__(self, strPath : str) -> None:
+        """
+        Description
+        -----------
+        Constructor of class ExperimentCatalog. The database and its tables
+        are created if they don't exist.
+
+        Parameters
+        ----------
+        `strPath` : str
+            Path of the SQLite database. Missing folders are created.
+
+        """
+        # Initalize class variable
+        self._strPath : str = strPath
+
+        # Create database and tables
+        Path(strPath).parent.mkdir(parents= True, exist_ok= True)
+        with self._connect() as connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS experiments (
+                    id INTEGER PRIMARY KEY,
+                    directory TEXT NOT NULL,
+                    sequence_position INTEGER NOT NULL,
+                    method TEXT,
+                    start_time REAL,
+                    end_time REAL,
+                    samples INTEGER,
+                    csv_file TEXT,
+                    parameters_file TEXT,
+                    binary_file TEXT,
+                    json_file TEXT,
+                    object_path TEXT,
+                    UNIQUE (directory, sequence_position));
+                CREATE TABLE IF NOT EXISTS parameters (
+                    experiment_id INTEGER NOT NULL REFERENCES experiments(id),
+                    key TEXT NOT NULL,
+                    value,
+                    PRIMARY KEY (experiment_id, key));
+                CREATE INDEX IF NOT EXISTS experiments_method
+                    ON experiments (method, start_time);
+                CREATE INDEX IF NOT EXISTS parameters_key
+                    ON parameters (key, value);""")
+        connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Description
+        -----------
+        Open a connection to the database. A new connection is used for every
+        operation, so the catalog can be updated from several processes.
+
+        Return
+        ------
+        `connection` : sqlite3.Connection
+            Connection to the database
+
+        """
+        connection = sqlite3.connect(self._strPath,
+                                     timeout= FREISTAT_CATALOG_TIMEOUT)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def update_Experiment(self, strDirectory : str, iSequencePosition : int,
+                          dictColumns : dict,
+                          listExperimentParameters : list = None) -> None:
+        """
+        Description
+        -----------
+        Create or update the entry of an exported data object.
+
+        Parameters
+        ----------
+        `strDirectory` : str
+            Directory of the experiment data
+
+        `iSequencePosition` : int
+            Position of the data object in the sequence
+
+        `dictColumns` : dict
+            Columns of the entry which should be updated (e.g. {"samples" : 10})
+
+        `listExperimentParameters` : list
+            List of [key, value] pairs replacing the stored experiment
+            parameters of the entry
+
+        """
+        # Only update known columns
+        listKeys : list = [strKey for strKey in dictColumns
+                           if strKey in _listColumns]
+
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO experiments (directory, sequence_position) "
+                "VALUES (?, ?) ON CONFLICT DO NOTHING",
+                (strDirectory, iSequencePosition))
+
+            if (len(listKeys) > 0):
+                connection.execute(
+                    "UPDATE experiments SET " +
+                    ", ".join(strKey + " = ?" for strKey in listKeys) +
+                    " WHERE directory = ? AND sequence_position = ?",
+                    [dictColumns[strKey] for strKey in listKeys] +
+                    [strDirectory, iSequencePosition])
+
+            if (listExperimentParameters is not None):
+                iId : int = connection.execute(
+                    "SELECT id FROM experiments WHERE directory = ? AND "
+                    "sequence_position = ?",
+                    (strDirectory, iSequencePosition)).fetchone()[0]
+                connection.execute(
+                    "DELETE FROM parameters WHERE experiment_id = ?", (iId,))
+                connection.executemany(
+                    "INSERT INTO parameters VALUES (?, ?, ?)",
+                    [(iId, listParameter[0], listParameter[1])
+                     for listParameter in listExperimentParameters])
+        connection.close()
+
+    def query_Experiments(self, strMethod : str = None,
+                          dictParameters : dict = None,
+                          fStartTime : float = None,
+                          fEndTime : float = None) -> list:
+        """
+        Description
+        -----------
+        Query the catalog for exported data objects.
+
+        Parameters
+        ----------
+        `strMethod` : str
+            Electrochemical method (e.g. CV) or None for every method
+
+        `dictParameters` : dict
+            Conditions on the experiment parameters in the form
+            {key : (operator, value)}, e.g. {SCAN_RATE : (">", 100)}.
+            Supported operators: <, <=, =, !=, >=, >
+
+        `fStartTime` : float
+            Only return experiments started at or after this time (seconds
+            since the epoch)
+
+        `fEndTime` : float
+            Only return experiments started before this time (seconds since
+            the epoch)
+
+        Return
+        ------
+        `listExperiments` : list
+            List of dictionaries containing all columns of the matching
+            entries and their experiment parameters (key "parameters"),
+            ordered by start time
+
+        """
+        # Initialize variables
+        listConditions : list = []
+        listValues : list = []
+
+        if (strMethod is not None):
+            listConditions.append("method = ?")
+            listValues.append(strMethod)
+        if (fStartTime is not None):
+            listConditions.append("start_time >= ?")
+            listValues.append(fStartTime)
+        if (fEndTime is not None):
+            listConditions.append("start_time < ?")
+            listValues.append(fEndTime)
+
+        for strKey, tupleCondition in (dictParameters or {}).items():
+            strOperator, value = tupleCondition
+            if (strOperator not in _listOperators):
+                raise ValueError("Operator not supported: " + strOperator)
+            listConditions.append(
+                "EXISTS (SELECT 1 FROM parameters WHERE experiment_id = "
+                "experiments.id AND key = ? AND value " + strOperator + " ?)")
+            listValues.extend([strKey, value])
+
+        with self._connect() as connection:
+            listRows : list = connection.execute(
+                "SELECT * FROM experiments" +
+                (" WHERE " + " AND ".join(listConditions)
+                 if len(listConditions) > 0 else "") +
+                " ORDER BY start_time", listValues).fetchall()
+
+            listExperiments : list = []
+            for row in listRows:
+                dictExperiment : dict = dict(row)
+                dictExperiment["parameters"] = {
+                    rowParameter["key"] : rowParameter["value"] for
+                    rowParameter in connection.execute(
+                        "SELECT key, value FROM parameters WHERE "
+                        "experiment_id = ?", (row["id"],))}
+                listExperiments.append(dictExperiment)
+        connection.close()
+
+        return listExperiments
@@ -0,0 +1,70 @@
+"""
+Module implementing different unittests for the experiment_catalog module.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import os
+import tempfile
+import unittest
+
+# Import internal dependencies
+from .constants import *
+from .experiment_catalog import ExperimentCatalog
+
+class ExperimentCatalog_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the class
+    ExperimentCatalog.
+
+    """
+    def test_query_Experiments(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing the update of catalog entries and the queries on
+        method, start time and experiment parameters.
+
+        """
+        with tempfile.TemporaryDirectory() as strDirectory:
+            # Create a test instance of the ExperimentCatalog
+            _ExperimentCatalog = ExperimentCatalog(os.path.join(
+                strDirectory, FREISTAT_CORE_DATA_FOLDER, FREISTAT_CATALOG))
+
+            # Test entries (directory, method, start time, scan rate)
+            for strTestDirectory, strMethod, fStartTime, fScanRate in [
+                ("A", CV, 100.0, 50), ("B", CV, 200.0, 150),
+                ("C", CV, 300.0, 250), ("D", LSV, 400.0, 500)]:
+                _ExperimentCatalog.update_Experiment(
+                    strTestDirectory, 0,
+                    {"method" : strMethod, "start_time" : fStartTime},
+                    [[SCAN_RATE, fScanRate], [CYCLE, 2]])
+
+            # Update existing entry
+            _ExperimentCatalog.update_Experiment("B", 0, {"samples" : 10})
+
+            # Check results
+            listExperiments : list = _ExperimentCatalog.query_Experiments(
+                CV, {SCAN_RATE : (">", 100)}, fStartTime= 150.0)
+            self.assertEqual([dictExperiment["directory"] for dictExperiment
+                              in listExperiments], ["B", "C"])
+            self.assertEqual(listExperiments[0]["samples"], 10)
+            self.assertEqual(listExperiments[0]["parameters"],
+                             {SCAN_RATE : 150, CYCLE : 2})
+            self.assertEqual(len(_ExperimentCatalog.query_Experiments(
+                fEndTime= 400.0)), 3)
+            self.assertRaises(ValueError, _ExperimentCatalog.query_Experiments,
+                              dictParameters= {SCAN_RATE : ("; --", 1)})
+
+if __name__ == '__main__':
+    unittest.main()
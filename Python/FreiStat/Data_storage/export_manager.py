@@ -0,0 +1,177 @@
+"""
+Module implementing a class which resolves the absolute paths of all exported
+files without changing the working directory of the process.
+
+The exported files are stored in the following layout relative to the base
+directory (working directory when the export manager is created):
+
+Measurements/<yy_mm_dd>/<HH_MM_SS>/               : csv, binary and JSON exports
+Persistent_Data_Objects/<yy_mm_dd>/<HH_MM_SS>/    : journals and memory maps
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Include dependencies
+import time
+from pathlib import Path
+
+# Include internal dependencies
+from .constants import *
+
+class ExportManager:
+    """
+    Description
+    -----------
+    Class which creates the export directories and resolves the paths of the
+    exported files.
+
+    """
+
+    def __init__(self, strBaseDirectory : str = "") -> None:
+        """
+        Description
+        -----------
+        Constructor of class ExportManager
+
+        Parameters
+        ----------
+        `strBaseDirectory` : str
+            Directory in which the export folders are created. If empty, the
+            current working directory is used.
+
+        """
+        # Initalize class variable
+        self._pathBase : Path = Path(strBaseDirectory or Path.cwd()).resolve()
+        self._listDirectories : list = [None, None]
+        self._fStartTime : float = 0.0
+
+    def setup_Directories(self) -> None:
+        """
+        Description
+        -----------
+        Create the directories for the current experiment. Existing
+        directories are reused.
+
+        """
+        # Initialize variables
+        self._fStartTime = time.time()
+        timeStruct : time.struct_time = time.localtime(self._fStartTime)
+        strDay : str = time.strftime("%y_%m_%d", timeStruct)
+        strTime : str = time.strftime("%H_%M_%S", timeStruct)
+
+        # Create directory for the experiment data and the data objects
+        for iDirectorySelect, strCoreFolder in [
+            (FREISTAT_CSV_EXPORT, FREISTAT_CORE_DATA_FOLDER),
+            (FREISTAT_OBJECT_EXPORT, FREISTAT_CORE_OBJECT_FOLDER)]:
+            pathDirectory : Path = self._pathBase / strCoreFolder / strDay / \
+                                   strTime
+            pathDirectory.mkdir(parents= True, exist_ok= True)
+            self._listDirectories[iDirectorySelect] = pathDirectory
+
+    def get_Directory(self, iDirectorySelect : int) -> Path:
+        """
+        Description
+        -----------
+        Get directory of the current experiment.
+
+        Parameters
+        ----------
+        `iDirectorySelect` : int
+            Directory of the experiment data (FREISTAT_CSV_EXPORT) or of the
+            data objects (FREISTAT_OBJECT_EXPORT)
+
+        Return
+        ------
+        `pathDirectory` : Path
+            Absolute path of the directory or None if `setup_Directories`
+            wasn't called yet
+
+        """
+        return self._listDirectories[iDirectorySelect]
+
+    def get_CoreDirectory(self, iDirectorySelect : int) -> Path:
+        """
+        Description
+        -----------
+        Get core directory containing the directories of all experiments.
+
+        Parameters
+        ----------
+        `iDirectorySelect` : int
+            Directory of the experiment data (FREISTAT_CSV_EXPORT) or of the
+            data objects (FREISTAT_OBJECT_EXPORT)
+
+        Return
+        ------
+        `pathDirectory` : Path
+            Absolute path of the core directory
+
+        """
+        if (iDirectorySelect == FREISTAT_CSV_EXPORT):
+            return self._pathBase / FREISTAT_CORE_DATA_FOLDER
+        return self._pathBase / FREISTAT_CORE_OBJECT_FOLDER
+
+    def get_StartTime(self) -> float:
+        """
+        Description
+        -----------
+        Get time at which the directories of the current experiment were
+        created.
+
+        Return
+        ------
+        `fStartTime` : float
+            Time in seconds since the epoch
+
+        """
+        return self._fStartTime
+
+    def get_FilePath(self, iDirectorySelect : int, strName : str) -> Path:
+        """
+        Description
+        -----------
+        Get absolute path of a file in a directory of the current experiment.
+
+        Parameters
+        ----------
+        `iDirectorySelect` : int
+            Directory of the experiment data (FREISTAT_CSV_EXPORT) or of the
+            data objects (FREISTAT_OBJECT_EXPORT)
+
+        `strName` : str
+            File name
+
+        Return
+        ------
+        `pathFile` : Path
+            Absolute path of the file
+
+        """
+        return self._listDirectories[iDirectorySelect] / strName
+
+    def is_Setup(self, iDirectorySelect : int) -> bool:
+        """
+        Description
+        -----------
+        Check if the directory of the current experiment is created.
+
+        Parameters
+        ----------
+        `iDirectorySelect` : int
+            Directory of the experiment data (FREISTAT_CSV_EXPORT) or of the
+            data objects (FREISTAT_OBJECT_EXPORT)
+
+        Return
+        ------
+        `bSetup` : bool
+            True if `setup_Directories` was called
+
+        """
+        return self._listDirectories[iDirectorySelect] is not None
@@ -0,0 +1,66 @@
+"""
+Module implementing different unittests for the export_manager module.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import os
+import tempfile
+import unittest
+
+# Import internal dependencies
+from .constants import *
+from .export_manager import ExportManager
+
+class ExportManager_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the class ExportManager.
+
+    """
+    def test_setup_Directories(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that the export directories are created in the
+        expected layout without changing the working directory.
+
+        """
+        # Initialize variables
+        strWorkingDirectory : str = os.getcwd()
+
+        with tempfile.TemporaryDirectory() as strDirectory:
+            # Create a test instance of the ExportManager
+            _ExportManager = ExportManager(strDirectory)
+            self.assertFalse(_ExportManager.is_Setup(FREISTAT_CSV_EXPORT))
+
+            # Setup twice to check that existing directories are reused
+            _ExportManager.setup_Directories()
+            _ExportManager.setup_Directories()
+
+            # Check results
+            for iDirectorySelect, strCoreFolder in [
+                (FREISTAT_CSV_EXPORT, FREISTAT_CORE_DATA_FOLDER),
+                (FREISTAT_OBJECT_EXPORT, FREISTAT_CORE_OBJECT_FOLDER)]:
+                pathDirectory = _ExportManager.get_Directory(iDirectorySelect)
+                self.assertTrue(pathDirectory.is_dir())
+                self.assertTrue(pathDirectory.is_absolute())
+                self.assertEqual(pathDirectory.parent.parent.name,
+                                 strCoreFolder)
+
+            self.assertEqual(_ExportManager.get_FilePath(
+                FREISTAT_CSV_EXPORT, "Test.csv").parent,
+                _ExportManager.get_Directory(FREISTAT_CSV_EXPORT))
+            self.assertEqual(os.getcwd(), strWorkingDirectory)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Module implementing a streaming export of the experiment data as
+newline-delimited JSON (NDJSON).
+
+The first line of the file is a header record containing the experiment type,
+the experiment parameters and the column labels. Every following line contains
+one sample with the column labels as keys:
+
+{"Electrochemical method": "CV", "Experiment parameters": {...}, "Columns": [...]}
+{"Cycle": 1, "Data point": 1, "Voltage in mV": -200.5, ...}
+
+The records are generated block wise from the stored columns, so the memory
+usage doesn't depend on the amount of samples. Since only complete lines are
+appended, the file can be read while the experiment is running.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Include dependencies
+import json
+from typing import Iterator
+
+# Include internal dependencies
+from .constants import *
+from .data_storage import DataStorage
+from .dictionaries import *
+
+def generate_NDJSONHeader(dataStorage : DataStorage) -> str:
+    """
+    Description
+    -----------
+    Generate the header record of a data storage object.
+
+    Parameters
+    ----------
+    `dataStorage` : DataStorage
+        Data storage object which should be exported
+
+    Return
+    ------
+    `strRecord` : str
+        Header record terminated by a newline
+
+    """
+    # Initialize variables
+    dictParameters : dict = {}
+
+    # Describe every experiment parameter like the csv export
+    for listParameter in dataStorage.get_ExperimentParameters():
+        dictParameters[listParameter[0]] = {
+            "Name" : dic_configParameters[listParameter[0]][0],
+            "Description" : dic_configParameters[listParameter[0]][1],
+            "Value" : listParameter[1]}
+
+    return json.dumps({
+        "Electrochemical method" : dataStorage.get_ExperimentType(),
+        "Experiment parameters" : dictParameters,
+        "Columns" : dataStorage.get_ColumnLabels()}) + "\n"
+
+def generate_NDJSONRecords(dataStorage : DataStorage,
+                           iStart : int = 0) -> Iterator[str]:
+    """
+    Description
+    -----------
+    Generate one record per stored sample.
+
+    Parameters
+    ----------
+    `dataStorage` : DataStorage
+        Data storage object which should be exported
+
+    `iStart` : int
+        Index of the first sample which should be exported
+
+    Return
+    ------
+    `strRecord` : str
+        Record of one sample terminated by a newline
+
+    """
+    # Initialize variables
+    listLabels : list = dataStorage.get_ColumnLabels()
+
+    for np_arrBlock in dataStorage.get_DataBlocks(iStart):
+        for tupleSample in np_arrBlock.tolist():
+            yield json.dumps(dict(zip(listLabels, tupleSample))) + "\n"
@@ -0,0 +1,60 @@
+"""
+Module implementing different unittests for the ndjson_export module.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import json
+import unittest
+
+# Import internal dependencies
+from .constants import *
+from .data_storage import DataStorage
+from .ndjson_export import generate_NDJSONHeader, generate_NDJSONRecords
+
+class NDJSONExport_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the NDJSON export.
+
+    """
+    def test_generate_NDJSONRecords(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing the header record and the incremental generation of
+        the sample records.
+
+        """
+        # Test data storage object
+        listTest : list = [[1, iIndex, -200.5 + iIndex, 3.25, 120.0 + iIndex]
+                           for iIndex in range(FREISTAT_STORAGE_CHUNK_SIZE + 5)]
+        _DataStorage = DataStorage()
+        _DataStorage.save_ExperimentType(CV)
+        _DataStorage.save_ExperimentParameters([[CYCLE, 2]])
+        _DataStorage.append_DataBatch(listTest)
+
+        # Check header record
+        dictHeader : dict = json.loads(generate_NDJSONHeader(_DataStorage))
+        self.assertEqual(dictHeader["Electrochemical method"], CV)
+        self.assertEqual(dictHeader["Experiment parameters"][CYCLE]["Value"], 2)
+        self.assertEqual(dictHeader["Columns"], FREISTAT_CV_LABEL)
+
+        # Check sample records starting in the middle of the data
+        listRecords : list = [json.loads(strRecord) for strRecord in
+                              generate_NDJSONRecords(_DataStorage, 3)]
+        self.assertEqual([list(dictRecord.values()) for dictRecord in
+                          listRecords], listTest[3:])
+        self.assertEqual(list(listRecords[0].keys()), FREISTAT_CV_LABEL)
+
+if __name__ == '__main__':
+    unittest.main()
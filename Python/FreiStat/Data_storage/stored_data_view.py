@@ -0,0 +1,72 @@
+"""
+Module implementing a lazy, read only view on the experiment data of a
+columnar data storage object.
+
+The view behaves like the list of samples which was used to store the
+experiment data before, so existing callers can still use `len`, indexing and
+iteration. Every sample is only converted into a list when it is accessed.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Include dependencies
+from typing import Iterator
+
+class StoredDataView:
+    """
+    Description
+    -----------
+    Class providing row wise access to the chunks of a data storage object.
+
+    """
+
+    def __init__(self, dataStorage) -> None:
+        """
+        Description
+        -----------
+        Constructor of class StoredDataView
+
+        Parameters
+        ----------
+        `dataStorage` : DataStorage
+            Reference to the data storage object whose samples are accessed.
+            Samples appended after creating the view are visible as well.
+
+        """
+        # Save reference to data storage object
+        self._dataStorage = dataStorage
+
+    def __len__(self) -> int:
+        return self._dataStorage.get_DataLength()
+
+    def __getitem__(self, index):
+        # Initialize variables
+        iLength : int = self._dataStorage.get_DataLength()
+
+        # Return list of samples for slices
+        if (isinstance(index, slice)):
+            return [self[iIndex] for iIndex in range(*index.indices(iLength))]
+
+        # Support negative indices like a list
+        if (index < 0):
+            index += iLength
+        if (index < 0 or index >= iLength):
+            raise IndexError("Stored data index out of range")
+
+        return list(self._dataStorage.get_DataChunks()
+                    [index // self._dataStorage.get_ChunkSize()]
+                    [index % self._dataStorage.get_ChunkSize()].tolist())
+
+    def __iter__(self) -> Iterator[list]:
+        # Convert blocks of samples at once, so large (memory-mapped) chunks
+        # are never converted completely
+        for np_arrBlock in self._dataStorage.get_DataBlocks():
+            for tupleSample in np_arrBlock.tolist():
+                yield list(tupleSample)
@@ -19,9 +19,13 @@ __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 # Import dependencies
 from multiprocessing.queues import Queue
 
+import numpy as np
+
 # Import internal dependencies
 from ...Data_storage.constants import *
 from ...Data_storage.data_software_storage import DataSoftwareStorage
+from ...Data_storage.data_storage import get_SampleType
+from ...Utility.data_queue_producer import DataQueueProducer
 
 class ExecuteBehavior():
     """
@@ -60,6 +64,9 @@ class ExecuteBehavior():
         # Get flag of the low performance mode
         self._lowPerformaneMode = self._dataSoftwareStorage.get_LowPerformanceMode()
 
+        # Producer collecting the samples for the data queue
+        self._dataQueueProducer : DataQueueProducer = None
+
     def execute(self, 
                 dataQueue : Queue,
                 iTelegrams : int = 3,
@@ -101,4 +108,180 @@ class ExecuteBehavior():
 
         """
         # Execute inheritance error, since this method should never be used
-        return EC_EXECUTE + EC_EX_INHERIT_ERROR
\ No newline at end of file
+        return EC_EXECUTE + EC_EX_INHERIT_ERROR
+
+    def _flush_Samples(self, dataQueue : Queue, listBatch : list) -> None:
+        """
+        Description
+        -----------
+        Store a batch of converted samples in the data storage and hand it to
+        the producer of the data queue, which publishes the samples block wise.
+
+        Parameters
+        ----------
+        `dataQueue` : Queue
+            Data queue which is used as a pipe between processes
+
+        `listBatch` : list | np.ndarray
+            List containing the converted samples or structured array of a
+            block of converted samples
+
+        """
+        # Check if samples are available
+        if (len(listBatch) == 0):
+            return
+
+        # Add data to data storage
+        self._dataHandling.append_StoredDataBatch(listBatch)
+
+        # Add data to dataQueue
+        self._get_DataQueueProducer(dataQueue).append_Samples(listBatch)
+
+        # Publish progress of the experiment
+        self._update_Status(listBatch)
+
+    def _store_SampleBlock(self, dataQueue, np_arrRecords : np.ndarray,
+                           bResetTime : bool, listFields : list) -> None:
+        """
+        Description
+        -----------
+        Store the records of a binary data telegram as blocks in the data
+        storage and the data queue. The records are only split where a new run
+        starts and converted column wise, like `_store_Samples` converts every
+        single sample.
+
+        Parameters
+        ----------
+        `dataQueue` : Queue
+            Data queue which is used as a pipe between processes
+
+        `np_arrRecords` : np.ndarray
+            Structured array of the binary records (see BINARY_RECORD_DTYPE)
+
+        `bResetTime` : bool
+            Flag indicating if the reference time is reset by every new run
+
+        `listFields` : list
+            Fields of the records which are stored in front of the time stamp
+
+        """
+        # Initialize variables
+        np_arrRuns : np.ndarray = np_arrRecords[RUN]
+
+        for np_arrRun in np.split(np_arrRecords, 
+            np.flatnonzero(np_arrRuns[1:] != np_arrRuns[:-1]) + 1):
+            # Unpack first sample of the run
+            iRun : int = int(np_arrRun[RUN][0])
+            fTimeStamp : float = float(np_arrRun[TIME_STAMP][0])
+
+            # Set reference time
+            if (self._referenceTime == -1):
+                self._referenceTime = fTimeStamp
+
+            # Check if a new run started
+            if (self._iRun != iRun):
+                # Reset reference time
+                if (bResetTime == True):
+                    self._referenceTime = fTimeStamp
+
+                # Check if low performance mode is enabled
+                if (self._lowPerformaneMode == True):
+                    print("Cycle: " + str(iRun))
+
+                # Save current run
+                self._iRun = iRun
+
+            # Convert samples
+            self._flush_Samples(dataQueue, self._create_SampleBlock(
+                [np_arrRun[strField] for strField in listFields] +
+                [np_arrRun[TIME_STAMP].astype(np.float64) - self._referenceTime]))
+
+    def _create_SampleBlock(self, listColumns : list) -> np.ndarray:
+        """
+        Description
+        -----------
+        Create a block of converted samples in the column layout of the data
+        storage.
+
+        Parameters
+        ----------
+        `listColumns` : list
+            Values of every column, the last column has to be an array
+
+        Return
+        ------
+        `np_arrBatch` : np.ndarray
+            Structured array containing the converted samples
+
+        """
+        # Initialize variables
+        np_arrBatch = np.empty(len(listColumns[-1]),
+                               dtype= get_SampleType(len(listColumns)))
+
+        for strLabel, column in zip(np_arrBatch.dtype.names, listColumns):
+            np_arrBatch[strLabel] = column
+
+        return np_arrBatch
+
+    def _update_Status(self, listBatch : list) -> None:
+        """
+        Description
+        -----------
+        Count the stored samples in the status block. The first value of the
+        last sample is published as current cycle, the last value as 
+        timestamp.
+
+        Parameters
+        ----------
+        `listBatch` : list
+            List containing the converted samples
+
+        """
+        # Get reference to the status block
+        statusBlock = self._dataSoftwareStorage.get_StatusBlock()
+
+        if (statusBlock is not None):
+            statusBlock.add_Samples(len(listBatch), int(listBatch[-1][0]),
+                                    float(listBatch[-1][-1]))
+
+    def _get_DataQueueProducer(self, dataQueue) -> DataQueueProducer:
+        """
+        Description
+        -----------
+        Get the producer of the data queue, which is created on first use.
+
+        Parameters
+        ----------
+        `dataQueue` : SharedRingBuffer
+            Data queue which is used as a pipe between processes
+
+        Return
+        ------
+        `dataQueueProducer` : DataQueueProducer
+            Producer collecting the samples for the data queue
+
+        """
+        if (self._dataQueueProducer is None):
+            self._dataQueueProducer = DataQueueProducer(dataQueue)
+        return self._dataQueueProducer
+
+    def _publish_Samples(self, dataQueue, bForce : bool = True) -> None:
+        """
+        Description
+        -----------
+        Publish the samples collected by the producer of the data queue.
+
+        Parameters
+        ----------
+        `dataQueue` : SharedRingBuffer
+            Data queue which is used as a pipe between processes
+
+        `bForce` : bool
+            Flag indicating if all samples should be published or only if
+            the max. delay of the producer passed
+
+        """
+        if (bForce == True):
+            self._get_DataQueueProducer(dataQueue).flush()
+        else:
+            self._get_DataQueueProducer(dataQueue).poll()
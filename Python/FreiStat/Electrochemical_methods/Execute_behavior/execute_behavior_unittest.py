@@ -0,0 +1,111 @@
+"""
+Module implementing different unittests for the execute behaviors of the
+electrochemical methods.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import os
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+# Import internal dependencies
+from ...Data_storage.constants import *
+from ...Data_storage.data_handling import DataHandling
+from ...Data_storage.data_software_storage import DataSoftwareStorage
+from ...JSON_parser.data_telegram_parser import DataSample
+from ...Utility.shared_ring_buffer import SharedRingBuffer
+from ..Execute_behavior.execute_cv import ExecuteCV
+from ...Methods.acquisition_worker_unittest import FakeFreiStat
+from ...Methods.run_cyclic_voltammetry import Run_CV
+
+class ExecuteBehavior_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the execute behaviors.
+
+    """
+    def test_terminate_Execute(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that an experiment waiting for the next telegram
+        is terminated within a few wait timeouts.
+
+        """
+        # FreiStat sending the second sample only after 2 s
+        fakeFreiStat = FakeFreiStat(iSamples= 2, fSampleTime= 2.0)
+        strWorkingDirectory : str = os.getcwd()
+
+        with tempfile.TemporaryDirectory() as strDirectory:
+            os.chdir(strDirectory)
+            try:
+                streamSamples = Run_CV(commnicationMode= FREISTAT_WLAN,
+                    wlanSetting= fakeFreiStat.get_WLANSetting()).stream(
+                    EnableOptimizer= False)
+                self.assertEqual(len(next(streamSamples)), 1)
+
+                # Terminate while the experiment waits for data
+                fStart : float = time.monotonic()
+                streamSamples.close()
+                self.assertLess(time.monotonic() - fStart,
+                                10 * FREISTAT_WAIT_TIMEOUT)
+            finally:
+                os.chdir(strWorkingDirectory)
+                fakeFreiStat.close()
+
+    def test_store_SampleBlock(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that records of binary data telegrams are stored 
+        like the same samples received as DataSample records.
+
+        """
+        np_arrRecords = np.array([(1, 1, 0.5, -1.5, 10), (1, 2, 0.6, -1.4, 20),
+                                  (2, 1, 0.7, -1.3, 30), (2, 2, 0.8, -1.2, 40)],
+                                 dtype= BINARY_RECORD_DTYPE)
+        listResults : list = []
+
+        for samples in [np_arrRecords, 
+                        [DataSample(*tupleRecord) for tupleRecord in 
+                         np_arrRecords.tolist()]]:
+            # Create execute behavior storing the samples
+            _DataSoftwareStorage = DataSoftwareStorage()
+            _DataHandling = DataHandling(_DataSoftwareStorage)
+            _DataHandling.create_DataObject()
+            _DataHandling.save_ExperimentType(CV)
+
+            _ExecuteCV = ExecuteCV(_DataSoftwareStorage)
+            _ExecuteCV._referenceTime = -1
+            _ExecuteCV._iRun = -1
+
+            dataQueue = SharedRingBuffer(iCapacity= 16)
+            try:
+                _ExecuteCV._store_Samples(dataQueue, samples)
+                _ExecuteCV._publish_Samples(dataQueue)
+
+                listResults.append((list(_DataHandling.get_StoredData()),
+                                    dataQueue.get_Records()))
+            finally:
+                dataQueue.close()
+
+        # Time stamp is reset for every run
+        self.assertEqual(listResults[0][0][2], [2, 1, 0.699999988079071, 
+                                                -1.2999999523162842, 0.0])
+        self.assertEqual(listResults[0], listResults[1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,8 @@ __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 import multiprocessing as mp
 from multiprocessing.queues import Queue
 
+import numpy as np
+
 # Import internal dependencies
 from ...Data_storage.constants import *
 from .execute_behavior import ExecuteBehavior
@@ -104,10 +106,9 @@ class ExecuteCV(ExecuteBehavior):
             .generateCommandTelegram(listCommandIDs[iIndex], 
                                      listCommandSubIDs[iIndex])[1])
 
-            # Wait as long as the input buffer is empty
-            while(self._communicationMode == FREISTAT_SERIAL):
-                if (self._serialConnection.get_SerialConnection().in_waiting > 0):
-                    break
+            # Block until the acknowledge telegram is received
+            while(self._serialConnection.wait_for_data(
+                  FREISTAT_WAIT_TIMEOUT) == False):
                 pass
 
             # Read acknowledge telegram
@@ -150,101 +151,120 @@ class ExecuteCV(ExecuteBehavior):
 
         """
         # Initialize variables
-        iDataPoint : int = 0
-
-        fCurrent : float = 0
-        fVoltage : float = 0
-        fTimeStamp : float = 0
-
-        strRun : str = ""
-        strReadData : str = ""
+        self._iRun : int = -1
 
         while(True):
-            # Initialize variables
-            listReadData : list = []
+            # Block until a telegram is received or the experiment is terminated
+            while(self._serialConnection.wait_for_data(
+                  FREISTAT_WAIT_TIMEOUT) == False):
+                # Publish collected samples while waiting
+                self._publish_Samples(dataQueue, bForce= False)
 
-            while(self._communicationMode == FREISTAT_SERIAL):
-                if(self._serialConnection.get_SerialConnection().in_waiting > 0):
+                if (self._event.is_set()):
                     break
-                pass
-
-            # Read byte stream from serial connection and convert into string
-            strReadData = self._serialConnection.read_Data("JSON").\
-                decode("utf-8")
-
-            # Parse JSON string
-            iCurrenPosition, bErrorflag, listReadData = \
-            self._jsonParser.parse_JSON_string(listReadData, strReadData)
-
-            # Check if system status is set to experiment startet
-            if (self._dataSoftwareStorage.get_SystemStatus() == 
-                FREISTAT_EXP_STARTED):
-                # Set system status to running experiment
-                self._dataSoftwareStorage.set_SystemStatus(
-                    FREISTAT_EXP_RUNNING)
 
             # Check if termination event occured
             if (self._event.is_set()):
                 # Send stop command
                 self._serialConnection.write_Data("{\"C\":3,\"ExC\":\"Stop\"}")
 
-                while(self._serialConnection.get_SerialConnection().in_waiting > 0 and
-                    self._iCommunicationMode == FREISTAT_SERIAL):
+                # Discard remaining telegrams until the connection is idle
+                while(self._serialConnection.wait_for_data(
+                      FREISTAT_DRAIN_TIMEOUT) == True):
                     # Read JSON-telegram
-                    self._serialConnection.read_Data("JSON").decode("utf-8")
-                    
+                    self._serialConnection.read_Data("JSON")
+
                 # Export data storage object
-                self._dataHandling.export_DataStorage()      
+                self._dataHandling.export_DataStorage()
                 break    
 
+            # Read next telegram, which is parsed while receiving
+            iTelegramType, telegramContent = \
+                self._serialConnection.read_Telegram()
+
+            # Check if system status is set to experiment startet
+            if (self._dataSoftwareStorage.get_SystemStatus() == 
+                FREISTAT_EXP_STARTED):
+                # Set system status to running experiment
+                self._dataSoftwareStorage.set_SystemStatus(
+                    FREISTAT_EXP_RUNNING)
+
             # Check if send telegram is a data telegram
-            if (listReadData[0][0] == ("\"" + RUN + "\"")):
-                # Set reference time
-                if (self._referenceTime == -1):
-                    self._referenceTime = float(listReadData[1][1][3][1])
-
-                # Check if a new run started
-                if (strRun != listReadData[0][1]):
-                    # Export data storage object
-                    self._dataHandling.export_DataStorage()
-
-                    # Reset reference time
-                    self._referenceTime = float(listReadData[1][1][3][1]) 
-
-                    # Check if low performance mode is enabled
-                    if (self._lowPerformaneMode == True):
-                        print("Cycle: " + strRun)
-
-                # Get current run
-                strRun = listReadData[0][1]
-
-                # Get datapoint
-                iDataPoint = int(listReadData[1][1][0][1], 10)
-
-                # Convert data
-                fVoltage = float(listReadData[1][1][1][1])   
-                fCurrent = float(listReadData[1][1][2][1])          
-                fTimeStamp = float(listReadData[1][1][3][1]) - \
-                    self._referenceTime
-                
-                # Add data to data storage
-                self._dataHandling.append_StoredData(
-                        [int(strRun,10),
-                        iDataPoint,
-                        fVoltage,
-                        fCurrent,
-                        fTimeStamp])
-                
-                # Add data to dataQueue
-                dataQueue.put([int(strRun,10),
-                                iDataPoint,
-                                fVoltage,
-                                fCurrent,
-                                fTimeStamp])
+            if (iTelegramType == TELEGRAM_TYPE_DATA):
+                # Store all samples of the telegram
+                self._store_Samples(dataQueue, telegramContent)
 
             # Check if send telegram is a command telegram
-            elif (listReadData[0][0] == ("\"" + COMMAND_TELEGRAM + "\"")):
+            elif (iTelegramType == TELEGRAM_TYPE_COMMAND):
                 # Experiment completed, update system status
                 self._dataSoftwareStorage.set_SystemStatus(
                     FREISTAT_EXP_COMPLETED)
-                break
\ No newline at end of file
+                break
+
+        # Publish remaining samples
+        self._publish_Samples(dataQueue)
+
+    def _store_Samples(self, dataQueue, listSamples : list) -> None:
+        """
+        Description
+        -----------
+        Store all samples received with one telegram in the data storage and
+        the data queue. Samples of different runs are stored seperatly, so that
+        the data storage object can be exported in between.
+
+        Parameters
+        ----------
+        `dataQueue` : Queue
+            Data queue which is used as a pipe between processes
+
+        `listSamples` : list | np.ndarray
+            List of DataSample records or structured array of the records of
+            a binary data telegram
+
+        """
+        # Records of binary data telegrams are stored block wise
+        if (isinstance(listSamples, np.ndarray)):
+            self._store_SampleBlock(dataQueue, listSamples, 
+                True, 
+                [RUN, DATA_PAIR_NUMBER, VOLTAGE_VALUE, CURRENT_VALUE])
+            return
+
+        # Initialize variables
+        listBatch : list = []
+
+        for dataSample in listSamples:
+            # Unpack converted sample
+            iRun : int = dataSample.iRun
+            iDataPoint : int = dataSample.iDataPoint
+            fTimeStamp : float = dataSample.fTimeStamp
+
+            # Set reference time
+            if (self._referenceTime == -1):
+                self._referenceTime = fTimeStamp
+
+            # Check if a new run started
+            if (self._iRun != iRun):
+                # Store samples of the previous run
+                self._flush_Samples(dataQueue, listBatch)
+                listBatch = []
+
+                # Reset reference time
+                self._referenceTime = fTimeStamp
+
+                # Check if low performance mode is enabled
+                if (self._lowPerformaneMode == True):
+                    print("Cycle: " + str(iRun))
+
+                # Save current run
+                self._iRun = iRun
+
+            # Convert sample
+            listBatch.append(
+                [iRun,
+                 iDataPoint,
+                 dataSample.fVoltage,
+                 dataSample.fCurrent,
+                 fTimeStamp - self._referenceTime])
+
+        # Store samples
+        self._flush_Samples(dataQueue, listBatch)
@@ -16,6 +16,8 @@ __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 import multiprocessing as mp
 from multiprocessing.queues import Queue
 
+import numpy as np
+
 # Import internal dependencies
 from ...Data_storage.constants import *
 from .execute_behavior import ExecuteBehavior
@@ -105,10 +107,9 @@ class ExecuteSequence(ExecuteBehavior):
             .generateCommandTelegram(listCommandIDs[iIndex], 
                                      listCommandSubIDs[iIndex])[1])
 
-            # Wait as long as the input buffer is empty
-            while(self._communicationMode == FREISTAT_SERIAL):
-                if (self._serialConnection.get_SerialConnection().in_waiting > 0):
-                    break
+            # Block until the acknowledge telegram is received
+            while(self._serialConnection.wait_for_data(
+                  FREISTAT_WAIT_TIMEOUT) == False):
                 pass
 
             # Read acknowledge telegram
@@ -151,148 +152,279 @@ class ExecuteSequence(ExecuteBehavior):
 
         """
         # Initialize variables
-        iDataPoint : int = 0
-        iMethodCount : int = 1
-        iSequenceCycle : int = 1
-
-        fCurrent : float = 0
-        fVoltage : float = 0
-        fTimeStamp : float = 0
-
-        strRun : str = ""
-        strReadData : str = ""
+        self._iRun : int = -1
+        self._iDataPoint : int = 0
+        self._iMethodCount : int = 1
+        self._iSequenceCycle : int = 1
 
         while(True):
-            # Initialize variables
-            listReadData : list = []
+            # Block until a telegram is received or the experiment is terminated
+            while(self._serialConnection.wait_for_data(
+                  FREISTAT_WAIT_TIMEOUT) == False):
+                # Publish collected samples while waiting
+                self._publish_Samples(dataQueue, bForce= False)
 
-            while(self._communicationMode == FREISTAT_SERIAL):
-                if(self._serialConnection.get_SerialConnection().in_waiting > 0):
+                if (self._event.is_set()):
                     break
-                pass
-
-            # Read byte stream from serial connection and convert into string
-            strReadData = self._serialConnection.read_Data("JSON").decode("utf-8")
-
-            iCurrenPosition, bErrorflag, listReadData = \
-            self._jsonParser.parse_JSON_string(listReadData, strReadData)
-
-            # Set FreiStat status into running if not done yet
-            if (self._dataSoftwareStorage.get_SystemStatus() == FREISTAT_EXP_STARTED):
-                # Set system status to starting experiment
-                self._dataSoftwareStorage.set_SystemStatus(FREISTAT_EXP_RUNNING)
 
             # Check if termination event occured
             if (self._event.is_set()):
                 # Send stop command
                 self._serialConnection.write_Data("{\"C\":3,\"ExC\":\"Stop\"}")
 
-                while(self._serialConnection.get_SerialConnection().in_waiting > 0 and
-                    self._iCommunicationMode == FREISTAT_SERIAL):
+                # Discard remaining telegrams until the connection is idle
+                while(self._serialConnection.wait_for_data(
+                      FREISTAT_DRAIN_TIMEOUT) == True):
                     # Read JSON-telegram
-                    self._serialConnection.read_Data("JSON").decode("utf-8")
+                    self._serialConnection.read_Data("JSON")
                     
                 # Export data storage object
                 self._dataHandling.export_DataStorage()      
                 break    
 
+            # Read next telegram, which is parsed while receiving
+            iTelegramType, telegramContent = \
+                self._serialConnection.read_Telegram()
+
+            # Set FreiStat status into running if not done yet
+            if (self._dataSoftwareStorage.get_SystemStatus() == FREISTAT_EXP_STARTED):
+                # Set system status to starting experiment
+                self._dataSoftwareStorage.set_SystemStatus(FREISTAT_EXP_RUNNING)
+
             # Check if send telegram is a data telegram
-            if (listReadData[0][0] == ("\"" + RUN + "\"")):
-                # Set reference time for the whole experiment
-                if (self._referenceTime == -1):
-                    self._referenceTime = float(listReadData[1][1][3][1])
-
-                # Set reference time for the cycle of the ec-method
-                if (self._referenceTimeCycle == -1):
-                    self._referenceTimeCycle = float(listReadData[1][1][3][1])
-
-                # Set reference time for the cycle of the sequence
-                if (self._referenceTimeSequenceCycle == -1):
-                    self._referenceTimeSequenceCycle = \
-                        float(listReadData[1][1][3][1])
-
-                # Check if a new run started
-                if (strRun != listReadData[0][1]):
-                    # Export data storage object
-                    self._dataHandling.export_DataStorage()
-
-                    # Reset reference time for a cycle
-                    self._referenceTimeCycle = float(listReadData[1][1][3][1]) 
-
-                    # Check if low performance mode is enabled
-                    if (self._lowPerformaneMode == True):
-                        print("Cycle: " + strRun)
-
-                # Check if new method has started
-                if (iDataPoint > int(listReadData[1][1][0][1])):
-                    # Catching case a method only has one cycle
-                    # Export data storage object
-                    self._dataHandling.export_DataStorage()
-
-                    # Reset reference time for a cycle
-                    self._referenceTimeCycle = float(listReadData[1][1][3][1]) 
-
-                    # Check if new sequence cycle has started
-                    if (iMethodCount % (self._dataHandling.\
-                        get_SequenceLength() - 1) == 0):
-                        # Increase sequence cycle
-                        iSequenceCycle += 1
-
-                        # Reset reference time of sequence cycle
-                        self._referenceTimeSequenceCycle = \
-                            float(listReadData[1][1][3][1])
-
-                    # Increase method counter
-                    iMethodCount += 1
-
-                    # Move to next data storage element
-                    self._dataHandling.move_next_DataObject()
-
-                # Get current run
-                strRun = listReadData[0][1]
-
-                # Get datapoint
-                iDataPoint = int(listReadData[1][1][0][1])
-
-                # Convert data
-                fCurrent = float(listReadData[1][1][2][1])          
-                fVoltage = float(listReadData[1][1][1][1])        
-                fTimeStamp : float = float(listReadData[1][1][3][1]) - \
-                    self._referenceTimeCycle
-
-                # Add data to data storage
-                self._dataHandling.append_StoredData(
-                                [iSequenceCycle,
-                                int(strRun,10),
-                                iDataPoint,
-                                fVoltage,
-                                fCurrent,
-                                fTimeStamp,
-                                float(listReadData[1][1][3][1]) - 
-                                self._referenceTimeSequenceCycle,
-                                float(listReadData[1][1][3][1]) - 
-                                self._referenceTime])
-                
-                # Add data to dataQueue
-                dataQueue.put([iSequenceCycle,
-                                int(strRun,10),
-                                iDataPoint,
-                                fVoltage,
-                                fCurrent,
-                                fTimeStamp,
-                                float(listReadData[1][1][3][1]) - 
-                                self._referenceTimeSequenceCycle,
-                                float(listReadData[1][1][3][1]) - 
-                                self._referenceTime,
-                                self._dataHandling.get_ExperimentType()])
+            if (iTelegramType == TELEGRAM_TYPE_DATA):
+                # Store all samples of the telegram
+                self._store_Samples(dataQueue, telegramContent)
 
             # Check if send telegram is a command telegram
-            elif (listReadData[0][0] == ("\"" + COMMAND_TELEGRAM + "\"")):
+            elif (iTelegramType == TELEGRAM_TYPE_COMMAND):
                 self._dataSoftwareStorage.set_SystemStatus(FREISTAT_EXP_COMPLETED)
 
                 # Fill in Blank command to stop plotter
-                dataQueue.put([iSequenceCycle, 0, 0, 0, 0, 0, 0, 0,
-                                UNDEFIEND])
-                dataQueue.put([iSequenceCycle, 0, 0, 0, 0, 0, 0, 0,
-                                UNDEFIEND])
-                break
\ No newline at end of file
+                self._get_DataQueueProducer(dataQueue).append_Samples(
+                    [[self._iSequenceCycle, 0, 0, 0, 0, 0, 0, 0]] * 2, UNDEFIEND)
+                break
+
+        # Publish remaining samples
+        self._publish_Samples(dataQueue)
+
+    def _store_Samples(self, dataQueue, listSamples : list) -> None:
+        """
+        Description
+        -----------
+        Store all samples received with one telegram in the data storage and 
+        the data queue. Thereby, changes of the ec-method and of the sequence
+        cycle are detected and the samples in front of such a change are stored
+        before switching the data storage object.
+
+        Parameters
+        ----------
+        `dataQueue` : Queue
+            Data queue which is used as a pipe between processes
+
+        `listSamples` : list | np.ndarray
+            List of DataSample records or structured array of the records of
+            a binary data telegram
+
+        """
+        # Records of binary data telegrams are stored block wise
+        if (isinstance(listSamples, np.ndarray)):
+            self._store_SequenceBlock(dataQueue, listSamples)
+            return
+
+        # Initialize variables
+        listBatch : list = []
+
+        for dataSample in listSamples:
+            # Unpack converted sample
+            iRun : int = dataSample.iRun
+            iDataPoint : int = dataSample.iDataPoint
+            fTimeStamp : float = dataSample.fTimeStamp
+
+            # Set reference time for the whole experiment
+            if (self._referenceTime == -1):
+                self._referenceTime = fTimeStamp
+
+            # Set reference time for the cycle of the ec-method
+            if (self._referenceTimeCycle == -1):
+                self._referenceTimeCycle = fTimeStamp
+
+            # Set reference time for the cycle of the sequence
+            if (self._referenceTimeSequenceCycle == -1):
+                self._referenceTimeSequenceCycle = fTimeStamp
+
+            # Check if a new run or a new method started
+            if (self._iRun != iRun or self._iDataPoint > iDataPoint):
+                # Store samples in front of the change
+                self._flush_Samples(dataQueue, listBatch)
+                listBatch = []
+
+            # Check if a new run started
+            if (self._iRun != iRun):
+                # Reset reference time for a cycle
+                self._referenceTimeCycle = fTimeStamp
+
+                # Check if low performance mode is enabled
+                if (self._lowPerformaneMode == True):
+                    print("Cycle: " + str(iRun))
+
+            # Check if new method has started
+            if (self._iDataPoint > iDataPoint):
+                # Reset reference time for a cycle
+                self._referenceTimeCycle = fTimeStamp
+
+                # Check if new sequence cycle has started
+                if (self._iMethodCount % (self._dataHandling.\
+                    get_SequenceLength() - 1) == 0):
+                    # Increase sequence cycle
+                    self._iSequenceCycle += 1
+
+                    # Reset reference time of sequence cycle
+                    self._referenceTimeSequenceCycle = fTimeStamp
+
+                # Increase method counter
+                self._iMethodCount += 1
+
+                # Move to next data storage element
+                self._dataHandling.move_next_DataObject()
+
+            # Save current run and datapoint
+            self._iRun = iRun
+            self._iDataPoint = iDataPoint
+
+            # Convert sample
+            listBatch.append(
+                [self._iSequenceCycle,
+                 iRun,
+                 iDataPoint,
+                 dataSample.fVoltage,
+                 dataSample.fCurrent,
+                 fTimeStamp - self._referenceTimeCycle,
+                 fTimeStamp - self._referenceTimeSequenceCycle,
+                 fTimeStamp - self._referenceTime])
+
+        # Store samples
+        self._flush_Samples(dataQueue, listBatch)
+
+    def _store_SequenceBlock(self, dataQueue, np_arrRecords : np.ndarray
+                             ) -> None:
+        """
+        Description
+        -----------
+        Store the records of a binary data telegram as blocks in the data 
+        storage and the data queue. The records are only split where a new run
+        or a new ec-method starts, the changes are handled like in 
+        `_store_Samples` for the first sample of every block.
+
+        Parameters
+        ----------
+        `dataQueue` : Queue
+            Data queue which is used as a pipe between processes
+
+        `np_arrRecords` : np.ndarray
+            Structured array of the binary records (see BINARY_RECORD_DTYPE)
+
+        """
+        # Initialize variables
+        np_arrRuns : np.ndarray = np_arrRecords[RUN]
+        np_arrDataPoints : np.ndarray = np_arrRecords[DATA_PAIR_NUMBER]
+
+        for np_arrBlock in np.split(np_arrRecords, np.flatnonzero(
+            (np_arrRuns[1:] != np_arrRuns[:-1]) | 
+            (np_arrDataPoints[1:] < np_arrDataPoints[:-1])) + 1):
+            # Unpack first sample of the block
+            iRun : int = int(np_arrBlock[RUN][0])
+            iDataPoint : int = int(np_arrBlock[DATA_PAIR_NUMBER][0])
+            fTimeStamp : float = float(np_arrBlock[TIME_STAMP][0])
+
+            # Set reference time for the whole experiment
+            if (self._referenceTime == -1):
+                self._referenceTime = fTimeStamp
+
+            # Set reference time for the cycle of the ec-method
+            if (self._referenceTimeCycle == -1):
+                self._referenceTimeCycle = fTimeStamp
+
+            # Set reference time for the cycle of the sequence
+            if (self._referenceTimeSequenceCycle == -1):
+                self._referenceTimeSequenceCycle = fTimeStamp
+
+            # Check if a new run started
+            if (self._iRun != iRun):
+                # Reset reference time for a cycle
+                self._referenceTimeCycle = fTimeStamp
+
+                # Check if low performance mode is enabled
+                if (self._lowPerformaneMode == True):
+                    print("Cycle: " + str(iRun))
+
+            # Check if new method has started
+            if (self._iDataPoint > iDataPoint):
+                # Reset reference time for a cycle
+                self._referenceTimeCycle = fTimeStamp
+
+                # Check if new sequence cycle has started
+                if (self._iMethodCount % (self._dataHandling.\
+                    get_SequenceLength() - 1) == 0):
+                    # Increase sequence cycle
+                    self._iSequenceCycle += 1
+
+                    # Reset reference time of sequence cycle
+                    self._referenceTimeSequenceCycle = fTimeStamp
+
+                # Increase method counter
+                self._iMethodCount += 1
+
+                # Move to next data storage element
+                self._dataHandling.move_next_DataObject()
+
+            # Save current run and last datapoint of the block
+            self._iRun = iRun
+            self._iDataPoint = int(np_arrBlock[DATA_PAIR_NUMBER][-1])
+
+            # Convert samples
+            np_arrTimeStamps : np.ndarray = \
+                np_arrBlock[TIME_STAMP].astype(np.float64)
+
+            self._flush_Samples(dataQueue, self._create_SampleBlock(
+                [self._iSequenceCycle,
+                 np_arrBlock[RUN],
+                 np_arrBlock[DATA_PAIR_NUMBER],
+                 np_arrBlock[VOLTAGE_VALUE],
+                 np_arrBlock[CURRENT_VALUE],
+                 np_arrTimeStamps - self._referenceTimeCycle,
+                 np_arrTimeStamps - self._referenceTimeSequenceCycle,
+                 np_arrTimeStamps - self._referenceTime]))
+
+    def _flush_Samples(self, dataQueue : Queue, listBatch : list) -> None:
+        """
+        Description
+        -----------
+        Store a batch of converted samples in the data storage and hand it to
+        the producer of the data queue. Every sample in the data queue is
+        extended by the experiment type of the current ec-method.
+
+        Parameters
+        ----------
+        `dataQueue` : Queue
+            Data queue which is used as a pipe between processes
+
+        `listBatch` : list | np.ndarray
+            List containing the converted samples or structured array of a
+            block of converted samples
+
+        """
+        # Check if samples are available
+        if (len(listBatch) == 0):
+            return
+
+        # Add data to data storage
+        self._dataHandling.append_StoredDataBatch(listBatch)
+
+        # Add data to dataQueue, the experiment type for the plotter is only
+        # published if it changes
+        self._get_DataQueueProducer(dataQueue).append_Samples(
+            listBatch, self._dataHandling.get_ExperimentType())
+
+        # Publish progress of the experiment
+        self._update_Status(listBatch)
@@ -0,0 +1,105 @@
+"""
+Module implementing the decoding of binary data telegrams, which are send by
+FreiStat instead of JSON data telegrams if the binary data format is enabled.
+
+Binary data telegram:
+| Magic header (2 byte) | Payload length (uint16) | Record 1 | ... | Record N |
+
+Every record is a little-endian copy of the S_DataContainer struct of the
+firmware (run, datapoint, voltage, current, time stamp).
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import numpy as np
+
+# Import internal dependencies
+from ..Data_storage.constants import *
+
+# Structured datatype of one sample record
+BINARY_RECORD = np.dtype(BINARY_RECORD_DTYPE)
+
+
+def is_BinaryTelegram(bTelegram : bytes) -> bool:
+    """
+    Description
+    -----------
+    Check if the given telegram is a binary data telegram.
+
+    Parameters
+    ----------
+    `bTelegram` : bytes
+        Byte stream containing one telegram
+
+    Return
+    ------
+    `bBinary` : bool
+        Flag indicating if the telegram starts with the binary magic header
+
+    """
+    return bTelegram[:len(BINARY_TELEGRAM_MAGIC)] == BINARY_TELEGRAM_MAGIC
+
+
+def get_BinaryTelegramLength(bBuffer : bytes, iStart : int = 0) -> int:
+    """
+    Description
+    -----------
+    Read the total length of a binary telegram from its header.
+
+    Parameters
+    ----------
+    `bBuffer` : bytes
+        Buffer containing at least the header of the binary telegram
+
+    `iStart` : int
+        Position of the magic header in the buffer
+
+    Return
+    ------
+    `iLength` : int
+        Length of the telegram including header in bytes or -1 if the header
+        isn't completly received yet
+
+    """
+    if (len(bBuffer) - iStart < BINARY_TELEGRAM_HEADER):
+        return -1
+
+    iPosition = iStart + len(BINARY_TELEGRAM_MAGIC)
+    return BINARY_TELEGRAM_HEADER + \
+        int.from_bytes(bBuffer[iPosition:iPosition + 2], "little")
+
+
+def decode_BinaryTelegram(bTelegram : bytes) -> np.ndarray:
+    """
+    Description
+    -----------
+    Decode all sample records of a binary data telegram at once.
+
+    Parameters
+    ----------
+    `bTelegram` : bytes
+        Byte stream containing one binary telegram including header
+
+    Return
+    ------
+    `np_arrRecords` : np.ndarray
+        Structured array with the fields R, D, V, C and T
+
+    """
+    # Check if telegram length matches the header
+    iLength = get_BinaryTelegramLength(bTelegram)
+    if (iLength != len(bTelegram) or
+        (iLength - BINARY_TELEGRAM_HEADER) % BINARY_RECORD_SIZE != 0):
+        raise ValueError("Binary telegram corrupted - Errorcode: " +
+                         str(EC_SERIAL_COMMUNICATION + EC_SC_BINARY_LENGTH))
+
+    return np.frombuffer(bTelegram, dtype= BINARY_RECORD,
+                         offset= BINARY_TELEGRAM_HEADER)
@@ -0,0 +1,138 @@
+"""
+Module implementing a fast path decoder for JSON data telegrams send by
+FreiStat. Data telegrams always have the same shape, which allows to extract
+run, datapoint, voltage, current and time stamp with precompiled patterns
+instead of validating the telegram character by character.
+
+Single data telegram:
+{"R":1,"M":{"D":1,"V":-0.50000,"C":1.25000,"T":120}}
+
+Batched data telegram:
+{"R":1,"M":[{"D":1,"V":-0.50000,"C":1.25000,"T":120},{"D":2, ... }]}
+
+The current is missing in the data telegrams of the open circuit potential.
+Telegrams which don't match these shapes aren't decoded and should be handed
+to the generic `JSON_Parser`.
+
+Every decoded sample is returned as `DataSample` record, whose numeric fields
+are already converted.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import re
+
+# Import internal dependencies
+from ..Data_storage.constants import *
+
+class DataSample:
+    """
+    Description
+    -----------
+    Lightweight record containing one converted sample of a data telegram.
+
+    """
+    __slots__ = ("iRun", "iDataPoint", "fVoltage", "fCurrent", "fTimeStamp")
+
+    def __init__(self, iRun : int, iDataPoint : int, fVoltage : float, 
+                 fCurrent : float, fTimeStamp : float) -> None:
+        """
+        Description
+        -----------
+        Constructor of class DataSample.
+
+        Parameters
+        ----------
+        `iRun` : int
+            Run (cycle) of the sample
+
+        `iDataPoint` : int
+            Number of the sample inside of the run
+
+        `fVoltage` : float
+            Measured voltage in mV
+
+        `fCurrent` : float
+            Measured current in uA (0.0 for the open circuit potential)
+
+        `fTimeStamp` : float
+            Time stamp of the FreiStat in ms
+
+        """
+        self.iRun = iRun
+        self.iDataPoint = iDataPoint
+        self.fVoltage = fVoltage
+        self.fCurrent = fCurrent
+        self.fTimeStamp = fTimeStamp
+
+
+# Pattern of a JSON number
+_strNumber : str = r'-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?'
+
+# Pattern of one measurement object, groups: D, V, C (optional), T
+_strSample : str = (r'\{"' + DATA_PAIR_NUMBER + r'":(-?\d+),"' +
+                    VOLTAGE_VALUE + r'":(' + _strNumber + r')(?:,"' +
+                    CURRENT_VALUE + r'":(' + _strNumber + r'))?,"' +
+                    TIME_STAMP + r'":(' + _strNumber + r')\}')
+
+# Precompiled patterns
+_reSample = re.compile(_strSample.encode())
+
+_reDataTelegram = re.compile((r'\{"' + RUN + r'":(-?\d+),"' + MEASUREMENTS +
+                              r'":' + _strSample + r'\}').encode())
+
+_reBatchTelegram = re.compile((r'\{"' + RUN + r'":(-?\d+),"' + MEASUREMENTS +
+                               r'":\[((?:' + _strSample + r',)*' +
+                               _strSample + r')\]\}').encode())
+
+
+def decode_DataTelegram(bTelegram : bytes) -> list:
+    """
+    Description
+    -----------
+    Decode a single or batched JSON data telegram into typed samples.
+
+    Parameters
+    ----------
+    `bTelegram` : bytes
+        Byte stream containing one JSON telegram
+
+    Return
+    ------
+    `listSamples` : list
+        List of DataSample records or None if the telegram isn't a data 
+        telegram of the expected shape. The current is 0.0 if it isn't part of
+        the telegram.
+
+    """
+    # Single data telegram
+    match = _reDataTelegram.fullmatch(bTelegram)
+    if (match is not None):
+        iRun, iDataPoint, fVoltage, fCurrent, fTimeStamp = match.groups()
+        return [DataSample(int(iRun),
+                           int(iDataPoint),
+                           float(fVoltage),
+                           float(fCurrent) if fCurrent else 0.0,
+                           float(fTimeStamp))]
+
+    # Batched data telegram
+    match = _reBatchTelegram.fullmatch(bTelegram)
+    if (match is not None):
+        iRun : int = int(match.group(1))
+        return [DataSample(iRun,
+                           int(iDataPoint),
+                           float(fVoltage),
+                           float(fCurrent) if fCurrent else 0.0,
+                           float(fTimeStamp))
+                for iDataPoint, fVoltage, fCurrent, fTimeStamp
+                in _reSample.findall(match.group(2))]
+
+    return None
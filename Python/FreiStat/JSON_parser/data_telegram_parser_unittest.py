@@ -0,0 +1,82 @@
+"""
+Module implementing different unittests for the data_telegram_parser module.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import unittest
+
+# Import internal dependencies
+from ..Data_storage.data_software_storage import DataSoftwareStorage
+from .data_telegram_parser import decode_DataTelegram
+from .json_parser import JSON_Parser
+
+class DataTelegramParser_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the data telegram parser.
+
+    """
+    def test_decode_DataTelegram(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that the fast path decoder returns the same samples
+        as the generic JSON parser.
+
+        """
+        # Test telegrams as send by FreiStat
+        listTest : list = [
+            b'{"R":1,"M":{"D":1,"V":-200.00000,"C":3.25000,"T":120}}',
+            b'{"R":12,"M":{"D":1045,"V":0.50000,"C":-1.5e-3,"T":-4}}',
+            b'{"R":3,"M":{"D":7,"V":812.12500,"T":98000}}',
+            b'{"R":2,"M":[{"D":1,"V":0.50000,"C":-1.50000,"T":10},' +
+            b'{"D":2,"V":0.60000,"C":-1.40000,"T":20}]}']
+
+        # Create a test instance of the JSON_Parser
+        _JSON_Parser = JSON_Parser(DataSoftwareStorage())
+
+        for bTelegram in listTest:
+            # Convert results of the generic parser
+            listReadData = _JSON_Parser.parse_JSON_string(
+                [], bTelegram.decode("utf-8"))[2]
+            listExpected : list = []
+            for listSample in listReadData[1][1:]:
+                listExpected.append((int(listReadData[0][1], 10),
+                                     int(listSample[0][1], 10),
+                                     float(listSample[1][1]),
+                                     float(listSample[2][1])
+                                     if len(listSample) == 4 else 0.0,
+                                     float(listSample[-1][1])))
+
+            # Check results
+            self.assertEqual([(dataSample.iRun, dataSample.iDataPoint,
+                               dataSample.fVoltage, dataSample.fCurrent,
+                               dataSample.fTimeStamp) for dataSample in 
+                              decode_DataTelegram(bTelegram)], listExpected)
+
+    def test_decode_Fallback(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that other telegrams aren't decoded.
+
+        """
+        self.assertIsNone(decode_DataTelegram(b'{"A":3}'))
+        self.assertIsNone(decode_DataTelegram(b'{"C":3,"ExC":"Stop"}'))
+        self.assertIsNone(decode_DataTelegram(
+            b'{"R":1, "M":{"D":1,"V":0.5,"C":1.0,"T":2}}'))
+        self.assertIsNone(decode_DataTelegram(
+            b'{"R":1,"M":{"D":1,"V":nan,"C":1.0,"T":2}}'))
+
+if __name__ == '__main__':
+    unittest.main()
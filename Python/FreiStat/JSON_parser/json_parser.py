@@ -17,7 +17,10 @@ import logging
 from typing import Union
 
 # Import internal dependencies
+from ..Data_storage.constants import *
 from ..Data_storage.data_software_storage import DataSoftwareStorage
+from .binary_parser import decode_BinaryTelegram, is_BinaryTelegram
+from .data_telegram_parser import DataSample, decode_DataTelegram
 
 class JSON_Parser:
     """
@@ -90,6 +93,78 @@ class JSON_Parser:
         # Return union
         return iCurrentPosition, bErrorFlag, listJSONdata
 
+    def parse_Telegram(self, bTelegram: bytes) -> Union[int, object]:
+        """
+        Description
+        -----------
+        Identify the type of a received telegram and convert its content. Data
+        telegrams are converted into DataSample records, using the fast path
+        decoder if possible and the generic parser otherwise. Binary data 
+        telegrams are decoded as one block.
+
+        Parameters
+        ----------
+        `bTelegram` : bytes
+            Byte stream containing one telegram
+
+        Return
+        ------
+        `iTelegramType` : int
+            Type of the telegram (TELEGRAM_TYPE_X)
+
+        `telegramContent` : object
+            List of DataSample records for data telegrams, structured array of
+            the records (see BINARY_RECORD_DTYPE) for binary data telegrams, 
+            command number for acknowledge telegrams, parsed list structure for
+            command telegrams and None for unknown telegrams
+
+        """
+        # Binary data telegram
+        if (is_BinaryTelegram(bTelegram)):
+            return TELEGRAM_TYPE_DATA, decode_BinaryTelegram(bTelegram)
+
+        # JSON data telegram with the expected shape
+        listSamples : list = decode_DataTelegram(bTelegram)
+        if (listSamples is not None):
+            return TELEGRAM_TYPE_DATA, listSamples
+
+        # Fall back to the generic parser
+        iCurrentPosition, bErrorFlag, listJSONdata = self.parse_JSON_string(
+            [], bTelegram.decode("utf-8"))
+
+        if (bErrorFlag == True or len(listJSONdata) == 0):
+            return TELEGRAM_TYPE_UNKNOWN, None
+
+        strTelegramKey : str = listJSONdata[0][0]
+
+        # Data telegram, the measurement object can contain a single sample or
+        # a batch of samples
+        if (strTelegramKey == "\"" + RUN + "\""):
+            iRun : int = int(listJSONdata[0][1], 10)
+            listSamples = []
+
+            for listSample in listJSONdata[1][1:]:
+                # Map value names to values, e.g. "V" -> "0.5"
+                dictSample : dict = {listEntry[0].strip("\""): listEntry[1] 
+                                     for listEntry in listSample}
+                listSamples.append(DataSample(
+                    iRun,
+                    int(dictSample[DATA_PAIR_NUMBER], 10),
+                    float(dictSample[VOLTAGE_VALUE]),
+                    float(dictSample.get(CURRENT_VALUE, 0.0)),
+                    float(dictSample[TIME_STAMP])))
+            return TELEGRAM_TYPE_DATA, listSamples
+
+        # Command telegram
+        elif (strTelegramKey == "\"" + COMMAND_TELEGRAM + "\""):
+            return TELEGRAM_TYPE_COMMAND, listJSONdata
+
+        # Acknowledge telegram
+        elif (strTelegramKey == "\"" + ACKNOWLEDGE_TELEGRAM + "\""):
+            return TELEGRAM_TYPE_ACKNOWLEDGE, int(listJSONdata[0][1], 10)
+
+        return TELEGRAM_TYPE_UNKNOWN, None
+
     def _check_WhiteSpaces(self,
                            listJSONdata: list,
                            strJSON: str, 
@@ -126,7 +201,7 @@ class JSON_Parser:
 
         """
         # Logging function call if --log = INFO
-        logging.info(str(iCurrentPosition) + "_check_WhiteSpaces\n")
+        logging.info("%d_check_WhiteSpaces\n", iCurrentPosition)
 
         # Skip through all whitespaces
         for iPosition in range(iCurrentPosition,iJSON_Length):
@@ -181,7 +256,7 @@ class JSON_Parser:
 
         """
         # Logging function call if --log = INFO
-        logging.info(str(iCurrentPosition) + "_check_String\n")
+        logging.info("%d_check_String\n", iCurrentPosition)
 
         # Initalize variables
         bErrorFlag : bool = False
@@ -265,7 +340,7 @@ class JSON_Parser:
 
         """
         # Logging function call if --log = INFO
-        logging.info(str(iCurrentPosition) + "_check_Digit\n")
+        logging.info("%d_check_Digit\n", iCurrentPosition)
 
         # Initalize variables
         bErrorFlag : bool = False
@@ -330,7 +405,7 @@ class JSON_Parser:
 
         """
         # Logging function call if --log = INFO
-        logging.info(str(iCurrentPosition) + "_check_Number\n")
+        logging.info("%d_check_Number\n", iCurrentPosition)
 
         # Initalize variables
         bErrorFlag : bool = False
@@ -474,7 +549,7 @@ class JSON_Parser:
 
         """
         # Logging function call if --log = INFO
-        logging.info(str(iCurrentPosition) + "_check_Array\n")
+        logging.info("%d_check_Array\n", iCurrentPosition)
 
         # Initalize variables
         bErrorFlag : bool = False
@@ -482,7 +557,6 @@ class JSON_Parser:
         if(strJSON[iCurrentPosition] == "["):
             # Move to the next position in the string
             iCurrentPosition += 1
-            iTempCurrentPosition = iCurrentPosition
 
             # Call _check_WhiteSpaces method
             iCurrentPosition, listJSONdata \
@@ -491,63 +565,62 @@ class JSON_Parser:
                                       iJSON_Length, 
                                       iCurrentPosition)
 
-            if (iTempCurrentPosition == iCurrentPosition):
-                # Call _check_Value method
-                iCurrentPosition, bErrorFlag, listJSONdata \
-                = self._check_Value(listJSONdata, 
-                                    strJSON, 
-                                    iJSON_Length, 
-                                    iCurrentPosition)
-
-                # Check if error has occured
-                if (bErrorFlag == True):
-                    # Return union
-                    return iCurrentPosition, bErrorFlag, listJSONdata
-
+            # Check for empty array
+            if(strJSON[iCurrentPosition] == "]"):
                 if (iCurrentPosition < iJSON_Length - 1):
                     # Move to the next position in the string
                     iCurrentPosition += 1
+                # Return union
+                return iCurrentPosition, bErrorFlag, listJSONdata
 
-                # Check for ","
-                for iPosition in range(iCurrentPosition, iJSON_Length):
-                    if (iPosition < iCurrentPosition):
-                        pass
-                    else:
-                        if (strJSON[iCurrentPosition] == ","):
-                            # Move to the next position in the string
-                            iCurrentPosition += 1
+            for iPosition in range(iCurrentPosition, iJSON_Length):
+                if (iPosition < iCurrentPosition):
+                    pass
+                else:
+                    # Call _check_Value method
+                    iCurrentPosition, bErrorFlag, listJSONdata \
+                    = self._check_Value(listJSONdata, 
+                                        strJSON, 
+                                        iJSON_Length, 
+                                        iCurrentPosition)
+
+                    # Check if error has occured
+                    if (bErrorFlag == True):
+                        # Return union
+                        return iCurrentPosition, bErrorFlag, listJSONdata
+
+                    # Strings stop at their closing quote
+                    if(strJSON[iCurrentPosition] == "\""):
+                        # Move to the next position in the string
+                        iCurrentPosition += 1
 
-                            # Call _check_Value method
-                            iCurrentPosition, bErrorFlag, listJSONdata  \
-                            = self._check_Value(listJSONdata, 
-                                                strJSON, 
-                                                iJSON_Length, 
-                                                iCurrentPosition)
-                            
-                            # Check if error has occured
-                            if (bErrorFlag == True):
-                                # Return union
-                                return iCurrentPosition, bErrorFlag, listJSONdata
-
-                        elif (strJSON[iCurrentPosition] == "]"):
-                            if (iCurrentPosition < iJSON_Length - 1):
-                                # Move to the next position in the string
-                                iCurrentPosition += 1
-                            break         
-                        else:
-                            bErrorFlag = True
-                            # Return union
-                            return iCurrentPosition, bErrorFlag, listJSONdata                
-            else: 
-                if(strJSON[iCurrentPosition] == "]"):
-                    if (iCurrentPosition < iJSON_Length - 1):
+                    # Call _check_WhiteSpaces method
+                    iCurrentPosition, listJSONdata \
+                    = self._check_WhiteSpaces(listJSONdata, 
+                                              strJSON, 
+                                              iJSON_Length, 
+                                              iCurrentPosition)
+
+                    # Check for "," or "]"
+                    if (strJSON[iCurrentPosition] == ","):
                         # Move to the next position in the string
                         iCurrentPosition += 1
-                    pass
-                else: 
-                    bErrorFlag = True
-                    # Return union
-                    return iCurrentPosition, bErrorFlag, listJSONdata                                     
+
+                        # Call _check_WhiteSpaces method
+                        iCurrentPosition, listJSONdata \
+                        = self._check_WhiteSpaces(listJSONdata, 
+                                                  strJSON, 
+                                                  iJSON_Length, 
+                                                  iCurrentPosition)
+                    elif (strJSON[iCurrentPosition] == "]"):
+                        if (iCurrentPosition < iJSON_Length - 1):
+                            # Move to the next position in the string
+                            iCurrentPosition += 1
+                        break
+                    else:
+                        bErrorFlag = True
+                        # Return union
+                        return iCurrentPosition, bErrorFlag, listJSONdata
         else:
             bErrorFlag = True
         
@@ -590,7 +663,7 @@ class JSON_Parser:
 
         """
         # Logging function call if --log = INFO
-        logging.info(str(iCurrentPosition) + "_check_Bool\n")
+        logging.info("%d_check_Bool\n", iCurrentPosition)
 
         # Initalize variables
         bErrorFlag : bool = False
@@ -673,7 +746,7 @@ class JSON_Parser:
 
         """
         # Logging function call if --log = INFO
-        logging.info(str(iCurrentPosition) + "_check_Value\n")
+        logging.info("%d_check_Value\n", iCurrentPosition)
 
         # Initalize variables
         bErrorFlag : bool = False
@@ -832,7 +905,7 @@ class JSON_Parser:
 
         """
         # Logging function call if --log = INFO
-        logging.info(str(iCurrentPosition) + "_check_Object\n")
+        logging.info("%d_check_Object\n", iCurrentPosition)
 
         # Initalize variables
         bErrorFlag: bool = False
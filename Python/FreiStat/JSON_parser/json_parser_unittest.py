@@ -15,7 +15,10 @@ __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 import logging
 import unittest
 
+import numpy as np
+
 # Import internal dependencies
+from ..Data_storage.constants import *
 from ..Data_storage.data_software_storage import DataSoftwareStorage
 from .json_parser import JSON_Parser
 
@@ -217,6 +220,65 @@ class JSON_Parser_UnitTest(unittest.TestCase):
         self.assertEqual(iTestLen, results[0] + 1, "Error in _check_Array "
                          + "occured, string not completly tested")
 
+    def test_parse_BatchTelegram(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing the parsing of a data telegram containing a batch of
+        measurement objects.
+
+        """
+        # Test string
+        strTest : str = "{\"R\":2,\"M\":[{\"D\":1,\"V\":0.5,\"C\":-1.5," + \
+                        "\"T\":10}, {\"D\":2,\"V\":0.6,\"C\":-1.4,\"T\":20}]}"
+
+        # Create a test instance of the JSON_Parser
+        _JSON_Parser = JSON_Parser(DataSoftwareStorage())
+
+        # Call method which should be tested
+        results = _JSON_Parser.parse_JSON_string([], strTest)
+
+        # Print results
+        self.assertTrue(results[1] == False, "Error in parse_JSON_string "
+                        + "occured - Error position: " + str(results[0]))
+        self.assertEqual(results[2][1][1:], 
+            [[['"D"', '1'], ['"V"', '0.5'], ['"C"', '-1.5'], ['"T"', '10']],
+             [['"D"', '2'], ['"V"', '0.6'], ['"C"', '-1.4'], ['"T"', '20']]])
+
+    def test_parse_Telegram(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing the identification and conversion of telegrams.
+
+        """
+        # Create a test instance of the JSON_Parser
+        _JSON_Parser = JSON_Parser(DataSoftwareStorage())
+
+        # Data telegram, which isn't handled by the fast path decoder
+        iTelegramType, listSamples = _JSON_Parser.parse_Telegram(
+            b'{"R":4, "M":{"D":5,"V":0.5,"T":20}}')
+        self.assertEqual(iTelegramType, TELEGRAM_TYPE_DATA)
+        self.assertEqual((listSamples[0].iRun, listSamples[0].iDataPoint,
+                          listSamples[0].fVoltage, listSamples[0].fCurrent,
+                          listSamples[0].fTimeStamp), (4, 5, 0.5, 0.0, 20.0))
+
+        # Binary data telegram is decoded as one block
+        bRecords : bytes = np.array([(1, 1, 0.5, -1.5, 10), (2, 1, 0.25, 1, 20)],
+            dtype= BINARY_RECORD_DTYPE).tobytes()
+        iTelegramType, np_arrRecords = _JSON_Parser.parse_Telegram(
+            BINARY_TELEGRAM_MAGIC + len(bRecords).to_bytes(2, "little") + 
+            bRecords)
+        self.assertEqual(iTelegramType, TELEGRAM_TYPE_DATA)
+        self.assertEqual(np_arrRecords.tolist(), 
+            [(1, 1, 0.5, -1.5, 10.0), (2, 1, 0.25, 1.0, 20.0)])
+
+        # Command and acknowledge telegram
+        self.assertEqual(_JSON_Parser.parse_Telegram(
+            b'{"C":3,"ExC":"Stop"}')[0], TELEGRAM_TYPE_COMMAND)
+        self.assertEqual(_JSON_Parser.parse_Telegram(b'{"A":2}'), 
+                         (TELEGRAM_TYPE_ACKNOWLEDGE, 2))
+
 if __name__ == '__main__':
     logging.basicConfig(level=logging.DEBUG)
     unittest.main()
\ No newline at end of file
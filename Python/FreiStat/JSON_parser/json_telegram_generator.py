@@ -133,6 +133,25 @@ class JSON_Telegram_Generator():
                     break
                 strTemp = strTemp + ","
 
+            # Request binary data telegrams if enabled
+            if (self._dataSoftwareStorage.get_DataFormat() == 
+                DATA_FORMAT_BINARY):
+                if (len(strTemp) > 0):
+                    strTemp = strTemp + ","
+
+                # '"pDF":1'
+                strTemp = strTemp + "\"" + DATA_FORMAT + "\":" + \
+                    str(DATA_FORMAT_BINARY)
+
+            # Request batched data telegrams if enabled
+            if (self._dataSoftwareStorage.get_BatchSize() > 1):
+                if (len(strTemp) > 0):
+                    strTemp = strTemp + ","
+
+                # '"pBS":N'
+                strTemp = strTemp + "\"" + BATCH_SIZE + "\":" + \
+                    str(self._dataSoftwareStorage.get_BatchSize())
+
             # ' {"C":2,"ExP": {           } '
             strJSON =  strJSON + "\"" + COMMAND_EXP_STR + "\":{" + strTemp + "}}"
 
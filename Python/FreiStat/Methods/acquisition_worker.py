@@ -0,0 +1,428 @@
+"""
+Module implementing a persistent acquisition worker, which keeps the
+connection to one FreiStat open and runs the experiments of the facades one
+after another in the same process.
+
+Example, back to back experiments without reopening the serial port:
+
+worker = AcquisitionWorker()
+worker.start()
+
+for fScanrate in [0.1, 0.2, 0.5]:
+    Run_CV(acquisitionWorker= worker).start(Scanrate= fScanrate)
+
+worker.stop()
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import multiprocessing as mp
+from multiprocessing import resource_tracker
+import queue
+import time
+
+# Import internal dependencies
+from ..Data_storage.constants import *
+from .run_electrochemical_method import Run_Electrochemical_Method
+from ..Utility.shared_ring_buffer import SharedRingBuffer
+from ..Utility.shared_status_block import SharedStatusBlock
+
+class AcquisitionWorker:
+    """
+    Description
+    -----------
+    Class managing the process of the acquisition worker. Experiments are
+    sent over a command queue and their error codes are returned over a
+    result queue, while the samples are streamed through the data queue of
+    the facade. Every experiment is terminated over its own status block, so
+    terminating one experiment doesn't affect the following ones.
+
+    """
+
+    def __init__(self,
+                 commnicationMode = FREISTAT_SERIAL,
+                 wlanSetting = [FREISTAT_UDP_SERVER_IP,
+                                FREISTAT_UDP_SERVER_PORT,
+                                FREISTAT_UDP_CLIENT_IP,
+                                FREISTAT_UDP_CLIENT_PORT]) -> None:
+        """
+        Description
+        -----------
+        Constructor of class AcquisitionWorker
+
+        Parameters
+        ----------
+        `commnicationMode` : int
+            Integer flag encoding if Python library communicates via serial (1)
+            or WiFi (2)
+
+        `wlanSetting` : list
+            [Server IP (str), Server Port (int), Client IP (str), Client Port(int)]
+
+        """
+        # Initalize class variable
+        self._iCommunicationMode : int = commnicationMode
+        self._listWLANSetting : list = wlanSetting
+
+        self._iJob : int = 0
+        self._dictResults : dict = {}
+        self._process = None
+
+    def start(self) -> None:
+        """
+        Description
+        -----------
+        Start the process of the acquisition worker, which opens the
+        connection to FreiStat.
+
+        """
+        # Check if worker is already running
+        if (self.is_running()):
+            return
+
+        # Define command and result queue
+        self._commandQueue = mp.Queue()
+        self._resultQueue = mp.Queue()
+
+        # Lock shared with the data queues and status blocks of all 
+        # experiments, which can't be sent over the command queue
+        self._lock = mp.Lock()
+
+        # Share the resource tracker of this process, so that shared memory
+        # attached by the worker isn't released when the worker stops
+        resource_tracker.ensure_running()
+
+        # Define a process which keeps the connection open and runs the
+        # experiments
+        self._process = mp.Process(target= AcquisitionWorker.P_AcquisitionWorker,
+            args= (self._iCommunicationMode, self._listWLANSetting,
+                   self._commandQueue, self._resultQueue, self._lock),
+            daemon= True)
+
+        # Start the process
+        self._process.start()
+
+    def stop(self, fTimeout : float = FREISTAT_WORKER_TIMEOUT) -> None:
+        """
+        Description
+        -----------
+        Stop the acquisition worker after all submitted experiments are
+        completed and close the connection to FreiStat.
+
+        Parameters
+        ----------
+        `fTimeout` : float
+            Max. time in s to wait for the worker, before it is terminated
+
+        """
+        # Check if worker is running
+        if (self._process is None):
+            return
+
+        if (self._process.is_alive()):
+            # Send stop command
+            self._commandQueue.put(None)
+            self._process.join(fTimeout)
+
+            # Terminate worker which doesn't react
+            if (self._process.is_alive()):
+                self._process.terminate()
+                self._process.join()
+
+        self._process.close()
+        self._process = None
+
+    def submit_Experiment(self,
+                          strMethod : str,
+                          listExperimentParameters : list,
+                          dataQueue : SharedRingBuffer,
+                          bLowPerformanceMode : bool,
+                          statusBlock : SharedStatusBlock,
+                          dictDataSettings : dict):
+        """
+        Description
+        -----------
+        Hand an experiment to the acquisition worker. Experiments are run in
+        the order they are submitted.
+
+        Parameters
+        ----------
+        `strMethod` : str
+            String containing the name of the electrochemical method
+
+        `listExperimentParameters` : list
+            List containing all defined experiment parameters
+
+        `dataQueue` : SharedRingBuffer
+            Data queue into which the samples are streamed
+
+        `bLowPerformanceMode` : bool
+            Enables low performance mode of the FreiStat, which disables
+            plotting of the data and most data output
+
+        `statusBlock` : SharedStatusBlock
+            Status block in the shared memory, into which the progress and the
+            export path are written
+
+        `dictDataSettings` : dict
+            Data settings of the facade (see `get_DataSettings`)
+
+        Return
+        ------
+        `acquisitionJob` : AcquisitionJob
+            Reference to the submitted experiment
+
+        """
+        # Check if worker is running
+        if (not self.is_running()):
+            raise RuntimeError("Acquisition worker not running.")
+
+        # Synchronize the data queue and the status block over the lock of 
+        # the worker
+        dataQueue.set_Lock(self._lock)
+        statusBlock.set_Lock(self._lock)
+
+        # Send experiment to the worker
+        self._iJob += 1
+        self._commandQueue.put([self._iJob, strMethod, listExperimentParameters,
+                                dataQueue, bLowPerformanceMode,
+                                statusBlock, dictDataSettings])
+
+        return AcquisitionJob(self, self._iJob)
+
+    def _get_Result(self, iJob : int, fTimeout : float = None) -> int:
+        """
+        Description
+        -----------
+        Wait for the error code of an experiment.
+
+        Parameters
+        ----------
+        `iJob` : int
+            Number of the experiment
+
+        `fTimeout` : float
+            Max. time in s to wait or None to wait until the experiment is
+            completed
+
+        Return
+        ------
+        `iErrorCode` : int
+            Error code of the experiment or None if it isn't completed
+
+        """
+        # Initialize variables
+        fDeadline : float = None
+        if (fTimeout is not None):
+            fDeadline = time.monotonic() + fTimeout
+
+        while (iJob not in self._dictResults):
+            # Limit waiting, so that a stopped worker is detected
+            fWait : float = FREISTAT_WAIT_TIMEOUT
+            if (fDeadline is not None):
+                fWait = max(0.0, min(fWait, fDeadline - time.monotonic()))
+
+            try:
+                iResultJob, iErrorCode = self._resultQueue.get(timeout= fWait)
+                self._dictResults[iResultJob] = iErrorCode
+            except queue.Empty:
+                if (self._process is None or not self._process.is_alive()):
+                    self._dictResults[iJob] = EC_FACADE + EC_FA_WORKER_STOPPED
+                elif (fDeadline is not None and time.monotonic() >= fDeadline):
+                    return None
+
+        return self._dictResults.pop(iJob)
+
+    def is_running(self) -> bool:
+        """
+        Description
+        -----------
+        Check if the process of the acquisition worker is running.
+
+        Return
+        ------
+        `bRunning` : bool
+            True if the worker accepts experiments
+
+        """
+        return self._process is not None and self._process.is_alive()
+
+    @staticmethod
+    def P_AcquisitionWorker(iCommunicationMode : int,
+                            listWLANSetting : list,
+                            commandQueue : mp.Queue,
+                            resultQueue : mp.Queue,
+                            lock) -> None:
+        """
+        Description
+        -----------
+        Method running in a seperate process, which opens the connection once
+        and runs the received experiments until the stop command (None) is
+        received.
+
+        Parameters
+        ----------
+        `iCommunicationMode` : int
+            Integer flag encoding if Python library communicates via serial (1)
+            or WiFi (2)
+
+        `listWLANSetting` : list
+            [Server IP (str), Server Port (int), Client IP (str), Client Port(int)]
+
+        `commandQueue` : Queue
+            Queue containing the submitted experiments
+
+        `resultQueue` : Queue
+            Queue receiving [experiment number, error code] of every experiment
+
+        `lock` : Lock
+            Lock shared with the data queues and status blocks of the facades
+
+        """
+        # Create facade owning the objects of the data collection and open
+        # the connection
+        runMethod = Run_Electrochemical_Method(
+            commnicationMode= iCommunicationMode, wlanSetting= listWLANSetting,
+            mode= FREISTAT_BACKEND)
+        runMethod._open_DataCollection(None, False)
+
+        while (True):
+            # Block until the next command is received
+            listJob = commandQueue.get()
+
+            # Check for stop command
+            if (listJob is None):
+                break
+
+            iJob, strMethod, listExperimentParameters, dataQueue, \
+                bLowPerformanceMode, statusBlock, dictDataSettings = listJob
+
+            # Use the lock the facade was given on submit
+            dataQueue.set_Lock(lock)
+            statusBlock.set_Lock(lock)
+
+            # Apply settings of the facade
+            runMethod.set_DataSettings(dictDataSettings)
+            runMethod._apply_DataSettings()
+            runMethod._dataSoftwareStorage.set_LowPerformanceMode(
+                bLowPerformanceMode)
+
+            # Terminate the experiment over its own status block
+            runMethod._event = statusBlock
+
+            # Run experiment, an error must not stop the worker
+            try:
+                # Discard telegrams left over from a terminated or failed
+                # experiment
+                runMethod._serialConnection.reset_Input()
+
+                iErrorCode : int = runMethod._run_DataCollection(strMethod,
+                    dataQueue, listExperimentParameters, statusBlock)
+            except Exception:
+                runMethod._logger.exception("Acquisition worker: " +
+                                            strMethod + " failed")
+                iErrorCode = EC_FACADE + EC_FA_WORKER_FAILED
+                statusBlock.set_ErrorCode(iErrorCode)
+
+            # Detach from the data queue and the status block of the facade
+            runMethod._dataSoftwareStorage.set_StatusBlock(None)
+            statusBlock.close()
+            dataQueue.close()
+
+            resultQueue.put([iJob, iErrorCode])
+
+        # Close existing connection
+        runMethod._close_DataCollection()
+
+class AcquisitionJob:
+    """
+    Description
+    -----------
+    Class referencing an experiment submitted to the acquisition worker. It
+    provides the same methods as a process (`is_alive`, `join` and `close`),
+    so the facades and the plotter can use it instead of the process.
+
+    """
+
+    def __init__(self, acquisitionWorker : AcquisitionWorker, iJob : int
+                 ) -> None:
+        """
+        Description
+        -----------
+        Constructor of class AcquisitionJob
+
+        Parameters
+        ----------
+        `acquisitionWorker` : AcquisitionWorker
+            Worker running the experiment
+
+        `iJob` : int
+            Number of the experiment
+
+        """
+        # Initalize class variable
+        self._acquisitionWorker : AcquisitionWorker = acquisitionWorker
+        self._iJob : int = iJob
+        self._iErrorCode : int = None
+
+    def join(self, timeout : float = None) -> None:
+        """
+        Description
+        -----------
+        Block until the experiment is completed.
+
+        Parameters
+        ----------
+        `timeout` : float
+            Max. time in s to wait or None to wait until completion
+
+        """
+        if (self._iErrorCode is None):
+            self._iErrorCode = self._acquisitionWorker._get_Result(
+                self._iJob, timeout)
+
+    def is_alive(self) -> bool:
+        """
+        Description
+        -----------
+        Check if the experiment is still running or waiting to be run.
+
+        Return
+        ------
+        `bAlive` : bool
+            True if the experiment isn't completed
+
+        """
+        self.join(0.0)
+        return self._iErrorCode is None
+
+    def close(self) -> None:
+        """
+        Description
+        -----------
+        Nothing to release, the process belongs to the worker.
+
+        """
+        pass
+
+    def get_ErrorCode(self) -> int:
+        """
+        Description
+        -----------
+        Getter method returning the error code of the experiment.
+
+        Return
+        ------
+        `iErrorCode` : int
+            Error code or None if the experiment isn't completed
+
+        """
+        return self._iErrorCode
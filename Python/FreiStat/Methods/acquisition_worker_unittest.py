@@ -0,0 +1,248 @@
+"""
+Module implementing different unittests for the acquisition worker.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+
+# Import internal dependencies
+from ..Data_storage.constants import *
+from .acquisition_worker import AcquisitionWorker
+from .run_cyclic_voltammetry import Run_CV
+from ..Utility.shared_ring_buffer import SharedRingBuffer
+from ..Utility.shared_status_block import SharedStatusBlock
+
+def get_FreePort() -> int:
+    """
+    Description
+    -----------
+    Get a free local UDP port.
+
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as udpSocket:
+        udpSocket.bind(("127.0.0.1", 0))
+        return udpSocket.getsockname()[1]
+
+class FakeFreiStat:
+    """
+    Description
+    -----------
+    Class simulating a FreiStat connected via WiFi. Every command telegram is
+    acknowledged and the start command streams data telegrams until all 
+    samples are sent or the stop command is received.
+
+    """
+    def __init__(self, iSamples : int, fSampleTime : float) -> None:
+        # Initalize class variable
+        self._iSamples : int = iSamples
+        self._fSampleTime : float = fSampleTime
+        self._iServerPort : int = get_FreePort()
+
+        self._udpSocket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._udpSocket.bind(("127.0.0.1", 0))
+        self._udpSocket.settimeout(0.1)
+
+        self._bRunning : bool = True
+        self._thread = threading.Thread(target= self._T_Device, daemon= True)
+        self._thread.start()
+
+    def get_WLANSetting(self) -> list:
+        """
+        Description
+        -----------
+        Get the WiFi settings of the facades connecting to the device.
+
+        """
+        return ["127.0.0.1", self._iServerPort, "127.0.0.1",
+                self._udpSocket.getsockname()[1]]
+
+    def close(self) -> None:
+        """
+        Description
+        -----------
+        Stop the simulated device.
+
+        """
+        self._bRunning = False
+        self._thread.join()
+        self._udpSocket.close()
+
+    def _send(self, dictTelegram : dict) -> None:
+        self._udpSocket.sendto(json.dumps(dictTelegram).encode("utf-8"),
+                               ("127.0.0.1", self._iServerPort))
+
+    def _receive(self) -> dict:
+        try:
+            return json.loads(self._udpSocket.recvfrom(4096)[0])
+        except (socket.timeout, ConnectionError):
+            return None
+
+    def _T_Device(self) -> None:
+        while (self._bRunning):
+            dictTelegram : dict = self._receive()
+            if (dictTelegram is None):
+                continue
+
+            # Acknowledge command telegram
+            self._send(dictTelegram)
+
+            if (dictTelegram.get(COMMAND_EXC_STR) != FREISTAT_START_STR):
+                continue
+
+            # Stream samples until the stop command is received
+            self._udpSocket.setblocking(False)
+            for iSample in range(1, self._iSamples + 1):
+                self._send({"R" : 1, "M" : {"D" : iSample, "V" : 1.0 * iSample,
+                            "C" : -0.5 * iSample, "T" : 10 * iSample}})
+                time.sleep(self._fSampleTime)
+
+                try:
+                    if (json.loads(self._udpSocket.recv(4096)).get(
+                        COMMAND_EXC_STR) == FREISTAT_STOP_STR):
+                        break
+                except (BlockingIOError, ValueError):
+                    pass
+            self._udpSocket.settimeout(0.1)
+
+            # Report end of the experiment
+            self._send({COMMAND_TELEGRAM : COMMAND_EXC,
+                        COMMAND_EXC_STR : FREISTAT_STOP_STR})
+
+def _collect_Stream(runMethod, listResult : list) -> None:
+    """
+    Description
+    -----------
+    Count the streamed samples of an experiment and save them together with
+    the export path.
+
+    """
+    iSamples : int = 0
+    streamSamples = runMethod.stream(EnableOptimizer= False)
+    try:
+        while (True):
+            iSamples += len(next(streamSamples))
+    except StopIteration as stopIteration:
+        listResult.extend([iSamples, stopIteration.value])
+
+class AcquisitionWorker_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the acquisition worker.
+
+    """
+    def setUp(self) -> None:
+        # Use a free local port instead of FreiStat
+        iPort : int = get_FreePort()
+
+        self._acquisitionWorker = AcquisitionWorker(FREISTAT_WLAN,
+            ["127.0.0.1", iPort, "127.0.0.1", iPort])
+        self._dataQueue = SharedRingBuffer(iCapacity= 8)
+        self._statusBlock = SharedStatusBlock()
+
+    def tearDown(self) -> None:
+        self._acquisitionWorker.stop()
+        self._dataQueue.close()
+        self._statusBlock.close()
+
+    def test_submit_Experiment(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that a failing experiment is reported and the
+        worker keeps running for the following experiments.
+
+        """
+        self.assertRaises(RuntimeError, self._acquisitionWorker.submit_Experiment,
+                          CV, [], self._dataQueue, True, self._statusBlock, {})
+
+        self._acquisitionWorker.start()
+
+        # Unknown methods have no setup behavior
+        listJobs : list = [self._acquisitionWorker.submit_Experiment(
+            UNDEFIEND, [], self._dataQueue, True, self._statusBlock, {
+                "dataFormat" : DATA_FORMAT_JSON, "batchSize" : 1,
+                "memoryMap" : False, "binaryExport" : BINARY_EXPORT_NONE,
+                "jsonExport" : False, "compression" : COMPRESSION_NONE})
+            for iJob in range(2)]
+
+        for acquisitionJob in listJobs:
+            acquisitionJob.join(FREISTAT_WORKER_TIMEOUT)
+            self.assertFalse(acquisitionJob.is_alive())
+            self.assertEqual(acquisitionJob.get_ErrorCode(),
+                             EC_FACADE + EC_FA_WORKER_FAILED)
+
+        self.assertTrue(self._acquisitionWorker.is_running())
+
+        # Failure is published in the status block as well
+        self.assertEqual(self._statusBlock.get_Status()["errorCode"],
+                         EC_FACADE + EC_FA_WORKER_FAILED)
+        self.assertEqual(self._statusBlock.get_ExportPath(), "")
+
+        # Experiments submitted after the stop are reported as stopped
+        self._acquisitionWorker.stop()
+        self.assertFalse(self._acquisitionWorker.is_running())
+
+    def test_terminate_Experiment(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that terminating an experiment doesn't terminate
+        the next experiment waiting in the worker.
+
+        """
+        fakeFreiStat = FakeFreiStat(iSamples= 100, fSampleTime= 0.005)
+        strWorkingDirectory : str = os.getcwd()
+
+        with tempfile.TemporaryDirectory() as strDirectory:
+            os.chdir(strDirectory)
+            try:
+                acquisitionWorker = AcquisitionWorker(FREISTAT_WLAN,
+                    fakeFreiStat.get_WLANSetting())
+                acquisitionWorker.start()
+
+                # Start first experiment and wait for its first samples
+                streamSamples = Run_CV(commnicationMode= FREISTAT_WLAN,
+                    acquisitionWorker= acquisitionWorker).stream(
+                    EnableOptimizer= False)
+                next(streamSamples)
+
+                # Queue second experiment behind the running one
+                listResult : list = []
+                thread = threading.Thread(target= _collect_Stream, args= (
+                    Run_CV(commnicationMode= FREISTAT_WLAN,
+                           acquisitionWorker= acquisitionWorker), listResult))
+                thread.start()
+                while (acquisitionWorker._iJob < 2):
+                    time.sleep(0.01)
+
+                # Terminate first experiment
+                streamSamples.close()
+                thread.join(FREISTAT_WORKER_TIMEOUT)
+
+                # Second experiment runs completely
+                self.assertEqual(listResult[0], 100)
+                self.assertTrue(os.path.isdir(listResult[1]))
+
+                acquisitionWorker.stop()
+            finally:
+                os.chdir(strWorkingDirectory)
+                fakeFreiStat.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,20 +12,27 @@ __maintainer__ = "Mark Jasper"
 __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 
 # Import dependencies
+import asyncio
 import logging
 import multiprocessing  as mp
-from multiprocessing import shared_memory
 import numpy as np
 import platform
+from typing import TYPE_CHECKING, AsyncIterator, Iterator
 
 # Import internal dependencies
 from ..Data_storage.constants import *
 from ..Serial_communication.serial_communication import Communication
+from ..Data_storage.compression import is_CompressionAvailable
 from ..Data_storage.data_handling import DataHandling
 from ..Data_storage.data_software_storage import DataSoftwareStorage
 from ..Electrochemical_methods.electrochemical_method import ElectrochemicalMethod
 from ..JSON_parser.json_parser import JSON_Parser
-from ..Plotter.plotter import Plotter
+from ..Utility.shared_ring_buffer import SharedRingBuffer
+from ..Utility.shared_status_block import SharedStatusBlock
+
+# The plotter is only imported if a plot is created
+if TYPE_CHECKING:
+    from ..Plotter.plotter import Plotter
 
 class Run_Electrochemical_Method:
     """
@@ -42,7 +49,14 @@ class Run_Electrochemical_Method:
                                 FREISTAT_UDP_SERVER_PORT,
                                 FREISTAT_UDP_CLIENT_IP,
                                 FREISTAT_UDP_CLIENT_PORT],
-                 mode: str = FREISTAT_STANDALONE) -> None:
+                 mode: str = FREISTAT_STANDALONE,
+                 dataFormat : int = DATA_FORMAT_JSON,
+                 batchSize : int = 1,
+                 memoryMap : bool = False,
+                 binaryExport : int = BINARY_EXPORT_NONE,
+                 jsonExport : bool = False,
+                 compression : str = COMPRESSION_NONE,
+                 acquisitionWorker = None) -> None:
         """
         Description
         -----------
@@ -64,11 +78,63 @@ class Run_Electrochemical_Method:
             String defining in which mode the FreiStat library should be used
             Defined: "standalone", "backend"
 
+        `dataFormat` : int
+            Integer flag encoding if FreiStat should send the data telegrams as
+            JSON (0) or binary (1). Binary data telegrams are only supported by
+            the serial communication.
+
+        `batchSize` : int
+            Amount of samples FreiStat should pack into one data telegram
+            (1 - 10). Larger batches reduce the telegram overhead.
+
+        `memoryMap` : bool
+            Flag indicating if the experiment data should be stored in 
+            memory-mapped files instead of the RAM, which keeps the memory
+            usage bounded for long experiments
+
+        `binaryExport` : int
+            Integer flag encoding if the experiment data should additionally
+            be exported as .npy (1) or compressed .npz (2) next to the csv file
+
+        `jsonExport` : bool
+            Flag indicating if the experiment data should be streamed into a 
+            newline-delimited JSON file while the experiment is running
+
+        `compression` : str
+            Compression of the persistent data objects and the exports
+            (COMPRESSION_NONE, _GZIP, _LZMA, _ZSTD or _LZ4). Zstd and lz4
+            require the packages zstandard and lz4.
+
+        `acquisitionWorker` : AcquisitionWorker
+            Persistent acquisition worker, which keeps the connection to 
+            FreiStat open and runs the experiments of the facade. If None, 
+            every experiment starts its own process.
+
         """
         # Save class variables
         self._logger= logger
         self._iCommunicationMode = commnicationMode
         self._listWLANSetting = wlanSetting
+        self._iDataFormat = dataFormat
+        self._bMemoryMap = memoryMap
+        self._iBinaryExport = binaryExport
+        self._bJSONExport = jsonExport
+        self._acquisitionWorker = acquisitionWorker
+        self._statusBlock = None
+        self._bStream : bool = False
+        self._strExportPath : str = ""
+
+        # Check if compression is supported
+        if (is_CompressionAvailable(compression)):
+            self._strCompression = compression
+        else:
+            raise RuntimeError("Compression not supported.")
+
+        # Check if batch size is supported
+        if (batchSize >= 1 and batchSize <= FREISTAT_MAX_BATCH_SIZE):
+            self._iBatchSize = batchSize
+        else:
+            raise RuntimeError("Batch size not supported.")
 
         # Check if mode is defined
         if (mode == FREISTAT_STANDALONE or mode == FREISTAT_BACKEND):
@@ -76,13 +142,407 @@ class Run_Electrochemical_Method:
         else:
             raise RuntimeError("Operation mode doesn't exist.")
 
+    def __getstate__(self) -> dict:
+        """
+        Description
+        -----------
+        Get the state of the facade, which is pickled if `P_DataCollection` is
+        started in a spawned process. The logger, the plotter and the resources
+        of a previous experiment only belong to this process and aren't
+        pickled, so that the facade can be started several times. The process
+        collecting the data creates its own logger.
+
+        Return
+        ------
+        `dictState` : dict
+            Attributes of the facade without the process local ones
+
+        """
+        # Initialize variables
+        dictState : dict = self.__dict__.copy()
+
+        for strAttribute in ["_logger", "_plotter", "_process", "_dataQueue",
+                             "_statusBlock"]:
+            dictState.pop(strAttribute, None)
+
+        return dictState
+
+    def stream(self, **dictParameters) -> Iterator[np.recarray]:
+        """
+        Description
+        -----------
+        Start the experiment without plotter and yield the samples as they
+        arrive. The samples are typed like in the data storage (see
+        `get_SampleType`), samples of a sequence contain the experiment type
+        as additional column. The export path is returned when the experiment
+        is completed.
+
+        If the iteration is stopped early (`break`, `close` or an exception
+        of the consumer), the experiment is terminated and all resources are
+        released.
+
+        Example:
+
+        for np_arrSamples in Run_CV().stream(Scanrate= 0.1):
+            print(np_arrSamples[DE_TAG_CURRENT].mean())
+
+        Parameters
+        ----------
+        `dictParameters` : dict
+            Parameters of the `start` method of the facade
+
+        Return
+        ------
+        `np_arrSamples` : np.recarray
+            Block of samples with the same layout
+
+        """
+        # Start the experiment without plotter
+        if (self._start_Stream(dictParameters) == False):
+            return ""
+
+        try:
+            while (True):
+                # Check before reading, so no sample is lost at the end
+                bRunning : bool = self._process.is_alive()
+
+                for np_arrSamples in self._read_Stream():
+                    yield np_arrSamples
+
+                if (bRunning == False):
+                    break
+
+                # Wait for the next block of the producer or the end of the
+                # data collection
+                self._dataQueue.wait_Data(FREISTAT_STREAM_WAIT_TIMEOUT,
+                                          self._get_Sentinels())
+        finally:
+            # Terminate the experiment, if the stream was stopped early
+            strExportPath : str = self._stop_Stream()
+
+        return strExportPath
+
+    async def stream_async(self, **dictParameters
+                           ) -> AsyncIterator[np.recarray]:
+        """
+        Description
+        -----------
+        Asynchronous variant of `stream`, which waits for the samples without
+        blocking the event loop. The samples are yielded in the same format.
+
+        The experiment is terminated and all resources are released, if the
+        task is cancelled or the generator is closed after stopping the
+        iteration early (`aclose`, e.g. with `contextlib.aclosing`). Since an 
+        asynchronous generator can't return a value, the export path is read
+        with `get_ExportPath` after the iteration.
+
+        The experiment is started in a thread of the executor of the event
+        loop, so that the optimizer and the start of the data collection don't
+        block other coroutines.
+
+        Example, several FreiStats driven by one event loop:
+
+        async def measure(runMethod):
+            async for np_arrSamples in runMethod.stream_async(Scanrate= 0.1):
+                print(len(np_arrSamples))
+
+        await asyncio.gather(*[measure(Run_CV(wlanSetting= listSetting, 
+            commnicationMode= FREISTAT_WLAN)) for listSetting in listDevices])
+
+        Parameters
+        ----------
+        `dictParameters` : dict
+            Parameters of the `start` method of the facade
+
+        Return
+        ------
+        `np_arrSamples` : np.recarray
+            Block of samples with the same layout
+
+        """
+        # Start the experiment without plotter
+        if (await self._start_StreamAsync(dictParameters) == False):
+            return
+
+        try:
+            while (True):
+                # Check before reading, so no sample is lost at the end
+                bRunning : bool = self._process.is_alive()
+
+                for np_arrSamples in self._read_Stream():
+                    yield np_arrSamples
+
+                if (bRunning == False):
+                    break
+
+                # Wait for the next block of the producer or the end of the
+                # data collection
+                await self._wait_SamplesAsync()
+        finally:
+            # Terminate the experiment, if the stream was stopped early
+            await self._wait_Stream()
+            self._stop_Stream()
+
+    async def start_async(self, **dictParameters) -> str:
+        """
+        Description
+        -----------
+        Run the experiment without plotter and wait for its completion 
+        without blocking the event loop. The experiment is started in a thread
+        of the executor of the event loop. If the task is cancelled, the 
+        experiment is terminated.
+
+        Example:
+
+        strExportPath = await Run_CV().start_async(Scanrate= 0.1)
+
+        Parameters
+        ----------
+        `dictParameters` : dict
+            Parameters of the `start` method of the facade
+
+        Return
+        ------
+        `ExportedFilePath` : string
+            Returns system path to the location where the experiment data and
+            experiment parameters where stored after the experiment
+
+        """
+        # Start the experiment without plotter
+        if (await self._start_StreamAsync(dictParameters) == False):
+            return ""
+
+        try:
+            # Wait until the experiment is completed, the samples aren't read
+            while (self._process.is_alive()):
+                await self._wait_Handles(self._get_Sentinels())
+        finally:
+            # Terminate the experiment, if the task was cancelled
+            await self._wait_Stream()
+            strExportPath : str = self._stop_Stream()
+
+        return strExportPath
+
+    def _start_Stream(self, dictParameters : dict) -> bool:
+        """
+        Description
+        -----------
+        Start the experiment of a stream by calling `start` of the facade, 
+        which only starts the data collection and saves data queue and status
+        block.
+
+        Parameters
+        ----------
+        `dictParameters` : dict
+            Parameters of the `start` method of the facade
+
+        Return
+        ------
+        `bStarted` : bool
+            True if the experiment was started
+
+        """
+        self._dataQueue = None
+        self._strExportPath = ""
+        self._bStream = True
+        try:
+            self.start(**dictParameters)
+        finally:
+            self._bStream = False
+
+        return self._dataQueue is not None
+
+    async def _start_StreamAsync(self, dictParameters : dict) -> bool:
+        """
+        Description
+        -----------
+        Start the experiment of a stream in a thread of the executor of the
+        event loop, since the optimizer and the start of the data collection
+        block. If the task is cancelled meanwhile, the experiment is 
+        terminated as soon as it is started.
+
+        Parameters
+        ----------
+        `dictParameters` : dict
+            Parameters of the `start` method of the facade
+
+        Return
+        ------
+        `bStarted` : bool
+            True if the experiment was started
+
+        """
+        # Initialize variables
+        futureStart = asyncio.get_running_loop().run_in_executor(None,
+            self._start_Stream, dictParameters)
+
+        try:
+            return await asyncio.shield(futureStart)
+        except asyncio.CancelledError:
+            # Starting can't be interrupted, terminate the started experiment
+            if (await futureStart == True):
+                await self._wait_Stream()
+                self._stop_Stream()
+            raise
+
+    def _read_Stream(self) -> list:
+        """
+        Description
+        -----------
+        Read all available samples of the stream as typed blocks.
+
+        Return
+        ------
+        `listRecordArrays` : list
+            List of numpy record arrays
+
+        """
+        # Skip markers between the cycles of a sequence
+        return [np_arrSamples for np_arrSamples in 
+                self._dataQueue.get_RecordArrays()
+                if not (DE_TAG_EXPERIMENT in np_arrSamples.dtype.names and
+                        np_arrSamples[DE_TAG_EXPERIMENT][0] == UNDEFIEND)]
+
+    async def _wait_Stream(self) -> None:
+        """
+        Description
+        -----------
+        Terminate the experiment of the stream, if it is still running, and
+        wait without blocking the event loop until the data collection is
+        done.
+
+        """
+        # Samples aren't read anymore, the producer mustn't wait for them
+        self._dataQueue.detach_Consumer()
+
+        if (self._process.is_alive()):
+            self._event.set()
+
+        while (self._process.is_alive()):
+            await self._wait_Handles(self._get_Sentinels())
+
+    async def _wait_SamplesAsync(self) -> None:
+        """
+        Description
+        -----------
+        Wait without blocking the event loop until the producer published
+        samples or the data collection is done. Polls the data queue, if the
+        producer doesn't wake up the consumer.
+
+        """
+        # Initialize variables
+        iHandle : int = self._dataQueue.get_WaitHandle()
+
+        if (iHandle is None):
+            await asyncio.sleep(FREISTAT_STREAM_POLL_TIME)
+            return
+
+        await self._wait_Handles(self._get_Sentinels() + [iHandle])
+        self._dataQueue.clear_Notifications()
+
+    async def _wait_Handles(self, listHandles : list) -> None:
+        """
+        Description
+        -----------
+        Wait without blocking the event loop until one of the file 
+        descriptors is readable or FREISTAT_STREAM_WAIT_TIMEOUT expired. If
+        the event loop can't wait for file descriptors (e.g. on Windows) or
+        no file descriptor is given, the method only waits 
+        FREISTAT_STREAM_POLL_TIME.
+
+        Parameters
+        ----------
+        `listHandles` : list
+            List of file descriptors
+
+        """
+        # Initialize variables
+        loop = asyncio.get_running_loop()
+        futureReady = loop.create_future()
+        listReaders : list = []
+
+        def wake_Up() -> None:
+            if (not futureReady.done()):
+                futureReady.set_result(None)
+
+        try:
+            for iHandle in listHandles:
+                loop.add_reader(iHandle, wake_Up)
+                listReaders.append(iHandle)
+        except NotImplementedError:
+            listHandles = []
+
+        try:
+            if (len(listHandles) == 0):
+                await asyncio.sleep(FREISTAT_STREAM_POLL_TIME)
+            else:
+                await asyncio.wait_for(futureReady, 
+                                       FREISTAT_STREAM_WAIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for iHandle in listReaders:
+                loop.remove_reader(iHandle)
+
+    def _get_Sentinels(self) -> list:
+        """
+        Description
+        -----------
+        Get the handle which becomes ready when the process of the data
+        collection ends. A job of the acquisition worker has no handle.
+
+        Return
+        ------
+        `listSentinels` : list
+            List containing the sentinel of the process or an empty list
+
+        """
+        iSentinel : int = getattr(self._process, "sentinel", None)
+        if (iSentinel is None):
+            return []
+        return [iSentinel]
+
+    def _stop_Stream(self) -> str:
+        """
+        Description
+        -----------
+        Terminate the experiment of the stream, if it is still running, and
+        release data queue, status block and process.
+
+        Return
+        ------
+        `strExportPath` : str
+            System path where the experiment data is stored
+
+        """
+        # Terminate the experiment and wait for the data collection, which
+        # mustn't wait for samples which aren't read anymore
+        self._dataQueue.detach_Consumer()
+        if (self._process.is_alive()):
+            self._event.set()
+        self._process.join()
+
+        # Read the file path and release the resources
+        strExportPath : str = self._statusBlock.get_ExportPath()
+        self._statusBlock.close()
+        self._dataQueue.close()
+        self._process.close()
+
+        self._dataQueue = None
+        self._statusBlock = None
+
+        # Save the file path for `get_ExportPath`
+        self._strExportPath = strExportPath
+
+        return strExportPath
+
     def P_DataCollection(self, 
                          strMethod : str,
-                         dataQueue : mp.Queue, 
+                         dataQueue : SharedRingBuffer, 
                          event : mp.Event(),
                          listTempExperimentParameters : list, 
                          bLowPerformanceMode : bool,
-                         sharedMemoryLocation_name : str) -> None:
+                         statusBlock : SharedStatusBlock) -> None:
         """
         Description
         -----------
@@ -97,7 +557,7 @@ class Run_Electrochemical_Method:
         `strMethod` : str
             String containing the name of the electrochemical method
 
-        `dataQueue` : Queue
+        `dataQueue` : SharedRingBuffer
             Data queue connecting the different processes with each other
 
         `listTempExperimentParameters` : list
@@ -108,9 +568,39 @@ class Run_Electrochemical_Method:
             Enables low performance mode of the FreiStat, which disables
             plotting of the data and most data output
 
-        `sharedMemoryLocation_name` : str
-            Unique name of the shared memory location in the ram. This is used
-            to return later the name of the file-path back to the user.
+        `statusBlock` : SharedStatusBlock
+            Status block in the shared memory, which is used to publish the
+            progress and to return later the file-path back to the user.
+
+        """
+        # Open connection and create all objects handling the data
+        self._open_DataCollection(event, bLowPerformanceMode)
+
+        # Run the experiment
+        self._run_DataCollection(strMethod, dataQueue, 
+                                 listTempExperimentParameters,
+                                 statusBlock)
+
+        # Close exisitng serial connection
+        self._close_DataCollection()
+
+    def _open_DataCollection(self, event : mp.Event(),
+                             bLowPerformanceMode : bool) -> None:
+        """
+        Description
+        -----------
+        Method creating all objects required for the data collection and 
+        opening the serial or WiFi connection. Runs in the process collecting
+        the data.
+
+        Parameters
+        ----------
+        `event` : Event
+            Multiprocessing event to indicate termination event
+
+        `bLowPerformanceMode` : bool
+            Enables low performance mode of the FreiStat, which disables
+            plotting of the data and most data output
 
         """
         self._logger = logging.Logger("FreiStat_Library")
@@ -121,12 +611,10 @@ class Run_Electrochemical_Method:
         # Creating an object which stores all references to other objects
         self._dataSoftwareStorage = DataSoftwareStorage()
 
-        # Save the low performance mode flag
+        # Save the low performance mode flag and the data settings
         self._dataSoftwareStorage.set_LowPerformanceMode(bLowPerformanceMode)
+        self._apply_DataSettings()
 
-        # Create an object which handles all data
-        self._dataHandling = DataHandling(self._dataSoftwareStorage)
-        
         # Create an object for handling communication
         self._serialConnection = Communication(self._dataSoftwareStorage,
                                                self._iCommunicationMode,
@@ -135,6 +623,49 @@ class Run_Electrochemical_Method:
         # Create an object for parsing JSON strings
         self._jsonParser = JSON_Parser(self._dataSoftwareStorage)
 
+    def _run_DataCollection(self, 
+                            strMethod : str,
+                            dataQueue : SharedRingBuffer,
+                            listTempExperimentParameters : list,
+                            statusBlock : SharedStatusBlock) -> int:
+        """
+        Description
+        -----------
+        Method setting up and executing one electrochemical method over the
+        opened connection. Afterwards the experiment data is exported and the
+        export path is written into the status block.
+
+        Parameters
+        ----------
+        `strMethod` : str
+            String containing the name of the electrochemical method
+
+        `dataQueue` : SharedRingBuffer
+            Data queue connecting the different processes with each other
+
+        `listTempExperimentParameters` : list
+            List containing all defined experiment parameters
+
+        `statusBlock` : SharedStatusBlock
+            Status block in the shared memory, which is used to publish the
+            progress and to return later the file-path back to the user.
+
+        Return
+        ------
+        `iErrorCode` : int
+            Error code of the setup of the electrochemical method
+
+        """
+        # Publish the progress of the experiment in the status block
+        self._dataSoftwareStorage.set_StatusBlock(statusBlock)
+
+        # Create an object which handles all data
+        self._dataHandling = DataHandling(self._dataSoftwareStorage)
+
+        # Telegram generator of a previous experiment references its data
+        # handling, therefore it is created again by the setup behavior
+        self._dataSoftwareStorage.setJSON_TelegramGenerator(None)
+
         # Creating an object for general electrochemical methods
         self._ecMethod = ElectrochemicalMethod(strMethod, self._dataSoftwareStorage)
         
@@ -145,19 +676,32 @@ class Run_Electrochemical_Method:
         if(iErrorCode != 0):
             self._logger.warning(strMethod + "setup failed: Error code: " + 
                 str(iErrorCode) + " Check error list for further informations.")
+            statusBlock.set_ErrorCode(iErrorCode)
             return iErrorCode
-        
-        # Start thread to run execute behavior
-        self._ecMethod.execute(dataQueue, self._event)
 
         # Set system status to starting experiment
         self._dataSoftwareStorage.set_SystemStatus(FREISTAT_EXP_STARTED)
+        
+        # Run execute behavior, blocks until the experiment is done
+        self._ecMethod.execute(dataQueue, self._event)
+
+        # Check if the experiment was terminated by the user
+        if (self._event.is_set()):
+            self._dataSoftwareStorage.set_SystemStatus(FREISTAT_EXP_CANCELED)
 
         # Post processing of experiment data
         # Export data to previously setup csv export after experiment is done
         strExportPath = self._dataHandling. \
             export_Data_csv(self._dataHandling.get_StoredData())
 
+        # Export data additionally as typed columns
+        if (self._iBinaryExport != BINARY_EXPORT_NONE):
+            self._dataHandling.export_Data_binary(self._iBinaryExport)
+
+        # Export remaining samples as NDJSON
+        if (self._bJSONExport == True):
+            self._dataHandling.export_JSON()
+
         # Export experiment type and parameters 
         self._dataHandling.export_ExperimentParameters_csv(
             self._dataHandling.get_ExperimentType(),
@@ -166,22 +710,206 @@ class Run_Electrochemical_Method:
         # Save data object persistent
         self._dataHandling.export_DataStorage()
 
-        # Get address of the shared memory in the RAM through the unique name
-        existing_shm = shared_memory.SharedMemory(
-            name=sharedMemoryLocation_name, create= False)
-        
-        # Define array which is located in the shared memory and has the right
-        # data format
-        np_array = np.ndarray((1,200), dtype= '|S1', buffer= existing_shm.buf)
-        
-        # Loop over the length of the file-path and write it into the array in
-        # the shared memory
-        for i in range(len(strExportPath)):
-            np_array[0,i] = strExportPath[i].encode("UTF-8")
+        # Return the file-path to the user
+        statusBlock.set_ExportPath(strExportPath)
 
-        # Close exisitng serial connection
+        return EC_NO_ERROR
+
+    def _close_DataCollection(self) -> None:
+        """
+        Description
+        -----------
+        Method closing the serial or WiFi connection of the data collection.
+
+        """
         self._serialConnection._closeConnection()
 
+    def _apply_DataSettings(self) -> None:
+        """
+        Description
+        -----------
+        Method handing the data settings of the facade to the data software
+        storage.
+
+        """
+        # Save the format of the data telegrams
+        self._dataSoftwareStorage.set_DataFormat(self._iDataFormat)
+        self._dataSoftwareStorage.set_BatchSize(self._iBatchSize)
+        self._dataSoftwareStorage.set_MemoryMap(self._bMemoryMap)
+        self._dataSoftwareStorage.set_JSONExport(self._bJSONExport)
+        self._dataSoftwareStorage.set_Compression(self._strCompression)
+
+    def get_DataSettings(self) -> dict:
+        """
+        Description
+        -----------
+        Getter method returning the data settings of the facade, which are
+        handed to an acquisition worker with every experiment.
+
+        Return
+        ------
+        `dictDataSettings` : dict
+            Data settings with the names of the constructor parameters as keys
+
+        """
+        return {"dataFormat" : self._iDataFormat,
+                "batchSize" : self._iBatchSize,
+                "memoryMap" : self._bMemoryMap,
+                "binaryExport" : self._iBinaryExport,
+                "jsonExport" : self._bJSONExport,
+                "compression" : self._strCompression}
+
+    def get_Status(self) -> dict:
+        """
+        Description
+        -----------
+        Getter method returning the progress of the running experiment, which
+        is read from the status block without communicating with the process
+        collecting the data.
+
+        Return
+        ------
+        `dictStatus` : dict
+            Status with the keys errorCode, systemStatus, samples, parseErrors,
+            cycle, timeStamp and exportPath or None if no experiment was 
+            started
+
+        """
+        if (self._statusBlock is None):
+            return None
+        return self._statusBlock.get_Status()
+
+    def get_ExportPath(self) -> str:
+        """
+        Description
+        -----------
+        Getter method returning the export path of the last experiment run by
+        `stream`, `stream_async` or `start_async`.
+
+        Return
+        ------
+        `strExportPath` : str
+            System path where the experiment data is stored or an empty string
+            if the experiment isn't completed yet
+
+        """
+        return self._strExportPath
+
+    def set_DataSettings(self, dictDataSettings : dict) -> None:
+        """
+        Description
+        -----------
+        Setter method for the data settings (see `get_DataSettings`).
+
+        Parameters
+        ----------
+        `dictDataSettings` : dict
+            Data settings with the names of the constructor parameters as keys
+
+        """
+        self._iDataFormat = dictDataSettings["dataFormat"]
+        self._iBatchSize = dictDataSettings["batchSize"]
+        self._bMemoryMap = dictDataSettings["memoryMap"]
+        self._iBinaryExport = dictDataSettings["binaryExport"]
+        self._bJSONExport = dictDataSettings["jsonExport"]
+        self._strCompression = dictDataSettings["compression"]
+
+    def _start_DataCollection(self, 
+                              strMethod : str,
+                              dataQueue : SharedRingBuffer,
+                              bLowPerformanceMode : bool,
+                              statusBlock : SharedStatusBlock):
+        """
+        Description
+        -----------
+        Method starting the data collection of an experiment. If an 
+        acquisition worker is used, the experiment is handed to the worker, 
+        otherwise a new process running `P_DataCollection` is started.
+
+        Parameters
+        ----------
+        `strMethod` : str
+            String containing the name of the electrochemical method
+
+        `dataQueue` : SharedRingBuffer
+            Data queue connecting the different processes with each other
+
+        `bLowPerformanceMode` : bool
+            Enables low performance mode of the FreiStat, which disables
+            plotting of the data and most data output
+
+        `statusBlock` : SharedStatusBlock
+            Status block in the shared memory
+
+        Return
+        ------
+        `process` : process or AcquisitionJob
+            Reference to the running data collection, providing `is_alive`,
+            `join` and `close`
+
+        """
+        # Check if an acquisition worker is used
+        if (self._acquisitionWorker is not None):
+            # Terminate the experiment over its status block, so that other
+            # experiments of the worker aren't affected
+            self._event = statusBlock
+
+            return self._acquisitionWorker.submit_Experiment(strMethod,
+                self._listExperimentParameters, dataQueue, bLowPerformanceMode,
+                statusBlock, self.get_DataSettings())
+
+        # Define event
+        self._event = mp.Event()
+
+        # Define a process which deals with the reading of the data from the 
+        # Serial connection and the storage of the data
+        process = mp.Process(target= self.P_DataCollection,
+            args=(strMethod, dataQueue, self._event, 
+                  self._listExperimentParameters, bLowPerformanceMode,
+                  statusBlock))
+
+        # Start the process
+        process.start()
+
+        return process
+
+    def _create_Plotter(self, 
+                        strMethod : str,
+                        listTempExperimentParameters : list,
+                        strMode : str,
+                        process) -> "Plotter":
+        """
+        Description
+        -----------
+        Method creating the plotter of the experiment. Matplotlib and tkinter 
+        are only imported at this point, so that experiments in low 
+        performance mode and the process collecting the data don't load them.
+
+        Parameters
+        ----------
+        `strMethod` : str
+            String containing the experiment type
+
+        `listTempExperimentParameters` : list
+            List containing the experiment parameters of the choosen ec-method
+
+        `strMode` : string
+            String defining in which mode the FreiStat plotter should be used
+            Defined: "standalone", "backend"
+
+        `process` : process or AcquisitionJob
+            Reference to the running data collection
+
+        Return
+        ------
+        `Plotter` : Plotter
+            Reference to the created plotter object
+
+        """
+        from ..Plotter.plotter import Plotter
+
+        return Plotter(strMethod, listTempExperimentParameters, strMode, process)
+
     def _check_OsProcess(self) -> str:
         """
         Description
@@ -379,7 +1107,7 @@ class Run_Electrochemical_Method:
         # Set event flag to true to end child process
         self._event.set()
 
-    def get_plotter(self) -> Plotter:
+    def get_plotter(self) -> "Plotter":
         """
         Description
         -----------
@@ -397,11 +1125,13 @@ class Run_Electrochemical_Method:
         """
         Description
         -----------
-        Getter method returning reference to data queue
+        Getter method returning reference to data queue. The data queue is a 
+        ring buffer in shared memory, which returns all available data points 
+        with `get_Records()` or one data point with `get()`.
 
         Return
         ------
-        `dataQueue` : Queue
+        `dataQueue` : SharedRingBuffer
             Reference to the data queue object used by FreiStat
 
         """
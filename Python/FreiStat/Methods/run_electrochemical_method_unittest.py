@@ -0,0 +1,227 @@
+"""
+Module implementing different unittests for the parent class of the facades.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import asyncio
+import contextlib
+import json
+import logging
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# Import internal dependencies
+from ..Data_storage.constants import *
+from .acquisition_worker_unittest import FakeFreiStat
+from .run_cyclic_voltammetry import Run_CV
+
+# Script importing all facades in a fresh interpreter
+_strImportScript : str = """
+import json, sys, time
+fStart = time.perf_counter()
+import FreiStat.Methods.run_chronoamperometry
+import FreiStat.Methods.run_cyclic_voltammetry
+import FreiStat.Methods.run_differential_pulse_voltammetry
+import FreiStat.Methods.run_linear_sweep_voltammetry
+import FreiStat.Methods.run_normal_pulse_voltammetry
+import FreiStat.Methods.run_open_circuit_potential
+import FreiStat.Methods.run_sequence
+import FreiStat.Methods.run_square_wave_voltammetry
+import FreiStat.Methods.acquisition_worker
+print(json.dumps([time.perf_counter() - fStart,
+                  sorted(strModule for strModule in sys.modules
+                         if strModule.split(".")[0] in
+                         ["matplotlib", "tkinter", "FreiStat"])]))
+"""
+
+class Run_Electrochemical_Method_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the parent class of the
+    facades.
+
+    """
+    # Max. time in s to import all facades without plotting dependencies
+    _fImportBudget : float = 1.0
+
+    def setUp(self) -> None:
+        # Export the experiments into a temporary directory
+        self._strWorkingDirectory : str = os.getcwd()
+        self._temporaryDirectory = tempfile.TemporaryDirectory()
+        os.chdir(self._temporaryDirectory.name)
+
+    def tearDown(self) -> None:
+        os.chdir(self._strWorkingDirectory)
+        self._temporaryDirectory.cleanup()
+
+    def test_Import(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that the facades can be imported headless, without
+        loading matplotlib or tkinter, within the start-up budget.
+
+        """
+        # Import facades in a new interpreter, like a spawned process does
+        strOutput : str = subprocess.run([sys.executable, "-c",
+            _strImportScript], cwd= Path(__file__).resolve().parents[2],
+            capture_output= True, check= True, text= True).stdout
+
+        fImportTime, listModules = json.loads(strOutput)
+
+        self.assertNotIn("FreiStat.Plotter.plotter", listModules)
+        self.assertEqual([strModule for strModule in listModules
+                          if not strModule.startswith("FreiStat")], [])
+        self.assertLess(fImportTime, self._fImportBudget)
+
+    def test_start_async(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that one event loop runs the experiments of two
+        FreiStats at the same time.
+
+        """
+        listFakeFreiStats : list = [FakeFreiStat(iSamples= 50, 
+            fSampleTime= 0.002) for iDevice in range(2)]
+        listRunMethods : list = [Run_CV(commnicationMode= FREISTAT_WLAN,
+            wlanSetting= fakeFreiStat.get_WLANSetting())
+            for fakeFreiStat in listFakeFreiStats]
+
+        async def run_Experiments() -> list:
+            return await asyncio.gather(*[runMethod.start_async(
+                EnableOptimizer= False) for runMethod in listRunMethods])
+
+        try:
+            listExportPaths : list = asyncio.run(run_Experiments())
+        finally:
+            for fakeFreiStat in listFakeFreiStats:
+                fakeFreiStat.close()
+
+        for runMethod, strExportPath in zip(listRunMethods, listExportPaths):
+            self.assertTrue(os.path.isdir(strExportPath))
+            self.assertEqual(runMethod.get_ExportPath(), strExportPath)
+
+    def test_stream_async(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that all samples are streamed and that the export
+        path is available after the iteration.
+
+        """
+        fakeFreiStat = FakeFreiStat(iSamples= 50, fSampleTime= 0.002)
+        runMethod = Run_CV(commnicationMode= FREISTAT_WLAN,
+                           wlanSetting= fakeFreiStat.get_WLANSetting())
+
+        async def count_Samples() -> int:
+            iSamples : int = 0
+            async for np_arrSamples in runMethod.stream_async(
+                EnableOptimizer= False):
+                iSamples += len(np_arrSamples)
+            return iSamples
+
+        try:
+            self.assertEqual(asyncio.run(count_Samples()), 50)
+        finally:
+            fakeFreiStat.close()
+
+        self.assertTrue(os.path.isdir(runMethod.get_ExportPath()))
+        self.assertIsNone(runMethod.get_Status())
+
+    def test_cancel_async(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that cancelling the task or closing the stream
+        terminates the experiment and releases all resources.
+
+        """
+        fakeFreiStat = FakeFreiStat(iSamples= 10000, fSampleTime= 0.002)
+
+        async def cancel_Start(runMethod, bStarted : bool) -> None:
+            task = asyncio.create_task(runMethod.start_async(
+                EnableOptimizer= False))
+
+            # Cancel while starting or after the first samples
+            await asyncio.sleep(0)
+            while (bStarted and not task.done() and 
+                   (runMethod.get_Status() is None or 
+                    runMethod.get_Status()["samples"] == 0)):
+                await asyncio.sleep(0.01)
+            task.cancel()
+
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        async def close_Stream(runMethod) -> int:
+            async with contextlib.aclosing(runMethod.stream_async(
+                EnableOptimizer= False)) as streamSamples:
+                async for np_arrSamples in streamSamples:
+                    return len(np_arrSamples)
+
+        try:
+            for bStarted in [False, True]:
+                runMethod = Run_CV(commnicationMode= FREISTAT_WLAN,
+                                   wlanSetting= fakeFreiStat.get_WLANSetting())
+                asyncio.run(cancel_Start(runMethod, bStarted))
+
+                self.assertIsNone(runMethod.get_Status())
+                self.assertTrue(os.path.isdir(runMethod.get_ExportPath()))
+
+            runMethod = Run_CV(commnicationMode= FREISTAT_WLAN,
+                               wlanSetting= fakeFreiStat.get_WLANSetting())
+            self.assertGreater(asyncio.run(close_Stream(runMethod)), 0)
+
+            self.assertIsNone(runMethod.get_Status())
+            self.assertTrue(os.path.isdir(runMethod.get_ExportPath()))
+        finally:
+            fakeFreiStat.close()
+
+    def test_start_Twice(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that a facade keeps its logger and can run several
+        experiments after each other.
+
+        """
+        fakeFreiStat = FakeFreiStat(iSamples= 20, fSampleTime= 0.002)
+        logger = logging.getLogger("FreiStat_UnitTest")
+        runMethod = Run_CV(logger= logger, commnicationMode= FREISTAT_WLAN,
+                           wlanSetting= fakeFreiStat.get_WLANSetting())
+
+        try:
+            # First experiment streamed, second one awaited
+            iSamples : int = sum(len(np_arrSamples) for np_arrSamples in
+                                 runMethod.stream(EnableOptimizer= False))
+            strExportPath : str = runMethod.get_ExportPath()
+            self.assertIs(runMethod._logger, logger)
+
+            self.assertTrue(os.path.isdir(asyncio.run(runMethod.start_async(
+                EnableOptimizer= False))))
+        finally:
+            fakeFreiStat.close()
+
+        # Check results
+        self.assertEqual(iSamples, 20)
+        self.assertTrue(os.path.isdir(strExportPath))
+        self.assertIs(runMethod._logger, logger)
+        self.assertNotIn("_logger", runMethod.__getstate__())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,17 +14,16 @@ __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 
 # Import dependencies
 import multiprocessing  as mp
-from multiprocessing import shared_memory
-import numpy as np
 
 # Import internal dependencies
 from ..Data_storage.constants import *
-from ..Plotter.plotter import Plotter
 from .run_electrochemical_method import Run_Electrochemical_Method
 from ..Utility.optimizer import Optimizer
 from ..Utility.encoder import _encode_Bool_Flag
 from ..Utility.encoder import _encode_LPTIA_Resistor_Size
 from ..Utility.encoder import _encode_Sinc_Oversampling_Rate
+from ..Utility.shared_ring_buffer import SharedRingBuffer
+from ..Utility.shared_status_block import SharedStatusBlock
 
 class Run_NPV(Run_Electrochemical_Method):
     """
@@ -117,9 +116,6 @@ class Run_NPV(Run_Electrochemical_Method):
 
         """
         # Intialize variables
-        bSerialBuffer = b""
-
-        iPosition : int = 0
 
         listPulse_Lengths : list = [] 
 
@@ -189,7 +185,8 @@ class Run_NPV(Run_Electrochemical_Method):
         if (EnableOptimizer == True):
             # Optimize experiment parameters
             # Create instance of the optimizer class
-            _Optimizer = Optimizer(self._logger, self._iCommunicationMode)
+            _Optimizer = Optimizer(self._logger, self._iCommunicationMode,
+                                   self._iDataFormat, self._iBatchSize)
 
             # Start optimization
             iErrorcode = _Optimizer.start(NPV, self._listExperimentParameters)
@@ -208,42 +205,36 @@ class Run_NPV(Run_Electrochemical_Method):
         # Define electrochemical method
         strMethod : str = NPV
 
-        # Unbound the logger
-        self._logger = None
-
         # Define start method for multiprocessing using helper method
         mp.get_context(self._check_OsProcess())
 
-        # Define data queue
-        manager = mp.Manager()
-        dataQueue = manager.Queue()
-
-        # Define event
-        self._event = mp.Event()
+        # Define data queue as ring buffer in shared memory
+        dataQueue = SharedRingBuffer()
 
-        # Define location in the RAM as shared memory between processes
-        sharedMemoryLocation = shared_memory.SharedMemory(create= True, size= 200)
+        # Define status block in the shared memory, which publishes the
+        # progress of the experiment and returns the file path
+        statusBlock = SharedStatusBlock()
 
-        # Define byte array which accesses the prviously defined memory spacee
-        np_arrbSharedMemory = np.ndarray((1,200), dtype= '|S1', 
-            buffer= sharedMemoryLocation.buf)
+        # Start the data collection in a new process or in the acquisition 
+        # worker
+        self._process = self._start_DataCollection(strMethod, dataQueue,
+            LowPerformanceMode, statusBlock)
 
-        # Define a process which deals with the reading of the data from the 
-        # Serial connection and the storage of the data
-        self._process = mp.Process(target= self.P_DataCollection,
-            args=(strMethod, dataQueue, self._event, self._listExperimentParameters, 
-                  LowPerformanceMode, sharedMemoryLocation.name))
-
-        # Start the process                                                 
-        self._process.start() 
+        # Check if the results are streamed, the samples are read by `stream`
+        if (self._bStream == True):
+            # Save data queue and status block, which are released by the stream
+            self._dataQueue = dataQueue
+            self._statusBlock = statusBlock
+            return ""
 
         # Check if Library is used as interface backend or not
         if(self._FreiStatMode == FREISTAT_STANDALONE):
 
             if (LowPerformanceMode == False):
                 # Create an object for plotting the data
-                self._plotter = Plotter(strMethod, self._listExperimentParameters,
-                                        FREISTAT_STANDALONE, self._process)
+                self._plotter = self._create_Plotter(strMethod,
+                    self._listExperimentParameters, FREISTAT_STANDALONE,
+                    self._process)
 
                 # Initialize plot
                 self._plotter.initPlot()
@@ -260,34 +251,25 @@ class Run_NPV(Run_Electrochemical_Method):
                 # Join process (Blocks until process is done)
                 self._process.join()
 
-            # Loop until the end of the shared memory array
-            while (True):
-                # Check if the array ended
-                if (np_arrbSharedMemory[0, iPosition] == b''):
-                    break
-                else :
-                    # Append data on serial buffer
-                    bSerialBuffer += np_arrbSharedMemory[0, iPosition]
-
-                    # Increase position counter
-                    iPosition += 1
+            # Read the file path from the status block
+            strExportPath : str = statusBlock.get_ExportPath()
 
-            # Close shared memory
-            sharedMemoryLocation.close()
+            # Release status block
+            statusBlock.close()
 
-            # Release allocated memory
-            sharedMemoryLocation.unlink()
+            # Release data queue
+            dataQueue.close()
             
             # End process
             self._process.close()
 
-            # Decode the string containing the file path and return it
-            return bSerialBuffer.decode("UTF-8")
+            # Return the file path
+            return strExportPath
 
         elif (self._FreiStatMode == FREISTAT_BACKEND):
             # Create an object for plotting the data
-            self._plotter = Plotter(strMethod, self._listExperimentParameters,
-                                    FREISTAT_BACKEND, self._process)
+            self._plotter = self._create_Plotter(strMethod,
+                self._listExperimentParameters, FREISTAT_BACKEND, self._process)
 
             # Initialize plot
             self._plotter.initPlot()
@@ -295,5 +277,5 @@ class Run_NPV(Run_Electrochemical_Method):
             # Save data queue to prevent dumping it, because scope is left
             self._dataQueue = dataQueue
 
-            # Save shared memory to prevent dumpint it, because scope is left
-            self._sharedMemoryLocation = sharedMemoryLocation
\ No newline at end of file
+            # Save status block to prevent dumping it, because scope is left
+            self._statusBlock = statusBlock
\ No newline at end of file
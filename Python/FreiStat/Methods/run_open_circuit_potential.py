@@ -14,16 +14,15 @@ __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 
 # Import dependencies
 import multiprocessing  as mp
-from multiprocessing import shared_memory
-import numpy as np
 
 # Import internal dependencies
 from ..Data_storage.constants import *
-from ..Plotter.plotter import Plotter
 from .run_electrochemical_method import Run_Electrochemical_Method
 from ..Utility.encoder import _encode_Bool_Flag
 from ..Utility.encoder import _encode_LPTIA_Resistor_Size
 from ..Utility.encoder import _encode_Sinc_Oversampling_Rate
+from ..Utility.shared_ring_buffer import SharedRingBuffer
+from ..Utility.shared_status_block import SharedStatusBlock
 
 class Run_OCP(Run_Electrochemical_Method):
     """
@@ -83,11 +82,6 @@ class Run_OCP(Run_Electrochemical_Method):
             experiment parameters where stored after the experiment
 
         """
-        # Intialize variables
-        bSerialBuffer = b""
-
-        iPosition : int = 0
-     
         # Translate Sinc2 oversampling rate into integer value
         Sinc2_Oversampling = _encode_Sinc_Oversampling_Rate("Sinc2", 
                                 Sinc2_Oversampling, self._logger)
@@ -116,32 +110,30 @@ class Run_OCP(Run_Electrochemical_Method):
         # Define start method for multiprocessing using helper method
         mp.get_context(self._check_OsProcess())
 
-        # Define data queue
-        manager = mp.Manager()
-        dataQueue = manager.Queue()
-
-        # Define event
-        self._event = mp.Event()
+        # Define data queue as ring buffer in shared memory
+        dataQueue = SharedRingBuffer()
 
-        # Define location in the RAM as shared memory between processes
-        sharedMemoryLocation = shared_memory.SharedMemory(create= True, size= 200)
+        # Define status block in the shared memory, which publishes the
+        # progress of the experiment and returns the file path
+        statusBlock = SharedStatusBlock()
 
-        # Define byte array which accesses the prviously defined memory spacee
-        np_arrbSharedMemory = np.ndarray((1,200), dtype= '|S1', 
-            buffer= sharedMemoryLocation.buf)
+        # Start the data collection in a new process or in the acquisition 
+        # worker
+        self._process = self._start_DataCollection(strMethod, dataQueue,
+            LowPerformanceMode, statusBlock)
 
-        # Define a process which deals with the reading of the data from the 
-        # Serial connection and the storage of the data
-        self._process = mp.Process(target= self.P_DataCollection,
-            args=(strMethod, dataQueue, self._event, self._listExperimentParameters, 
-                  LowPerformanceMode, sharedMemoryLocation.name))
-
-        # Start the process                                                 
-        self._process.start() 
+        # Check if the results are streamed, the samples are read by `stream`
+        if (self._bStream == True):
+            # Save data queue and status block, which are released by the stream
+            self._dataQueue = dataQueue
+            self._statusBlock = statusBlock
+            return ""
 
         if (LowPerformanceMode == False):
             # Create an object for plotting the data
-            self._plotter = Plotter(strMethod, self._listExperimentParameters)
+            self._plotter = self._create_Plotter(strMethod,
+                self._listExperimentParameters, FREISTAT_STANDALONE,
+                self._process)
 
             # Initialize plot
             self._plotter.initPlot()
@@ -158,26 +150,17 @@ class Run_OCP(Run_Electrochemical_Method):
             # Join process (Blocks until process is done)
             self._process.join()
 
-        # Loop until the end of the shared memory array
-        while (True):
-            # Check if the array ended
-            if (np_arrbSharedMemory[0, iPosition] == b''):
-                break
-            else :
-                # Append data on serial buffer
-                bSerialBuffer += np_arrbSharedMemory[0, iPosition]
-
-                # Increase position counter
-                iPosition += 1
+        # Read the file path from the status block
+        strExportPath : str = statusBlock.get_ExportPath()
 
-        # Close shared memory
-        sharedMemoryLocation.close()
+        # Release status block
+        statusBlock.close()
 
-        # Release allocated memory
-        sharedMemoryLocation.unlink()
+        # Release data queue
+        dataQueue.close()
 
         # End process
         self._process.close()
 
-        # Decode the string containing the file path and return it
-        return bSerialBuffer.decode("UTF-8")
+        # Return the file path
+        return strExportPath
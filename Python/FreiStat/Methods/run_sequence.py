@@ -15,22 +15,22 @@ __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 # Import dependencies
 import logging
 import multiprocessing  as mp
-from multiprocessing import shared_memory
-import numpy as np
 
 # Import internal dependencies
 from ..Data_storage.constants import *
 from ..Serial_communication.serial_communication import Communication
+from ..Data_storage.compression import is_CompressionAvailable
 from ..Data_storage.data_handling import DataHandling
 from ..Data_storage.data_software_storage import DataSoftwareStorage
 from ..Electrochemical_methods.electrochemical_method import ElectrochemicalMethod
 from ..JSON_parser.json_parser import JSON_Parser
-from ..Plotter.plotter import Plotter
 from .run_electrochemical_method import Run_Electrochemical_Method
 from ..Utility.optimizer import Optimizer
 from ..Utility.encoder import _encode_Bool_Flag
 from ..Utility.encoder import _encode_LPTIA_Resistor_Size
 from ..Utility.encoder import _encode_Sinc_Oversampling_Rate
+from ..Utility.shared_ring_buffer import SharedRingBuffer
+from ..Utility.shared_status_block import SharedStatusBlock
 
 class Run_Sequence(Run_Electrochemical_Method):
     """
@@ -48,7 +48,13 @@ class Run_Sequence(Run_Electrochemical_Method):
                                 FREISTAT_UDP_CLIENT_IP,
                                 FREISTAT_UDP_CLIENT_PORT],
                  EnableOptimizer : bool = True, 
-                 mode: str = FREISTAT_STANDALONE ) -> None:
+                 mode: str = FREISTAT_STANDALONE,
+                 dataFormat : int = DATA_FORMAT_JSON,
+                 batchSize : int = 1,
+                 memoryMap : bool = False,
+                 binaryExport : int = BINARY_EXPORT_NONE,
+                 jsonExport : bool = False,
+                 compression : str = COMPRESSION_NONE) -> None:
         """
         Description
         -----------
@@ -74,11 +80,57 @@ class Run_Sequence(Run_Electrochemical_Method):
             String defining in which mode the FreiStat library should be used
             Defined: "standalone", "backend"
 
+        `dataFormat` : int
+            Integer flag encoding if FreiStat should send the data telegrams as
+            JSON (0) or binary (1). Binary data telegrams are only supported by
+            the serial communication.
+
+        `batchSize` : int
+            Amount of samples FreiStat should pack into one data telegram
+            (1 - 10). Larger batches reduce the telegram overhead.
+
+        `memoryMap` : bool
+            Flag indicating if the experiment data should be stored in 
+            memory-mapped files instead of the RAM, which keeps the memory
+            usage bounded for long experiments
+
+        `binaryExport` : int
+            Integer flag encoding if the experiment data should additionally
+            be exported as .npy (1) or compressed .npz (2) next to the csv file
+
+        `jsonExport` : bool
+            Flag indicating if the experiment data should be streamed into a 
+            newline-delimited JSON file while the experiment is running
+
+        `compression` : str
+            Compression of the persistent data objects and the exports
+            (COMPRESSION_NONE, _GZIP, _LZMA, _ZSTD or _LZ4). Zstd and lz4
+            require the packages zstandard and lz4.
+
         """
         # Initialize class variable
         self._logger= logger
         self._iCommunicationMode = commnicationMode
         self._listWLANSetting = wlanSetting
+        self._iDataFormat = dataFormat
+        self._bMemoryMap = memoryMap
+        self._iBinaryExport = binaryExport
+        self._bJSONExport = jsonExport
+        self._statusBlock = None
+        self._bStream : bool = False
+        self._strExportPath : str = ""
+
+        # Check if compression is supported
+        if (is_CompressionAvailable(compression)):
+            self._strCompression = compression
+        else:
+            raise RuntimeError("Compression not supported.")
+
+        # Check if batch size is supported
+        if (batchSize >= 1 and batchSize <= FREISTAT_MAX_BATCH_SIZE):
+            self._iBatchSize = batchSize
+        else:
+            raise RuntimeError("Batch size not supported.")
 
         self._iSetupFailed : int = 0
 
@@ -87,6 +139,13 @@ class Run_Sequence(Run_Electrochemical_Method):
         # Creating an object which stores all references to other objects
         self._dataSoftwareStorage = DataSoftwareStorage()
 
+        # Save the format of the data telegrams
+        self._dataSoftwareStorage.set_DataFormat(self._iDataFormat)
+        self._dataSoftwareStorage.set_BatchSize(self._iBatchSize)
+        self._dataSoftwareStorage.set_MemoryMap(self._bMemoryMap)
+        self._dataSoftwareStorage.set_JSONExport(self._bJSONExport)
+        self._dataSoftwareStorage.set_Compression(self._strCompression)
+
         # Create an object which handles all data
         self._dataHandling = DataHandling(self._dataSoftwareStorage)
 
@@ -126,11 +185,6 @@ class Run_Sequence(Run_Electrochemical_Method):
             experiment parameters where stored after the experiment
 
         """
-        # Intialize variables
-        bSerialBuffer = b""
-
-        iPosition : int = 0
-
         # Check sequence length
         if (len(self._listEcMethod) <= 1):
             self._logger.error("Sequence to short, add more methods via the \"Run" +
@@ -162,25 +216,18 @@ class Run_Sequence(Run_Electrochemical_Method):
         # Define electrochemical method
         strMethod = SEQUENCE
 
-        # Unbound the logger
-        self._logger = None
-
         # Define start method for multiprocessing using helper method
         mp.get_context(self._check_OsProcess())
 
-        # Define data queue
-        manager = mp.Manager()
-        dataQueue = manager.Queue()
+        # Define data queue as ring buffer in shared memory
+        dataQueue = SharedRingBuffer()
 
         # Define event
         self._event = mp.Event()
 
-        # Define location in the RAM as shared memory between processes
-        sharedMemoryLocation = shared_memory.SharedMemory(create= True, size= 200)
-
-        # Define byte array which accesses the prviously defined memory spacee
-        np_arrbSharedMemory = np.ndarray((1,200), dtype='|S1', 
-            buffer=sharedMemoryLocation.buf)
+        # Define status block in the shared memory, which publishes the
+        # progress of the experiment and returns the file path
+        statusBlock = SharedStatusBlock()
 
         # Define a process which deals with the reading of the data from the 
         # Serial connection and the storage of the data
@@ -190,7 +237,7 @@ class Run_Sequence(Run_Electrochemical_Method):
                                          SequenceCycles,
                                          listTempExperimentParameters,
                                          LowPerformanceMode,  
-                                         sharedMemoryLocation.name))
+                                         statusBlock))
 
         # Start the process                                                 
         self._process.start() 
@@ -219,13 +266,21 @@ class Run_Sequence(Run_Electrochemical_Method):
             # Move to next object
             self._dataHandling.move_next_DataObject()
 
+        # Check if the results are streamed, the samples are read by `stream`
+        if (self._bStream == True):
+            # Save data queue and status block, which are released by the stream
+            self._dataQueue = dataQueue
+            self._statusBlock = statusBlock
+            return ""
+
         # Check if Library is used as interface backend or not
         if(self._FreiStatMode == FREISTAT_STANDALONE):
 
             if (LowPerformanceMode == False):
                 # Create an object for plotting the data
-                self._plotter = Plotter(strMethod, listTempExperimentParameters,
-                                        FREISTAT_STANDALONE, self._process)
+                self._plotter = self._create_Plotter(strMethod,
+                    listTempExperimentParameters, FREISTAT_STANDALONE,
+                    self._process)
 
                 # Initialize plot
                 self._plotter.initPlot()
@@ -242,34 +297,25 @@ class Run_Sequence(Run_Electrochemical_Method):
                 # Join process (Blocks until process is done)
                 self._process.join()
 
-            # Loop until the end of the shared memory array
-            while (True):
-                # Check if the array ended
-                if (np_arrbSharedMemory[0, iPosition] == b''):
-                    break
-                else :
-                    # Append data on serial buffer
-                    bSerialBuffer += np_arrbSharedMemory[0, iPosition]
-
-                    # Increase position counter
-                    iPosition += 1
+            # Read the file path from the status block
+            strExportPath : str = statusBlock.get_ExportPath()
 
-            # Close shared memory
-            sharedMemoryLocation.close()
+            # Release status block
+            statusBlock.close()
 
-            # Release allocated memory
-            sharedMemoryLocation.unlink()
+            # Release data queue
+            dataQueue.close()
             
             # End process
             self._process.close()
 
-            # Decode the string containing the file path and return it
-            return bSerialBuffer.decode("UTF-8")
+            # Return the file path
+            return strExportPath
 
         elif (self._FreiStatMode == FREISTAT_BACKEND):
             # Create an object for plotting the data
-            self._plotter = Plotter(strMethod, listTempExperimentParameters,
-                                    FREISTAT_BACKEND, self._process)
+            self._plotter = self._create_Plotter(strMethod,
+                listTempExperimentParameters, FREISTAT_BACKEND, self._process)
 
             # Initialize plot
             self._plotter.initPlot()
@@ -277,8 +323,8 @@ class Run_Sequence(Run_Electrochemical_Method):
             # Save data queue to prevent dumping it, because scope is left
             self._dataQueue = dataQueue
 
-            # Save shared memory to prevent dumpint it, because scope is left
-            self._sharedMemoryLocation = sharedMemoryLocation
+            # Save status block to prevent dumping it, because scope is left
+            self._statusBlock = statusBlock
 
     def P_DataCollection(self, 
                          dataQueue : mp.Queue, 
@@ -286,7 +332,7 @@ class Run_Sequence(Run_Electrochemical_Method):
                          SequenceCycles : int,
                          listTempExperimentParameters : list, 
                          bLowPerformanceMode : bool,
-                         sharedMemoryLocation_name : str) -> None:
+                         statusBlock : SharedStatusBlock) -> None:
         """
         Description
         -----------
@@ -309,14 +355,17 @@ class Run_Sequence(Run_Electrochemical_Method):
             Enables low performance mode of the FreiStat, which disables
             plotting of the data and most data output
 
-        `sharedMemoryLocation_name` : str
-            Unique name of the shared memory location in the ram. This is used
-            to return later the name of the file-path back to the user.
+        `statusBlock` : SharedStatusBlock
+            Status block in the shared memory, which is used to publish the
+            progress and to return later the file-path back to the user.
 
         """
         # Save event reference
         self._event = event
 
+        # Publish the progress of the experiment in the status block
+        self._dataSoftwareStorage.set_StatusBlock(statusBlock)
+
         # Create an object for handling communication
         self._serialConnection = Communication(self._dataSoftwareStorage,
                                                self._iCommunicationMode,
@@ -356,13 +405,17 @@ class Run_Sequence(Run_Electrochemical_Method):
         # Move to the first stored data object in the list
         self._dataHandling.move_first_DataObject()
 
+        # Set system status to starting experiment
+        self._dataSoftwareStorage.set_SystemStatus(FREISTAT_EXP_STARTED)
+
         # Execute behavior for sequence needed -> thread reading data 
         # Persistant data export , etc. 
         self._ecMethod.execute(dataQueue, event= self._event, iTelegrams= 2, bEnableReading= True,
             bPorgressiveMesurement= False)
 
-        # Set system status to starting experiment
-        self._dataSoftwareStorage.set_SystemStatus(FREISTAT_EXP_STARTED)
+        # Check if the experiment was terminated by the user
+        if (self._event.is_set()):
+            self._dataSoftwareStorage.set_SystemStatus(FREISTAT_EXP_CANCELED)
 
         # Post processing of experiment data
         # Move to the first stored data object in the list
@@ -374,6 +427,14 @@ class Run_Sequence(Run_Electrochemical_Method):
             strExportPath = self._dataHandling. \
                 export_Data_csv(self._dataHandling.get_StoredData())
 
+            # Export data additionally as typed columns
+            if (self._iBinaryExport != BINARY_EXPORT_NONE):
+                self._dataHandling.export_Data_binary(self._iBinaryExport)
+
+            # Export remaining samples as NDJSON
+            if (self._bJSONExport == True):
+                self._dataHandling.export_JSON()
+
             # Save data object persistent
             self._dataHandling.export_DataStorage()
 
@@ -385,18 +446,8 @@ class Run_Sequence(Run_Electrochemical_Method):
             # Move to the next stored data object
             self._dataHandling.move_next_DataObject()
 
-        # Get address of the shared memory in the RAM through the unique name
-        existing_shm = shared_memory.SharedMemory(
-            name=sharedMemoryLocation_name, create= False)
-
-        # Define array which is located in the shared memory and has the right
-        # data format
-        np_array = np.ndarray((1,200), dtype='|S1', buffer=existing_shm.buf)
-        
-        # Loop over the length of the file-path and write it into the array in
-        # the shared memory
-        for i in range(len(strExportPath)):
-            np_array[0,i] = strExportPath[i].encode("UTF-8")
+        # Return the file-path to the user
+        statusBlock.set_ExportPath(strExportPath)
 
         # Close exisitng serial connection
         self._serialConnection._closeConnection()
@@ -524,7 +575,8 @@ class Run_Sequence(Run_Electrochemical_Method):
         if (self._bEnableOptimizer == True):
             # Optimize experiment parameters
             # Create instance of the optimizer class
-            _Optimizer = Optimizer(self._logger, self._iCommunicationMode)
+            _Optimizer = Optimizer(self._logger, self._iCommunicationMode,
+                                   self._iDataFormat, self._iBatchSize)
 
             # Start optimization
             iErrorcode = _Optimizer.start(CV, listTempExperimentParameters)
@@ -669,7 +721,8 @@ class Run_Sequence(Run_Electrochemical_Method):
         if (self._bEnableOptimizer == True):
             # Optimize experiment parameters
             # Create instance of the optimizer class
-            _Optimizer = Optimizer(self._logger, self._iCommunicationMode)
+            _Optimizer = Optimizer(self._logger, self._iCommunicationMode,
+                                   self._iDataFormat, self._iBatchSize)
 
             # Start optimization
             iErrorcode = _Optimizer.start(LSV, listTempExperimentParameters)
@@ -806,7 +859,8 @@ class Run_Sequence(Run_Electrochemical_Method):
         if (self._bEnableOptimizer == True):
             # Optimize experiment parameters
             # Create instance of the optimizer class
-            _Optimizer = Optimizer(self._logger, self._iCommunicationMode)
+            _Optimizer = Optimizer(self._logger, self._iCommunicationMode,
+                                   self._iDataFormat, self._iBatchSize)
 
             # Start optimization
             iErrorcode = _Optimizer.start(CA, listTempExperimentParameters)
@@ -978,7 +1032,8 @@ class Run_Sequence(Run_Electrochemical_Method):
         if (self._bEnableOptimizer == True):
             # Optimize experiment parameters
             # Create instance of the optimizer class
-            _Optimizer = Optimizer(self._logger, self._iCommunicationMode)
+            _Optimizer = Optimizer(self._logger, self._iCommunicationMode,
+                                   self._iDataFormat, self._iBatchSize)
 
             # Start optimization
             iErrorcode = _Optimizer.start(NPV, listTempExperimentParameters)
@@ -1146,7 +1201,8 @@ class Run_Sequence(Run_Electrochemical_Method):
         if (self._bEnableOptimizer == True):
             # Optimize experiment parameters
             # Create instance of the optimizer class
-            _Optimizer = Optimizer(self._logger, self._iCommunicationMode)
+            _Optimizer = Optimizer(self._logger, self._iCommunicationMode,
+                                   self._iDataFormat, self._iBatchSize)
 
             # Start optimization
             iErrorcode = _Optimizer.start(DPV, listTempExperimentParameters)
@@ -1307,7 +1363,8 @@ class Run_Sequence(Run_Electrochemical_Method):
         if (self._bEnableOptimizer == True):
             # Optimize experiment parameters
             # Create instance of the optimizer class
-            _Optimizer = Optimizer(self._logger, self._iCommunicationMode)
+            _Optimizer = Optimizer(self._logger, self._iCommunicationMode,
+                                   self._iDataFormat, self._iBatchSize)
 
             # Start optimization
             iErrorcode = _Optimizer.start(SWV, listTempExperimentParameters)
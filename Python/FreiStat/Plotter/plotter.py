@@ -503,12 +503,11 @@ class Plotter:
             Reference to the 2D line which is used to draw the data in the plot
 
         """      
-        # Check if data is available in the queue
-        while (dataQueue.empty() == False):
-            listTemp : list = dataQueue.get()
-            self._listStoredData.append(listTemp)
+        # Read all samples available in the data queue
+        for listData in dataQueue.get_Records():
+            self._listStoredData.append(listData)
 
-            self._insertDataInOutput(listTemp)
+            self._insertDataInOutput(listData)
 
         # Check if sequence or single method should be plotted
         if (self._bPlotSequence == False):
@@ -874,7 +873,7 @@ class Plotter:
         -----------
         Show the plot and start dynamically updating the plot
 
-        `dataQueue` : Queue
+        `dataQueue` : SharedRingBuffer
             Data queue used as pipe between the different processes
 
         """
@@ -891,6 +890,10 @@ class Plotter:
         if (self._strMode == FREISTAT_STANDALONE):
             plt.show()
 
+            # Plot window is closed, the data collection mustn't wait for
+            # samples which aren't read anymore
+            dataQueue.detach_Consumer()
+
     def T_Print(self, iInterval : int, dataQueue) -> None:
         """
         Description
@@ -903,7 +906,7 @@ class Plotter:
         `iInterval` : int
             Time at which the data should be updated in ms
 
-        `dataQueue` : Queue
+        `dataQueue` : SharedRingBuffer
             Data queue used as pipe between the different processes
 
         """
@@ -925,13 +928,13 @@ class Plotter:
 
         Parameters
         ----------
-        `dataQueue` : Queue
+        `dataQueue` : SharedRingBuffer
             Data queue used as pipe between the different processes
             
         """
-        while (dataQueue.empty() == False):
-            listTemp : list = dataQueue.get()
-            self._insertDataInOutput(listTemp)
+        # Read all samples available in the data queue
+        for listData in dataQueue.get_Records():
+            self._insertDataInOutput(listData)
 
     def _insertDataInOutput(self, listData):
         """
@@ -15,13 +15,17 @@ __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 # Import dependencies
 import logging
 import platform
+import select
 import serial
 import serial.tools.list_ports
 import socket
+import time
+from typing import Union
 
 # Import internal dependencies
 from ..Data_storage.constants import *
 from ..Data_storage.data_software_storage import DataSoftwareStorage
+from .telegram_stream_parser import TelegramStreamParser
 
 class Communication:
     """
@@ -71,6 +75,7 @@ class Communication:
         self._iSerialBaud : int = FREISTAT_SERIAL_BAUDRATE
         
         self._fSerialTimeout : float = FREISTAT_SERIAL_TIMEOUT
+        self._fReadTimeout : float = FREISTAT_READ_TIMEOUT
         
         self._strClientIP : str = wlanSetting[2]
         self._strServerIP : str = wlanSetting[0]
@@ -80,6 +85,12 @@ class Communication:
         self._dataSoftwareStorage = dataSoftwareStorage
         self._dataSoftwareStorage.setCommunication(self)
 
+        # Create stream parser splitting the received byte stream into parsed
+        # telegrams
+        self._telegramStreamParser = TelegramStreamParser(
+            self._dataSoftwareStorage, FREISTAT_MAX_TELEGRAM_LENGTH, 
+            self._logger)
+
         # Check operation mode
         if (self._iOperationMode == FREISTAT_SERIAL):
             # Check for available ports
@@ -100,10 +111,11 @@ class Communication:
 
         """
         # Create a serial object with the interal parameters and try to open a
-        # connection
+        # connection. Single reads only block for a short time, so that waiting
+        # for data doesn't prevent reacting to other events.
         try:
             self._serialConnection = serial.Serial(self._strSerialPort, 
-                self._iSerialBaud, timeout=self._fSerialTimeout)
+                self._iSerialBaud, timeout=self._fReadTimeout)
         except:
             self._logger.error("Port already in use, connection could not be established")
             return
@@ -201,6 +213,31 @@ class Communication:
         elif (self._iOperationMode == FREISTAT_WLAN):
             return self._read_WiFi(strFileFormat)
 
+    def read_Telegram(self) -> Union[int, object]:
+        """
+        Description
+        -----------
+        Read the next telegram, which is already framed and parsed while
+        receiving the bytes.
+
+        Return
+        ------
+        `iTelegramType` : int
+            Type of the telegram (TELEGRAM_TYPE_X)
+
+        `telegramContent` : object
+            Converted content of the telegram (see `JSON_Parser.parse_Telegram`)
+
+        """
+        # Check operation mode
+        if (self._iOperationMode == FREISTAT_SERIAL):
+            self._receive_Serial()
+
+        elif (self._iOperationMode == FREISTAT_WLAN):
+            self._receive_WiFi()
+
+        return self._telegramStreamParser.pop_ParsedTelegram()
+
     def _read_WiFi(self, strFileFormat: str = "JSON") -> bytes:
         """
         Description
@@ -217,14 +254,33 @@ class Communication:
         `bSerialBuffer` : bytes
             Byte stream containing one JSON telegram
 
+        """
+        # For JSON Format
+        if (strFileFormat == "JSON"):
+            self._receive_WiFi()
+
+        return self._telegramStreamParser.pop_Telegram()
+
+    def _receive_WiFi(self) -> None:
+        """
+        Description
+        -----------
+        Receive datagrams and hand them over to the stream parser until at 
+        least one telegram is completed or the serial timeout expired.
+
         """
         # Intialize variables
         bufferSize  = 1024
 
-        # For JSON Format
-        if (strFileFormat == "JSON"):
+        while (self._telegramStreamParser.get_TelegramCount() == 0):
+            # Check for timeout
+            listReadable = select.select([self._UdpServerSocket], [], [],
+                                         self._fSerialTimeout)[0]
+            if (len(listReadable) == 0):
+                break
+
             bytesAddressPair = self._UdpServerSocket.recvfrom(bufferSize)
-        return bytesAddressPair[0]
+            self._telegramStreamParser.feed(bytesAddressPair[0])
 
     def _read_Serial(self, strFileFormat: str = "JSON") -> bytes:
         """
@@ -245,36 +301,73 @@ class Communication:
         """
         # For JSON Format
         if (strFileFormat == "JSON"):
-            # Initialize variables
-            iTimeoutCounter = 0
-            iObjectCounter = 0
-            bSerialBuffer = b""
-
-            # Loop until iObjectCounter = 0
-            while (True):
-                bInputByte = self._serialConnection.read(1)
-                # Check for brackets
-                if (bInputByte == b"}"):    
-                    iObjectCounter -= 1
-                elif (bInputByte == b"{"):
-                    iObjectCounter += 1
-
-                # Append byte to serial buffer
-                bSerialBuffer += bInputByte
-                
-                # Check if while loop can be left
-                if (iObjectCounter == 0):
-                    break
-
-                #Increase timout counter
-                iTimeoutCounter += 1
-
-                # Break out if faulty message is read. 
-                # Try to read at max 256 bytes.
-                if (iTimeoutCounter >= 256):
-                    break
-        
-        return bSerialBuffer
+            self._receive_Serial()
+
+        return self._telegramStreamParser.pop_Telegram()
+
+    def _receive_Serial(self) -> None:
+        """
+        Description
+        -----------
+        Read chunks from the serial port until at least one telegram is
+        completed or the serial timeout expired.
+
+        """
+        # Calculate point in time at which reading is aborted
+        fDeadline = time.monotonic() + self._fSerialTimeout
+
+        # Read chunks until at least one telegram is completed
+        while (self._telegramStreamParser.get_TelegramCount() == 0):
+            self._read_SerialChunk()
+
+            # Check for timeout, also if bytes without a telegram are received
+            if (time.monotonic() >= fDeadline):
+                break
+
+    def _read_SerialChunk(self) -> bool:
+        """
+        Description
+        -----------
+        Read all bytes waiting in the input buffer of the serial port or block
+        for the next byte at most for the read timeout and hand them over to the
+        stream parser.
+
+        Return
+        ------
+        `bReceived` : bool
+            Flag indicating if any bytes were received
+
+        """
+        bChunk = self._serialConnection.read(
+            self._serialConnection.in_waiting or 1)
+
+        # Timeout occured
+        if (len(bChunk) == 0):
+            return False
+
+        # Hand received bytes to the stream parser
+        self._telegramStreamParser.feed(bChunk)
+        return True
+
+    def reset_Input(self) -> None:
+        """
+        Description
+        -----------
+        Discard all bytes waiting in the input buffer of the serial port or
+        the UDP socket and reset the stream parser, so that partial or late
+        telegrams of a previous experiment don't reach the next one.
+
+        """
+        # Check operation mode
+        if (self._iOperationMode == FREISTAT_SERIAL):
+            self._serialConnection.reset_input_buffer()
+
+        elif (self._iOperationMode == FREISTAT_WLAN):
+            # Receive datagrams without blocking until the socket is empty
+            while (len(select.select([self._UdpServerSocket], [], [], 0)[0]) > 0):
+                self._UdpServerSocket.recvfrom(1024)
+
+        self._telegramStreamParser.reset()
 
     def write_Data(self, strJSONtelegram: str) -> None:
         """
@@ -297,11 +390,75 @@ class Communication:
                 (self._strClientIP, self._iClientPort))
         
     def data_available(self) -> int:
+        """
+        Description
+        -----------
+        Get amount of data which is ready to be read. Telegrams already framed
+        from previously read chunks are taken into account.
+
+        Return
+        ------
+        `iAvailable` : int
+            Amount of finished telegrams and bytes waiting in the input buffer
+
+        """
         if (self._iOperationMode == FREISTAT_SERIAL):
-            return self._serialConnection.in_waiting
+            return self._telegramStreamParser.get_TelegramCount() + \
+                self._serialConnection.in_waiting
+
+        elif (self._iOperationMode == FREISTAT_WLAN):
+            # Check without blocking if a datagram is ready to be read
+            listReadable = select.select([self._UdpServerSocket], [], [], 0)[0]
+            return self._telegramStreamParser.get_TelegramCount() + len(listReadable)
+
+    def wait_for_data(self, fTimeout : float) -> bool:
+        """
+        Description
+        -----------
+        Block until a complete telegram can be read or the timeout expired.
+        The calling process is suspended by the operating system while waiting
+        instead of polling the input buffer.
+
+        Parameters
+        ----------
+        `fTimeout` : float
+            Max. time in seconds which is waited for a telegram
+
+        Return
+        ------
+        `bDataAvailable` : bool
+            Flag indicating if a telegram is ready to be read
+
+        """
+        # Check operation mode
+        if (self._iOperationMode == FREISTAT_SERIAL):
+            # Calculate point in time at which waiting is aborted
+            fDeadline = time.monotonic() + fTimeout
+
+            # Read chunks until one telegram is completed or time is up
+            while (self._telegramStreamParser.get_TelegramCount() == 0):
+                if (time.monotonic() >= fDeadline):
+                    return False
+                self._read_SerialChunk()
+            return True
 
         elif (self._iOperationMode == FREISTAT_WLAN):
-            self._UdpServerSocket.inWaiting()   
+            # Calculate point in time at which waiting is aborted
+            fDeadline = time.monotonic() + fTimeout
+
+            # Receive datagrams until one telegram is completed or time is up,
+            # datagrams containing only a part of a telegram are buffered
+            while (self._telegramStreamParser.get_TelegramCount() == 0):
+                fRemaining : float = fDeadline - time.monotonic()
+                if (fRemaining <= 0.0 or len(select.select(
+                    [self._UdpServerSocket], [], [], fRemaining)[0]) == 0):
+                    return False
+
+                self._telegramStreamParser.feed(
+                    self._UdpServerSocket.recvfrom(1024)[0])
+            return True
+
+        return False
 
 
     # Getter methods
@@ -0,0 +1,138 @@
+"""
+Module implementing different unittests for the serial_communication module.
+The WiFi connection is tested over the local network interface.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import socket
+import threading
+import time
+import unittest
+
+# Import internal dependencies
+from ..Data_storage.constants import *
+from ..Data_storage.data_software_storage import DataSoftwareStorage
+from ..JSON_parser.json_parser import JSON_Parser
+from .serial_communication import Communication
+
+class Communication_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the class Communication.
+
+    """
+    def setUp(self) -> None:
+        # Socket of the simulated FreiStat
+        self._udpSocket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._udpSocket.bind(("127.0.0.1", 0))
+
+        # Use a free local port for the server
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as udpSocket:
+            udpSocket.bind(("127.0.0.1", 0))
+            self._iServerPort : int = udpSocket.getsockname()[1]
+
+        _DataSoftwareStorage = DataSoftwareStorage()
+        JSON_Parser(_DataSoftwareStorage)
+        self._communication = Communication(_DataSoftwareStorage,
+            FREISTAT_WLAN, ["127.0.0.1", self._iServerPort, "127.0.0.1",
+                            self._udpSocket.getsockname()[1]])
+
+    def tearDown(self) -> None:
+        self._communication._closeConnection()
+        self._udpSocket.close()
+
+    def _send(self, bDatagram : bytes) -> None:
+        self._udpSocket.sendto(bDatagram, ("127.0.0.1", self._iServerPort))
+
+    def test_reset_Input(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that partial and waiting telegrams are discarded,
+        so that the next telegram is read correctly.
+
+        """
+        # First telegram followed by the start of a second one
+        self._send(b'{"A":1}{"R":1,"M":{"D"')
+        self._send(b'{"A":2}')
+
+        self.assertEqual(self._communication.read_Telegram(),
+                         (TELEGRAM_TYPE_ACKNOWLEDGE, 1))
+
+        # Discard partial telegram and waiting datagram
+        self._communication.reset_Input()
+        self.assertEqual(self._communication.data_available(), 0)
+
+        self._send(b'{"A":3}')
+        self.assertEqual(self._communication.read_Telegram(),
+                         (TELEGRAM_TYPE_ACKNOWLEDGE, 3))
+
+    def test_wait_for_data(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that waiting only ends with a complete telegram
+        or after the timeout, also if only a part of a telegram is received.
+
+        """
+        # Timeout without data
+        fStart : float = time.monotonic()
+        self.assertFalse(self._communication.wait_for_data(0.1))
+        self.assertGreaterEqual(time.monotonic() - fStart, 0.1)
+
+        # Timeout with a partial telegram
+        self._send(b'{"R":1,"M":{"D":1,')
+        fStart = time.monotonic()
+        self.assertFalse(self._communication.wait_for_data(0.1))
+        self.assertGreaterEqual(time.monotonic() - fStart, 0.1)
+
+        # Rest of the telegram is received while waiting
+        timer = threading.Timer(0.05, self._send, 
+                                [b'"V":1.0,"C":-0.5,"T":10}}{"A":2}'])
+        timer.start()
+        self.assertTrue(self._communication.wait_for_data(1.0))
+        timer.join()
+
+        self.assertEqual(self._communication.read_Telegram()[0],
+                         TELEGRAM_TYPE_DATA)
+
+        # Telegram framed from a previous datagram is available immediately
+        self.assertTrue(self._communication.wait_for_data(0.1))
+        self.assertEqual(self._communication.read_Telegram(),
+                         (TELEGRAM_TYPE_ACKNOWLEDGE, 2))
+
+    def test_receive_Serial(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that reading from the serial port ends after the
+        serial timeout, also if bytes without a telegram keep arriving.
+
+        """
+        # Serial port only receiving noise
+        class NoiseSerial:
+            in_waiting = 1
+
+            def read(self, iBytes : int) -> bytes:
+                return b"x" * iBytes
+
+        self._communication._serialConnection = NoiseSerial()
+        self._communication._fSerialTimeout = 0.1
+
+        fStart : float = time.monotonic()
+        self._communication._receive_Serial()
+        self.assertLess(time.monotonic() - fStart, 1.0)
+        self.assertEqual(self._communication.data_available(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
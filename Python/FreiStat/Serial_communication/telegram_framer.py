@@ -0,0 +1,330 @@
+"""
+Module implementing a buffer based framing engine, which splits the byte stream
+received from FreiStat into complete JSON telegrams and binary data telegrams.
+
+The received bytes are collected in a reusable `bytearray`. Only the structural
+characters (`{`, `}`, `"`, `\\`) are visited while scanning, so braces inside of
+JSON strings are ignored. Incomplete telegrams stay in the buffer until the
+missing bytes arrive with the next call of `feed`. Binary data telegrams are
+identified by their magic header and split off by the length in their header.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+from collections import deque
+import logging
+import re
+
+# Import internal dependencies
+from ..Data_storage.constants import *
+from ..JSON_parser.binary_parser import get_BinaryTelegramLength
+
+# Pattern matching all characters which change the state of the framer
+_reStructuralCharacter = re.compile(rb'[{}"\\]')
+
+# Pattern matching the start of a JSON telegram or a binary telegram
+_reTelegramStart = re.compile(rb'\{|' + re.escape(BINARY_TELEGRAM_MAGIC))
+
+class TelegramFramer:
+    """
+    Description
+    -----------
+    Class which frames the incoming byte stream into complete JSON telegrams
+    and stores them in a queue until they are requested.
+
+    """
+
+    def __init__(self,
+                 iMaxTelegramLength : int = FREISTAT_MAX_TELEGRAM_LENGTH,
+                 logger = logging.Logger("TelegramFramer")) -> None:
+        """
+        Description
+        -----------
+        Constructor of class TelegramFramer.
+
+        Parameters
+        ----------
+        `iMaxTelegramLength` : int
+            Maximum length of one telegram in bytes. Longer telegrams are
+            treated as faulty and discarded.
+
+        `logger` : logging.Logger
+            Logger which should be used in the library
+
+        """
+        # Save variables
+        self._logger = logger
+        self._iMaxTelegramLength : int = iMaxTelegramLength
+
+        # Initialize class variables
+        self._bBuffer : bytearray = bytearray()
+        self._dequeTelegrams : deque = deque()
+
+        self._iScanPosition : int = 0
+        self._iObjectCounter : int = 0
+        self._iDiscardedBytes : int = 0
+
+        self._bInString : bool = False
+        self._bDiscard : bool = False
+
+    def feed(self, bData : bytes) -> int:
+        """
+        Description
+        -----------
+        Append received bytes to the internal buffer and move every completed
+        telegram into the telegram queue.
+
+        Parameters
+        ----------
+        `bData` : bytes
+            Bytes read from the serial connection
+
+        Return
+        ------
+        `iTelegrams` : int
+            Amount of finished telegrams waiting in the queue
+
+        """
+        # Append data to the buffer
+        self._bBuffer += bData
+
+        # Scan new data for complete telegrams
+        self._scan_Buffer()
+
+        return len(self._dequeTelegrams)
+
+    def _scan_Buffer(self) -> None:
+        """
+        Description
+        -----------
+        Scan the buffer from the last scanned position and split off every
+        completed telegram. Consumed bytes are only tracked by their offset
+        and removed from the buffer at once after the scan.
+
+        """
+        # Save references as local variables to speed up the loop
+        bBuffer = self._bBuffer
+        iPosition = self._iScanPosition
+
+        # Initialize variables
+        iStart : int = 0
+
+        while (True):
+            # Search for the start of a telegram
+            if (self._iObjectCounter == 0):
+                match = _reTelegramStart.search(bBuffer, iPosition)
+
+                # No telegram start found, drop the bytes in front of it
+                if (match is None):
+                    # Keep last byte, if it could be the start of a magic header
+                    iKeep = 1 if bBuffer.endswith(BINARY_TELEGRAM_MAGIC[:1]) \
+                        else 0
+                    iPosition = max(iStart, len(bBuffer) - iKeep)
+                    if (iPosition > iStart):
+                        self._logger.warning("Discarded " + 
+                                             str(iPosition - iStart) +
+                                             " bytes outside of a telegram")
+                    iStart = iPosition
+                    break
+                elif (match.start() > iStart):
+                    self._logger.warning("Discarded " + 
+                                         str(match.start() - iStart) +
+                                         " bytes outside of a telegram")
+                iStart = match.start()
+
+                # Binary telegram, split it off by the length in the header
+                if (bBuffer[iStart] != 0x7B):
+                    iLength = get_BinaryTelegramLength(bBuffer, iStart)
+
+                    if (iLength > self._iMaxTelegramLength):
+                        # Faulty header, resynchronize behind its first byte
+                        self._discard_Telegram()
+                        iStart += 1
+                        iPosition = iStart
+                        continue
+                    elif (iLength < 0 or len(bBuffer) - iStart < iLength):
+                        # Wait for the rest of the telegram
+                        iPosition = iStart
+                        break
+
+                    self._complete_Telegram(
+                        bytes(bBuffer[iStart:iStart + iLength]))
+                    iStart += iLength
+                    iPosition = iStart
+                    continue
+
+                # Enter telegram
+                self._iObjectCounter = 1
+                self._bInString = False
+                iPosition = iStart + 1
+                continue
+
+            # Jump to the next structural character
+            match = _reStructuralCharacter.search(bBuffer, iPosition)
+
+            # Check if telegram is still incomplete
+            if (match is None):
+                iPosition = len(bBuffer)
+
+                # Drop the scanned bytes of a discarded telegram directly
+                if (self._bDiscard == True):
+                    self._iDiscardedBytes += iPosition - iStart
+                    iStart = iPosition
+
+                    # Closing bracket got lost, resynchronize on the next
+                    # telegram start
+                    if (self._iDiscardedBytes > self._iMaxTelegramLength):
+                        self._iObjectCounter = 0
+                        self._bInString = False
+                        self._bDiscard = False
+
+                # Drop faulty telegram if it exceeds the maximum length
+                elif (iPosition - iStart > self._iMaxTelegramLength):
+                    self._discard_Telegram()
+                    self._bDiscard = True
+                    self._iDiscardedBytes = iPosition - iStart
+                    iStart = iPosition
+                break
+
+            iPosition = match.end()
+            iCharacter = bBuffer[match.start()]
+
+            # Handle characters inside of a JSON string
+            if (self._bInString == True):
+                # Escape character, skip next byte
+                if (iCharacter == 0x5C):
+                    # Wait for more data if escaped byte isn't received yet
+                    if (iPosition >= len(bBuffer)):
+                        iPosition = match.start()
+                        break
+                    iPosition += 1
+
+                # End of JSON string
+                elif (iCharacter == 0x22):
+                    self._bInString = False
+
+            # Start of JSON string
+            elif (iCharacter == 0x22):
+                self._bInString = True
+
+            # Open bracket
+            elif (iCharacter == 0x7B):
+                self._iObjectCounter += 1
+
+            # Closing bracket
+            elif (iCharacter == 0x7D):
+                self._iObjectCounter -= 1
+
+                # Check if telegram is completed
+                if (self._iObjectCounter == 0):
+                    if (self._bDiscard == True):
+                        # End of the discarded telegram
+                        self._bDiscard = False
+                    elif (iPosition - iStart <= self._iMaxTelegramLength):
+                        self._complete_Telegram(
+                            bytes(bBuffer[iStart:iPosition]))
+                    else:
+                        self._discard_Telegram()
+                    iStart = iPosition
+
+        # Remove consumed bytes and save position for the next call
+        del bBuffer[:iStart]
+        self._iScanPosition = iPosition - iStart
+
+    def _complete_Telegram(self, bTelegram : bytes) -> None:
+        """
+        Description
+        -----------
+        Store a completed telegram in the telegram queue.
+
+        Parameters
+        ----------
+        `bTelegram` : bytes
+            Byte stream containing one complete telegram
+
+        """
+        self._dequeTelegrams.append(bTelegram)
+
+    def _discard_Telegram(self) -> None:
+        """
+        Description
+        -----------
+        Report a faulty telegram, which is dropped. The framer skips the whole
+        telegram up to its closing bracket, or resynchronizes on the next
+        telegram start if the closing bracket doesn't follow within the
+        maximum telegram length.
+
+        """
+        self._logger.warning("Telegram exceeds " +
+                             str(self._iMaxTelegramLength) +
+                             " bytes and is discarded")
+
+    def pop_Telegram(self) -> bytes:
+        """
+        Description
+        -----------
+        Return the oldest finished telegram.
+
+        Return
+        ------
+        `bTelegram` : bytes
+            Byte stream containing one JSON telegram or an empty byte string if
+            no telegram is finished
+
+        """
+        if (len(self._dequeTelegrams) == 0):
+            return b""
+        return self._dequeTelegrams.popleft()
+
+    def reset(self) -> None:
+        """
+        Description
+        -----------
+        Drop all buffered bytes and finished telegrams.
+
+        """
+        del self._bBuffer[:]
+        self._dequeTelegrams.clear()
+
+        self._iScanPosition = 0
+        self._iObjectCounter = 0
+        self._iDiscardedBytes = 0
+        self._bInString = False
+        self._bDiscard = False
+
+    # Getter methods
+    def get_TelegramCount(self) -> int:
+        """
+        Description
+        -----------
+        Get amount of finished telegrams waiting in the queue.
+
+        Return
+        ------
+        `iTelegrams` : int
+            Amount of finished telegrams
+
+        """
+        return len(self._dequeTelegrams)
+
+    def get_BufferedBytes(self) -> int:
+        """
+        Description
+        -----------
+        Get amount of bytes belonging to a not yet finished telegram.
+
+        Return
+        ------
+        `iBytes` : int
+            Amount of bytes stored in the buffer
+
+        """
+        return len(self._bBuffer)
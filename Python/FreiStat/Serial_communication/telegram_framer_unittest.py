@@ -0,0 +1,150 @@
+"""
+Module implementing different unittests for the telegram_framer module.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import struct
+import unittest
+
+# Import internal dependencies
+from ..Data_storage.constants import *
+from ..JSON_parser.binary_parser import decode_BinaryTelegram
+from .telegram_framer import TelegramFramer
+
+class TelegramFramer_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the class TelegramFramer.
+
+    """
+    def test_feed_Chunks(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing the framing of telegrams split over several chunks.
+
+        """
+        # Test stream containing two data telegrams and an acknowledge telegram
+        bTest : bytes = b'{"R":1,"M":{"D":1,"V":-200.5,"C":3.25,"T":120}}' + \
+                        b'{"R":1,"M":{"D":2,"V":-199.5,"C":3.5,"T":123}}' + \
+                        b'{"A":3}'
+
+        # Create a test instance of the TelegramFramer
+        _TelegramFramer = TelegramFramer()
+
+        # Feed test stream in chunks of 7 bytes
+        for iIndex in range(0, len(bTest), 7):
+            _TelegramFramer.feed(bTest[iIndex:iIndex + 7])
+
+        # Check results
+        self.assertEqual(_TelegramFramer.get_TelegramCount(), 3)
+        self.assertEqual(_TelegramFramer.pop_Telegram(),
+            b'{"R":1,"M":{"D":1,"V":-200.5,"C":3.25,"T":120}}')
+        self.assertEqual(_TelegramFramer.pop_Telegram(),
+            b'{"R":1,"M":{"D":2,"V":-199.5,"C":3.5,"T":123}}')
+        self.assertEqual(_TelegramFramer.pop_Telegram(), b'{"A":3}')
+        self.assertEqual(_TelegramFramer.pop_Telegram(), b"")
+        self.assertEqual(_TelegramFramer.get_BufferedBytes(), 0)
+
+    def test_feed_Strings(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that braces and escaped quotes inside of JSON
+        strings are ignored and leading garbage is discarded.
+
+        """
+        # Test stream with braces inside of a string
+        bTest : bytes = b'xx{"C":3,"ExC":"St{o\\"}p"}{"A"'
+
+        # Create a test instance of the TelegramFramer
+        _TelegramFramer = TelegramFramer()
+
+        # Check results
+        self.assertEqual(_TelegramFramer.feed(bTest), 1)
+        self.assertEqual(_TelegramFramer.pop_Telegram(),
+            b'{"C":3,"ExC":"St{o\\"}p"}')
+        self.assertEqual(_TelegramFramer.get_BufferedBytes(), 4)
+
+        # Complete the partial telegram
+        self.assertEqual(_TelegramFramer.feed(b':2}'), 1)
+        self.assertEqual(_TelegramFramer.pop_Telegram(), b'{"A":2}')
+
+    def test_feed_Overlength(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing the resynchronization after a faulty telegram, which
+        exceeds the maximum telegram length, with and without its closing
+        bracket.
+
+        """
+        # Create a test instance of the TelegramFramer
+        _TelegramFramer = TelegramFramer(16)
+
+        # Feed faulty telegram with a nested object followed by a valid one
+        _TelegramFramer.feed(b'{"R":1,"M":{"D":1,"V":"' + b'0' * 32)
+        _TelegramFramer.feed(b'{"A":1}"}}{"A":2}')
+
+        # Check results, nothing of the faulty telegram is framed
+        self.assertEqual(_TelegramFramer.get_TelegramCount(), 1)
+        self.assertEqual(_TelegramFramer.pop_Telegram(), b'{"A":2}')
+        self.assertEqual(_TelegramFramer.get_BufferedBytes(), 0)
+
+        # Feed faulty telegram whose closing bracket got lost
+        _TelegramFramer.feed(b'{"R":1,"M":{"D":1,"V":' + b'0' * 32)
+        _TelegramFramer.feed(b'0' * 32)
+        _TelegramFramer.feed(b'{"A":3}')
+
+        # Check results
+        self.assertEqual(_TelegramFramer.get_TelegramCount(), 1)
+        self.assertEqual(_TelegramFramer.pop_Telegram(), b'{"A":3}')
+
+    def test_feed_Binary(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing the framing and decoding of binary data telegrams
+        mixed with JSON telegrams.
+
+        """
+        # Binary telegram containing two records
+        bRecords : bytes = struct.pack("<iifff", 1, 1, -200.5, 3.25, 120.0) + \
+                           struct.pack("<iifff", 1, 2, -199.5, 3.5, 123.0)
+        bBinary : bytes = BINARY_TELEGRAM_MAGIC + \
+                          struct.pack("<H", len(bRecords)) + bRecords
+
+        # Test stream
+        bTest : bytes = b'{"A":3}' + bBinary + b'{"C":3,"ExC":"Stop"}'
+
+        # Create a test instance of the TelegramFramer
+        _TelegramFramer = TelegramFramer()
+
+        # Feed test stream byte per byte
+        for iIndex in range(len(bTest)):
+            _TelegramFramer.feed(bTest[iIndex:iIndex + 1])
+
+        # Check results
+        self.assertEqual(_TelegramFramer.get_TelegramCount(), 3)
+        self.assertEqual(_TelegramFramer.pop_Telegram(), b'{"A":3}')
+        self.assertEqual(_TelegramFramer.pop_Telegram(), bBinary)
+        self.assertEqual(_TelegramFramer.pop_Telegram(),
+                         b'{"C":3,"ExC":"Stop"}')
+
+        # Decode binary telegram
+        np_arrRecords = decode_BinaryTelegram(bBinary)
+        self.assertEqual(np_arrRecords.tolist(), 
+            [(1, 1, -200.5, 3.25, 120.0), (1, 2, -199.5, 3.5, 123.0)])
+
+if __name__ == '__main__':
+    unittest.main()
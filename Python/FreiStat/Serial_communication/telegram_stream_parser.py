@@ -0,0 +1,178 @@
+"""
+Module implementing a streaming parser, which frames the byte stream received
+from FreiStat and parses every telegram directly from bytes as soon as it is
+completed.
+
+The parser keeps its state between calls of `feed`, so telegrams can be split
+over several serial reads or UDP datagrams. Completed telegrams are stored
+together with their type and converted content and can either be requested
+one by one or iterated while feeding:
+
+for iTelegramType, telegramContent in streamParser.parse_Stream(bChunk):
+    ...
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import logging
+from typing import Iterator, Union
+
+# Import internal dependencies
+from ..Data_storage.constants import *
+from ..Data_storage.data_software_storage import DataSoftwareStorage
+from .telegram_framer import TelegramFramer
+
+class TelegramStreamParser(TelegramFramer):
+    """
+    Description
+    -----------
+    Class which frames the incoming byte stream and parses every completed
+    telegram with the JSON parser registered in the data software storage.
+
+    """
+
+    def __init__(self,
+                 dataSoftwareStorage : DataSoftwareStorage,
+                 iMaxTelegramLength : int = FREISTAT_MAX_TELEGRAM_LENGTH,
+                 logger = logging.Logger("TelegramStreamParser")) -> None:
+        """
+        Description
+        -----------
+        Constructor of class TelegramStreamParser.
+
+        Parameters
+        ----------
+        `dataSoftwareStorage` : DataSoftwareStorage
+            Reference to the data software storage object, which provides the
+            JSON parser
+
+        `iMaxTelegramLength` : int
+            Maximum length of one telegram in bytes. Longer telegrams are
+            treated as faulty and discarded.
+
+        `logger` : logging.Logger
+            Logger which should be used in the library
+
+        """
+        super().__init__(iMaxTelegramLength, logger)
+
+        # Save reference to data software storage object
+        self._dataSoftwareStorage = dataSoftwareStorage
+
+    def _complete_Telegram(self, bTelegram : bytes) -> None:
+        """
+        Description
+        -----------
+        Parse a completed telegram and store it together with its type and
+        converted content in the telegram queue.
+
+        Parameters
+        ----------
+        `bTelegram` : bytes
+            Byte stream containing one complete telegram
+
+        """
+        # Parse telegram directly from bytes
+        try:
+            iTelegramType, telegramContent = self._dataSoftwareStorage. \
+                getJSON_Parser().parse_Telegram(bTelegram)
+        except (ValueError, IndexError, KeyError, UnicodeDecodeError) as error:
+            self._logger.warning("Telegram could not be parsed: " + str(error))
+            iTelegramType, telegramContent = TELEGRAM_TYPE_UNKNOWN, None
+            self._count_ParseError()
+
+        self._dequeTelegrams.append((bTelegram, iTelegramType, telegramContent))
+
+    def _discard_Telegram(self) -> None:
+        """
+        Description
+        -----------
+        Drop the current faulty telegram and count it as parse error.
+
+        """
+        self._count_ParseError()
+        super()._discard_Telegram()
+
+    def _count_ParseError(self) -> None:
+        """
+        Description
+        -----------
+        Count a faulty telegram in the status block, if the progress of the
+        experiment is published.
+
+        """
+        # Get reference to the status block
+        statusBlock = self._dataSoftwareStorage.get_StatusBlock()
+
+        if (statusBlock is not None):
+            statusBlock.add_ParseError()
+
+    def parse_Stream(self, bData : bytes) -> Iterator[Union[int, object]]:
+        """
+        Description
+        -----------
+        Feed received bytes and yield every telegram completed by them.
+
+        Parameters
+        ----------
+        `bData` : bytes
+            Bytes read from the serial connection or the UDP socket
+
+        Return
+        ------
+        `iTelegramType` : int
+            Type of the telegram (TELEGRAM_TYPE_X)
+
+        `telegramContent` : object
+            Converted content of the telegram (see `JSON_Parser.parse_Telegram`)
+
+        """
+        self.feed(bData)
+
+        while (len(self._dequeTelegrams) > 0):
+            yield self.pop_ParsedTelegram()
+
+    def pop_Telegram(self) -> bytes:
+        """
+        Description
+        -----------
+        Return the oldest finished telegram as raw byte stream.
+
+        Return
+        ------
+        `bTelegram` : bytes
+            Byte stream containing one telegram or an empty byte string if no
+            telegram is finished
+
+        """
+        if (len(self._dequeTelegrams) == 0):
+            return b""
+        return self._dequeTelegrams.popleft()[0]
+
+    def pop_ParsedTelegram(self) -> Union[int, object]:
+        """
+        Description
+        -----------
+        Return type and converted content of the oldest finished telegram.
+
+        Return
+        ------
+        `iTelegramType` : int
+            Type of the telegram (TELEGRAM_TYPE_X) or TELEGRAM_TYPE_UNKNOWN if
+            no telegram is finished
+
+        `telegramContent` : object
+            Converted content of the telegram (see `JSON_Parser.parse_Telegram`)
+
+        """
+        if (len(self._dequeTelegrams) == 0):
+            return TELEGRAM_TYPE_UNKNOWN, None
+        return self._dequeTelegrams.popleft()[1:]
@@ -0,0 +1,64 @@
+"""
+Module implementing different unittests for the telegram_stream_parser module.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import unittest
+
+# Import internal dependencies
+from ..Data_storage.constants import *
+from ..Data_storage.data_software_storage import DataSoftwareStorage
+from ..JSON_parser.json_parser import JSON_Parser
+from .telegram_stream_parser import TelegramStreamParser
+
+class TelegramStreamParser_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the class 
+    TelegramStreamParser.
+
+    """
+    def test_parse_Stream(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that telegrams split over several chunks are yielded
+        parsed as soon as they are completed.
+
+        """
+        # Test stream containing an acknowledge, a data and a command telegram
+        bTest : bytes = b'{"A":3}{"R":2,"M":{"D":7,"V":-0.5,"C":1.25,"T":40}}' + \
+                        b'{"C":3,"ExC":"Stop"}'
+
+        # Create a test instance of the TelegramStreamParser
+        _DataSoftwareStorage = DataSoftwareStorage()
+        JSON_Parser(_DataSoftwareStorage)
+        _TelegramStreamParser = TelegramStreamParser(_DataSoftwareStorage)
+
+        # Feed test stream in chunks of 5 bytes
+        listTelegrams : list = []
+        for iIndex in range(0, len(bTest), 5):
+            listTelegrams.extend(
+                _TelegramStreamParser.parse_Stream(bTest[iIndex:iIndex + 5]))
+
+        # Check results
+        self.assertEqual(len(listTelegrams), 3)
+        self.assertEqual(listTelegrams[0], (TELEGRAM_TYPE_ACKNOWLEDGE, 3))
+        self.assertEqual(listTelegrams[1][0], TELEGRAM_TYPE_DATA)
+        self.assertEqual(listTelegrams[1][1][0].fTimeStamp, 40.0)
+        self.assertEqual(listTelegrams[2][0], TELEGRAM_TYPE_COMMAND)
+        self.assertEqual(_TelegramStreamParser.pop_ParsedTelegram(), 
+                         (TELEGRAM_TYPE_UNKNOWN, None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+Module implementing the producer side of the data queue, which collects the
+samples of the execute behaviors and publishes them as one block.
+
+A block is published as soon as FREISTAT_PRODUCER_SAMPLES samples are
+collected or the oldest collected sample is older than
+FREISTAT_PRODUCER_DELAY. The experiment type of a sequence is only published,
+if it changes (see `SharedRingBuffer`).
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import time
+
+import numpy as np
+
+# Import internal dependencies
+from ..Data_storage.constants import *
+from .shared_ring_buffer import SharedRingBuffer
+
+class DataQueueProducer:
+    """
+    Description
+    -----------
+    Class collecting samples and publishing them block wise into the data
+    queue.
+
+    """
+
+    def __init__(self, dataQueue : SharedRingBuffer,
+                 iMaxSamples : int = FREISTAT_PRODUCER_SAMPLES,
+                 fMaxDelay : float = FREISTAT_PRODUCER_DELAY) -> None:
+        """
+        Description
+        -----------
+        Constructor of class DataQueueProducer
+
+        Parameters
+        ----------
+        `dataQueue` : SharedRingBuffer
+            Data queue which is used as a pipe between processes
+
+        `iMaxSamples` : int
+            Max. amount of samples collected before they are published
+
+        `fMaxDelay` : float
+            Max. time in s samples are collected before they are published
+
+        """
+        # Initalize class variable
+        self._dataQueue : SharedRingBuffer = dataQueue
+        self._iMaxSamples : int = iMaxSamples
+        self._fMaxDelay : float = fMaxDelay
+
+        self._listParts : list = []
+        self._iSamples : int = 0
+        self._fBlockStart : float = 0.0
+        self._strMethod : str = None
+        self._strPublishedMethod : str = None
+
+    def append_Samples(self, listSamples : list, strMethod : str = None
+                       ) -> None:
+        """
+        Description
+        -----------
+        Collect samples and publish the block, if it is full or too old.
+
+        Parameters
+        ----------
+        `listSamples` : list | np.ndarray
+            List of samples or structured array of samples
+
+        `strMethod` : str
+            Experiment type of the samples or None if the samples aren't part
+            of a sequence
+
+        """
+        # Check if samples are available
+        if (len(listSamples) == 0):
+            return
+
+        # Publish samples of the previous experiment type
+        if (strMethod != self._strMethod):
+            self.flush()
+            self._strMethod = strMethod
+
+        # Save time of the oldest sample of the block
+        if (self._iSamples == 0):
+            self._fBlockStart = time.monotonic()
+
+        self._listParts.append(listSamples)
+        self._iSamples += len(listSamples)
+
+        if (self._iSamples >= self._iMaxSamples):
+            self.flush()
+        else:
+            self.poll()
+
+    def poll(self) -> None:
+        """
+        Description
+        -----------
+        Publish the block, if its oldest sample is older than the max. delay.
+        Should be called periodically, while no samples are received.
+
+        """
+        if (self._iSamples > 0 and
+            time.monotonic() - self._fBlockStart >= self._fMaxDelay):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Description
+        -----------
+        Publish all collected samples as one block. Structured arrays are
+        published without converting them into lists.
+
+        """
+        # Check if samples are available
+        if (self._iSamples == 0):
+            return
+
+        # Join the collected parts of the block
+        if (all(isinstance(part, np.ndarray) for part in self._listParts)):
+            listBlock = np.concatenate(self._listParts)
+        else:
+            listBlock : list = []
+            for part in self._listParts:
+                if (isinstance(part, np.ndarray)):
+                    part = part.tolist()
+                listBlock.extend(part)
+
+        # Only publish the experiment type if it changed
+        strMethod : str = None
+        if (self._strMethod != self._strPublishedMethod):
+            strMethod = self._strMethod
+
+        iWritten : int = self._dataQueue.put_Records(listBlock,
+                                                     strMethod= strMethod)
+
+        # Publish the experiment type again if no sample was written
+        if (iWritten > 0):
+            self._strPublishedMethod = self._strMethod
+
+        self._listParts = []
+        self._iSamples = 0
@@ -0,0 +1,116 @@
+"""
+Module implementing different unittests for the producer of the data queue.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import time
+import unittest
+
+import numpy as np
+
+# Import internal dependencies
+from ..Data_storage.constants import *
+from .data_queue_producer import DataQueueProducer
+from .shared_ring_buffer import SharedRingBuffer
+
+class DataQueueProducer_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the producer of the data
+    queue.
+
+    """
+    def setUp(self) -> None:
+        self._dataQueue = SharedRingBuffer(iCapacity= 64)
+
+    def tearDown(self) -> None:
+        self._dataQueue.close()
+
+    def test_append_Samples(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that samples are published as soon as the block is
+        full or too old.
+
+        """
+        dataQueueProducer = DataQueueProducer(self._dataQueue, iMaxSamples= 4,
+                                              fMaxDelay= 0.05)
+
+        dataQueueProducer.append_Samples([[1, 1, 0.5], [1, 2, 0.6]])
+        self.assertTrue(self._dataQueue.empty())
+
+        dataQueueProducer.append_Samples([[1, 3, 0.7], [1, 4, 0.8]])
+        self.assertEqual(self._dataQueue.qsize(), 4)
+
+        dataQueueProducer.append_Samples([[1, 5, 0.9]])
+        dataQueueProducer.poll()
+        self.assertEqual(self._dataQueue.qsize(), 4)
+
+        time.sleep(0.06)
+        dataQueueProducer.poll()
+        self.assertEqual([listData[1] for listData in
+                          self._dataQueue.get_Records()], [1, 2, 3, 4, 5])
+
+    def test_Method(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that the experiment type is only published if it
+        changes and restored for every sample.
+
+        """
+        dataQueueProducer = DataQueueProducer(self._dataQueue, iMaxSamples= 2)
+
+        dataQueueProducer.append_Samples([[1, 1, 0.5], [1, 2, 0.6]], CV)
+        dataQueueProducer.append_Samples([[1, 3, 0.7], [1, 4, 0.8]], CV)
+        dataQueueProducer.append_Samples([[2, 1, 0.1]], CA)
+        dataQueueProducer.flush()
+
+        # One method record for every change of the experiment type
+        self.assertEqual(self._dataQueue.qsize(), 7)
+
+        # Method is kept by the consumer between two reads
+        self.assertEqual(self._dataQueue.get(), [1, 1, 0.5, CV])
+        self.assertEqual(self._dataQueue.get_Records(),
+                         [[1, 2, 0.6, CV], [1, 3, 0.7, CV], [1, 4, 0.8, CV],
+                          [2, 1, 0.1, CA]])
+
+    def test_append_SampleBlock(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that blocks of samples are published without
+        converting them into lists and can be mixed with lists of samples.
+
+        """
+        dataQueueProducer = DataQueueProducer(self._dataQueue, iMaxSamples= 8)
+        np_arrBlock = np.array([(1, 1, 0.5), (1, 2, 0.25)],
+            dtype= [("Cycle", "<i4"), ("Datapoint", "<i4"), ("Voltage", "<f8")])
+
+        dataQueueProducer.append_Samples(np_arrBlock, CV)
+        dataQueueProducer.append_Samples(np_arrBlock, CV)
+        dataQueueProducer.flush()
+        dataQueueProducer.append_Samples([[2, 1, 0.75]], CV)
+        dataQueueProducer.append_Samples(np_arrBlock[:1], CV)
+        dataQueueProducer.flush()
+
+        # Integer fields are restored as integers
+        listRecords : list = self._dataQueue.get_Records()
+        self.assertEqual(listRecords,
+                         [[1, 1, 0.5, CV], [1, 2, 0.25, CV], [1, 1, 0.5, CV],
+                          [1, 2, 0.25, CV], [2, 1, 0.75, CV], [1, 1, 0.5, CV]])
+        self.assertIsInstance(listRecords[0][0], int)
+
+if __name__ == '__main__':
+    unittest.main()
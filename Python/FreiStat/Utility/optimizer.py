@@ -30,7 +30,9 @@ class Optimizer:
     by the user to get the optimal results.
 
     """
-    def __init__(self, logger : logging.Logger, iCommunicationMode : int) -> None:
+    def __init__(self, logger : logging.Logger, iCommunicationMode : int,
+                 iDataFormat : int = DATA_FORMAT_JSON,
+                 iBatchSize : int = 1) -> None:
         """
         Description
         -----------
@@ -45,10 +47,19 @@ class Optimizer:
             Integer flag encoding if Python library communicates via serial (1)
             or WiFi (2)
 
+        `iDataFormat` : int
+            Integer flag encoding if FreiStat sends the data telegrams as JSON
+            (0) or binary (1)
+
+        `iBatchSize` : int
+            Amount of samples FreiStat packs into one data telegram
+
         """
         # Initialize class variables
         self._logger = logger
         self._iCommunicationMode = iCommunicationMode
+        self._iDataFormat = iDataFormat
+        self._iBatchSize = iBatchSize
 
         self._strMethod : str = ""
 
@@ -62,7 +73,12 @@ class Optimizer:
         self._fStepSize : float = 0.0
 
         # Check for mode of operation
-        if (self._iCommunicationMode == FREISTAT_SERIAL):
+        if (self._iCommunicationMode == FREISTAT_SERIAL and
+            self._iDataFormat == DATA_FORMAT_BINARY):
+            self._fSampleTimeCA : float = FREISTAT_CA_ST_SERIAL_BIN
+            self._fSampleTimeCV : float = FREISTAT_CV_ST_SERIAL_BIN
+            self._fSampleTimeDPV : float = FREISTAT_DPV_ST_SERIAL_BIN
+        elif (self._iCommunicationMode == FREISTAT_SERIAL):
             self._fSampleTimeCA : float = FREISTAT_CA_ST_SERIAL
             self._fSampleTimeCV : float = FREISTAT_CV_ST_SERIAL
             self._fSampleTimeDPV : float = FREISTAT_DPV_ST_SERIAL
@@ -71,6 +87,38 @@ class Optimizer:
             self._fSampleTimeCV : float = FREISTAT_CV_ST_WLAN
             self._fSampleTimeDPV : float = FREISTAT_DPV_ST_WLAN
 
+        # Share the telegram overhead between all samples of a batch
+        if (self._iBatchSize > 1):
+            self._fSampleTimeCA = self._scale_SampleTime(self._fSampleTimeCA)
+            self._fSampleTimeCV = self._scale_SampleTime(self._fSampleTimeCV)
+            self._fSampleTimeDPV = self._scale_SampleTime(self._fSampleTimeDPV)
+
+    def _scale_SampleTime(self, fSampleTime : float) -> float:
+        """
+        Description
+        -----------
+        Scale the minimal sampling time for batched data telegrams. Only the
+        part of the sampling time caused by the telegram overhead is divided by
+        the batch size, while the time required by the measurement itself stays.
+
+        Parameters
+        ----------
+        `fSampleTime` : float
+            Minimal sampling time in s for one sample per data telegram
+
+        Return
+        ------
+        `fSampleTime` : float
+            Minimal sampling time in s for the configured batch size
+
+        """
+        # Check if sampling time is only limited by the measurement
+        if (fSampleTime <= FREISTAT_ST_MEASUREMENT):
+            return fSampleTime
+
+        return FREISTAT_ST_MEASUREMENT + \
+            (fSampleTime - FREISTAT_ST_MEASUREMENT) / self._iBatchSize
+
     def start(self, strMethod : str, listExperimentParameters : list) -> int:
         """
         Description
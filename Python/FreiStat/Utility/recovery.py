@@ -2,6 +2,12 @@
 Module implementing a class for recovering data from the exported data storage
 and export the data as csv.
 
+`start_Recovery` recovers all data storage objects of one experiment folder.
+`start_BulkRecovery` scans a whole `Persistent_Data_Objects` tree and recovers
+the data storage objects in a process pool. The modification time and size of
+every recovered file are stored in a manifest in the root of the tree, so
+files whose recovery csv is up to date are skipped in the next run.
+
 """
 
 __author__ = "Mark Jasper"
@@ -13,11 +19,19 @@ __maintainer__ = "Mark Jasper"
 __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 
 # Import dependencies
+import json
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
 
 # Import internal dependencies
 from ..Data_storage.constants import *
 from ..Data_storage.data_software_storage import DataSoftwareStorage
 from ..Data_storage.data_handling import DataHandling
+from ..Data_storage.data_recovery import (find_PersistentDataStorages,
+                                          get_FileState, get_RecoveryPath,
+                                          recover_PersistentDataStorage)
 
 class Recovery_Data:
     """
@@ -47,4 +61,87 @@ class Recovery_Data:
         self._DataHandling = DataHandling(self._DataSoftwareStorage)
 
         # Import external data
-        self._DataHandling.import_DataStorage(Path)
\ No newline at end of file
+        self._DataHandling.import_DataStorage(Path)
+
+    def start_BulkRecovery(self, Path_Tree : str, iProcesses : int = None,
+                           bForce : bool = False) -> list:
+        """
+        Description
+        -----------
+        Method for recovering every data storage object in a folder tree
+        (e.g. `Persistent_Data_Objects`) in a process pool.
+        
+        Parameters
+        ----------
+        `Path_Tree` : string
+            String containing the path to the root folder of the tree
+
+        `iProcesses` : int
+            Amount of worker processes (None: amount of CPUs)
+
+        `bForce` : bool
+            Flag indicating if files with an up to date recovery csv should be
+            recovered again
+
+        Return
+        ------
+        `listRecovered` : list
+            List containing the paths of the written recovery csv files
+
+        """
+        # Initialize variables
+        pathManifest : Path = Path(Path_Tree).resolve() / \
+                              FREISTAT_RECOVERY_MANIFEST
+        dictManifest : dict = {}
+        listPending : list = []
+        listRecovered : list = []
+
+        # Load state of the previous recovery
+        if (pathManifest.is_file()):
+            with open(pathManifest, encoding="utf-8") as jsonFile:
+                dictManifest = json.load(jsonFile)
+
+        # Skip files whose recovery csv is up to date
+        listFiles : list = find_PersistentDataStorages(Path_Tree, True)
+        for strPath in listFiles:
+            strRecoveryPath : str = get_RecoveryPath(strPath)
+            if (bForce == False and strPath in dictManifest and
+                os.path.isfile(strRecoveryPath) and
+                dictManifest[strPath] == [*get_FileState(strPath),
+                                          os.path.getsize(strRecoveryPath)]):
+                continue
+            listPending.append(strPath)
+
+        print("Recovering " + str(len(listPending)) + " of " + 
+              str(len(listFiles)) + " data storage objects")
+
+        # Recover files in a process pool
+        with ProcessPoolExecutor(max_workers= iProcesses) as executor:
+            listFutures : list = [executor.submit(
+                recover_PersistentDataStorage, strPath) 
+                for strPath in listPending]
+
+            for iIndex, future in enumerate(as_completed(listFutures)):
+                try:
+                    strPath, listState, strRecoveryPath, iSamples = \
+                        future.result()
+                except (OSError, ValueError, EOFError, 
+                        pickle.UnpicklingError) as error:
+                    print("[" + str(iIndex + 1) + "/" + str(len(listPending)) +
+                          "] Recovery failed: " + str(error))
+                    continue
+
+                # Save state of the recovered file
+                dictManifest[strPath] = [*listState, 
+                                         os.path.getsize(strRecoveryPath)]
+                listRecovered.append(strRecoveryPath)
+
+                print("[" + str(iIndex + 1) + "/" + str(len(listPending)) +
+                      "] " + strRecoveryPath + " (" + str(iSamples) + 
+                      " samples)")
+
+        # Save state of the recovery
+        with open(pathManifest, "w", encoding="utf-8") as jsonFile:
+            json.dump(dictManifest, jsonFile, indent= 4)
+
+        return listRecovered
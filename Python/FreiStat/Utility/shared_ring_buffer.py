@@ -0,0 +1,903 @@
+"""
+Module implementing a single-producer/single-consumer ring buffer in
+shared memory, which is used as data queue between the process collecting the
+data (`P_DataCollection`) and the plotter.
+
+The shared memory consists of a header and FREISTAT_RING_CAPACITY records of
+FREISTAT_RING_RECORD_SIZE float64 values:
+
+Header  : Write index | Read index | Capacity, overflow and backpressure
+          counters | Consumer flag (every index on its own cache line)
+Record  : [Amount of values, Method code, Integer mask, Value 0, ...]
+
+A record with RING_METHOD_RECORD as amount of values sets the method of all
+following records without method code. Therefore the experiment type of a
+sequence is only written, if it changes.
+
+The write index is only changed by the producer after the records are written,
+the read index only by the consumer after the records are read. The indices
+count all records and are mapped to the ring with a modulo operation.
+
+Numpy stores don't order the memory accesses. On x86 stores are seen in
+program order by other cores, but weakly ordered CPUs (e.g. the ARM of a 
+Raspberry Pi) may show the new write index before the records. Therefore the
+indices are only accessed while holding a lock shared by both processes. 
+Releasing the lock publishes all previous stores of one process and acquiring
+it makes them visible to the other process. The records themselves are copied
+without the lock, so it is only held for a few instructions per block.
+
+The lock is created with the ring buffer and handed to processes started with
+it. Processes receiving the ring buffer in another way (e.g. the acquisition
+worker over its command queue) have to be given the same lock with 
+`set_Lock`.
+
+A consumer doesn't have to poll the ring. On POSIX systems the producer writes
+a byte into a pipe after publishing records for an attached consumer, so the
+consumer can block on the file descriptor of the pipe (`wait_Data`, or 
+`get_WaitHandle` for an event loop). The pipe is handed over like the lock.
+The producer marks in the header that it wakes up the consumer, until then
+(e.g. for the acquisition worker, which doesn't get the pipe) the consumer 
+falls back to polling.
+
+If the ring is full, the producer waits for an attached consumer until the
+records fit (backpressure), so no sample read by the consumer is lost. It
+only stops waiting if the consumer detaches (`detach_Consumer`), which it has
+to do before it stops reading. A ring buffer created with `bDropOnFull` only
+waits up to FREISTAT_RING_TIMEOUT instead. Records which don't fit without an
+attached consumer (e.g. no plotter is running in low performance mode) are 
+dropped, counted as overflow and logged, so the data collection is never 
+blocked.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import logging
+import multiprocessing as mp
+from multiprocessing import connection, context, shared_memory
+import os
+import queue
+import time
+from typing import Iterator
+
+import numpy as np
+
+# Import internal dependencies
+from ..Data_storage.constants import *
+from ..Data_storage.data_storage import get_SampleType
+from ..Data_storage.dictionaries import *
+
+# Electrochemical methods decoded by their code
+_listMethods : list = sorted(dic_methodCodes, key= dic_methodCodes.get)
+
+_logger = logging.getLogger(__name__)
+
+class SharedRingBuffer:
+    """
+    Description
+    -----------
+    Class implementing the ring buffer. The object can be handed to another
+    process, which attaches to the same shared memory.
+
+    """
+
+    def __init__(self, strName : str = None,
+                 iCapacity : int = FREISTAT_RING_CAPACITY,
+                 bDropOnFull : bool = False,
+                 lock = None,
+                 connNotify = None) -> None:
+        """
+        Description
+        -----------
+        Constructor of class SharedRingBuffer. Creates a new ring buffer or
+        attaches to an existing one.
+
+        Parameters
+        ----------
+        `strName` : str
+            Name of the shared memory of an existing ring buffer or None to
+            create a new ring buffer
+
+        `iCapacity` : int
+            Amount of records of a new ring buffer
+
+        `bDropOnFull` : bool
+            Flag indicating if a new ring buffer drops records after waiting
+            FREISTAT_RING_TIMEOUT for an attached consumer instead of waiting
+            until they fit
+
+        `lock` : Lock
+            Lock shared with the other process or None to create a new lock
+            for a new ring buffer
+
+        `connNotify` : Connection
+            Write end of the pipe waking up the consumer or None
+
+        """
+        # Initalize class variable
+        self._bOwner : bool = strName is None
+
+        self._lock = lock
+        if (self._lock is None and self._bOwner):
+            self._lock = mp.Lock()
+
+        # Non-blocking pipe waking up the consumer (POSIX only, the file
+        # descriptors of the pipe are used directly)
+        self._connWait = None
+        self._connNotify = connNotify
+        if (self._bOwner and os.name == "posix"):
+            self._connWait, self._connNotify = mp.Pipe(duplex= False)
+            os.set_blocking(self._connWait.fileno(), False)
+            os.set_blocking(self._connNotify.fileno(), False)
+
+        if (self._bOwner):
+            self._sharedMemory = shared_memory.SharedMemory(create= True,
+                size= 8 * (FREISTAT_RING_HEADER_SIZE +
+                           iCapacity * FREISTAT_RING_RECORD_SIZE))
+        else:
+            self._sharedMemory = shared_memory.SharedMemory(name= strName)
+
+        self._np_arrHeader = np.ndarray((FREISTAT_RING_HEADER_SIZE,),
+            dtype= np.uint64, buffer= self._sharedMemory.buf)
+
+        if (self._bOwner):
+            self._np_arrHeader[:] = 0
+            self._np_arrHeader[RING_CAPACITY] = iCapacity
+            self._np_arrHeader[RING_DROP_ON_FULL] = bDropOnFull
+
+        self._iCapacity : int = int(self._np_arrHeader[RING_CAPACITY])
+        self._iMethod : int = -1
+        self._bDropping : bool = False
+        self._np_arrRecords = np.ndarray(
+            (self._iCapacity, FREISTAT_RING_RECORD_SIZE), dtype= np.float64,
+            buffer= self._sharedMemory.buf, offset= 8 * FREISTAT_RING_HEADER_SIZE)
+
+    def __getstate__(self) -> dict:
+        """
+        Description
+        -----------
+        Only hand the name of the shared memory to another process. The lock
+        and the pipe waking up the consumer can only be handed to a process
+        while it is started.
+
+        """
+        dictState : dict = {"strName" : self._sharedMemory.name}
+        if (context.get_spawning_popen() is not None):
+            dictState["lock"] = self._lock
+            dictState["connNotify"] = self._connNotify
+        return dictState
+
+    def __setstate__(self, dictState : dict) -> None:
+        """
+        Description
+        -----------
+        Attach to the shared memory in another process.
+
+        """
+        self.__init__(dictState["strName"], lock= dictState.get("lock"),
+                      connNotify= dictState.get("connNotify"))
+
+    def set_Lock(self, lock) -> None:
+        """
+        Description
+        -----------
+        Setter method for the lock shared with the other process, which is
+        required if the ring buffer wasn't handed over while starting a 
+        process.
+
+        Parameters
+        ----------
+        `lock` : Lock
+            Lock shared by the producer and the consumer
+
+        """
+        self._lock = lock
+
+    def _load_Index(self, iIndex : int) -> int:
+        """
+        Description
+        -----------
+        Read an index of the header while holding the shared lock, so that
+        all records written or read before the index was stored are visible.
+
+        Parameters
+        ----------
+        `iIndex` : int
+            Header position of the index (RING_X_INDEX)
+
+        Return
+        ------
+        `iValue` : int
+            Value of the index
+
+        """
+        with self._get_Lock():
+            return int(self._np_arrHeader[iIndex])
+
+    def _store_Index(self, iIndex : int, iValue : int) -> None:
+        """
+        Description
+        -----------
+        Write an index of the header while holding the shared lock, so that
+        the other process sees all records written or read before.
+
+        Parameters
+        ----------
+        `iIndex` : int
+            Header position of the index (RING_X_INDEX)
+
+        `iValue` : int
+            New value of the index
+
+        """
+        with self._get_Lock():
+            self._np_arrHeader[iIndex] = iValue
+
+    def _get_Lock(self):
+        """
+        Description
+        -----------
+        Getter method for the shared lock.
+
+        Return
+        ------
+        `lock` : Lock
+            Lock shared by the producer and the consumer
+
+        """
+        if (self._lock is None):
+            raise RuntimeError("Ring buffer isn't connected to the lock of " +
+                               "its owner (see set_Lock).")
+        return self._lock
+
+    # Producer methods
+    def put_Records(self, listRecords : list,
+                    fTimeout : float = FREISTAT_RING_TIMEOUT,
+                    strMethod : str = None) -> int:
+        """
+        Description
+        -----------
+        Write samples into the ring buffer. A sample consists of up to
+        FREISTAT_RING_RECORD_SIZE - 3 numbers, optionally followed by the
+        experiment type as string.
+
+        Parameters
+        ----------
+        `listRecords` : list | np.ndarray
+            List of samples or structured array of samples
+
+        `fTimeout` : float
+            Max. time in s to wait for free records, if the ring buffer drops
+            records on a full ring
+
+        `strMethod` : str
+            Experiment type of the samples and all following samples without
+            experiment type or None if it didn't change
+
+        Return
+        ------
+        `iWritten` : int
+            Amount of written samples, the remaining samples are dropped
+
+        """
+        # Initialize variables
+        iWrite : int = int(self._np_arrHeader[RING_WRITE_INDEX])
+        iFree : int = self._get_Free(iWrite)
+        iRequired : int = len(listRecords) + (strMethod is not None)
+
+        # Wait for the consumer if the ring is full (backpressure), blocks
+        # larger than the ring are written as far as they fit
+        if (iFree < iRequired and self._np_arrHeader[RING_CONSUMER]):
+            self._np_arrHeader[RING_BACKPRESSURE] += 1
+            iRequired = min(iRequired, self._iCapacity)
+
+            fDeadline : float = float("inf")
+            if (self._np_arrHeader[RING_DROP_ON_FULL]):
+                fDeadline = time.monotonic() + fTimeout
+
+            while (iFree < iRequired and self._np_arrHeader[RING_CONSUMER] and
+                   time.monotonic() < fDeadline):
+                time.sleep(FREISTAT_RING_POLL_TIME)
+                iFree = self._get_Free(iWrite)
+
+        # Write method record in front of the samples
+        if (strMethod is not None):
+            if (iFree == 0):
+                self._drop_Records(len(listRecords))
+                return 0
+
+            np_arrMethod = np.zeros((1, FREISTAT_RING_RECORD_SIZE))
+            np_arrMethod[0, :2] = [RING_METHOD_RECORD,
+                                   dic_methodCodes.get(strMethod, 0)]
+            self._copy_Records(iWrite, np_arrMethod)
+            iWrite += 1
+            iFree -= 1
+
+        # Drop samples which don't fit
+        iWritten : int = min(iFree, len(listRecords))
+        if (iWritten < len(listRecords)):
+            self._drop_Records(len(listRecords) - iWritten)
+        else:
+            self._bDropping = False
+
+        if (iWritten == 0):
+            self._store_Index(RING_WRITE_INDEX, iWrite)
+            return 0
+
+        # Encode samples and copy them into the ring
+        self._copy_Records(iWrite, self._encode_Records(listRecords[:iWritten]))
+
+        # Publish records after they are written
+        self._store_Index(RING_WRITE_INDEX, iWrite + iWritten)
+        self._notify_Consumer()
+        return iWritten
+
+    def put(self, listData : list) -> None:
+        """
+        Description
+        -----------
+        Write one sample or a list of samples into the ring buffer (interface
+        of a queue).
+
+        Parameters
+        ----------
+        `listData` : list
+            Sample or list of samples
+
+        """
+        if (len(listData) > 0 and isinstance(listData[0], list)):
+            self.put_Records(listData)
+        else:
+            self.put_Records([listData])
+
+    def _notify_Consumer(self) -> None:
+        """
+        Description
+        -----------
+        Wake up an attached consumer waiting for records.
+
+        """
+        if (self._connNotify is None):
+            return
+
+        # Consumer can wait for the pipe from now on
+        self._np_arrHeader[RING_NOTIFY] = 1
+        if (not self._np_arrHeader[RING_CONSUMER]):
+            return
+
+        # A full pipe already wakes up the consumer
+        try:
+            os.write(self._connNotify.fileno(), b"\0")
+        except BlockingIOError:
+            pass
+
+    def _drop_Records(self, iDropped : int) -> None:
+        """
+        Description
+        -----------
+        Count dropped samples as overflow. A warning is logged, when the 
+        producer starts dropping samples.
+
+        Parameters
+        ----------
+        `iDropped` : int
+            Amount of samples which didn't fit into the ring
+
+        """
+        self._np_arrHeader[RING_OVERFLOW] += iDropped
+
+        if (self._bDropping == False):
+            self._bDropping = True
+            _logger.warning("Data queue full, %d samples dropped (%d in total)",
+                            iDropped, self._np_arrHeader[RING_OVERFLOW])
+
+    def _get_Free(self, iWrite : int) -> int:
+        """
+        Description
+        -----------
+        Get amount of free records.
+
+        Parameters
+        ----------
+        `iWrite` : int
+            Amount of written records
+
+        Return
+        ------
+        `iFree` : int
+            Amount of records which can be written
+
+        """
+        return self._iCapacity - (iWrite - self._load_Index(RING_READ_INDEX))
+
+    def _encode_Records(self, listRecords : list) -> np.ndarray:
+        """
+        Description
+        -----------
+        Encode samples as records. Samples of the same length are encoded
+        in one operation, which is the case for every batch of a producer.
+
+        Parameters
+        ----------
+        `listRecords` : list | np.ndarray
+            List of samples containing numbers and optionally the experiment
+            type or structured array of samples
+
+        Return
+        ------
+        `np_arrBlock` : np.ndarray
+            Encoded records (sample x FREISTAT_RING_RECORD_SIZE)
+
+        """
+        # Encode structured arrays column wise, integer fields are marked so
+        # they are restored as integers
+        if (isinstance(listRecords, np.ndarray) and 
+            listRecords.dtype.names is not None):
+            np_arrBlock = np.zeros((len(listRecords), 
+                                    FREISTAT_RING_RECORD_SIZE))
+            np_arrBlock[:, 0] = len(listRecords.dtype.names)
+            np_arrBlock[:, 1] = -1
+
+            iMask : int = 0
+            for iIndex, strLabel in enumerate(listRecords.dtype.names):
+                if (listRecords.dtype[strLabel].kind in "iu"):
+                    iMask |= 1 << iIndex
+                np_arrBlock[:, 3 + iIndex] = listRecords[strLabel]
+
+            np_arrBlock[:, 2] = iMask
+            return np_arrBlock
+
+        # Initialize variables
+        listFirst : list = listRecords[0]
+        iLength : int = len(listFirst)
+        bMethod : bool = iLength > 0 and isinstance(listFirst[-1], str)
+        iValues : int = iLength - bMethod
+        np_arrBlock = np.zeros((len(listRecords), FREISTAT_RING_RECORD_SIZE))
+
+        # Encode samples one by one if their layout differs
+        if (any(len(listData) != iLength for listData in listRecords)):
+            for iIndex, listData in enumerate(listRecords):
+                np_arrBlock[iIndex] = self._encode_Records([listData])[0]
+            return np_arrBlock
+
+        # Mark integer values of the first sample, so they are restored as
+        # integers
+        iMask : int = 0
+        for iIndex in range(iValues):
+            if (isinstance(listFirst[iIndex], (int, np.integer))):
+                iMask |= 1 << iIndex
+
+        np_arrBlock[:, 0] = iValues
+        np_arrBlock[:, 2] = iMask
+
+        # Encode experiment type
+        if (bMethod):
+            np_arrBlock[:, 1] = [dic_methodCodes.get(listData[-1], 0)
+                                 for listData in listRecords]
+            np_arrBlock[:, 3:3 + iValues] = [listData[:-1]
+                                             for listData in listRecords]
+        else:
+            np_arrBlock[:, 1] = -1
+            np_arrBlock[:, 3:3 + iValues] = listRecords
+
+        return np_arrBlock
+
+    def _copy_Records(self, iWrite : int, np_arrBlock : np.ndarray) -> None:
+        """
+        Description
+        -----------
+        Copy records into the ring, wrapping around at its end.
+
+        Parameters
+        ----------
+        `iWrite` : int
+            Amount of written records
+
+        `np_arrBlock` : np.ndarray
+            Encoded records
+
+        """
+        # Initialize variables
+        iPosition : int = iWrite % self._iCapacity
+        iFirst : int = min(len(np_arrBlock), self._iCapacity - iPosition)
+
+        self._np_arrRecords[iPosition:iPosition + iFirst] = np_arrBlock[:iFirst]
+        self._np_arrRecords[:len(np_arrBlock) - iFirst] = np_arrBlock[iFirst:]
+
+    # Consumer methods
+    def detach_Consumer(self) -> None:
+        """
+        Description
+        -----------
+        Mark the consumer as detached, so that the producer doesn't wait for
+        free records anymore. Has to be called before the consumer stops 
+        reading, the next read attaches the consumer again.
+
+        """
+        self._np_arrHeader[RING_CONSUMER] = 0
+
+    def get_WaitHandle(self) -> int:
+        """
+        Description
+        -----------
+        Get the file descriptor which becomes readable if the producer 
+        published records, e.g. to wait with `loop.add_reader`. Call
+        `clear_Notifications` after waking up and before reading.
+
+        Return
+        ------
+        `iHandle` : int
+            File descriptor of the pipe or None if the consumer has to poll
+
+        """
+        if (self._get_WaitConnection() is None):
+            return None
+        return self._connWait.fileno()
+
+    def _get_WaitConnection(self):
+        """
+        Description
+        -----------
+        Getter method for the read end of the pipe, if the producer wakes up
+        the consumer.
+
+        Return
+        ------
+        `connWait` : Connection
+            Read end of the pipe or None if the consumer has to poll
+
+        """
+        if (self._connWait is None or not self._np_arrHeader[RING_NOTIFY]):
+            return None
+        return self._connWait
+
+    def clear_Notifications(self) -> None:
+        """
+        Description
+        -----------
+        Discard all pending wake ups of the producer.
+
+        """
+        if (self._connWait is None):
+            return
+
+        try:
+            while (len(os.read(self._connWait.fileno(), 4096)) > 0):
+                pass
+        except BlockingIOError:
+            pass
+
+    def wait_Data(self, fTimeout : float, listSentinels : list = []) -> None:
+        """
+        Description
+        -----------
+        Block until the producer published records, one of the sentinels 
+        (e.g. of the producing process) is ready or the timeout expired. 
+        If the producer doesn't wake up the consumer, the method only waits 
+        up to FREISTAT_STREAM_POLL_TIME.
+
+        Parameters
+        ----------
+        `fTimeout` : float
+            Max. time in s to wait
+
+        `listSentinels` : list
+            Further objects ending the wait (see `multiprocessing.connection.wait`)
+
+        """
+        # Initialize variables
+        listObjects : list = list(listSentinels)
+        connWait = self._get_WaitConnection()
+
+        if (connWait is None):
+            fTimeout = min(fTimeout, FREISTAT_STREAM_POLL_TIME)
+        else:
+            listObjects.append(connWait)
+
+        if (len(listObjects) > 0):
+            connection.wait(listObjects, fTimeout)
+        else:
+            time.sleep(fTimeout)
+
+        self.clear_Notifications()
+
+    def get_Array(self, iMax : int = None) -> np.ndarray:
+        """
+        Description
+        -----------
+        Read all available records without decoding them.
+
+        Parameters
+        ----------
+        `iMax` : int
+            Max. amount of records which should be read or None for all
+
+        Return
+        ------
+        `np_arrRecords` : np.ndarray
+            Copy of the records (record x FREISTAT_RING_RECORD_SIZE)
+
+        """
+        # Initialize variables
+        iRead : int = int(self._np_arrHeader[RING_READ_INDEX])
+        iAvailable : int = self._load_Index(RING_WRITE_INDEX) - iRead
+        self._np_arrHeader[RING_CONSUMER] = 1
+
+        if (iMax is not None):
+            iAvailable = min(iAvailable, iMax)
+
+        # Copy records, wrapping around at the end of the ring
+        iPosition : int = iRead % self._iCapacity
+        iFirst : int = min(iAvailable, self._iCapacity - iPosition)
+        np_arrRecords = np.concatenate([
+            self._np_arrRecords[iPosition:iPosition + iFirst],
+            self._np_arrRecords[:iAvailable - iFirst]])
+
+        # Release records after they are copied
+        self._store_Index(RING_READ_INDEX, iRead + iAvailable)
+        return np_arrRecords
+
+    def get_Records(self, iMax : int = None) -> list:
+        """
+        Description
+        -----------
+        Read and decode all available records.
+
+        Parameters
+        ----------
+        `iMax` : int
+            Max. amount of records which should be read or None for all
+
+        Return
+        ------
+        `listRecords` : list
+            List of samples in the format they were written
+
+        """
+        # Initialize variables
+        listRecords : list = []
+
+        for iValues, iMask, iMethod, np_arrGroup in self._split_Records(
+            self.get_Array(iMax)):
+            # Restore integers and experiment type column wise
+            listColumns : list = []
+            for iIndex in range(iValues):
+                np_arrColumn = np_arrGroup[:, 3 + iIndex]
+                if (iMask >> iIndex & 1):
+                    np_arrColumn = np_arrColumn.astype(np.int64)
+                listColumns.append(np_arrColumn.tolist())
+            if (iMethod >= 0):
+                listColumns.append(
+                    [_listMethods[iMethod]] * len(np_arrGroup))
+
+            listRecords.extend(map(list, zip(*listColumns)))
+
+        return listRecords
+
+    def get_RecordArrays(self, iMax : int = None) -> list:
+        """
+        Description
+        -----------
+        Read all available records as typed samples. Consecutive records with
+        the same layout are returned as one structured array, using the column
+        layout of the data storage (see `get_SampleType`). Samples of a
+        sequence contain the experiment type as additional column.
+
+        Parameters
+        ----------
+        `iMax` : int
+            Max. amount of records which should be read or None for all
+
+        Return
+        ------
+        `listRecordArrays` : list
+            List of numpy record arrays in the order they were written
+
+        """
+        # Initialize variables
+        listRecordArrays : list = []
+
+        for iValues, iMask, iMethod, np_arrGroup in self._split_Records(
+            self.get_Array(iMax)):
+            listFields : list = get_SampleType(iValues).descr
+            if (iMethod >= 0):
+                listFields.append((DE_TAG_EXPERIMENT,
+                                   "<U" + str(max(map(len, _listMethods)))))
+
+            np_arrSamples = np.rec.array(None, shape= len(np_arrGroup),
+                                         dtype= listFields)
+            for iIndex, strField in enumerate(np_arrSamples.dtype.names):
+                if (iIndex < iValues):
+                    np_arrSamples[strField] = np_arrGroup[:, 3 + iIndex]
+                else:
+                    np_arrSamples[strField] = _listMethods[iMethod]
+
+            listRecordArrays.append(np_arrSamples)
+
+        return listRecordArrays
+
+    def _split_Records(self, np_arrRecords : np.ndarray) -> Iterator[tuple]:
+        """
+        Description
+        -----------
+        Split read records into groups of consecutive records with the same
+        layout, so that every group is decoded in one operation. Records 
+        setting the method are consumed.
+
+        Parameters
+        ----------
+        `np_arrRecords` : np.ndarray
+            Read records (record x FREISTAT_RING_RECORD_SIZE)
+
+        Return
+        ------
+        `iValues` : int
+            Amount of values of the samples of the group
+
+        `iMask` : int
+            Bit mask of the values which are integers
+
+        `iMethod` : int
+            Code of the experiment type or -1 if not defined
+
+        `np_arrGroup` : np.ndarray
+            Records of the group
+
+        """
+        # Find changes of the layout
+        np_arrChanges = np.flatnonzero(np.any(
+            np_arrRecords[1:, :3] != np_arrRecords[:-1, :3], axis= 1)) + 1
+        for np_arrGroup in np.split(np_arrRecords, np_arrChanges):
+            if (len(np_arrGroup) == 0):
+                continue
+
+            iValues : int = int(np_arrGroup[0, 0])
+            iMask : int = int(np_arrGroup[0, 2])
+            iMethod : int = int(np_arrGroup[0, 1])
+
+            # Save method of the following records
+            if (iValues == RING_METHOD_RECORD):
+                self._iMethod = iMethod
+                continue
+            elif (iMethod < 0):
+                iMethod = self._iMethod
+
+            yield iValues, iMask, iMethod, np_arrGroup
+
+    def get(self, block : bool = True, timeout : float = None) -> list:
+        """
+        Description
+        -----------
+        Read one sample (interface of a queue).
+
+        Parameters
+        ----------
+        `block` : bool
+            Flag indicating if the method should wait for a sample
+
+        `timeout` : float
+            Max. time in s to wait or None to wait without limit
+
+        Return
+        ------
+        `listData` : list
+            Sample in the format it was written
+
+        """
+        # Initialize variables
+        fStart : float = time.monotonic()
+
+        while (True):
+            # Method records don't return a sample
+            listRecords : list = self.get_Records(1)
+            if (len(listRecords) > 0):
+                return listRecords[0]
+
+            if (not block or (timeout is not None and
+                              time.monotonic() - fStart >= timeout)):
+                raise queue.Empty
+
+            fWait : float = FREISTAT_STREAM_WAIT_TIMEOUT
+            if (timeout is not None):
+                fWait = min(fWait, fStart + timeout - time.monotonic())
+            self.wait_Data(max(fWait, 0.0))
+
+    def empty(self) -> bool:
+        """
+        Description
+        -----------
+        Check if no record is available (interface of a queue).
+
+        Return
+        ------
+        `bEmpty` : bool
+            True if no record is available
+
+        """
+        return self.qsize() == 0
+
+    def qsize(self) -> int:
+        """
+        Description
+        -----------
+        Get amount of available records.
+
+        Return
+        ------
+        `iSize` : int
+            Amount of records which aren't read yet
+
+        """
+        return self._load_Index(RING_WRITE_INDEX) - \
+               self._load_Index(RING_READ_INDEX)
+
+    # Getter methods
+    def get_Overflow(self) -> int:
+        """
+        Description
+        -----------
+        Get amount of samples which were dropped, because the ring was full.
+
+        Return
+        ------
+        `iOverflow` : int
+            Amount of dropped samples
+
+        """
+        return int(self._np_arrHeader[RING_OVERFLOW])
+
+    def get_Backpressure(self) -> int:
+        """
+        Description
+        -----------
+        Get amount of writes which had to wait for the consumer.
+
+        Return
+        ------
+        `iBackpressure` : int
+            Amount of writes which found the ring full
+
+        """
+        return int(self._np_arrHeader[RING_BACKPRESSURE])
+
+    def get_Name(self) -> str:
+        """
+        Description
+        -----------
+        Get name of the shared memory.
+
+        Return
+        ------
+        `strName` : str
+            Name used to attach to the ring buffer
+
+        """
+        return self._sharedMemory.name
+
+    def close(self) -> None:
+        """
+        Description
+        -----------
+        Close the shared memory. The process which created the ring buffer
+        releases the memory as well.
+
+        """
+        # Release views on the shared memory before it is closed
+        self._np_arrHeader = None
+        self._np_arrRecords = None
+        self._sharedMemory.close()
+
+        # Close the pipe waking up the consumer
+        for conn in [self._connWait, self._connNotify]:
+            if (conn is not None):
+                conn.close()
+
+        if (self._bOwner):
+            self._sharedMemory.unlink()
@@ -0,0 +1,244 @@
+"""
+Module implementing different unittests for the shared memory ring buffer.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import logging
+import multiprocessing as mp
+import os
+import pickle
+import threading
+import time
+import unittest
+
+# Import internal dependencies
+from ..Data_storage.constants import *
+from .shared_ring_buffer import SharedRingBuffer
+
+def _write_Samples(dataQueue : SharedRingBuffer, iSamples : int) -> None:
+    """
+    Description
+    -----------
+    Write samples from another process into the ring buffer.
+
+    """
+    for iSample in range(iSamples):
+        dataQueue.put_Records([[1, iSample, 0.5 * iSample, 2.0, CV]],
+                              fTimeout= 5.0)
+
+class SharedRingBuffer_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the shared memory ring
+    buffer.
+
+    """
+    def setUp(self) -> None:
+        # Lock of the start method used by the tests
+        self._dataQueue = SharedRingBuffer(iCapacity= 8,
+                                           lock= mp.get_context("spawn").Lock())
+
+    def tearDown(self) -> None:
+        self._dataQueue.close()
+
+    def test_put_Records(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that samples keep their integers and experiment
+        type and are read in order, also across the end of the ring.
+
+        """
+        listSamples : list = [[1, iSample, 0.5 * iSample, 2.0, SEQUENCE]
+                              for iSample in range(20)]
+
+        listRead : list = []
+        for iSample in range(0, 20, 5):
+            self.assertEqual(
+                self._dataQueue.put_Records(listSamples[iSample:iSample + 5]),
+                5)
+            listRead.extend(self._dataQueue.get_Records())
+
+        self.assertEqual(listRead, listSamples)
+        self.assertIsInstance(listRead[3][1], int)
+        self.assertIsInstance(listRead[3][2], float)
+        self.assertTrue(self._dataQueue.empty())
+
+    def test_Overflow(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that samples which don't fit without a consumer
+        are dropped, counted and logged, while the oldest samples are kept.
+
+        """
+        with self.assertLogs(SharedRingBuffer.__module__, logging.WARNING):
+            self.assertEqual(self._dataQueue.put_Records(
+                [[iSample, 1.0] for iSample in range(12)]), 8)
+
+        self.assertEqual(self._dataQueue.get_Overflow(), 4)
+        self.assertEqual([listData[0] for listData in
+                          self._dataQueue.get_Records()], list(range(8)))
+
+    def test_Backpressure(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that the producer waits for an attached consumer
+        until the samples fit and stops waiting if the consumer detaches.
+
+        """
+        # Attach consumer and fill the ring
+        self._dataQueue.get_Records()
+        self._dataQueue.put_Records([[iSample] for iSample in range(8)])
+
+        # Sample is written as soon as the consumer reads
+        timer = threading.Timer(0.05, self._dataQueue.get_Records, [1])
+        timer.start()
+        self.assertEqual(self._dataQueue.put_Records([[8]], fTimeout= 0.01), 1)
+        timer.join()
+        self.assertEqual(self._dataQueue.get_Backpressure(), 1)
+        self.assertEqual(self._dataQueue.get_Overflow(), 0)
+
+        # Detached consumer releases the producer
+        timer = threading.Timer(0.05, self._dataQueue.detach_Consumer)
+        timer.start()
+        self.assertEqual(self._dataQueue.put_Records([[9]]), 0)
+        timer.join()
+        self.assertEqual(self._dataQueue.get_Overflow(), 1)
+
+        # Ring buffer dropping samples only waits up to the timeout
+        dataQueue = SharedRingBuffer(iCapacity= 1, bDropOnFull= True,
+                                     lock= mp.get_context("spawn").Lock())
+        try:
+            dataQueue.get_Records()
+            dataQueue.put_Records([[1]])
+            self.assertEqual(dataQueue.put_Records([[2]], fTimeout= 0.01), 0)
+            self.assertEqual(dataQueue.get_Overflow(), 1)
+        finally:
+            dataQueue.close()
+
+    @unittest.skipUnless(os.name == "posix", "Consumer is only woken up on POSIX")
+    def test_wait_Data(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that a waiting consumer is woken up by the
+        producer and polls until the producer wakes it up.
+
+        """
+        # Producer didn't publish yet, consumer has to poll
+        self._dataQueue.get_Records()
+        self.assertIsNone(self._dataQueue.get_WaitHandle())
+
+        fStart : float = time.monotonic()
+        self._dataQueue.wait_Data(1.0)
+        self.assertLess(time.monotonic() - fStart, 0.5)
+
+        # Published records wake up the consumer immediately
+        self._dataQueue.put_Records([[1, 0.5]])
+        self.assertIsNotNone(self._dataQueue.get_WaitHandle())
+
+        fStart = time.monotonic()
+        self._dataQueue.wait_Data(5.0)
+        self.assertLess(time.monotonic() - fStart, 0.5)
+
+        # Wake up is consumed, the next wait blocks until the timeout
+        fStart = time.monotonic()
+        self._dataQueue.wait_Data(0.05)
+        self.assertGreaterEqual(time.monotonic() - fStart, 0.05)
+        self.assertEqual(self._dataQueue.get_Records(), [[1, 0.5]])
+
+    def test_Queue_Interface(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing the queue compatible methods.
+
+        """
+        self._dataQueue.put([1, 2, 3.0])
+        self._dataQueue.put([[4, 5, 6.0], [7, 8, 9.0]])
+
+        self.assertEqual(self._dataQueue.qsize(), 3)
+        self.assertEqual(self._dataQueue.get(), [1, 2, 3.0])
+        self.assertEqual(self._dataQueue.get_Records(),
+                         [[4, 5, 6.0], [7, 8, 9.0]])
+
+    def test_get_RecordArrays(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that samples are read as typed blocks with the
+        column layout of the data storage.
+
+        """
+        self._dataQueue.put_Records([[1, iSample, 0.5 * iSample, 2.0, 3.0]
+                                     for iSample in range(3)])
+        self._dataQueue.put_Records([[1, 2, 3, 4.0, 5.0, 6.0, 7.0, 8.0]],
+                                    strMethod= CA)
+
+        listRecordArrays : list = self._dataQueue.get_RecordArrays()
+        self.assertEqual(len(listRecordArrays), 2)
+
+        np_arrSamples = listRecordArrays[0]
+        self.assertEqual(list(np_arrSamples.dtype.names), FREISTAT_CV_LABEL)
+        self.assertEqual(np_arrSamples[DE_TAG_DATAPOINT].tolist(), [0, 1, 2])
+        self.assertEqual(np_arrSamples.dtype[DE_TAG_CYCLE],
+                         FREISTAT_STORAGE_INT_TYPE)
+        self.assertEqual(np_arrSamples[DE_TAG_VOLTAGE].tolist(),
+                         [0.0, 0.5, 1.0])
+
+        np_arrSamples = listRecordArrays[1]
+        self.assertEqual(list(np_arrSamples.dtype.names),
+                         FREISTAT_CV_LABEL_SEQ + [DE_TAG_EXPERIMENT])
+        self.assertEqual(np_arrSamples[0][DE_TAG_EXPERIMENT], CA)
+        self.assertEqual(np_arrSamples[0][DE_TAG_TOTAL_TIME], 8.0)
+
+    def test_Process(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that another process can write into the ring
+        buffer.
+
+        """
+        # Pickling only hands over the name of the shared memory, the lock
+        # has to be set if the ring buffer isn't handed to a starting process
+        self.assertLess(len(pickle.dumps(self._dataQueue)), 200)
+
+        dataQueue : SharedRingBuffer = pickle.loads(
+            pickle.dumps(self._dataQueue))
+        self.assertRaises(RuntimeError, dataQueue.qsize)
+        dataQueue.set_Lock(self._dataQueue._lock)
+        dataQueue.put_Records([[1, 0, 0.5]])
+        self.assertEqual(self._dataQueue.get_Records(), [[1, 0, 0.5]])
+        dataQueue.close()
+
+        process = mp.get_context("spawn").Process(target= _write_Samples,
+            args= (self._dataQueue, 100))
+        process.start()
+
+        # Consumer is woken up by the producer or the end of the process
+        listRead : list = []
+        while (process.is_alive() or not self._dataQueue.empty()):
+            listRead.extend(self._dataQueue.get_Records())
+            self._dataQueue.wait_Data(1.0, [process.sentinel])
+        process.join()
+
+        self.assertEqual([listData[1] for listData in listRead],
+                         list(range(100)))
+        self.assertEqual(listRead[-1][-1], CV)
+        self.assertEqual(self._dataQueue.get_Overflow(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,376 @@
+"""
+Module implementing a control block in shared memory, which is written by the
+process collecting the data (`P_DataCollection`) and read by the facade, the
+plotter or a GUI backend without any further inter-process communication.
+
+The shared memory consists of a header of FREISTAT_STATUS_HEADER_SIZE int64
+values and the export path:
+
+Header  : Update counter | Error code | System status | Received samples |
+          Parse errors | Current cycle | Last timestamp (float64) |
+          Length of the export path | Termination flag
+Path    : FREISTAT_STATUS_PATH_SIZE bytes of the UTF-8 encoded export path
+
+The block is written by a single process. Every update and every snapshot is
+done while holding a lock shared by all processes using the block, which 
+results in a consistent snapshot and orders the memory accesses also on 
+weakly ordered CPUs. The lock is handed over like the lock of the data queue
+(see `SharedRingBuffer.set_Lock`).
+
+The termination flag is the only value written by the facade. It provides the
+interface of an event (`set`, `is_set`, `clear`), so that every experiment of
+the acquisition worker can be terminated on its own.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import multiprocessing as mp
+from multiprocessing import context, shared_memory
+
+import numpy as np
+
+# Import internal dependencies
+from ..Data_storage.constants import *
+
+class SharedStatusBlock:
+    """
+    Description
+    -----------
+    Class implementing the status block. The object can be handed to another
+    process, which attaches to the same shared memory.
+
+    """
+
+    def __init__(self, strName : str = None, lock = None) -> None:
+        """
+        Description
+        -----------
+        Constructor of class SharedStatusBlock. Creates a new status block or
+        attaches to an existing one.
+
+        Parameters
+        ----------
+        `strName` : str
+            Name of the shared memory of an existing status block or None to
+            create a new status block
+
+        `lock` : Lock
+            Lock shared with the other processes or None to create a new lock
+            for a new status block
+
+        """
+        # Initalize class variable
+        self._bOwner : bool = strName is None
+
+        self._lock = lock
+        if (self._lock is None and self._bOwner):
+            self._lock = mp.Lock()
+
+        if (self._bOwner):
+            self._sharedMemory = shared_memory.SharedMemory(create= True,
+                size= 8 * FREISTAT_STATUS_HEADER_SIZE +
+                      FREISTAT_STATUS_PATH_SIZE)
+        else:
+            self._sharedMemory = shared_memory.SharedMemory(name= strName)
+
+        # Integer and float view on the same header
+        self._np_arrHeader = np.ndarray((FREISTAT_STATUS_HEADER_SIZE,),
+            dtype= np.int64, buffer= self._sharedMemory.buf)
+        self._np_arrfHeader = np.ndarray((FREISTAT_STATUS_HEADER_SIZE,),
+            dtype= np.float64, buffer= self._sharedMemory.buf)
+        self._np_arrbPath = np.ndarray((FREISTAT_STATUS_PATH_SIZE,),
+            dtype= np.uint8, buffer= self._sharedMemory.buf,
+            offset= 8 * FREISTAT_STATUS_HEADER_SIZE)
+
+        if (self._bOwner):
+            self._np_arrHeader[:] = 0
+            self._np_arrHeader[STATUS_ERROR_CODE] = EC_NO_ERROR
+            self._np_arrHeader[STATUS_SYSTEM_STATUS] = FREISTAT_BOOTUP
+            self._np_arrHeader[STATUS_CYCLE] = -1
+            self._np_arrfHeader[STATUS_TIMESTAMP] = 0.0
+
+    def __getstate__(self) -> dict:
+        """
+        Description
+        -----------
+        Only hand the name of the shared memory to another process. The lock
+        can only be handed to a process while it is started.
+
+        """
+        dictState : dict = {"strName" : self._sharedMemory.name}
+        if (context.get_spawning_popen() is not None):
+            dictState["lock"] = self._lock
+        return dictState
+
+    def __setstate__(self, dictState : dict) -> None:
+        """
+        Description
+        -----------
+        Attach to the shared memory in another process.
+
+        """
+        self.__init__(dictState["strName"], lock= dictState.get("lock"))
+
+    def set_Lock(self, lock) -> None:
+        """
+        Description
+        -----------
+        Setter method for the lock shared with the other processes, which is
+        required if the status block wasn't handed over while starting a 
+        process.
+
+        Parameters
+        ----------
+        `lock` : Lock
+            Lock shared by all processes using the status block
+
+        """
+        self._lock = lock
+
+    def _get_Lock(self):
+        """
+        Description
+        -----------
+        Getter method for the shared lock.
+
+        Return
+        ------
+        `lock` : Lock
+            Lock shared by all processes using the status block
+
+        """
+        if (self._lock is None):
+            raise RuntimeError("Status block isn't connected to the lock of " +
+                               "its owner (see set_Lock).")
+        return self._lock
+
+    # Writer methods
+    def _begin_Write(self) -> None:
+        """
+        Description
+        -----------
+        Acquire the shared lock before the block is written.
+
+        """
+        self._get_Lock().acquire()
+
+    def _end_Write(self) -> None:
+        """
+        Description
+        -----------
+        Count the update and release the shared lock, which publishes the 
+        written values.
+
+        """
+        self._np_arrHeader[STATUS_SEQUENCE] += 1
+        self._lock.release()
+
+    def set_SystemStatus(self, iSystemStatus : int) -> None:
+        """
+        Description
+        -----------
+        Setter method for the system status.
+
+        Parameters
+        ----------
+        `iSystemStatus` : int
+            Status of the system encoded in an integer value (FREISTAT_X)
+
+        """
+        self._begin_Write()
+        self._np_arrHeader[STATUS_SYSTEM_STATUS] = iSystemStatus
+        self._end_Write()
+
+    def set_ErrorCode(self, iErrorCode : int) -> None:
+        """
+        Description
+        -----------
+        Setter method for the error code of the experiment.
+
+        Parameters
+        ----------
+        `iErrorCode` : int
+            Error code encoded as integer
+
+        """
+        self._begin_Write()
+        self._np_arrHeader[STATUS_ERROR_CODE] = iErrorCode
+        self._end_Write()
+
+    def set_ExportPath(self, strExportPath : str) -> None:
+        """
+        Description
+        -----------
+        Setter method for the path the experiment data was exported to.
+
+        Parameters
+        ----------
+        `strExportPath` : str
+            System path where the experiment data is stored
+
+        """
+        # Initialize variables
+        bExportPath : bytes = strExportPath.encode("UTF-8")
+
+        # Check if export path fits into the block
+        if (len(bExportPath) > FREISTAT_STATUS_PATH_SIZE):
+            raise RuntimeError("Export path too long.")
+
+        self._begin_Write()
+        self._np_arrbPath[:len(bExportPath)] = np.frombuffer(bExportPath,
+                                                             dtype= np.uint8)
+        self._np_arrHeader[STATUS_PATH_LENGTH] = len(bExportPath)
+        self._end_Write()
+
+    def add_Samples(self, iSamples : int, iCycle : int,
+                    fTimeStamp : float) -> None:
+        """
+        Description
+        -----------
+        Count received samples and save the progress of the experiment.
+
+        Parameters
+        ----------
+        `iSamples` : int
+            Amount of received samples
+
+        `iCycle` : int
+            Cycle of the last received sample
+
+        `fTimeStamp` : float
+            Timestamp of the last received sample
+
+        """
+        self._begin_Write()
+        self._np_arrHeader[STATUS_SAMPLES] += iSamples
+        self._np_arrHeader[STATUS_CYCLE] = iCycle
+        self._np_arrfHeader[STATUS_TIMESTAMP] = fTimeStamp
+        self._end_Write()
+
+    def add_ParseError(self) -> None:
+        """
+        Description
+        -----------
+        Count a telegram which couldn't be parsed.
+
+        """
+        self._begin_Write()
+        self._np_arrHeader[STATUS_PARSE_ERRORS] += 1
+        self._end_Write()
+
+    # Event methods
+    def set(self) -> None:
+        """
+        Description
+        -----------
+        Request the termination of the experiment.
+
+        """
+        self._np_arrHeader[STATUS_TERMINATE] = 1
+
+    def clear(self) -> None:
+        """
+        Description
+        -----------
+        Reset the termination request.
+
+        """
+        self._np_arrHeader[STATUS_TERMINATE] = 0
+
+    def is_set(self) -> bool:
+        """
+        Description
+        -----------
+        Check if the termination of the experiment was requested.
+
+        Return
+        ------
+        `bTerminate` : bool
+            True if the experiment should be terminated
+
+        """
+        return bool(self._np_arrHeader[STATUS_TERMINATE])
+
+    # Reader methods
+    def get_Status(self) -> dict:
+        """
+        Description
+        -----------
+        Get a consistent snapshot of the status block.
+
+        Return
+        ------
+        `dictStatus` : dict
+            Status with the keys errorCode, systemStatus, samples, parseErrors,
+            cycle, timeStamp and exportPath
+
+        """
+        # Copy the block while the writer can't change it
+        with self._get_Lock():
+            np_arrHeader = self._np_arrHeader.copy()
+            fTimeStamp : float = float(self._np_arrfHeader[STATUS_TIMESTAMP])
+            bExportPath : bytes = self._np_arrbPath[
+                :min(max(int(np_arrHeader[STATUS_PATH_LENGTH]), 0),
+                     FREISTAT_STATUS_PATH_SIZE)].tobytes()
+
+        return {"errorCode" : int(np_arrHeader[STATUS_ERROR_CODE]),
+                "systemStatus" : int(np_arrHeader[STATUS_SYSTEM_STATUS]),
+                "samples" : int(np_arrHeader[STATUS_SAMPLES]),
+                "parseErrors" : int(np_arrHeader[STATUS_PARSE_ERRORS]),
+                "cycle" : int(np_arrHeader[STATUS_CYCLE]),
+                "timeStamp" : fTimeStamp,
+                "exportPath" : bExportPath.decode("UTF-8")}
+
+    def get_ExportPath(self) -> str:
+        """
+        Description
+        -----------
+        Getter method for the path the experiment data was exported to.
+
+        Return
+        ------
+        `strExportPath` : str
+            System path where the experiment data is stored or an empty string
+            if the experiment wasn't exported yet
+
+        """
+        return self.get_Status()["exportPath"]
+
+    def get_Name(self) -> str:
+        """
+        Description
+        -----------
+        Get name of the shared memory.
+
+        Return
+        ------
+        `strName` : str
+            Name used to attach to the status block
+
+        """
+        return self._sharedMemory.name
+
+    def close(self) -> None:
+        """
+        Description
+        -----------
+        Close the shared memory. The process which created the status block
+        releases the memory as well.
+
+        """
+        # Release views on the shared memory before it is closed
+        self._np_arrHeader = None
+        self._np_arrfHeader = None
+        self._np_arrbPath = None
+        self._sharedMemory.close()
+
+        if (self._bOwner):
+            self._sharedMemory.unlink()
@@ -0,0 +1,111 @@
+"""
+Module implementing different unittests for the shared memory status block.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import multiprocessing as mp
+import unittest
+
+# Import internal dependencies
+from ..Data_storage.constants import *
+from .shared_status_block import SharedStatusBlock
+
+def _write_Status(statusBlock : SharedStatusBlock, iSamples : int) -> None:
+    """
+    Description
+    -----------
+    Write the progress of an experiment from another process into the status
+    block.
+
+    """
+    statusBlock.set_SystemStatus(FREISTAT_EXP_RUNNING)
+
+    for iSample in range(iSamples):
+        statusBlock.add_Samples(1, iSample // 10, 0.1 * iSample)
+
+    statusBlock.add_ParseError()
+    statusBlock.set_ExportPath("Measurements/22_01_01/12_00_00/µA")
+    statusBlock.set_SystemStatus(FREISTAT_EXP_COMPLETED)
+    statusBlock.close()
+
+class SharedStatusBlock_UnitTest(unittest.TestCase):
+    """
+    Description
+    -----------
+    Class which handles all unittests in regard to the shared memory status
+    block.
+
+    """
+    def setUp(self) -> None:
+        # Lock of the start method used by the tests
+        self._statusBlock = SharedStatusBlock(
+            lock= mp.get_context("spawn").Lock())
+
+    def tearDown(self) -> None:
+        self._statusBlock.close()
+
+    def test_get_Status(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing the initial state, that the export path has to fit
+        into the block and the termination flag.
+
+        """
+        self.assertEqual(self._statusBlock.get_Status(),
+                         {"errorCode" : EC_NO_ERROR,
+                          "systemStatus" : FREISTAT_BOOTUP,
+                          "samples" : 0, "parseErrors" : 0, "cycle" : -1,
+                          "timeStamp" : 0.0, "exportPath" : ""})
+
+        self.assertRaises(RuntimeError, self._statusBlock.set_ExportPath,
+                          "a" * (FREISTAT_STATUS_PATH_SIZE + 1))
+        self.assertEqual(self._statusBlock.get_ExportPath(), "")
+
+        # Termination flag
+        self.assertFalse(self._statusBlock.is_set())
+        self._statusBlock.set()
+        self.assertTrue(self._statusBlock.is_set())
+        self._statusBlock.clear()
+        self.assertFalse(self._statusBlock.is_set())
+
+    def test_Process(self) -> None:
+        """
+        Description
+        -----------
+        Method for testing that the progress written by another process is
+        read without any further communication.
+
+        """
+        process = mp.get_context("spawn").Process(target= _write_Status,
+            args= (self._statusBlock, 100))
+        process.start()
+
+        # Counters only increase while the experiment is running
+        iSamples : int = 0
+        while (process.is_alive()):
+            dictStatus : dict = self._statusBlock.get_Status()
+            self.assertGreaterEqual(dictStatus["samples"], iSamples)
+            iSamples = dictStatus["samples"]
+        process.join()
+
+        dictStatus = self._statusBlock.get_Status()
+        self.assertEqual(dictStatus["systemStatus"], FREISTAT_EXP_COMPLETED)
+        self.assertEqual(dictStatus["samples"], 100)
+        self.assertEqual(dictStatus["parseErrors"], 1)
+        self.assertEqual(dictStatus["cycle"], 9)
+        self.assertAlmostEqual(dictStatus["timeStamp"], 9.9)
+        self.assertEqual(dictStatus["exportPath"],
+                         "Measurements/22_01_01/12_00_00/µA")
+
+if __name__ == '__main__':
+    unittest.main()
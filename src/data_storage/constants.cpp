@@ -208,6 +208,8 @@ const float PULSE_LENGTHS_F[] =     {4000, 3000, 3000};
 #define MAINS_FILTER            "pMF"       // Parameter 50 Hz/ 60 Hz mains filter enabled
 #define SINC2_OVERSAMPLING      "pOS2"      // Parameter oversampling rate sinc2 filter
 #define SINC3_OVERSAMPLING      "pOS3"      // Parameter oversampling rate sinc3 filter
+#define DATA_FORMAT             "pDF"       // Parameter format of the data telegrams
+#define BATCH_SIZE              "pBS"       // Parameter amount of samples packed into one data telegram
 
 /******************************************************************************
  * Telegram: Telegram type abbreviations
@@ -232,6 +234,20 @@ const float PULSE_LENGTHS_F[] =     {4000, 3000, 3000};
 #define CURRENT_VALUE           "C"         // Current value           
 #define TIME_VALUE              "T"         // Time stamp  
 
+/******************************************************************************
+ * Telegram: Binary data telegrams
+ *
+ *      Constant                Value                     Meaning
+ *****************************************************************************/
+#define DATA_FORMAT_JSON        0           // Data telegrams are send as JSON strings
+#define DATA_FORMAT_BINARY      1           // Data telegrams are send as binary S_DataContainer records
+
+#define BINARY_TELEGRAM_MAGIC_1 0xA5        // First byte of the magic header of binary telegrams
+#define BINARY_TELEGRAM_MAGIC_2 0x5A        // Second byte of the magic header of binary telegrams
+#define BINARY_TELEGRAM_HEADER  4           // Size of magic header and payload length in bytes
+
+#define MAX_BATCH_SIZE          10          // Maximum amount of samples packed into one data telegram
+
 /******************************************************************************
  * Telegram: Command telegram types
  *
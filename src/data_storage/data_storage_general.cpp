@@ -34,6 +34,8 @@ void C_DataStorageGeneral::Begin(C_DataSoftwareStorage * c_DataSoftwareStorage){
     iSequenceLength_ = 1;
     iSequenceCycles_ = 1;
     iSendDataCounter_ = 0;
+    iDataFormat_ = DATA_FORMAT_JSON;
+    iBatchSize_ = 1;
     iFiFoThreshold_ = AD5940_FIFO_THRESHOLD;
     iLPTIALoadSize_ = LPTIARLOAD_SHORT;
     iLPAmpPowerMode_ = LPAMPPWR_NORM;
@@ -57,6 +59,31 @@ void C_DataStorageGeneral::set_CommandNumber(int iCommandNumber){
     iCommandNumber_ = iCommandNumber;
 }
 
+/******************************************************************************
+ * @brief Setter method for saving the format of the data telegrams
+ * @param iDataFormat: Data format (DATA_FORMAT_JSON | DATA_FORMAT_BINARY)
+ *****************************************************************************/
+void C_DataStorageGeneral::set_DataFormat(int iDataFormat){
+    iDataFormat_ = iDataFormat;
+}
+
+/******************************************************************************
+ * @brief Setter method for saving the amount of samples per data telegram
+ * @param iBatchSize: Amount of samples per data telegram (1 - MAX_BATCH_SIZE)
+ *****************************************************************************/
+void C_DataStorageGeneral::set_BatchSize(int iBatchSize){
+    // Limit batch size to the size of the send buffer
+    if (iBatchSize < 1){
+        iBatchSize_ = 1;
+    }
+    else if (iBatchSize > MAX_BATCH_SIZE){
+        iBatchSize_ = MAX_BATCH_SIZE;
+    }
+    else {
+        iBatchSize_ = iBatchSize;
+    }
+}
+
 /******************************************************************************
  * @brief Setter method for saving the length of the experiment sequence
  * @param iSequenceLength: Length of the experiment sequence
@@ -148,6 +175,22 @@ int C_DataStorageGeneral::get_CommandNumber(){
     return iCommandNumber_;
 }
 
+/******************************************************************************
+ * @brief Getter method for returning the format of the data telegrams
+ * @return: Data format (DATA_FORMAT_JSON | DATA_FORMAT_BINARY)
+ *****************************************************************************/
+int C_DataStorageGeneral::get_DataFormat(){
+    return iDataFormat_;
+}
+
+/******************************************************************************
+ * @brief Getter method for returning the amount of samples per data telegram
+ * @return: Amount of samples per data telegram
+ *****************************************************************************/
+int C_DataStorageGeneral::get_BatchSize(){
+    return iBatchSize_;
+}
+
 /******************************************************************************
  * @brief Getter method for returning the length of the experiment sequence
  * @return: Length of the experiment sequence
@@ -32,6 +32,8 @@ class C_DataStorageGeneral{
          * 
          **********************************************************************/ 
         int     iCommandNumber_;
+        int     iDataFormat_;
+        int     iBatchSize_;
         int     iSendDataCounter_;
 
         /**********************************************************************
@@ -93,6 +95,8 @@ class C_DataStorageGeneral{
          * 
          **********************************************************************/ 
         void set_CommandNumber(int);   
+        void set_DataFormat(int);
+        void set_BatchSize(int);
         void set_SendDataCounter(int);
 
         /**********************************************************************
@@ -133,6 +137,8 @@ class C_DataStorageGeneral{
          * 
          **********************************************************************/ 
         int get_CommandNumber();
+        int get_DataFormat();
+        int get_BatchSize();
         int get_SendDataCounter();
 
         /**********************************************************************
@@ -242,6 +242,11 @@ int C_JSONParser::funParseCommandTelegram(String strJSON, int iJSONLength,
             c_DataStorageGeneral_->set_CommandNumber(iCommandNumber_);
             c_DataStorageLocal_->set_ExperimentType(chrExperimentType_);
 
+            // Fall back to single JSON data telegrams until requested 
+            // otherwise
+            c_DataStorageGeneral_->set_DataFormat(DATA_FORMAT_JSON);
+            c_DataStorageGeneral_->set_BatchSize(1);
+
             // Experiment type received. Change system status 1 -> 2
             c_DataSoftwareStorage_->set_SystemStatus(FREISTAT_ExT);
         }
@@ -549,8 +554,15 @@ int C_JSONParser::funParseExperimentParameters(String strJSON, int iJSONLength,
             }
         }
 
+        // Check for parameters which are independent of the ec-method
+        if (strTempParameter == DATA_FORMAT){
+            c_DataStorageGeneral_->set_DataFormat(strTempNumber.toInt());
+        }
+        else if (strTempParameter == BATCH_SIZE){
+            c_DataStorageGeneral_->set_BatchSize(strTempNumber.toInt());
+        }
         // Check for electrochemical method
-        if (strTempExperimentType == OCP){
+        else if (strTempExperimentType == OCP){
             int iErrorCode = this->funHandleOCPParameter(
                 strTempParameter, strTempNumber);
             if (iErrorCode != 0){
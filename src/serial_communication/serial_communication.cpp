@@ -21,7 +21,11 @@
  * @brief Constructor of the class C_Communication
  * 
  *****************************************************************************/ 
-C_Communication::C_Communication(){}
+C_Communication::C_Communication(){
+    // No samples buffered yet
+    iBatchCounter_ = 0;
+    iBatchEcMethod_ = 0;
+}
 
 /******************************************************************************
  * @brief Starting method for the class C_Communication
@@ -212,6 +216,9 @@ int C_Communication::funStopSDcard(){
  * @return Error code
  *****************************************************************************/
 int C_Communication::funConstructPrefixes(char * chrEcMethod){
+    // Send buffered samples of the previous method with its prefixes
+    this->funFlushExperimentData();
+
     if (strcmp(chrEcMethod, CA)  == 0 ||
         strcmp(chrEcMethod, LSV) == 0 ||
         strcmp(chrEcMethod, CV)  == 0 ||
@@ -265,59 +272,45 @@ int C_Communication::funSendExperimentData(S_DataContainer S_ExperimentData,
     char chrBuff[128];
 
     #if !FREISTAT_STANDALONE && !WiFiEnabled
-    // Send different data depending on the electrochemical method
-    switch (iEcMethod){
-    case OCP_I:
-        strncpy(chrBuff, chrPrefix1_, sizeof(chrPrefix1_));
-        strncat(chrBuff, itoa(S_ExperimentData.iCycle, chrIntBuff, 10), 
-            sizeof(chrIntBuff));
-        strncat(chrBuff, chrPrefix2_, sizeof(chrPrefix2_));
-        strncat(chrBuff, chrPrefix3_, sizeof(chrPrefix3_));
-        strncat(chrBuff, itoa(S_ExperimentData.iMeasurmentPair, chrIntBuff, 10), 
-            sizeof(chrIntBuff));
-        strncat(chrBuff, chrPrefix4_, sizeof(chrPrefix1_));
-
-        dtostrf(S_ExperimentData.fVoltage, 7, 5, chrFloatBuff);
-
-        strncat(chrBuff, chrFloatBuff, sizeof(chrFloatBuff));
-        strncat(chrBuff, chrPrefix5_, sizeof(chrPrefix1_));
-        strncat(chrBuff, itoa(S_ExperimentData.fTimeStamp, chrIntBuff, 10), 
-            sizeof(chrIntBuff));
-        strncat(chrBuff, "}}", sizeof("}}"));
-
-        break;
-    case SWV_I:
-    case DPV_I:
-    case NPV_I:
-    case CA_I:
-    case LSV_I:
-    case CV_I:
-        strncpy(chrBuff, chrPrefix1_, sizeof(chrPrefix1_));
-        strncat(chrBuff, itoa(S_ExperimentData.iCycle, chrIntBuff, 10), 
-            sizeof(chrIntBuff));
-        strncat(chrBuff, chrPrefix2_, sizeof(chrPrefix2_));
-        strncat(chrBuff, chrPrefix3_, sizeof(chrPrefix3_));
-        strncat(chrBuff, itoa(S_ExperimentData.iMeasurmentPair, chrIntBuff, 10), 
-            sizeof(chrIntBuff));
-        strncat(chrBuff, chrPrefix4_, sizeof(chrPrefix1_));
+    // Check if batched data telegrams were requested
+    if (c_DataSoftwareStorage_->get_DataStorageGeneral()->get_BatchSize() > 1){
+        // Send buffered samples first if they belong to another run or method
+        if (iBatchCounter_ > 0 && 
+            (iBatchEcMethod_ != iEcMethod ||
+             S_BatchBuffer_[0].iCycle != S_ExperimentData.iCycle)){
+            this->funFlushExperimentData();
+        }
 
-        dtostrf(S_ExperimentData.fVoltage, 7, 5, chrFloatBuff);
+        // Buffer sample
+        S_BatchBuffer_[iBatchCounter_] = S_ExperimentData;
+        iBatchCounter_ += 1;
+        iBatchEcMethod_ = iEcMethod;
 
-        strncat(chrBuff, chrFloatBuff, sizeof(chrFloatBuff));
-        strncat(chrBuff, chrPrefix5_, sizeof(chrPrefix1_));
+        // Send batch if it is completed
+        if (iBatchCounter_ >= c_DataSoftwareStorage_->
+            get_DataStorageGeneral()->get_BatchSize() || 
+            iBatchCounter_ >= MAX_BATCH_SIZE){
+            this->funFlushExperimentData();
+        }
+        return EC_NO_ERROR;
+    }
 
-        dtostrf(S_ExperimentData.fCurrent, 7, 5, chrFloatBuff);
+    // Check if binary data telegrams were requested
+    if (c_DataSoftwareStorage_->get_DataStorageGeneral()->get_DataFormat() ==
+        DATA_FORMAT_BINARY){
+        return this->funSendBinaryData(&S_ExperimentData, 1);
+    }
 
-        strncat(chrBuff, chrFloatBuff, sizeof(chrFloatBuff));
-        strncat(chrBuff, chrPrefix6_, sizeof(chrPrefix6_));
-        strncat(chrBuff, itoa(S_ExperimentData.fTimeStamp, chrIntBuff, 10), 
-            sizeof(chrIntBuff));
-        strncat(chrBuff, "}}", sizeof("}}"));
+    // {"R":1,"M":
+    strncpy(chrBuff, chrPrefix1_, sizeof(chrPrefix1_));
+    strncat(chrBuff, itoa(S_ExperimentData.iCycle, chrIntBuff, 10), 
+        sizeof(chrIntBuff));
+    strncat(chrBuff, chrPrefix2_, sizeof(chrPrefix2_));
 
-        break;
-    default:
-        break;
-    }
+    // {"D":1,"V":...}
+    this->funConstructDataObject(chrBuff + strlen(chrBuff), S_ExperimentData,
+        iEcMethod);
+    strncat(chrBuff, "}", sizeof("}"));
     #endif
     #if FREISTAT_STANDALONE
     // Send different data depending on the electrochemical method
@@ -399,6 +392,151 @@ int C_Communication::funSendExperimentData(S_DataContainer S_ExperimentData,
     return EC_NO_ERROR;
 }
 
+/******************************************************************************
+ * @brief Function to write the measurement object of one sample in json 
+ * format into a char array, e.g. {"D":1,"V":-0.50000,"C":1.25000,"T":120}
+ * @param chrBuff: Char array in which the object should be written
+ * @param S_ExperimentData: struct with the experiment data
+ * @param iEcMethod: Integer containing the abbreviation for the electro-
+ * chemical method
+ * @return Error code encoded as integer
+ *****************************************************************************/ 
+int C_Communication::funConstructDataObject(char * chrBuff,
+                                            S_DataContainer S_ExperimentData,
+                                            int iEcMethod){
+    // Initalize variables
+    char chrIntBuff[16];
+    char chrFloatBuff[33];
+
+    // Send different data depending on the electrochemical method
+    switch (iEcMethod){
+    case OCP_I:
+        strcpy(chrBuff, chrPrefix3_);
+        strncat(chrBuff, itoa(S_ExperimentData.iMeasurmentPair, chrIntBuff, 10), 
+            sizeof(chrIntBuff));
+        strncat(chrBuff, chrPrefix4_, sizeof(chrPrefix1_));
+
+        dtostrf(S_ExperimentData.fVoltage, 7, 5, chrFloatBuff);
+
+        strncat(chrBuff, chrFloatBuff, sizeof(chrFloatBuff));
+        strncat(chrBuff, chrPrefix5_, sizeof(chrPrefix1_));
+        strncat(chrBuff, itoa(S_ExperimentData.fTimeStamp, chrIntBuff, 10), 
+            sizeof(chrIntBuff));
+        strncat(chrBuff, "}", sizeof("}"));
+
+        break;
+    case SWV_I:
+    case DPV_I:
+    case NPV_I:
+    case CA_I:
+    case LSV_I:
+    case CV_I:
+        strcpy(chrBuff, chrPrefix3_);
+        strncat(chrBuff, itoa(S_ExperimentData.iMeasurmentPair, chrIntBuff, 10), 
+            sizeof(chrIntBuff));
+        strncat(chrBuff, chrPrefix4_, sizeof(chrPrefix1_));
+
+        dtostrf(S_ExperimentData.fVoltage, 7, 5, chrFloatBuff);
+
+        strncat(chrBuff, chrFloatBuff, sizeof(chrFloatBuff));
+        strncat(chrBuff, chrPrefix5_, sizeof(chrPrefix1_));
+
+        dtostrf(S_ExperimentData.fCurrent, 7, 5, chrFloatBuff);
+
+        strncat(chrBuff, chrFloatBuff, sizeof(chrFloatBuff));
+        strncat(chrBuff, chrPrefix6_, sizeof(chrPrefix6_));
+        strncat(chrBuff, itoa(S_ExperimentData.fTimeStamp, chrIntBuff, 10), 
+            sizeof(chrIntBuff));
+        strncat(chrBuff, "}", sizeof("}"));
+
+        break;
+    default:
+        chrBuff[0] = '\0';
+        break;
+    }
+    return EC_NO_ERROR;
+}
+
+/******************************************************************************
+ * @brief Function to send all buffered samples as one data telegram to the 
+ * serial port. Depending on the data format a binary telegram or a json 
+ * telegram with an array of measurement objects is send, e.g.
+ * {"R":1,"M":[{"D":1,...},{"D":2,...}]}
+ * @return Error code encoded as integer
+ *****************************************************************************/ 
+int C_Communication::funFlushExperimentData(){
+    #if !FREISTAT_STANDALONE && !WiFiEnabled
+    // Initalize variables
+    char chrIntBuff[16];
+    char chrBuff[128];
+
+    // Check if samples are buffered
+    if (iBatchCounter_ == 0){
+        return EC_NO_ERROR;
+    }
+
+    // Check if binary data telegrams were requested
+    if (c_DataSoftwareStorage_->get_DataStorageGeneral()->get_DataFormat() ==
+        DATA_FORMAT_BINARY){
+        this->funSendBinaryData(S_BatchBuffer_, iBatchCounter_);
+    }
+    else {
+        // {"R":1,"M":[
+        strncpy(chrBuff, chrPrefix1_, sizeof(chrPrefix1_));
+        strncat(chrBuff, itoa(S_BatchBuffer_[0].iCycle, chrIntBuff, 10), 
+            sizeof(chrIntBuff));
+        strncat(chrBuff, chrPrefix2_, sizeof(chrPrefix2_));
+        strncat(chrBuff, "[", sizeof("["));
+        Serial.write(chrBuff);
+
+        // {"D":1,"V":...},{"D":2,"V":...}
+        for (int iSample = 0; iSample < iBatchCounter_; iSample++){
+            if (iSample > 0){
+                Serial.write(",");
+            }
+            this->funConstructDataObject(chrBuff, S_BatchBuffer_[iSample],
+                iBatchEcMethod_);
+            Serial.write(chrBuff);
+        }
+
+        // ]}
+        Serial.write("]}");
+    }
+
+    // Reset send buffer
+    iBatchCounter_ = 0;
+    #endif
+    return EC_NO_ERROR;
+}
+
+/******************************************************************************
+ * @brief Function to send experiment data as binary telegram to the serial 
+ * port. The records are send as little-endian copy of S_DataContainer behind 
+ * a magic header and the payload length.
+ * | 0xA5 | 0x5A | Length (uint16) | Record 1 | ... | Record N |
+ * @param S_ExperimentData: Pointer to the first record which should be send
+ * @param iRecords: Amount of records which should be send
+ * @return Error code encoded as integer
+ *****************************************************************************/ 
+int C_Communication::funSendBinaryData(S_DataContainer * S_ExperimentData,
+                                       int iRecords){
+    // Initalize variables
+    uint8_t arruiHeader[BINARY_TELEGRAM_HEADER];
+    uint16_t uiLength = iRecords * sizeof(S_DataContainer);
+
+    // Write magic header and payload length
+    arruiHeader[0] = BINARY_TELEGRAM_MAGIC_1;
+    arruiHeader[1] = BINARY_TELEGRAM_MAGIC_2;
+    arruiHeader[2] = uiLength & 0xFF;
+    arruiHeader[3] = (uiLength >> 8) & 0xFF;
+
+    // Send header and records via serial port
+    Serial.write(arruiHeader, BINARY_TELEGRAM_HEADER);
+    Serial.write((const uint8_t *)S_ExperimentData, uiLength);
+
+    return EC_NO_ERROR;
+}
+
 /******************************************************************************
  * @brief Function to send acknowledge telegram to the serial port
  * @return Error code
@@ -435,6 +573,9 @@ int C_Communication::funSendCommandTelegram(char * chrCommandType){
     char chrBuffer2[2];
     char chrBuffer[32];
 
+    // Send buffered samples in front of the command telegram
+    this->funFlushExperimentData();
+
     c_JSONParser_->funWrapObjectChar(chrBuffer, COMMAND_TELEGRAM, true);
     c_JSONParser_->funWrapObjectChar(chrBuffer1, COMMAND_EXC_STR, false);
 
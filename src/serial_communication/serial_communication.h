@@ -45,6 +45,11 @@ class C_Communication{
 
         char chrFilename[13];
 
+        // Send buffer for batched data telegrams
+        S_DataContainer S_BatchBuffer_[MAX_BATCH_SIZE];
+        int iBatchCounter_;
+        int iBatchEcMethod_;
+
         // Object pointers
         C_JSONParser * c_JSONParser_;
         C_DataSoftwareStorage * c_DataSoftwareStorage_;
@@ -55,6 +60,7 @@ class C_Communication{
 
         // Methods
         int funWriteSerial(char*);
+        int funConstructDataObject(char *, S_DataContainer, int);
         //int funWriteSerial(char* ,int);   DEPRECATED
 
         #if WiFiEnabled || FREISTAT_STANDALONE
@@ -79,6 +85,8 @@ class C_Communication{
         int funSendAcknowledgeTelegram();
         int funSendCommandTelegram(char *);
         int funSendExperimentData(S_DataContainer, int);
+        int funSendBinaryData(S_DataContainer *, int);
+        int funFlushExperimentData();
         int funSetupSDcard();
         int funStopSDcard();
 